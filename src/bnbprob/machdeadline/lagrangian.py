@@ -1,4 +1,4 @@
-from collections import defaultdict
+import warnings
 from dataclasses import dataclass
 from math import ceil
 from typing import Collection
@@ -34,16 +34,10 @@ class LagrangianDeadline(Problem):
     """Total processing time of the unscheduled jobs"""
     _mask: int
     """Mask for hashing and equality, based on the sequence of schedules jobs.
-    Useful for dominance rules.
+    Used as state key for dominance rules.
     """
     _lagrangian: 'LagrangianHelper'
     """Helper for computing the lagrangian multipliers and blocks."""
-    _is_dominated: bool
-    """Whether the current node is dominated by another one.
-    Useful for dominance rules.
-    """
-    _lb_refs: dict[int, int]
-    """References to lower bounds for dominance rules, indexed by the mask."""
 
     def __init__(self, jobs: Collection[Job]) -> None:
         super().__init__()
@@ -59,8 +53,6 @@ class LagrangianDeadline(Problem):
         self._fixed_term = 0
         self._unscheduled_term = UnscheduledCosts(0, 0)
         self._mask = 0
-        self._is_dominated = False
-        self._lb_refs = defaultdict(lambda: LARGE_INT)
         self._compute_completion_times()
 
     @property
@@ -92,17 +84,24 @@ class LagrangianDeadline(Problem):
             # by the Smith's rule,
             # it means that the current node is strictly infeasible
             return LARGE_INT
-        cost = self._unscheduled_term.lagrangian + self._fixed_term
-        # This will cause the early pruning
-        # of dominated nodes
-        if self._fixed_term >= self._lb_refs[self._mask]:
-            self._is_dominated = True
-            return cost
-        self._lb_refs[self._mask] = self._fixed_term
-        return cost
-
-    def clean_cache(self) -> None:
-        self._lb_refs.clear()
+        return self._unscheduled_term.lagrangian + self._fixed_term
+
+    def state_key(self) -> int:
+        # Sequences of the same jobs at the end share their completions
+        return self._mask
+
+    def state_value(self) -> float:
+        return self._fixed_term
+
+    def clean_cache(self) -> None:  # noqa: PLR6301
+        """Deprecated: dominated states are kept by the transposition
+        table of the search, which is cleared as the search restarts."""
+        warnings.warn(
+            'clean_cache is deprecated and does nothing, as dominated states '
+            'are kept by the transposition table of the search',
+            DeprecationWarning,
+            stacklevel=2,
+        )
 
     def calc_real_cost(self) -> int:
         if not self._precumputed:
@@ -113,8 +112,7 @@ class LagrangianDeadline(Problem):
         return len(self._unscheduled) == 0
 
     def branch(self) -> list['LagrangianDeadline']:
-        # Early pruning of dominated nodes
-        if self._is_dominated or not self._lagrangian.success:
+        if not self._lagrangian.success:
             return []
         # Create one child for each possible job to schedule next
         children = []
@@ -175,8 +173,6 @@ class LagrangianDeadline(Problem):
         other._unscheduled = self._unscheduled.copy()
         # Mask is immutable, so we can just pass on the reference
         other._mask = self._mask
-        other._is_dominated = False
-        other._lb_refs = self._lb_refs
         return other
 
 
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from typing import Collection
 
 from bnbprob.machdeadline.job import Job
@@ -28,14 +27,8 @@ class MachDeadlineProb(Problem):
     """Total processing time of the unscheduled jobs"""
     _mask: int
     """Mask for hashing and equality, based on the sequence of schedules jobs.
-    Useful for dominance rules.
+    Used as state key for dominance rules.
     """
-    _is_dominated: bool
-    """Whether the current node is dominated by another one.
-    Useful for dominance rules.
-    """
-    _lb_refs: dict[int, int]
-    """References to lower bounds for dominance rules, indexed by the mask."""
 
     def __init__(self, jobs: Collection[Job]) -> None:
         super().__init__()
@@ -47,8 +40,6 @@ class MachDeadlineProb(Problem):
         self._unscheduled_total_time = sum(job.p for job in self._unscheduled)
         self._violations = False
         self._mask = 0
-        self._is_dominated = False
-        self._lb_refs = defaultdict(lambda: LARGE_INT)
         MachDeadlineProb.find_wspt(self._unscheduled)
         self._compute_completion_times()
 
@@ -74,14 +65,14 @@ class MachDeadlineProb(Problem):
     def calc_bound(self) -> int:
         if not self._precumputed:
             self._compute_completion_times()
-        cost = self._unscheduled_term + self._fixed_term
-        # This will cause the early pruning
-        # of dominated nodes
-        if cost >= self._lb_refs[self._mask]:
-            self._is_dominated = True
-            return cost
-        self._lb_refs[self._mask] = cost
-        return cost
+        return self._unscheduled_term + self._fixed_term
+
+    def state_key(self) -> int:
+        # Sequences of the same jobs at the end share their completions
+        return self._mask
+
+    def state_value(self) -> float:
+        return self._fixed_term
 
     def is_feasible(self) -> bool:
         if not self._precumputed:
@@ -89,9 +80,6 @@ class MachDeadlineProb(Problem):
         return not self._violations
 
     def branch(self) -> list['MachDeadlineProb']:
-        # Early pruning of dominated nodes
-        if self._is_dominated:
-            return []
         # Create one child for each possible job to schedule next
         children = []
         for job in self._unscheduled:
@@ -142,9 +130,6 @@ class MachDeadlineProb(Problem):
         other._violations = self._violations
         # Mask is immutable, so we can just pass on the reference
         other._mask = self._mask
-        other._is_dominated = False
-        # Shared reference
-        other._lb_refs = self._lb_refs
         return other
 
     @staticmethod
@@ -188,14 +188,13 @@ cdef extern from "permutation.hpp":
 
         # Constructor from free jobs
         Permutation(
-            const int &m_,
             const vector[JobPtr] &jobs_,
             const shared_ptr[MachineGraph]& mach_graph_
         )
 
         # Constructor given all desired attributes
         Permutation(
-            const int &m_, const int &n_, const int &level_,
+            const int &n_, const int &level_,
             const Sigma &sigma1_, const vector[JobPtr] &free_jobs_,
             const Sigma &sigma2_,
             const shared_ptr[MachineGraph]& mach_graph_,
@@ -204,7 +203,7 @@ cdef extern from "permutation.hpp":
 
         # Constructor given all desired attributes but two_mach
         Permutation(
-            const int &m_, const int &n_, const int &level_,
+            const int &n_, const int &level_,
             const Sigma &sigma1_, const vector[JobPtr] &free_jobs_,
             const Sigma &sigma2_,
             const shared_ptr[MachineGraph]& mach_graph_
@@ -242,6 +241,7 @@ cdef extern from "permutation.hpp":
         vector[int] get_q() const
         vector[JobTimes*] get_job_times(const int& m1, const int& m2) const
         MachineGraph get_mach_graph() const
+        shared_ptr[TwoMach] get_two_mach_cache() const
 
         # Modification methods
         void push_job(const unsigned int &j)
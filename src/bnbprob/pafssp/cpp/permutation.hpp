@@ -250,6 +250,10 @@ public:
     std::vector<int> get_q() const;
     std::vector<JobTimes *> get_job_times(const int &m1, const int &m2) const;
     MachineGraph get_mach_graph() const { return *this->mach_graph.get(); }
+    std::shared_ptr<TwoMach> get_two_mach_cache() const
+    {
+        return this->two_mach_cache;
+    }
 
     // Modification methods
     void push_job(const unsigned int &j);
@@ -8,6 +8,7 @@ from libcpp.vector cimport vector
 from bnbprob.pafssp.cython.problem cimport BenchPermFlowShop, PermFlowShop
 from bnbpy.cython.levelqueue cimport CyclicBestSearch, LevelQueue
 from bnbpy.cython.node cimport Node
+from bnbpy.cython.nodequeue cimport PriorityKey, native_priority
 from bnbpy.cython.primanager cimport PriorityManagerTemplate
 from bnbpy.cython.search cimport BranchAndBound, SearchResults
 from bnbpy.cython.solution cimport Solution
@@ -26,6 +27,9 @@ cdef class DfsFlowShop(PriorityManagerTemplate):
     then least idle time first.
     """
 
+    def __cinit__(self, *args, **kwargs):
+        self.native_key = native_priority(self, DfsFlowShop)
+
     cpdef vector[double] make_priority(self, Node node):
         cdef:
             int idle_time
@@ -38,6 +42,18 @@ cdef class DfsFlowShop(PriorityManagerTemplate):
         pri[2] = <double>problem.calc_idle_time()
         return pri
 
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PermFlowShop problem
+            PriorityKey key
+
+        problem = node.problem
+        key.v[0] = -node.level
+        key.v[1] = node.lb
+        key.v[2] = <double>problem.calc_idle_time()
+        key.n = 3
+        return key
+
 
 cdef class DfsLevelQueue(LevelQueue):
     """Per-level queue for PermFlowShop with best-first priority.
@@ -45,6 +61,9 @@ cdef class DfsLevelQueue(LevelQueue):
     Priority is ``(lb, idle_time)`` — best bound first, then least idle time.
     """
 
+    def __cinit__(self, *args, **kwargs):
+        self.native_key = native_priority(self, DfsLevelQueue)
+
     cpdef vector[double] make_priority(self, Node node):
         cdef:
             int idle_time
@@ -56,6 +75,17 @@ cdef class DfsLevelQueue(LevelQueue):
         pri[1] = <double>problem.calc_idle_time()
         return pri
 
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PermFlowShop problem
+            PriorityKey key
+
+        problem = node.problem
+        key.v[0] = node.lb
+        key.v[1] = <double>problem.calc_idle_time()
+        key.n = 2
+        return key
+
 
 cdef class CycleBestFlowShop(CyclicBestSearch):
     """Cyclic best-first search node manager specialised for PermFlowShop,
@@ -147,10 +177,9 @@ cdef class CutoffBnB(LazyBnB):
         problem.set_solution(solution)
         node = Node(problem)
 
+        BranchAndBound._restart_search(self)
         self.incumbent = node
-        self.bound_node = None
         self.gap = 1.0
-        self.manager.clear()
 
 
 cdef class BenchCutoffBnB(CutoffBnB):
@@ -168,10 +197,9 @@ cdef class BenchCutoffBnB(CutoffBnB):
         problem.solution = solution
         node = Node(problem)
 
+        BranchAndBound._restart_search(self)
         self.incumbent = node
-        self.bound_node = None
         self.gap = 1.0
-        self.manager.clear()
 
     cpdef void post_eval_callback(self, Node node):
         cdef:
@@ -225,7 +253,7 @@ cdef class CallbackBnB(LazyBnB):
         new_prob = problem.intensify(ref_problem)
         if new_prob.solution.lb < self.get_ub():
             new_node = Node(new_prob)
-            self.log_row("Intensification")
+            self.log_progress("Intensification")
             self.set_solution(new_node)
             # Reduce the heuristic wait iterations factor
             self.heur_calls = <int>sqrt(self.heur_calls)
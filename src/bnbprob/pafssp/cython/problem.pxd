@@ -30,9 +30,22 @@ cdef class PermFlowShop(Problem):
 
     cdef:
         Permutation perm
+        # Problem owning the jobs shared by `perm` (None if self)
+        PermFlowShop _owner
+        unsigned long long _instance_id
+        object __weakref__
+
+    cdef void _register_instance(PermFlowShop self, unsigned long long instance_id)
 
     cdef inline void set_perm(PermFlowShop self, vector[vector[int]] p_, MachineGraph mach_graph_):
         self.perm = Permutation(p_, mach_graph_)
+        self._owner = None
+        self._register_instance(0)
+
+    cdef inline PermFlowShop get_owner(PermFlowShop self):
+        if self._owner is None:
+            return self
+        return self._owner
 
     cdef inline Permutation get_perm(PermFlowShop self):
         return self.perm
@@ -95,10 +108,24 @@ cdef class PermFlowShop(Problem):
 
     cpdef int calc_tot_time(PermFlowShop self)
 
+    cpdef object solution_key(PermFlowShop self)
+
+    cpdef object decisions(PermFlowShop self)
+
+    cpdef PermFlowShop apply_decisions(PermFlowShop self, object decisions)
+
+    cpdef double cost_decrease(PermFlowShop self, Problem former)
+
+    cpdef Py_ssize_t memory_size(PermFlowShop self)
+
     cpdef PermFlowShop copy(PermFlowShop self, bool deep=*)
 
     cdef PermFlowShop _copy(PermFlowShop self)
 
+    cdef bytes _pack_perm(PermFlowShop self)
+
+    cdef void _unpack_perm(PermFlowShop self, PermFlowShop owner, int level, bytes packed)
+
     cpdef void perm_copy(PermFlowShop self)
 
 
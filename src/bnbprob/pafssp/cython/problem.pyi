@@ -1,5 +1,5 @@
 import logging
-from typing import List, Literal, Optional, Tuple
+from typing import Any, List, Literal, Optional, Tuple
 
 from bnbprob.pafssp.cython.pyjob import PyJob
 from bnbprob.pafssp.cython.pysigma import PySigma
@@ -54,6 +54,7 @@ class PermFlowShop(Problem):
         constructive: Constructive = 'neh',
     ) -> None: ...
     def __del__(self) -> None: ...
+    def __reduce__(self) -> tuple[Any, ...]: ...
     @property
     def lb(self) -> float: ...
     @property
@@ -385,6 +386,33 @@ class PermFlowShop(Problem):
         """Calculate total completion time with time complexity of O(m)."""
         ...
 
+    def solution_key(self) -> Tuple[int, ...]:
+        """Job ids of the sequence, identifying the schedule of a
+        complete permutation."""
+        ...
+
+    def decisions(self) -> bytes:
+        """Job ids of sigma1 and sigma2, packed as 32-bit integers
+        preceded by the size of sigma1."""
+        ...
+
+    def apply_decisions(self, decisions: bytes) -> 'PermFlowShop':
+        """Subproblem of the instance with the jobs of sigma1 and sigma2
+        fixed as in *decisions*, whose completion times are computed
+        with the processing times of this instance."""
+        ...
+
+    def cost_decrease(self, former: Problem) -> float:
+        """Total decrease of processing times from the instance of
+        *former*, which bounds the decrease of any makespan (infinity
+        if the instances differ in jobs or machines)."""
+        ...
+
+    def memory_size(self) -> int:
+        """Approximate memory in bytes of the subproblem, counting its
+        permutation but not the jobs shared by the instance."""
+        ...
+
     def copy(self, deep: bool = False) -> 'PermFlowShop':
         """Create a copy of the problem instance"""
         ...
@@ -1,18 +1,23 @@
 # distutils: language = c++
 # cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
 
+from libc.math cimport INFINITY
 from libcpp cimport bool
 from libcpp.vector cimport vector
 from libcpp.string cimport string
 from cython.operator cimport dereference as deref
 
 import logging
+import secrets
+import weakref
+from array import array
 from typing import List, Literal, Optional, Tuple
 
 from bnbprob.pafssp.cpp.environ cimport (
     JobPtr,
     MachineGraph,
     Permutation,
+    Sigma,
     iga,
     intensify,
     local_search,
@@ -31,6 +36,9 @@ from bnbpy.cython.solution cimport Solution
 cdef:
     int DEFAULT_SEED = 42
 
+# Problems owning the processing times of each instance, by instance id
+_instances = weakref.WeakValueDictionary()
+
 
 cdef class PermFlowShop(Problem):
     """
@@ -371,6 +379,119 @@ cdef class PermFlowShop(Problem):
     cpdef int calc_tot_time(PermFlowShop self):
         return self.calc_tot_time()
 
+    cpdef object solution_key(PermFlowShop self):
+        # Schedules are identified by their sequence of jobs
+        cdef:
+            size_t i
+            vector[JobPtr] seq = self.perm.get_sequence()
+        return tuple([deref(seq[i]).j for i in range(seq.size())])
+
+    cpdef object decisions(PermFlowShop self):
+        # Job ids of sigma1 and sigma2, preceded by the size of sigma1
+        cdef:
+            size_t k
+            vector[JobPtr] jobs1, jobs2
+            vector[int] out
+
+        jobs1 = self.perm.sigma1.get_jobs()
+        jobs2 = self.perm.sigma2.get_jobs()
+        out.reserve(1 + jobs1.size() + jobs2.size())
+        out.push_back(jobs1.size())
+        for k in range(jobs1.size()):
+            out.push_back(deref(jobs1[k]).j)
+        for k in range(jobs2.size()):
+            out.push_back(deref(jobs2[k]).j)
+        # Same layout as array('i').tobytes(), without Python calls
+        return (<char*>out.data())[:out.size() * sizeof(int)]
+
+    cpdef PermFlowShop apply_decisions(PermFlowShop self, object decisions):
+        cdef:
+            int i, n1, size
+            PermFlowShop child, owner
+            vector[JobPtr] jobs, free_jobs
+            vector[bool] fixed
+            Sigma sigma1, sigma2
+            const MachineGraph* mach_graph
+            JobPtr job
+            const int[::1] values
+
+        # Jobs of the instance indexed by id
+        owner = self.get_owner()
+        jobs.resize(owner.perm.n)
+        fixed.resize(owner.perm.n, False)
+        for job in owner.perm.get_sequence():
+            jobs[deref(job).j] = job
+
+        # Completion times are computed as jobs are pushed again
+        values = array('i', decisions)
+        n1 = values[0]
+        size = values.shape[0]
+        mach_graph = owner.perm.mach_graph.get()
+        sigma1 = Sigma(owner.perm.m, mach_graph)
+        for i in range(1, n1 + 1):
+            sigma1.job_to_bottom(jobs[values[i]])
+            fixed[values[i]] = True
+        sigma2 = Sigma(owner.perm.m, mach_graph)
+        for i in range(size - 1, n1, -1):
+            sigma2.job_to_top(jobs[values[i]])
+            fixed[values[i]] = True
+        for i in range(owner.perm.n):
+            if not fixed[i]:
+                free_jobs.push_back(jobs[i])
+
+        child = self._copy()
+        child.perm = Permutation(
+            owner.perm.n,
+            size - 1,
+            sigma1,
+            free_jobs,
+            sigma2,
+            owner.perm.mach_graph,
+            owner.perm.get_two_mach_cache(),
+        )
+        child._owner = owner
+        return child
+
+    cpdef double cost_decrease(PermFlowShop self, Problem former):
+        # Makespans are the longest paths through the processing times of
+        # the instance, each one counted at most once in a path, so they
+        # decrease at most by the total decrease of processing times
+        cdef:
+            int k
+            double out = 0.0
+            PermFlowShop owner, other
+            vector[JobPtr] former_jobs
+            vector[vector[int]] prec, former_prec
+            JobPtr job
+
+        if not isinstance(former, PermFlowShop):
+            return INFINITY
+        owner = self.get_owner()
+        other = (<PermFlowShop>former).get_owner()
+        prec = owner.perm.mach_graph.get().get_prec_all()
+        former_prec = other.perm.mach_graph.get().get_prec_all()
+        if owner.perm.n != other.perm.n or prec != former_prec:
+            return INFINITY
+        former_jobs.resize(other.perm.n)
+        for job in other.perm.get_sequence():
+            former_jobs[deref(job).j] = job
+        for job in owner.perm.get_sequence():
+            for k in range(owner.perm.m):
+                out += max(
+                    0, deref(former_jobs[deref(job).j]).p[k] - deref(job).p[k]
+                )
+        return out
+
+    cpdef Py_ssize_t memory_size(PermFlowShop self):
+        # Jobs are shared by the problems of an instance: each one
+        # owns its permutation, with job pointers and completion times
+        return (
+            Problem.memory_size(self)
+            + sizeof(Permutation)
+            + 2 * self.perm.n * sizeof(JobPtr)
+            + 4 * self.perm.m * sizeof(int)
+        )
+
     cpdef PermFlowShop copy(PermFlowShop self, bool deep=False):
         return self._copy()
 
@@ -382,6 +503,7 @@ cdef class PermFlowShop(Problem):
         child.constructive = self.constructive
         child.perm = self.perm
         child.simple_upgraded = False
+        child._owner = self.get_owner()
         return child
 
     cpdef void perm_copy(PermFlowShop self):
@@ -389,6 +511,122 @@ cdef class PermFlowShop(Problem):
             Permutation perm
         perm = self.perm
 
+    def __reduce__(self):
+        """Compact pickling of the subproblem.
+
+        Only the job ids of sigma1, free jobs and sigma2 and the
+        completion times of each sigma are serialised. Processing times
+        are referenced by the id of the instance they belong to and
+        only sent along with root problems (no jobs fixed), which
+        register the instance on unpickling. Processes forked after
+        the instance is created share it by default.
+        """
+        cdef:
+            PermFlowShop owner
+            JobPtr job
+            vector[JobPtr] jobs
+            object instance, p
+            bytes packed
+
+        owner = self.get_owner()
+        instance = None
+        packed = None
+        if owner._instance_id != 0:
+            packed = self._pack_perm()
+            if self.perm.level == 0:
+                jobs = owner.perm.get_sequence()
+                p = [None] * jobs.size()
+                for job in jobs:
+                    p[deref(job).j] = deref(job).p
+                instance = (p, owner.get_mach_graph())
+        return (
+            _rebuild_flowshop,
+            (
+                type(self),
+                owner._instance_id,
+                instance,
+                self.constructive,
+                self.simple_upgraded,
+                self.solution,
+                self.perm.level,
+                packed,
+            ),
+            getattr(self, '__dict__', None),
+        )
+
+    cdef void _register_instance(
+        PermFlowShop self, unsigned long long instance_id
+    ):
+        if self._instance_id != 0:
+            _instances.pop(self._instance_id, None)
+        if instance_id == 0:
+            instance_id = secrets.randbits(63) + 1
+        self._instance_id = instance_id
+        _instances[instance_id] = self
+
+    cdef bytes _pack_perm(PermFlowShop self):
+        cdef:
+            size_t k
+            vector[JobPtr] jobs1, jobs2
+            object out
+
+        jobs1 = self.perm.sigma1.get_jobs()
+        jobs2 = self.perm.sigma2.get_jobs()
+        out = array('i', [jobs1.size(), self.perm.free_jobs.size()])
+        for k in range(jobs1.size()):
+            out.append(deref(jobs1[k]).j)
+        for k in range(self.perm.free_jobs.size()):
+            out.append(deref(self.perm.free_jobs[k]).j)
+        for k in range(jobs2.size()):
+            out.append(deref(jobs2[k]).j)
+        out.extend(self.perm.sigma1.C)
+        out.extend(self.perm.sigma2.C)
+        return out.tobytes()
+
+    cdef void _unpack_perm(
+        PermFlowShop self, PermFlowShop owner, int level, bytes packed
+    ):
+        cdef:
+            int i, m, n, n1, n_free
+            vector[JobPtr] jobs, jobs1, free_jobs, jobs2
+            vector[int] C1, C2
+            const MachineGraph* mach_graph
+            JobPtr job
+            const int[::1] values
+
+        # Jobs of the instance indexed by id
+        n = owner.perm.n
+        jobs.resize(n)
+        for job in owner.perm.get_sequence():
+            jobs[deref(job).j] = job
+
+        values = array('i', packed)
+        n1 = values[0]
+        n_free = values[1]
+        for i in range(2, 2 + n1):
+            jobs1.push_back(jobs[values[i]])
+        for i in range(2 + n1, 2 + n1 + n_free):
+            free_jobs.push_back(jobs[values[i]])
+        for i in range(2 + n1 + n_free, 2 + n):
+            jobs2.push_back(jobs[values[i]])
+        m = owner.perm.m
+        for i in range(2 + n, 2 + n + m):
+            C1.push_back(values[i])
+        for i in range(2 + n + m, 2 + n + 2 * m):
+            C2.push_back(values[i])
+
+        mach_graph = owner.perm.mach_graph.get()
+        self.perm = Permutation(
+            n,
+            level,
+            Sigma(m, jobs1, C1, mach_graph),
+            free_jobs,
+            Sigma(m, jobs2, C2, mach_graph),
+            owner.perm.mach_graph,
+            owner.perm.get_two_mach_cache(),
+        )
+        self._owner = owner
+
 
 cdef class BenchPermFlowShop(PermFlowShop):
     """Benchmarking variant of PermFlowShop.
@@ -410,6 +648,7 @@ cdef class BenchPermFlowShop(PermFlowShop):
         child.constructive = self.constructive
         child.perm = self.perm
         child.simple_upgraded = False
+        child._owner = self.get_owner()
         return child
 
 
@@ -430,4 +669,43 @@ cdef class PermFlowShop1M(PermFlowShop):
         child.constructive = self.constructive
         child.perm = self.perm
         child.simple_upgraded = False
+        child._owner = self.get_owner()
         return child
+
+
+def _rebuild_flowshop(
+    cls,
+    instance_id,
+    instance,
+    constructive,
+    simple_upgraded,
+    solution,
+    level,
+    packed,
+):
+    cdef:
+        PermFlowShop problem, owner
+        MachineGraph mach_graph
+
+    problem = cls.__new__(cls)
+    problem.solution = solution
+    problem.constructive = constructive
+    problem.simple_upgraded = simple_upgraded
+    if packed is None:
+        return problem
+
+    owner = _instances.get(instance_id)
+    if owner is None:
+        if instance is None:
+            raise RuntimeError(
+                f'Flow-shop instance {instance_id} is not available in this'
+                ' process; unpickle a root problem of the instance first'
+            )
+        p, mi = instance
+        mach_graph = create_machine_graph(mi)
+        owner = PermFlowShop.__new__(PermFlowShop)
+        owner.solution = Solution()
+        owner.set_perm(p, mach_graph)
+        owner._register_instance(instance_id)
+    problem._unpack_perm(owner, level, packed)
+    return problem
@@ -4,12 +4,18 @@ __all__ = [
     'Problem',
     'Solution',
     'BranchAndBound',
+    'FrontierRecorder',
     'BestFirstBnB',
     'BreadthFirstBnB',
     'DepthFirstBnB',
     'FifoBnB',
     'LifoBnB',
     'SearchResults',
+    'SearchProgress',
+    'SearchStats',
+    'SolutionPool',
+    'TranspositionTable',
+    'TreeRecorder',
     'configure_logfile',
     'BaseNodeManager',
     'LifoManager',
@@ -20,7 +26,14 @@ __all__ = [
     'PriceSol',
     'Pricing',
     'CyclicBestSearch',
+    'BeamSearch',
+    'LimitedDiscrepancySearch',
+    'MemoryAwareSearch',
+    'SpillingBestFirstSearch',
     'Node',
+    'ParallelBnB',
+    'PortfolioBnB',
+    'solve_many',
 ]
 
 from logging import getLogger
@@ -32,9 +45,15 @@ from bnbpy.colgen import (
     PriceSol,
     Pricing,
 )
-from bnbpy.cython.levelqueue import CyclicBestSearch
+from bnbpy.cython.frontier import FrontierRecorder
+from bnbpy.cython.levelqueue import BeamSearch, CyclicBestSearch
 from bnbpy.cython.manager import BaseNodeManager, FifoManager, LifoManager
 from bnbpy.cython.node import Node
+from bnbpy.cython.pool import SolutionPool
+from bnbpy.cython.primanager import (
+    LimitedDiscrepancySearch,
+    MemoryAwareSearch,
+)
 from bnbpy.cython.problem import Problem
 from bnbpy.cython.search import (
     BestFirstBnB,
@@ -43,10 +62,16 @@ from bnbpy.cython.search import (
     DepthFirstBnB,
     FifoBnB,
     LifoBnB,
+    SearchProgress,
     SearchResults,
     configure_logfile,
 )
 from bnbpy.cython.solution import Solution
+from bnbpy.cython.spillmanager import SpillingBestFirstSearch
+from bnbpy.cython.stats import SearchStats
+from bnbpy.cython.transposition import TranspositionTable
+from bnbpy.cython.tree import TreeRecorder
+from bnbpy.parallel import ParallelBnB, PortfolioBnB, solve_many
 from bnbpy.plot import plot_tree
 
 log = getLogger(__name__)
@@ -0,0 +1,27 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+from libcpp.vector cimport vector
+
+
+@cython.final
+cdef class CheckpointWriter:
+
+    cdef readonly:
+        str path
+        Py_ssize_t total
+        Py_ssize_t written
+
+    cdef:
+        object _file
+        list _problems
+        vector[int] _levels
+        vector[double] _lbs
+
+    cpdef bool step(self, Py_ssize_t n)
+
+    cpdef void abort(self)
+
+    cdef void _release(self)
@@ -0,0 +1,95 @@
+import os
+from collections.abc import Iterator
+from typing import Any, Union
+
+from bnbpy.cython.node import Node
+
+MAGIC: bytes
+VERSION: int
+
+class CheckpointWriter:
+    """Writes a snapshot of open nodes to a checkpoint file in steps.
+
+    The problem, level and lower bound of each node are taken when the
+    writer is created, so the file describes the search at that moment
+    even if it goes on between steps: nodes explored meanwhile keep
+    their problems alive until they are written.
+
+    The file starts with :data:`MAGIC` and a pickled header, followed
+    by one record per node: its lower bound (float64), level (int64),
+    and the length (uint64) and bytes of its pickled problem, so
+    problems with compact pickling hooks take little space. It is
+    written next to ``path`` and only replaces it once complete, such
+    that an interrupted write keeps the former checkpoint intact.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Destination file
+
+    header : dict
+        Picklable search state, stored with the number of nodes and
+        the format version
+
+    nodes : list[Node]
+        Open nodes
+    """
+
+    path: str
+    total: int
+    written: int
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        header: dict[str, Any],
+        nodes: list[Node[Any]],
+    ) -> None: ...
+    @property
+    def done(self) -> bool:
+        """Whether the file is complete (or the write aborted)"""
+        ...
+
+    def step(self, n: int) -> bool:
+        """Writes up to *n* more nodes, moving the file into place once
+        all of them are written.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of nodes to write
+
+        Returns
+        -------
+        bool
+            Whether the file is complete
+        """
+        ...
+
+    def abort(self) -> None:
+        """Stops writing, discarding the incomplete file."""
+        ...
+
+def read_checkpoint(
+    path: Union[str, os.PathLike[str]],
+) -> tuple[dict[str, Any], Iterator[Node[Any]]]:
+    """Reads a checkpoint written by :class:`CheckpointWriter`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Checkpoint file
+
+    Returns
+    -------
+    tuple[dict, Iterator[Node]]
+        Header, and an iterator reading open nodes from the file one at
+        a time, detached from their parents. The header is unpickled
+        first, so problems it holds are available when nodes are read.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a checkpoint of a supported version.
+    """
+    ...
@@ -0,0 +1,198 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+from libcpp.vector cimport vector
+
+import os
+import pickle
+import struct
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.node import _rebuild_node
+
+MAGIC = b'BNBPYCK1'
+VERSION = 1
+
+# Length of the header, and (lb, level, length) of each node record
+cdef object _LENGTH = struct.Struct('<Q')
+cdef object _RECORD = struct.Struct('<dqQ')
+
+
+@cython.final
+cdef class CheckpointWriter:
+    """Writes a snapshot of open nodes to a checkpoint file in steps.
+
+    The problem, level and lower bound of each node are taken when the
+    writer is created, so the file describes the search at that moment
+    even if it goes on between steps: nodes explored meanwhile keep
+    their problems alive until they are written.
+
+    The file starts with :data:`MAGIC` and a pickled header, followed
+    by one record per node: its lower bound (float64), level (int64),
+    and the length (uint64) and bytes of its pickled problem, so
+    problems with compact pickling hooks take little space. It is
+    written next to ``path`` and only replaces it once complete, such
+    that an interrupted write keeps the former checkpoint intact.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Destination file
+
+    header : dict
+        Picklable search state, stored with the number of nodes and
+        the format version
+
+    nodes : list[Node]
+        Open nodes
+    """
+
+    def __init__(self, path, dict header, list nodes):
+        cdef:
+            Py_ssize_t i
+            Node node
+            bytes blob
+
+        self.path = os.fspath(path)
+        self.total = len(nodes)
+        self.written = 0
+        self._problems = [None] * self.total
+        self._levels.reserve(self.total)
+        self._lbs.reserve(self.total)
+        for i in range(self.total):
+            node = nodes[i]
+            self._problems[i] = node.problem
+            self._levels.push_back(node.level)
+            self._lbs.push_back(node.lb)
+
+        blob = pickle.dumps(
+            dict(header, version=VERSION, nodes=self.total),
+            pickle.HIGHEST_PROTOCOL,
+        )
+        self._file = open(self.path + '.tmp', 'wb')
+        self._file.write(MAGIC)
+        self._file.write(_LENGTH.pack(len(blob)))
+        self._file.write(blob)
+
+    def __repr__(self) -> str:
+        return (
+            f'CheckpointWriter(path={self.path!r}, '
+            f'written={self.written}/{self.total})'
+        )
+
+    @property
+    def done(self):
+        """Whether the file is complete (or the write aborted)"""
+        return self._file is None
+
+    cpdef bool step(self, Py_ssize_t n):
+        """Writes up to *n* more nodes, moving the file into place once
+        all of them are written.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of nodes to write
+
+        Returns
+        -------
+        bool
+            Whether the file is complete
+        """
+        cdef:
+            Py_ssize_t i, stop
+            bytes blob
+            object f = self._file
+
+        if f is None:
+            return True
+        stop = min(self.written + n, self.total)
+        for i in range(self.written, stop):
+            blob = pickle.dumps(self._problems[i], pickle.HIGHEST_PROTOCOL)
+            f.write(_RECORD.pack(self._lbs[i], self._levels[i], len(blob)))
+            f.write(blob)
+            # Problems are released as soon as they are written
+            self._problems[i] = None
+        self.written = stop
+        if stop < self.total:
+            return False
+
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(self.path + '.tmp', self.path)
+        self._release()
+        return True
+
+    cpdef void abort(self):
+        """Stops writing, discarding the incomplete file."""
+        if self._file is None:
+            return
+        self._file.close()
+        try:
+            os.remove(self.path + '.tmp')
+        except FileNotFoundError:
+            pass
+        self._release()
+
+    cdef void _release(self):
+        self._file = None
+        self._problems = []
+        self._levels.clear()
+        self._lbs.clear()
+
+
+def read_checkpoint(path):
+    """Reads a checkpoint written by :class:`CheckpointWriter`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Checkpoint file
+
+    Returns
+    -------
+    tuple[dict, Iterator[Node]]
+        Header, and an iterator reading open nodes from the file one at
+        a time, detached from their parents. The header is unpickled
+        first, so problems it holds are available when nodes are read.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a checkpoint of a supported version.
+    """
+    cdef:
+        dict header
+        bytes magic
+        Py_ssize_t size
+
+    f = open(path, 'rb')
+    try:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f'{os.fspath(path)!r} is not a bnbpy checkpoint')
+        (size,) = _LENGTH.unpack(f.read(_LENGTH.size))
+        header = pickle.loads(f.read(size))
+        if header.get('version') != VERSION:
+            raise ValueError(
+                f'Unsupported checkpoint version {header.get("version")!r}'
+            )
+    except BaseException:
+        f.close()
+        raise
+    return header, _read_nodes(f, header['nodes'])
+
+
+def _read_nodes(f, Py_ssize_t n):
+    cdef:
+        Py_ssize_t i, size
+        long long level
+        double lb
+
+    with f:
+        for i in range(n):
+            lb, level, size = _RECORD.unpack(f.read(_RECORD.size))
+            yield _rebuild_node(pickle.loads(f.read(size)), level, lb)
@@ -1,8 +0,0 @@
-class Counter:
-    def pynext(self) -> int:
-        """Increments the counter and returns the new value."""
-        ...
-
-    def get_value(self) -> int:
-        """Returns the current value of the counter."""
-        ...
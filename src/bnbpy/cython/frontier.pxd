@@ -0,0 +1,44 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.problem cimport Problem
+
+
+@cython.final
+cdef class FrontierRecorder:
+
+    cdef readonly:
+        Problem problem
+        Problem incumbent
+
+    cdef:
+        list _decisions
+        vector[int] _levels
+        vector[double] _lbs
+        Py_ssize_t _branched
+        # Slots of open nodes, which might still be branched
+        unordered_map[long long, Py_ssize_t] _open
+        double _incumbent_lb
+
+    cdef void start(FrontierRecorder self, Problem problem)
+
+    cdef void open(FrontierRecorder self, Node node)
+
+    cdef void close(FrontierRecorder self, Node node)
+
+    cdef void remove(FrontierRecorder self, Node node)
+
+    cdef void add_solution(FrontierRecorder self, Node node)
+
+    cdef void add_leaf(
+        FrontierRecorder self, object decisions, int level, double lb
+    )
+
+    cpdef list leaves(self)
+
+    cpdef void clear(self)
@@ -0,0 +1,44 @@
+from typing import Any, Optional
+
+from bnbpy.cython.problem import Problem
+
+class FrontierRecorder:
+    """Leaves of a search tree, from which a modified version of its
+    problem can be solved by
+    :meth:`~bnbpy.cython.search.BranchAndBound.reoptimize`.
+
+    Assigned as ``frontier`` of a search, it keeps the level, lower
+    bound and :meth:`~bnbpy.cython.problem.Problem.decisions` of every
+    node that was not branched: open nodes, whether explored later or
+    not, as well as pruned, infeasible and solution nodes. As branching
+    partitions the solutions of a node among its children, these leaves
+    partition the solutions of the root ``problem``, even when the
+    search is interrupted. The best solution recorded is kept as
+    ``incumbent``.
+
+    Leaves take the size of their decisions and about 20 bytes, and
+    subproblems are not kept alive. Leaves must be recorded from the
+    start: those of a search restored from a checkpoint do not cover
+    the nodes pruned before it was saved. Subtrees solved by worker
+    processes are recorded by their roots.
+    """
+
+    problem: Optional[Problem]
+    incumbent: Optional[Problem]
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def leaves(self) -> list[tuple[Any, int, float]]:
+        """Returns the leaves recorded so far.
+
+        Returns
+        -------
+        list[tuple[Any, int, float]]
+            Decisions, level and lower bound of each leaf, in the order
+            recorded
+        """
+        ...
+
+    def clear(self) -> None:
+        """Removes all leaves, the incumbent and the root problem."""
+        ...
@@ -0,0 +1,124 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from cython.operator cimport dereference as deref
+from libc.math cimport INFINITY
+from libcpp.unordered_map cimport unordered_map
+from libcpp.vector cimport vector
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.problem cimport Problem
+
+
+@cython.final
+cdef class FrontierRecorder:
+    """Leaves of a search tree, from which a modified version of its
+    problem can be solved by
+    :meth:`~bnbpy.cython.search.BranchAndBound.reoptimize`.
+
+    Assigned as ``frontier`` of a search, it keeps the level, lower
+    bound and :meth:`~bnbpy.cython.problem.Problem.decisions` of every
+    node that was not branched: open nodes, whether explored later or
+    not, as well as pruned, infeasible and solution nodes. As branching
+    partitions the solutions of a node among its children, these leaves
+    partition the solutions of the root ``problem``, even when the
+    search is interrupted. The best solution recorded is kept as
+    ``incumbent``.
+
+    Leaves take the size of their decisions and about 20 bytes, and
+    subproblems are not kept alive. Leaves must be recorded from the
+    start: those of a search restored from a checkpoint do not cover
+    the nodes pruned before it was saved. Subtrees solved by worker
+    processes are recorded by their roots.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._decisions) - self._branched
+
+    def __repr__(self) -> str:
+        return f'FrontierRecorder(leaves={len(self)})'
+
+    cdef void start(FrontierRecorder self, Problem problem):
+        self.clear()
+        self.problem = problem
+
+    cdef void open(FrontierRecorder self, Node node):
+        # Nodes opened again (e.g. by load_frontier) keep their slot
+        if self._open.count(node._sort_index):
+            self._lbs[self._open[node._sort_index]] = node.lb
+            return
+        self._open[node._sort_index] = len(self._decisions)
+        self.add_leaf(node.problem.decisions(), node.level, node.lb)
+
+    cdef void close(FrontierRecorder self, Node node):
+        # Pruned nodes are leaves for good, with their final bound
+        cdef:
+            unordered_map[long long, Py_ssize_t].iterator it
+
+        it = self._open.find(node._sort_index)
+        if it == self._open.end():
+            self.add_leaf(node.problem.decisions(), node.level, node.lb)
+            return
+        self._lbs[deref(it).second] = node.lb
+        self._open.erase(it)
+
+    cdef void remove(FrontierRecorder self, Node node):
+        cdef:
+            unordered_map[long long, Py_ssize_t].iterator it
+            Py_ssize_t slot
+
+        it = self._open.find(node._sort_index)
+        if it == self._open.end():
+            return
+        slot = deref(it).second
+        self._open.erase(it)
+        self._decisions[slot] = None
+        self._branched += 1
+
+    cdef void add_solution(FrontierRecorder self, Node node):
+        self.close(node)
+        if node.lb < self._incumbent_lb:
+            self._incumbent_lb = node.lb
+            self.incumbent = node.problem
+
+    cdef void add_leaf(
+        FrontierRecorder self, object decisions, int level, double lb
+    ):
+        self._decisions.append(decisions)
+        self._levels.push_back(level)
+        self._lbs.push_back(lb)
+
+    cpdef list leaves(self):
+        """Returns the leaves recorded so far.
+
+        Returns
+        -------
+        list[tuple[Any, int, float]]
+            Decisions, level and lower bound of each leaf, in the order
+            recorded
+        """
+        cdef:
+            Py_ssize_t i
+            object decisions
+            list out = []
+
+        for i in range(len(self._decisions)):
+            decisions = self._decisions[i]
+            if decisions is not None:
+                out.append((decisions, self._levels[i], self._lbs[i]))
+        return out
+
+    cpdef void clear(self):
+        """Removes all leaves, the incumbent and the root problem."""
+        self._decisions = []
+        self._levels.clear()
+        self._lbs.clear()
+        self._branched = 0
+        self._open.clear()
+        self._incumbent_lb = INFINITY
+        self.problem = None
+        self.incumbent = None
@@ -6,7 +6,7 @@ from libcpp.vector cimport vector
 
 from bnbpy.cython.manager cimport BaseNodeManager
 from bnbpy.cython.node cimport Node
-from bnbpy.cython.nodequeue cimport NodePriQueueWrapper
+from bnbpy.cython.nodequeue cimport NodePriQueueWrapper, PriorityKey
 
 
 cdef class LevelQueue:
@@ -19,6 +19,9 @@ cdef class LevelQueue:
         int level
         NodePriQueueWrapper pq
 
+    cdef:
+        bool native_key
+
     cpdef int size(self)
 
     cpdef void push(self, Node node)
@@ -29,6 +32,8 @@ cdef class LevelQueue:
 
     cpdef vector[double] make_priority(self, Node node)
 
+    cdef PriorityKey make_key(self, Node node)
+
 
 cdef class LevelManagerInterface(BaseNodeManager):
     """Abstract base class for level-based node managers.
@@ -86,3 +91,28 @@ cdef class DfsPriority(LevelManagerInterface):
     """
 
     cpdef LevelQueue new_level(self, int level)
+
+
+cdef class BeamSearch(LevelManagerInterface):
+    """Width-bounded beam search node manager.
+
+    Explores tree levels in order, dequeuing at most *width* nodes
+    (those of lowest lb) from each level and dropping the others.
+    """
+
+    cdef readonly:
+        int width
+
+    cdef:
+        vector[int] _popped
+        int _cursor
+
+    cpdef LevelQueue new_level(self, int level)
+
+    cpdef void _enqueue(self, Node node)
+
+    cpdef Node _dequeue(self)
+
+    cpdef void _clear(self)
+
+    cdef void _truncate(self, LevelQueue level, int keep)
@@ -132,3 +132,29 @@ class DfsPriority(LevelManagerInterface[P]):
 
     def __init__(self) -> None: ...
     def new_level(self, level: int) -> LevelQueue[P]: ...
+
+class BeamSearch(LevelManagerInterface[P]):
+    """Width-bounded beam search.
+
+    Explores tree levels in order, dequeuing at most *width* nodes from
+    each level, those of lowest lb, and dropping the others.  Levels
+    hold at most ``2 * width`` nodes: a full level is truncated to the
+    best nodes left in its beam before a new node is added, so memory
+    stays flat however large the tree.
+
+    Good incumbents are found after about ``width * depth`` nodes, but
+    the search is not exhaustive: the smallest lb among dropped nodes
+    is kept as ``dropped_lb``, below which optimality is not claimed.
+    Nodes should be evaluated as they are enqueued (``eval_node='in'``)
+    so that the beam is chosen by their own bounds.
+
+    Parameters
+    ----------
+    width : int, optional
+        Maximum number of nodes dequeued per level, by default 100
+    """
+
+    width: int
+
+    def __init__(self, width: int = 100) -> None: ...
+    def new_level(self, level: int) -> LevelQueue[P]: ...
@@ -3,12 +3,17 @@
 
 import logging
 
+from libc.limits cimport INT_MAX
 from libcpp cimport bool
 from libcpp.vector cimport vector
 
 from bnbpy.cython.manager cimport BaseNodeManager
 from bnbpy.cython.node cimport Node
-from bnbpy.cython.nodequeue cimport NodePriQueueWrapper
+from bnbpy.cython.nodequeue cimport (
+    NodePriQueueWrapper,
+    PriorityKey,
+    native_priority,
+)
 
 log = logging.getLogger(__name__)
 
@@ -27,6 +32,9 @@ cdef class LevelQueue:
 
     The ordering key for each node is produced by :meth:`make_priority`;
     subclasses override this to customise the intra-level priority.
+    Native subclasses may also override :meth:`make_key` to fill the
+    inline key of the heap directly, setting ``native_key`` as
+    :class:`LevelQueue` does for its default priority.
     """
 
     @classmethod
@@ -34,6 +42,10 @@ cdef class LevelQueue:
         """Support generic syntax LevelQueue[P] at runtime."""
         return cls
 
+    def __cinit__(self, *args, **kwargs):
+        # Subclasses overriding make_priority keep using it
+        self.native_key = native_priority(self, LevelQueue)
+
     def __init__(self, int level):
         self.level = level
         self.next = self
@@ -48,7 +60,10 @@ cdef class LevelQueue:
         return <int>self.pq.size()
 
     cpdef void push(self, Node node):
-        self.pq.push(node, self.make_priority(node))
+        if self.native_key:
+            self.pq.push_key(node, self.make_key(node))
+        else:
+            self.pq.push(node, self.make_priority(node))
         # Possibly reactivating this level in forward checks
         # if self.pq.size() == 1:
         #     self.prev.next = self
@@ -86,6 +101,15 @@ cdef class LevelQueue:
         pri[2] = -node.get_index()
         return pri
 
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = node.lb
+        key.v[1] = -node.level
+        key.v[2] = -node.get_index()
+        key.n = 3
+        return key
+
 
 # ---------------------------------------------------------------------------
 # LevelManagerInterface
@@ -181,6 +205,8 @@ cdef class LevelManagerInterface(BaseNodeManager):
 
     cpdef void _filter_by_lb(self, double max_lb):
         cdef LevelQueue level
+        if not self.any_lb_above(max_lb):
+            return
         for level in self.levels:
             level.filter(max_lb)
 
@@ -262,3 +288,93 @@ cdef class DfsPriority(LevelManagerInterface):
 
     cpdef LevelQueue new_level(self, int level):
         return LevelQueue(level)
+
+
+# ---------------------------------------------------------------------------
+# BeamSearch
+# ---------------------------------------------------------------------------
+
+cdef class BeamSearch(LevelManagerInterface):
+    """Width-bounded beam search.
+
+    Explores tree levels in order, dequeuing at most *width* nodes from
+    each level, those of lowest lb, and dropping the others.  Levels
+    hold at most ``2 * width`` nodes: a full level is truncated to the
+    best nodes left in its beam before a new node is added, so memory
+    stays flat however large the tree.
+
+    Good incumbents are found after about ``width * depth`` nodes, but
+    the search is not exhaustive: the smallest lb among dropped nodes
+    is kept as ``dropped_lb``, below which optimality is not claimed.
+    Nodes should be evaluated as they are enqueued (``eval_node='in'``)
+    so that the beam is chosen by their own bounds.
+
+    Parameters
+    ----------
+    width : int, optional
+        Maximum number of nodes dequeued per level, by default 100
+    """
+
+    def __init__(self, int width=100):
+        if width < 1:
+            raise ValueError('width must be positive')
+        self.width = width
+        self._cursor = 0
+        super(BeamSearch, self).__init__(max_size=INT_MAX)
+
+    cpdef LevelQueue new_level(self, int level):
+        self._popped.push_back(0)
+        return LevelQueue(level)
+
+    cpdef void _enqueue(self, Node node):
+        cdef:
+            LevelQueue level
+
+        if node.level < len(self.levels):
+            level = self.levels[node.level]
+            if level.size() >= 2 * self.width:
+                self._truncate(
+                    level, max(self.width - self._popped[node.level], 0)
+                )
+        LevelManagerInterface._enqueue(self, node)
+        if node.level < self._cursor:
+            self._cursor = node.level
+
+    cpdef Node _dequeue(self):
+        cdef:
+            LevelQueue level
+            int n = len(self.levels)
+
+        while self._cursor < n:
+            level = self.levels[self._cursor]
+            if level.size() > 0:
+                if self._popped[self._cursor] < self.width:
+                    self._popped[self._cursor] += 1
+                    self.current_level = level
+                    return level.pop()
+                # The beam of this level is complete
+                self._truncate(level, 0)
+            self._cursor += 1
+        return None
+
+    cpdef void _clear(self):
+        self._popped.clear()
+        self._cursor = 0
+        LevelManagerInterface._clear(self)
+
+    cdef void _truncate(self, LevelQueue level, int keep):
+        cdef:
+            list[Node] kept = []
+            Node node
+
+        # Lazily pruned nodes must not take places in the beam
+        if self.stale > 0:
+            self.compact()
+        while level.size() > 0:
+            node = level.pop()
+            if len(kept) < keep:
+                kept.append(node)
+            else:
+                self.drop(node)
+        for node in kept:
+            level.push(node)
@@ -1,18 +1,225 @@
 # distutils: language = c++
 # cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
 
+from cpython.ref cimport PyObject
+from libc.math cimport INFINITY
 from libcpp cimport bool
+from libcpp.vector cimport vector
 
 from bnbpy.cython.node cimport Node
 
 
+cdef extern from *:
+    """
+    #include <deque>
+    #include <functional>
+    #include <set>
+    #include <vector>
+
+    // Entry stored in the NodeDeque of LifoManager / FifoManager.
+    struct NodeDequeEntry {
+        PyObject* obj;
+        double lb;
+        NodeDequeEntry() : obj(nullptr), lb(0.0) {}
+        NodeDequeEntry(PyObject* o, double l) : obj(o), lb(l) {}
+    };
+
+    // Double-ended queue of nodes with O(1) operations at both ends.
+    // Lifetime: same rules as NodePriQueue, the deque owns one reference.
+    //   - push_back()              : Py_INCREF obj
+    //   - pop_front() / pop_back() : transfers ownership to caller
+    //   - clear()                  : Py_DECREF obj for all entries
+    //   - filter()                 : removed objs still carry their push
+    //                                INCREFs; caller must Py_DECREF them
+    struct NodeDeque {
+        std::deque<NodeDequeEntry> items;
+
+        void push_back(PyObject* obj, double lb) {
+            Py_INCREF(obj);
+            items.emplace_back(obj, lb);
+        }
+
+        // The deque must not be empty.
+        NodeDequeEntry pop_front() {
+            NodeDequeEntry entry = items.front();
+            items.pop_front();
+            return entry;
+        }
+
+        // The deque must not be empty.
+        NodeDequeEntry pop_back() {
+            NodeDequeEntry entry = items.back();
+            items.pop_back();
+            return entry;
+        }
+
+        // In-place compaction keeping the order of entries with lb < max_lb.
+        std::vector<PyObject*> filter(double max_lb) {
+            std::vector<PyObject*> removed;
+            size_t keep = 0;
+            for (size_t i = 0; i < items.size(); ++i) {
+                if (items[i].lb < max_lb) {
+                    items[keep++] = items[i];
+                } else {
+                    removed.push_back(items[i].obj);
+                }
+            }
+            items.resize(keep);
+            return removed;
+        }
+
+        void clear() {
+            std::deque<NodeDequeEntry> old;
+            old.swap(items);
+            for (const NodeDequeEntry& e : old) {
+                Py_DECREF(e.obj);
+            }
+        }
+
+        size_t size() const { return items.size(); }
+        bool empty() const { return items.empty(); }
+    };
+
+    // Entry of the lower bound index of BaseNodeManager.
+    struct LbEntry {
+        double lb;
+        PyObject* obj;
+        LbEntry() : lb(0.0), obj(nullptr) {}
+        LbEntry(double l, PyObject* o) : lb(l), obj(o) {}
+    };
+
+    // Order by lb; ties are broken by address, so each node is unique.
+    struct LbEntryLess {
+        bool operator()(const LbEntry& a, const LbEntry& b) const {
+            if (a.lb != b.lb) return a.lb < b.lb;
+            return std::less<PyObject*>()(a.obj, b.obj);
+        }
+    };
+
+    // Open nodes ordered by lower bound.
+    // Lifetime: the index owns one reference to each node.
+    //   - insert()                   : Py_INCREF obj (unless already present)
+    //   - erase() / filter() / clear(): Py_DECREF removed objs, only after
+    //                                   they left the set
+    struct LbIndex {
+        std::set<LbEntry, LbEntryLess> entries;
+
+        // O(log n)
+        void insert(PyObject* obj, double lb) {
+            if (entries.emplace(lb, obj).second) {
+                Py_INCREF(obj);
+            }
+        }
+
+        // O(log n). Returns false if obj is not indexed under lb.
+        bool erase(PyObject* obj, double lb) {
+            auto it = entries.find(LbEntry(lb, obj));
+            if (it == entries.end()) return false;
+            entries.erase(it);
+            Py_DECREF(obj);
+            return true;
+        }
+
+        // Removes entries with lb >= max_lb in O(log n + removed).
+        size_t filter(double max_lb) {
+            auto first = entries.lower_bound(LbEntry(max_lb, nullptr));
+            std::vector<PyObject*> removed;
+            for (auto it = first; it != entries.end(); ++it) {
+                removed.push_back(it->obj);
+            }
+            entries.erase(first, entries.end());
+            for (PyObject* obj : removed) {
+                Py_DECREF(obj);
+            }
+            return removed.size();
+        }
+
+        void clear() {
+            filter(-HUGE_VAL);
+            entries.clear();
+        }
+
+        // Entry with the smallest lb. The index must not be empty.
+        const LbEntry& front() const { return *entries.begin(); }
+
+        // Entry with the largest lb. The index must not be empty.
+        const LbEntry& back() const { return *entries.rbegin(); }
+
+        // Nodes sharing the smallest lb.
+        std::vector<PyObject*> min_nodes() const {
+            std::vector<PyObject*> out;
+            for (const LbEntry& e : entries) {
+                if (e.lb != entries.begin()->lb) break;
+                out.push_back(e.obj);
+            }
+            return out;
+        }
+
+        // Copy of all entries in lb order.
+        std::vector<LbEntry> items() const {
+            return std::vector<LbEntry>(entries.begin(), entries.end());
+        }
+
+        size_t size() const { return entries.size(); }
+        bool empty() const { return entries.empty(); }
+    };
+    """
+    cdef cppclass NodeDequeEntry:
+        PyObject* obj
+        double lb
+
+    cdef cppclass NodeDeque:
+        NodeDeque()
+        void push_back(PyObject* obj, double lb)
+        NodeDequeEntry pop_front()
+        NodeDequeEntry pop_back()
+        vector[PyObject*] filter(double max_lb)
+        void clear()
+        size_t size()
+        bool empty()
+
+    cdef cppclass LbEntry:
+        double lb
+        PyObject* obj
+
+    cdef cppclass LbIndex:
+        LbIndex()
+        void insert(PyObject* obj, double lb)
+        bool erase(PyObject* obj, double lb)
+        size_t filter(double max_lb)
+        void clear()
+        const LbEntry& front()
+        const LbEntry& back()
+        vector[PyObject*] min_nodes()
+        vector[LbEntry] items()
+        size_t size()
+        bool empty()
+
+
 cdef class BaseNodeManager:
 
     cdef readonly:
-        object bound_memory
-        double lb
-        set[Node] bound_nodes
         int nodecount
+        int stale
+        bool lazy
+        double stale_threshold
+        double lazy_lb
+        long long dropped
+        double dropped_lb
+
+    cdef:
+        LbIndex lb_index
+
+    cdef inline double min_lb(self):
+        if self.lb_index.empty():
+            return INFINITY
+        return self.lb_index.front().lb
+
+    cdef inline bool any_lb_above(self, double max_lb):
+        # Whether some stored node might have lb >= max_lb, in O(1)
+        if self.stale > 0:
+            return True
+        return not self.lb_index.empty() and self.lb_index.back().lb >= max_lb
 
     cdef void memorize(self, Node node)
 
@@ -22,6 +229,8 @@ cdef class BaseNodeManager:
 
     cdef void clear_memory(self)
 
+    cdef void drop(self, Node node)
+
     cpdef bool not_empty(self)
 
     cpdef int size(self)
@@ -46,11 +255,21 @@ cdef class BaseNodeManager:
 
     cpdef void filter_by_lb(self, double max_lb)
 
+    cpdef void set_lazy(self, bool lazy=*, double threshold=*)
+
+    cpdef void compact(self)
+
+    cpdef list[Node] open_nodes(self)
+
+    cpdef dict get_state(self)
+
+    cpdef void set_state(self, dict state)
+
 
 cdef class LifoManager(BaseNodeManager):
 
     cdef:
-        list[Node] stack
+        NodeDeque queue
 
     cpdef void _enqueue(self, Node node)
 
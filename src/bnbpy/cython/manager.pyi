@@ -1,4 +1,4 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from bnbpy.cython.node import Node
 from bnbpy.cython.problem import Problem
@@ -18,27 +18,80 @@ class BaseNodeManager(Generic[P]):
 
     All other public methods implement the template logic and should not be
     overridden.
+
+    Open nodes are indexed by lower bound in a C++ ordered set, so the
+    bookkeeping of enqueue / dequeue is O(log n), the global lower bound
+    is available in O(1), and filtering by a new upper bound costs
+    O(log n + removed).
+
+    In lazy pruning mode (see :meth:`set_lazy`), :meth:`filter_by_lb`
+    only removes nodes from this index.  They become *stale*: they are
+    no longer counted by :meth:`size` and are dropped when they reach
+    :meth:`dequeue`.  The underlying structure is compacted only once
+    stale nodes exceed a fraction of those stored.
+
+    Heuristic managers (e.g. beam search) may :meth:`drop` open nodes
+    that could still hold better solutions.  The smallest lower bound
+    among them is kept as ``dropped_lb``, so the search does not claim
+    optimality unless its upper bound reaches it.
     """
 
-    bound_memory: dict[float, set[Node[P]]]
-    lb: float
-    bound_nodes: set[Node[P]]
     nodecount: int
+    stale: int
+    """Number of stored nodes pruned lazily, not yet removed"""
+
+    lazy: bool
+    """Whether :meth:`filter_by_lb` prunes lazily"""
+
+    stale_threshold: float
+    """Fraction of stale nodes that triggers a compaction"""
+
+    lazy_lb: float
+    """Smallest bound given to :meth:`filter_by_lb` in lazy mode"""
+
+    dropped: int
+    """Number of open nodes discarded by :meth:`drop`"""
+
+    dropped_lb: float
+    """Smallest lower bound among dropped nodes (``inf`` if none)"""
+
+    @property
+    def lb(self) -> float:
+        """Global lower bound of the open nodes (``inf`` if empty)"""
+        ...
+
+    @property
+    def bound_nodes(self) -> set[Node[P]]:
+        """Set of open nodes whose lower bound is ``lb``"""
+        ...
+
+    @property
+    def bound_memory(self) -> dict[float, set[Node[P]]]:
+        """Snapshot of the open nodes grouped by lower bound.
+
+        Built in O(n) on each access, intended for inspection only.
+        """
+        ...
 
     def memorize(self, node: Node[P]) -> None:
-        """Record *node* in ``bound_memory``; update ``lb``/``bound_nodes``."""
+        """Index *node* by its lower bound in O(log n)."""
         ...
 
     def forget(self, node: Node[P]) -> None:
-        """Remove *node* from ``bound_memory``; recompute ``lb`` if needed."""
+        """Remove *node* from the lower bound index in O(log n)."""
         ...
 
     def filter_memory_lb(self, max_lb: float) -> None:
-        """Remove all ``bound_memory`` entries with key >= *max_lb*."""
+        """Remove indexed nodes with lb >= *max_lb* and recount nodes."""
         ...
 
     def clear_memory(self) -> None:
-        """Reset ``bound_memory``, ``lb``, and ``bound_nodes``."""
+        """Empty the lower bound index."""
+        ...
+
+    def drop(self, node: Node[P]) -> None:
+        """Discard *node*, already removed from the underlying
+        structure, without exploring it."""
         ...
 
     def size(self) -> int:
@@ -66,7 +119,7 @@ class BaseNodeManager(Generic[P]):
         ...
 
     def enqueue(self, node: Node[P]) -> None:
-        """Add *node* and record it in ``bound_memory``."""
+        """Add *node* and index its lower bound."""
         ...
 
     def enqueue_all(self, nodes: list[Node[P]]) -> None:
@@ -74,7 +127,7 @@ class BaseNodeManager(Generic[P]):
         ...
 
     def dequeue(self) -> Node[P] | None:
-        """Remove and return the next node, updating ``bound_memory``."""
+        """Remove and return the next node, updating the lb index."""
         ...
 
     def get_lower_bound(self) -> Node[P] | None:
@@ -86,11 +139,73 @@ class BaseNodeManager(Generic[P]):
         ...
 
     def filter_by_lb(self, max_lb: float) -> None:
-        """Remove nodes with lb >= *max_lb* and update ``bound_memory``."""
+        """Remove nodes with lb >= *max_lb* and update the lb index."""
+        ...
+
+    def set_lazy(self, lazy: bool = True, threshold: float = 0.5) -> None:
+        """Enables or disables lazy pruning.
+
+        Disabling it compacts the manager right away.
+
+        Parameters
+        ----------
+        lazy : bool, optional
+            Whether :meth:`filter_by_lb` prunes lazily, by default True
+
+        threshold : float, optional
+            Fraction of stale nodes among those stored above which
+            the manager is compacted, by default 0.5
+
+        Raises
+        ------
+        ValueError
+            If *threshold* is not in (0, 1].
+        """
+        ...
+
+    def compact(self) -> None:
+        """Physically removes nodes pruned lazily by :meth:`filter_by_lb`,
+        in a single pass over the underlying structure."""
+        ...
+
+    def open_nodes(self) -> list[Node[P]]:
+        """Returns the open nodes, in lower bound order, without
+        removing them.
+
+        Returns
+        -------
+        list[Node]
+            Nodes still to be explored
+        """
+        ...
+
+    def get_state(self) -> dict[str, Any]:
+        """Returns the counters describing the history of the manager,
+        which are not implied by its open nodes.
+
+        Returns
+        -------
+        dict
+            Picklable state, restored by :meth:`set_state`
+        """
+        ...
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restores counters returned by :meth:`get_state`.
+
+        Parameters
+        ----------
+        state : dict
+            State of a manager of the same type
+        """
         ...
 
 class LifoManager(BaseNodeManager[P]):
-    """Last-In First-Out (stack) node manager."""
+    """Last-In First-Out (stack) node manager.
+
+    Nodes are kept in a native double-ended queue, so enqueue and
+    dequeue are O(1), and filtering compacts it in place.
+    """
 
     def _enqueue(self, node: Node[P]) -> None: ...
     def _dequeue(self) -> Node[P] | None: ...
@@ -98,6 +213,6 @@ class LifoManager(BaseNodeManager[P]):
     def _filter_by_lb(self, max_lb: float) -> None: ...
 
 class FifoManager(LifoManager[P]):
-    """First-In First-Out (queue) node manager."""
+    """First-In First-Out (queue) node manager, with O(1) dequeue."""
 
     def _dequeue(self) -> Node[P] | None: ...
@@ -1,7 +1,7 @@
 # distutils: language = c++
 # cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
 
-from collections import defaultdict
+from cpython.ref cimport PyObject
 from libc.math cimport INFINITY
 from libcpp cimport bool
 from libcpp.vector cimport vector
@@ -10,6 +10,18 @@ from bnbpy.cython.node cimport Node
 from bnbpy.cython.problem cimport Problem
 
 
+# Raw CPython DECREF — accepts PyObject* directly
+cdef extern from "Python.h":
+    void _Py_DECREF "Py_DECREF"(PyObject* o)
+
+
+cdef inline Node _steal(PyObject* obj):
+    # Takes over the reference released by a native container
+    cdef Node node = <Node>obj
+    _Py_DECREF(obj)
+    return node
+
+
 cdef class BaseNodeManager:
     """Base class for managing active nodes in a Branch & Bound search.
 
@@ -26,13 +38,35 @@ cdef class BaseNodeManager:
     ``memorize``, ``forget``, ``filter_memory_lb``, ``clear_memory``,
     ``enqueue_all``) implement the template logic and should not be
     overridden.
+
+    Open nodes are indexed by lower bound in a C++ ordered set, so the
+    bookkeeping of enqueue / dequeue is O(log n), the global lower bound
+    is available in O(1), and filtering by a new upper bound costs
+    O(log n + removed).
+
+    In lazy pruning mode (see :meth:`set_lazy`), :meth:`filter_by_lb`
+    only removes nodes from this index.  They become *stale*: they are
+    no longer counted by :meth:`size` and are dropped when they reach
+    :meth:`dequeue`.  The underlying structure is compacted only once
+    stale nodes exceed a fraction of those stored.
+
+    Heuristic managers (e.g. beam search) may :meth:`drop` open nodes
+    that could still hold better solutions.  The smallest lower bound
+    among them is kept as ``dropped_lb``, so the search does not claim
+    optimality unless its upper bound reaches it.
     """
 
     def __cinit__(self, *args, **kwargs):
-        self.bound_memory = defaultdict(set)
-        self.lb = INFINITY
-        self.bound_nodes = set()
         self.nodecount = 0
+        self.stale = 0
+        self.lazy = False
+        self.stale_threshold = 0.5
+        self.lazy_lb = INFINITY
+        self.dropped = 0
+        self.dropped_lb = INFINITY
+
+    def __dealloc__(self):
+        self.lb_index.clear()
 
     @classmethod
     def __class_getitem__(cls, item: type[Problem]):
@@ -44,62 +78,64 @@ cdef class BaseNodeManager:
             )
         return cls
 
-    cdef void memorize(self, Node node):
-        """Record *node* in ``bound_memory`` and update ``lb`` / ``bound_nodes``."""
-        self.bound_memory[node.lb].add(node)
+    @property
+    def lb(self):
+        """Global lower bound of the open nodes (``inf`` if empty)"""
+        return self.min_lb()
 
-        if node.lb < self.lb:
-            self.lb = node.lb
-            self.bound_nodes = self.bound_memory[node.lb]
-
-    cdef void forget(self, Node node):
-        """Remove *node* from ``bound_memory``; recompute ``lb`` if needed."""
+    @property
+    def bound_nodes(self):
+        """Set of open nodes whose lower bound is ``lb``"""
         cdef:
-            set[Node] s
+            vector[PyObject*] nodes = self.lb_index.min_nodes()
+            size_t i
 
-        s = self.bound_memory[node.lb]
-        s.discard(node)
-        if not s:
-            del self.bound_memory[node.lb]
+        return {<Node>nodes[i] for i in range(nodes.size())}
 
-    cdef void filter_memory_lb(self, double max_lb):
-        """Remove all ``bound_memory`` entries with key >= *max_lb*."""
+    @property
+    def bound_memory(self):
+        """Snapshot of the open nodes grouped by lower bound.
+
+        Built in O(n) on each access, intended for inspection only.
+        """
         cdef:
-            vector[double] keys_to_remove
-            double lb_key
-            double min_key
-            int i, n
-            set[Node] s
-
-        min_key = INFINITY
-        keys_to_remove = vector[double]()
-        keys_to_remove.reserve(len(self.bound_memory))
-        for lb_key in self.bound_memory:
-            if lb_key < min_key:
-                min_key = lb_key
-            if lb_key >= max_lb:
-                keys_to_remove.push_back(lb_key)
-
-        for i in range(keys_to_remove.size()):
-            del self.bound_memory[keys_to_remove[i]]
-
-        if min_key < max_lb:
-            self.lb = min_key
-            self.bound_nodes = self.bound_memory[min_key]
-        else:
-            self.lb = INFINITY
-            self.bound_nodes = set()
+            vector[LbEntry] entries = self.lb_index.items()
+            size_t i
+            dict memory = {}
 
-        n = 0
-        for s in self.bound_memory.values():
-            n += len(s)
-        self.nodecount = n
+        for i in range(entries.size()):
+            memory.setdefault(entries[i].lb, set()).add(<Node>entries[i].obj)
+        return memory
+
+    cdef void memorize(self, Node node):
+        """Index *node* by its lower bound in O(log n)."""
+        self.lb_index.insert(<PyObject*>node, node.lb)
+
+    cdef void forget(self, Node node):
+        """Remove *node* from the lower bound index in O(log n)."""
+        self.lb_index.erase(<PyObject*>node, node.lb)
+
+    cdef void filter_memory_lb(self, double max_lb):
+        """Remove indexed nodes with lb >= *max_lb* and recount nodes."""
+        self.lb_index.filter(max_lb)
+        self.nodecount = <int>self.lb_index.size()
 
     cdef void clear_memory(self):
-        """Reset ``bound_memory``, ``lb``, and ``bound_nodes``."""
-        self.bound_memory.clear()
-        self.lb = INFINITY
-        self.bound_nodes = set()
+        """Empty the lower bound index."""
+        self.lb_index.clear()
+
+    cdef void drop(self, Node node):
+        """Discard *node*, already removed from the underlying
+        structure, without exploring it."""
+        if self.lb_index.erase(<PyObject*>node, node.lb):
+            self.nodecount -= 1
+            self.dropped += 1
+            if node.lb < self.dropped_lb:
+                self.dropped_lb = node.lb
+        else:
+            # Lazily pruned by a former filter_by_lb
+            self.stale -= 1
+        node.cleanup()
 
     cpdef int size(self):
         """Returns the number of nodes in the manager.
@@ -150,7 +186,7 @@ cdef class BaseNodeManager:
         raise NotImplementedError("Must implement _clear()")
 
     cpdef void enqueue(self, Node node):
-        """Adds a node to the manager and records it in ``bound_memory``.
+        """Adds a node to the manager and indexes its lower bound.
 
         Parameters
         ----------
@@ -175,7 +211,7 @@ cdef class BaseNodeManager:
             self.enqueue(node)
 
     cpdef Node dequeue(self):
-        """Removes and returns the next node, updating ``bound_memory``.
+        """Removes and returns the next node, updating the lb index.
 
         Returns
         -------
@@ -185,6 +221,14 @@ cdef class BaseNodeManager:
         cdef:
             Node node
         node = self._dequeue()
+        while node is not None and self.stale > 0:
+            if self.lb_index.erase(<PyObject*>node, node.lb):
+                self.nodecount -= 1
+                return node
+            # Not indexed: lazily pruned by a former filter_by_lb
+            self.stale -= 1
+            node.cleanup()
+            node = self._dequeue()
         if node is not None:
             self.forget(node)
             self.nodecount -= 1
@@ -198,28 +242,22 @@ cdef class BaseNodeManager:
         Node
             A node with the lowest lower bound, or ``None`` if empty.
         """
-        cdef:
-            Node node
-
-        # If bound notes are updated
-        for node in self.bound_nodes:
-            return node
-        # Clear out any stale bound_memory entries
-        # and update lb / bound_nodes accordingly
-        self.filter_memory_lb(INFINITY)
-        for node in self.bound_nodes:
-            return node
-        # Last resort: no bound nodes, so return None
-        return None
+        if self.lb_index.empty():
+            return None
+        return <Node>self.lb_index.front().obj
 
     cpdef void clear(self):
         """Makes the manager empty."""
         self._clear()
         self.clear_memory()
         self.nodecount = 0
+        self.stale = 0
+        self.lazy_lb = INFINITY
+        self.dropped = 0
+        self.dropped_lb = INFINITY
 
     cpdef void filter_by_lb(self, double max_lb):
-        """Remove nodes with lb >= *max_lb* and update ``bound_memory``.
+        """Remove nodes with lb >= *max_lb* and update the lb index.
 
         Parameters
         ----------
@@ -227,11 +265,96 @@ cdef class BaseNodeManager:
             The maximum lower bound value (exclusive upper bound).
         """
         cdef:
-            int n
-            set[Node] s
+            size_t removed
+
+        if not self.lazy:
+            self._filter_by_lb(max_lb)
+            self.filter_memory_lb(max_lb)
+            return
+        if max_lb < self.lazy_lb:
+            self.lazy_lb = max_lb
+        removed = self.lb_index.filter(max_lb)
+        self.nodecount -= <int>removed
+        self.stale += <int>removed
+        if self.stale > self.stale_threshold * (self.nodecount + self.stale):
+            self.compact()
 
-        self._filter_by_lb(max_lb)
-        self.filter_memory_lb(max_lb)
+    cpdef void set_lazy(self, bool lazy=True, double threshold=0.5):
+        """Enables or disables lazy pruning.
+
+        Disabling it compacts the manager right away.
+
+        Parameters
+        ----------
+        lazy : bool, optional
+            Whether :meth:`filter_by_lb` prunes lazily, by default True
+
+        threshold : float, optional
+            Fraction of stale nodes among those stored above which
+            the manager is compacted, by default 0.5
+
+        Raises
+        ------
+        ValueError
+            If *threshold* is not in (0, 1].
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError('threshold must be in (0, 1]')
+        self.stale_threshold = threshold
+        self.lazy = lazy
+        if not lazy:
+            self.compact()
+            self.lazy_lb = INFINITY
+
+    cpdef void compact(self):
+        """Physically removes nodes pruned lazily by :meth:`filter_by_lb`,
+        in a single pass over the underlying structure."""
+        if self.stale == 0:
+            return
+        self._filter_by_lb(self.lazy_lb)
+        self.filter_memory_lb(self.lazy_lb)
+        self.stale = 0
+
+    cpdef list[Node] open_nodes(self):
+        """Returns the open nodes, in lower bound order, without
+        removing them.
+
+        Returns
+        -------
+        list[Node]
+            Nodes still to be explored
+        """
+        cdef:
+            vector[LbEntry] entries = self.lb_index.items()
+            size_t i
+            list[Node] nodes
+
+        nodes = [None] * entries.size()
+        for i in range(entries.size()):
+            nodes[i] = <Node>entries[i].obj
+        return nodes
+
+    cpdef dict get_state(self):
+        """Returns the counters describing the history of the manager,
+        which are not implied by its open nodes.
+
+        Returns
+        -------
+        dict
+            Picklable state, restored by :meth:`set_state`
+        """
+        return {'dropped': self.dropped, 'dropped_lb': self.dropped_lb}
+
+    cpdef void set_state(self, dict state):
+        """Restores counters returned by :meth:`get_state`.
+
+        Parameters
+        ----------
+        state : dict
+            State of a manager of the same type
+        """
+        self.dropped = state.get('dropped', 0)
+        self.dropped_lb = state.get('dropped_lb', INFINITY)
 
 
 cdef class LifoManager(BaseNodeManager):
@@ -239,47 +362,48 @@ cdef class LifoManager(BaseNodeManager):
 
     :meth:`dequeue` returns the most recently enqueued node.
     :meth:`get_lower_bound` returns a node with the minimum ``lb`` in O(1)
-    via the inherited ``bound_memory`` mechanism.
+    via the inherited lower bound index.
+
+    Nodes are kept in a native double-ended queue, so enqueue and
+    dequeue are O(1), and filtering compacts it in place.
     """
 
-    def __cinit__(self, *args, **kwargs):
-        self.stack = []
+    def __dealloc__(self):
+        self.queue.clear()
 
     cpdef void _enqueue(self, Node node):
-        self.stack.append(node)
+        self.queue.push_back(<PyObject*>node, node.lb)
 
     cpdef Node _dequeue(self):
-        if self.nodecount > 0:
-            return self.stack.pop()
-        return None
+        if self.queue.empty():
+            return None
+        return _steal(self.queue.pop_back().obj)
 
     cpdef void _clear(self):
-        self.stack.clear()
+        self.queue.clear()
 
     cpdef void _filter_by_lb(self, double max_lb):
         cdef:
-            int i, j
+            vector[PyObject*] removed
+            size_t i
             Node node
 
-        j = 0
-        for i in range(len(self.stack)):
-            node = self.stack[i]
-            if node.lb < max_lb:
-                self.stack[j] = node
-                j += 1
-            else:
-                node.cleanup()
-        self.stack = self.stack[:j]
+        if not self.any_lb_above(max_lb):
+            return
+        removed = self.queue.filter(max_lb)
+        for i in range(removed.size()):
+            node = _steal(removed[i])
+            node.cleanup()
 
 
 cdef class FifoManager(LifoManager):
     """First-In First-Out (queue) node manager.
 
     Identical to :class:`LifoManager` except that :meth:`dequeue` returns
-    the **oldest** enqueued node (``pop(0)``).
+    the **oldest** enqueued node, also in O(1).
     """
 
     cpdef Node _dequeue(self):
-        if self.nodecount > 0:
-            return self.stack.pop(0)
-        return None
+        if self.queue.empty():
+            return None
+        return _steal(self.queue.pop_front().obj)
@@ -6,7 +6,6 @@ from libcpp cimport bool
 
 import copy
 
-from bnbpy.cython.counter cimport Counter
 from bnbpy.cython.problem cimport Problem, P
 from bnbpy.cython.solution cimport Solution
 
@@ -18,23 +17,24 @@ cdef class Node:
         Problem problem
         Node parent
         int level
+        int rank
         double lb
         list[Node] children
-        int _sort_index
-
-    cdef:
-        Counter _counter
+        long long _sort_index
+        long long _parent_index
 
     cpdef void cleanup(self)
 
     cdef inline Solution get_solution(self):
         return self.problem.solution
 
-    cdef inline int get_index(self):
+    cdef inline long long get_index(self):
         return self._sort_index
 
     cpdef void compute_bound(self)
 
+    cpdef void compute_bound_batch(self, list[Node] children)
+
     cpdef bool check_feasible(self)
 
     cpdef void set_solution(self, Solution solution)
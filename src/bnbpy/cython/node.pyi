@@ -1,4 +1,4 @@
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
 from bnbpy.cython.problem import Problem
 from bnbpy.cython.solution import Solution
@@ -6,14 +6,23 @@ from bnbpy.cython.solution import Solution
 P = TypeVar('P', bound=Problem)
 
 class Node(Generic[P]):
-    """Class for representing a node in a search tree."""
+    """Class for representing a node in a search tree.
+
+    Children created by :meth:`branch` are only linked to their
+    `parent` by :meth:`save_children`, i.e., when the search keeps
+    the tree (``save_tree=True``). Their `rank` is their position
+    among the subproblems returned by `Problem.branch`, and 0 for
+    other nodes.
+    """
 
     problem: P
     parent: Optional['Node[P]']
     level: int
+    rank: int
     lb: float
     children: Optional[list['Node[P]']]
     _sort_index: int
+    _parent_index: int
 
     def __init__(self, problem: P, parent: 'Optional[Node[P]]' = None) -> None:
         """Instantiates a new `Node` object based on a (sub)problem.
@@ -31,16 +40,33 @@ class Node(Generic[P]):
 
     def __del__(self) -> None: ...
     def __lt__(self, other: 'Node[P]') -> bool: ...
+    def __reduce__(self) -> tuple[Any, ...]: ...
     @property
     def solution(self) -> Solution: ...
     @property
     def index(self) -> int: ...
+    @property
+    def parent_index(self) -> int:
+        """Index of the node this one was branched from, or 0 for
+        roots. Unlike `parent`, it is kept when the tree is not."""
+        ...
     def compute_bound(self) -> None:
         """Computes the lower bound of the problem and sets it to
         problem attribute `lb`, which is referenced as a `Node` property.
         """
         ...
 
+    def compute_bound_batch(self, children: list['Node[P]']) -> None:
+        """Computes the lower bounds of child nodes at once via
+        `problem` `compute_bound_batch()`.
+
+        Parameters
+        ----------
+        children : list[Node]
+            Child nodes of this node
+        """
+        ...
+
     def check_feasible(self) -> bool:
         """Calls `problem` `check_feasible()` method
 
@@ -82,7 +108,8 @@ class Node(Generic[P]):
 
     def save_children(self, children: list['Node[P]']) -> None:
         """Saves the list of child nodes to the
-        `children` attribute of the node.
+        `children` attribute of the node and links them back to it
+        as their `parent`.
 
         Parameters
         ----------
@@ -7,7 +7,6 @@ from libcpp cimport bool
 
 import copy
 
-from bnbpy.cython.counter cimport Counter
 from bnbpy.cython.problem cimport Problem, P
 from bnbpy.cython.solution cimport Solution
 
@@ -15,11 +14,27 @@ from bnbpy.cython.solution cimport Solution
 cdef:
     double LARGE_POS = INFINITY
     double LOW_NEG = -INFINITY
+    # Creation order of nodes, shared by all trees in the process
+    long long NODE_COUNT = 0
+
+
+cdef inline long long next_index() noexcept:
+    global NODE_COUNT
+    NODE_COUNT += 1
+    return NODE_COUNT
 
 
 @cython.final
+@cython.freelist(1024)
 cdef class Node:
-    """Class for representing a node in a search tree."""
+    """Class for representing a node in a search tree.
+
+    Children created by :meth:`branch` are only linked to their
+    `parent` by :meth:`save_children`, i.e., when the search keeps
+    the tree (``save_tree=True``). Their `rank` is their position
+    among the subproblems returned by `Problem.branch`, and 0 for
+    other nodes.
+    """
 
     def __init__(
         self, Problem problem, Node parent=None
@@ -39,15 +54,16 @@ cdef class Node:
         self.problem = problem
         self.parent = parent
         self.children = None
+        self.rank = 0
         if parent is None:
-            self._counter = Counter()
             self.level = 0
             self.lb = self.problem.get_lb()
+            self._parent_index = 0
         else:
-            self._counter = self.parent._counter
             self.lb = self.parent.lb
             self.level = parent.level + 1
-        self._sort_index = self._counter.next()
+            self._parent_index = parent._sort_index
+        self._sort_index = next_index()
 
     cpdef void cleanup(self):
         cdef:
@@ -69,6 +85,13 @@ cdef class Node:
     def __hash__(self):
         return id(self)
 
+    def __reduce__(self):
+        # Nodes are pickled detached from the tree: parent, children
+        # and index are process-local and not serialised
+        return (
+            _rebuild_node, (self.problem, self.level, self.lb, self.rank)
+        )
+
     @classmethod
     def __class_getitem__(cls, item: type[Problem]):
         """Support generic syntax Node[P] at runtime."""
@@ -87,6 +110,12 @@ cdef class Node:
     def index(self):
         return self._sort_index
 
+    @property
+    def parent_index(self):
+        """Index of the node this one was branched from, or 0 for
+        roots. Unlike `parent`, it is kept when the tree is not."""
+        return self._parent_index
+
     cpdef void compute_bound(self):
         """Computes the lower bound of the problem and sets it to
         problem attribute `lb`, which is referenced as a `Node` property.
@@ -94,6 +123,28 @@ cdef class Node:
         self.problem.compute_bound()
         self.lb = max(self.lb, self.problem.get_lb())
 
+    cpdef void compute_bound_batch(self, list[Node] children):
+        """Computes the lower bounds of child nodes at once via
+        `problem` `compute_bound_batch()`.
+
+        Parameters
+        ----------
+        children : list[Node]
+            Child nodes of this node
+        """
+        cdef:
+            int i
+            Node child
+            list[Problem] problems
+
+        problems = [None] * len(children)
+        for i in range(len(children)):
+            child = children[i]
+            problems[i] = child.problem
+        self.problem.compute_bound_batch(problems)
+        for child in children:
+            child.lb = max(child.lb, child.problem.get_lb())
+
     cpdef bool check_feasible(self):
         """Calls `problem` `check_feasible()` method
 
@@ -137,6 +188,7 @@ cdef class Node:
             Problem prob_child
             list[Problem] prob_children
             list[Node] children
+            Node child
 
         prob_children = self.problem.branch()
         if prob_children is None:
@@ -145,18 +197,27 @@ cdef class Node:
         children = [None] * len(prob_children)
         for i in range(len(prob_children)):
             prob_child = prob_children[i]
-            children[i] = self.child_problem(prob_child)
+            child = self.child_problem(prob_child)
+            child.rank = i
+            children[i] = child
         return children
 
     cpdef void save_children(self, list[Node] children):
-        """Saves the list of child nodes to `children` attribute of the node.
+        """Saves the list of child nodes to `children` attribute of the node
+        and links them back to it as their `parent`.
 
         Parameters
         ----------
         children : list[Node]
             List of child nodes to save
         """
+        cdef:
+            Node child
+
         self.children = children
+        if children:
+            for child in children:
+                child.parent = self
 
     cpdef Node primal_heuristic(self):
         """Calls `problem` `primal_heuristic()`
@@ -205,14 +266,17 @@ cdef class Node:
     cdef Node child_problem(self, P problem):
         cdef:
             Node other
+        # The parent is only linked by save_children(), so nodes of
+        # searches that do not keep the tree are freed as they are done
         other = Node.__new__(Node)
         other.problem = problem
-        other.parent = self
+        other.parent = None
         other.children = None
-        other._counter = self._counter
         other.lb = self.lb
         other.level = self.level + 1
-        other._sort_index = other._counter.next()
+        other.rank = 0
+        other._sort_index = next_index()
+        other._parent_index = self._sort_index
         return other
 
     cdef Node shallow_copy(self):
@@ -222,10 +286,11 @@ cdef class Node:
         other.problem = self.problem
         other.parent = self
         other.children = None
-        other._counter = self._counter
         other.lb = self.lb
         other.level = self.level + 1
-        other._sort_index = other._counter.next()
+        other.rank = 0
+        other._sort_index = next_index()
+        other._parent_index = self._sort_index
         return other
 
 
@@ -236,13 +301,29 @@ cdef Node init_node(P problem, Node parent=None):
     node.problem = problem
     node.parent = parent
     node.children = None
+    node.rank = 0
     if parent is None:
-        node._counter = Counter()
         node.level = 0
         node.lb = node.problem.get_lb()
+        node._parent_index = 0
     else:
-        node._counter = parent._counter
         node.lb = parent.lb
         node.level = parent.level + 1
-    node._sort_index = node._counter.next()
+        node._parent_index = parent._sort_index
+    node._sort_index = next_index()
+    return node
+
+
+def _rebuild_node(Problem problem, int level, double lb, int rank=0):
+    cdef:
+        Node node
+    node = Node.__new__(Node)
+    node.problem = problem
+    node.parent = None
+    node.children = None
+    node.level = level
+    node.rank = rank
+    node.lb = lb
+    node._sort_index = next_index()
+    node._parent_index = 0
     return node
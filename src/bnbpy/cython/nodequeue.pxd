@@ -3,6 +3,7 @@
 
 cimport cython
 from cpython.ref cimport PyObject
+from libc.stdint cimport uint32_t
 from libcpp cimport bool
 from libcpp.vector cimport vector
 
@@ -12,10 +13,75 @@ from bnbpy.cython.node cimport Node
 
 cdef extern from *:
     """
-    #include <vector>
     #include <algorithm>
+    #include <cstdint>
+    #include <memory>
+    #include <vector>
+
+    // Fixed-width priority key compared lexicographically.
+    // The first WIDTH values are stored inline, so keys of the built-in
+    // managers never allocate and a heap entry fits in 64 bytes; longer
+    // priorities keep the remainder in `rest`, which is null otherwise.
+    struct PriorityKey {
+        static constexpr size_t WIDTH = 4;
+        double v[WIDTH];
+        uint32_t n;
+        std::unique_ptr<std::vector<double>> rest;
+
+        PriorityKey() : v{0.0, 0.0, 0.0, 0.0}, n(0), rest() {}
 
-    // POD entry stored in the C++ heap for NodePriQueue.
+        explicit PriorityKey(const std::vector<double>& p)
+            : v{0.0, 0.0, 0.0, 0.0}, n(static_cast<uint32_t>(p.size())), rest() {
+            size_t k = std::min(p.size(), WIDTH);
+            std::copy(p.begin(), p.begin() + k, v);
+            if (p.size() > WIDTH) {
+                rest.reset(new std::vector<double>(p.begin() + WIDTH, p.end()));
+            }
+        }
+
+        PriorityKey(const PriorityKey& other)
+            : n(other.n),
+              rest(other.rest ? new std::vector<double>(*other.rest) : nullptr) {
+            std::copy(other.v, other.v + WIDTH, v);
+        }
+
+        PriorityKey(PriorityKey&& other) noexcept = default;
+        PriorityKey& operator=(PriorityKey&& other) noexcept = default;
+
+        PriorityKey& operator=(const PriorityKey& other) {
+            if (this != &other) {
+                PriorityKey tmp(other);
+                *this = std::move(tmp);
+            }
+            return *this;
+        }
+
+        std::vector<double> to_vector() const {
+            std::vector<double> out(v, v + std::min(static_cast<size_t>(n), WIDTH));
+            if (rest) out.insert(out.end(), rest->begin(), rest->end());
+            return out;
+        }
+    };
+
+    // Same ordering as std::vector<double>::operator<: element-wise,
+    // then the shorter key first.
+    static inline bool priority_less(const PriorityKey& a, const PriorityKey& b) {
+        size_t m = std::min(a.n, b.n);
+        size_t k = std::min(m, PriorityKey::WIDTH);
+        for (size_t i = 0; i < k; ++i) {
+            if (a.v[i] < b.v[i]) return true;
+            if (b.v[i] < a.v[i]) return false;
+        }
+        for (size_t i = PriorityKey::WIDTH; i < m; ++i) {
+            double x = (*a.rest)[i - PriorityKey::WIDTH];
+            double y = (*b.rest)[i - PriorityKey::WIDTH];
+            if (x < y) return true;
+            if (y < x) return false;
+        }
+        return a.n < b.n;
+    }
+
+    // Entry stored in the C++ heap for NodePriQueue.
     // Lifetime: C++ heap owns one reference to obj.
     //   - push()              : Py_INCREF obj
     //   - pop() / pop_min_bound(): transfers ownership to caller (no DECREF)
@@ -23,17 +89,17 @@ cdef extern from *:
     struct NodePriEntry {
         PyObject* obj;
         double lb;
-        std::vector<double> priority;
+        PriorityKey priority;
         NodePriEntry() : obj(nullptr), lb(0.0), priority() {}
-        NodePriEntry(PyObject* o, double l, const std::vector<double>& p) : obj(o), lb(l), priority(p) {}
+        NodePriEntry(PyObject* o, double l, const PriorityKey& p) : obj(o), lb(l), priority(p) {}
     };
 
-    // Comparator: min-heap over vector<double> priorities.
-    // C++ max-heap; a < b  <=>  a.priority > b.priority makes the smallest
+    // Comparator: min-heap over lexicographic priorities.
+    // C++ max-heap; a < b  <=>  b.priority < a.priority makes the smallest
     // priority bubble to the top.
     struct NodePriEntryLess {
         bool operator()(const NodePriEntry& a, const NodePriEntry& b) const {
-            return a.priority > b.priority;
+            return priority_less(b.priority, a.priority);
         }
     };
 
@@ -45,7 +111,7 @@ cdef extern from *:
 
         // Push: C++ takes ownership (INCREFs obj).
         // Capacity grows by RESERVE_BLOCK to amortise reallocations.
-        void push(PyObject* obj, double lb, const std::vector<double>& priority) {
+        void push_key(PyObject* obj, double lb, const PriorityKey& priority) {
             if (heap.size() == heap.capacity()) {
                 heap.reserve(heap.capacity() + RESERVE_BLOCK);
             }
@@ -54,12 +120,16 @@ cdef extern from *:
             std::push_heap(heap.begin(), heap.end(), cmp);
         }
 
+        void push(PyObject* obj, double lb, const std::vector<double>& priority) {
+            push_key(obj, lb, PriorityKey(priority));
+        }
+
         // Pop: transfers ownership to caller.
         // Shrinks capacity when it exceeds 2x new size by more than
         // RESERVE_BLOCK to prevent unbounded memory retention.
         NodePriEntry pop() {
             std::pop_heap(heap.begin(), heap.end(), cmp);
-            NodePriEntry entry = heap.back();
+            NodePriEntry entry = std::move(heap.back());
             heap.pop_back();
             size_t sz = heap.size();
             if (heap.capacity() > 2 * sz + RESERVE_BLOCK) {
@@ -70,14 +140,16 @@ cdef extern from *:
         }
 
         // pop_min_bound: transfers ownership to caller.
-        // Same capacity-shrink policy as pop().
+        // Same capacity-shrink policy as pop().  O(n): scans for the
+        // minimum lb and rebuilds the heap; NodeDualQueue indexes lbs
+        // to do it in O(log n).
         NodePriEntry pop_min_bound() {
             size_t best = 0;
             for (size_t i = 1; i < heap.size(); ++i) {
                 if (heap[i].lb < heap[best].lb) best = i;
             }
-            NodePriEntry entry = heap[best];
-            heap[best] = heap.back();
+            NodePriEntry entry = std::move(heap[best]);
+            heap[best] = std::move(heap.back());
             heap.pop_back();
             if (!heap.empty()) {
                 std::make_heap(heap.begin(), heap.end(), cmp);
@@ -106,9 +178,10 @@ cdef extern from *:
             size_t keep = 0;
             for (size_t i = 0; i < heap.size(); ++i) {
                 if (heap[i].lb < max_lb) {
-                    heap[keep++] = heap[i];
+                    if (keep != i) heap[keep] = std::move(heap[i]);
+                    ++keep;
                 } else {
-                    removed.push_back(heap[i]);
+                    removed.push_back(std::move(heap[i]));
                 }
             }
             heap.resize(keep);
@@ -118,28 +191,237 @@ cdef extern from *:
             return removed;
         }
 
+        // Entry with the smallest priority, without removing it.
+        // The heap must not be empty.
+        const NodePriEntry& top() const { return heap.front(); }
+
         size_t size() const { return heap.size(); }
         bool empty() const { return heap.empty(); }
     };
+
+    // Entry of NodeDualQueue, with its positions in both heaps.
+    struct NodeDualEntry {
+        PyObject* obj;
+        double lb;
+        PriorityKey priority;
+        size_t pri_pos;
+        size_t lb_pos;
+        NodeDualEntry() : obj(nullptr), lb(0.0), priority(), pri_pos(0), lb_pos(0) {}
+    };
+
+    // Indexed dual heap: entries live in a slab of slots, ordered by two
+    // binary min-heaps of slot ids, one by priority and one by lb (ties
+    // by priority).  Each entry knows its position in both heaps, so
+    // removing the top of either heap also removes the entry from the
+    // other in O(log n).
+    // Lifetime: same rules as NodePriQueue, the slab owns one reference.
+    struct NodeDualQueue {
+        std::vector<NodeDualEntry> slots;
+        std::vector<size_t> free_slots;
+        std::vector<size_t> pri_heap;
+        std::vector<size_t> lb_heap;
+
+        bool pri_less(size_t a, size_t b) const {
+            return priority_less(slots[a].priority, slots[b].priority);
+        }
+
+        bool lb_less(size_t a, size_t b) const {
+            if (slots[a].lb != slots[b].lb) return slots[a].lb < slots[b].lb;
+            return priority_less(slots[a].priority, slots[b].priority);
+        }
+
+        bool less(bool by_lb, size_t a, size_t b) const {
+            return by_lb ? lb_less(a, b) : pri_less(a, b);
+        }
+
+        void place(bool by_lb, std::vector<size_t>& h, size_t i, size_t slot) {
+            h[i] = slot;
+            if (by_lb) slots[slot].lb_pos = i;
+            else slots[slot].pri_pos = i;
+        }
+
+        void sift_up(bool by_lb, std::vector<size_t>& h, size_t i) {
+            size_t slot = h[i];
+            while (i > 0) {
+                size_t parent = (i - 1) / 2;
+                if (!less(by_lb, slot, h[parent])) break;
+                place(by_lb, h, i, h[parent]);
+                i = parent;
+            }
+            place(by_lb, h, i, slot);
+        }
+
+        void sift_down(bool by_lb, std::vector<size_t>& h, size_t i) {
+            size_t n = h.size();
+            size_t slot = h[i];
+            while (true) {
+                size_t child = 2 * i + 1;
+                if (child >= n) break;
+                if (child + 1 < n && less(by_lb, h[child + 1], h[child])) ++child;
+                if (!less(by_lb, h[child], slot)) break;
+                place(by_lb, h, i, h[child]);
+                i = child;
+            }
+            place(by_lb, h, i, slot);
+        }
+
+        void remove_at(bool by_lb, std::vector<size_t>& h, size_t i) {
+            size_t last = h.back();
+            h.pop_back();
+            if (i == h.size()) return;
+            place(by_lb, h, i, last);
+            sift_down(by_lb, h, i);
+            sift_up(by_lb, h, by_lb ? slots[last].lb_pos : slots[last].pri_pos);
+        }
+
+        void heapify(bool by_lb, std::vector<size_t>& h) {
+            for (size_t i = 0; i < h.size(); ++i) place(by_lb, h, i, h[i]);
+            for (size_t i = h.size() / 2; i-- > 0;) sift_down(by_lb, h, i);
+        }
+
+        // Push: C++ takes ownership (INCREFs obj).
+        void push_key(PyObject* obj, double lb, const PriorityKey& priority) {
+            size_t slot;
+            if (free_slots.empty()) {
+                slot = slots.size();
+                slots.emplace_back();
+            } else {
+                slot = free_slots.back();
+                free_slots.pop_back();
+            }
+            Py_INCREF(obj);
+            NodeDualEntry& e = slots[slot];
+            e.obj = obj;
+            e.lb = lb;
+            e.priority = priority;
+            pri_heap.push_back(slot);
+            sift_up(false, pri_heap, pri_heap.size() - 1);
+            lb_heap.push_back(slot);
+            sift_up(true, lb_heap, lb_heap.size() - 1);
+        }
+
+        void push(PyObject* obj, double lb, const std::vector<double>& priority) {
+            push_key(obj, lb, PriorityKey(priority));
+        }
+
+        // Removes the entry in *slot* from both heaps and transfers
+        // ownership of its object to the caller.
+        PyObject* take(size_t slot) {
+            NodeDualEntry& e = slots[slot];
+            remove_at(false, pri_heap, e.pri_pos);
+            remove_at(true, lb_heap, e.lb_pos);
+            PyObject* obj = e.obj;
+            e.obj = nullptr;
+            e.priority = PriorityKey();
+            free_slots.push_back(slot);
+            if (pri_heap.empty()) {
+                slots.clear();
+                free_slots.clear();
+            }
+            return obj;
+        }
+
+        // Entry with the smallest priority: transfers ownership to caller.
+        PyObject* pop() { return take(pri_heap.front()); }
+
+        // Entry with the smallest lb: transfers ownership to caller.
+        PyObject* pop_min_bound() { return take(lb_heap.front()); }
+
+        const NodeDualEntry& top() const { return slots[pri_heap.front()]; }
+
+        const NodeDualEntry& top_min_bound() const { return slots[lb_heap.front()]; }
+
+        // Releases all owned references and empties the queue.
+        void clear() {
+            for (size_t slot : pri_heap) {
+                Py_DECREF(slots[slot].obj);
+            }
+            slots.clear();
+            free_slots.clear();
+            pri_heap.clear();
+            lb_heap.clear();
+        }
+
+        // Keeps entries with lb < max_lb, compacting the slab, and
+        // returns the removed objects.  They still carry their push
+        // INCREFs; caller must Py_DECREF each of them.
+        std::vector<PyObject*> filter(double max_lb) {
+            std::vector<PyObject*> removed;
+            std::vector<NodeDualEntry> kept;
+            kept.reserve(pri_heap.size());
+            for (size_t slot : pri_heap) {
+                NodeDualEntry& e = slots[slot];
+                if (e.lb < max_lb) kept.push_back(std::move(e));
+                else removed.push_back(e.obj);
+            }
+            slots.swap(kept);
+            free_slots.clear();
+            pri_heap.resize(slots.size());
+            lb_heap.resize(slots.size());
+            for (size_t i = 0; i < slots.size(); ++i) {
+                pri_heap[i] = i;
+                lb_heap[i] = i;
+            }
+            heapify(false, pri_heap);
+            heapify(true, lb_heap);
+            return removed;
+        }
+
+        size_t size() const { return pri_heap.size(); }
+        bool empty() const { return pri_heap.empty(); }
+    };
     """
+    cdef cppclass PriorityKey:
+        double v[4]
+        uint32_t n
+        PriorityKey()
+        PriorityKey(const vector[double]& p)
+        vector[double] to_vector()
+
     cdef cppclass NodePriEntry:
         PyObject* obj
         double lb
-        vector[double] priority
+        PriorityKey priority
         NodePriEntry()
-        NodePriEntry(PyObject* o, double l, const vector[double]& p)
+        NodePriEntry(PyObject* o, double l, const PriorityKey& p)
 
     cdef cppclass NodePriQueue:
         NodePriQueue()
         void push(PyObject* obj, double lb, const vector[double]& priority)
+        void push_key(PyObject* obj, double lb, const PriorityKey& priority)
         NodePriEntry pop()
         NodePriEntry pop_min_bound()
         vector[NodePriEntry] filter(double max_lb)
+        const NodePriEntry& top()
+        void clear()
+        size_t size()
+        bint empty()
+
+    cdef cppclass NodeDualEntry:
+        PyObject* obj
+        double lb
+        PriorityKey priority
+
+    cdef cppclass NodeDualQueue:
+        NodeDualQueue()
+        void push(PyObject* obj, double lb, const vector[double]& priority)
+        void push_key(PyObject* obj, double lb, const PriorityKey& priority)
+        PyObject* pop()
+        PyObject* pop_min_bound()
+        const NodeDualEntry& top()
+        const NodeDualEntry& top_min_bound()
+        vector[PyObject*] filter(double max_lb)
         void clear()
         size_t size()
         bint empty()
 
 
+cdef inline bool native_priority(object manager, type cls):
+    """Whether *manager* still uses the ``make_priority`` of *cls*, so
+    the inline key of *cls* (``make_key``) produces the same order."""
+    return type(manager).make_priority is cls.__dict__['make_priority']
+
+
 @cython.final
 cdef class NodePriQueueWrapper:
 
@@ -149,9 +431,51 @@ cdef class NodePriQueueWrapper:
     @cython.final
     cpdef void push(self, Node node, vector[double]& priority)
 
+    @cython.final
+    cdef inline void push_key(self, Node node, const PriorityKey& key):
+        self.pq.push_key(<PyObject*>node, node.lb, key)
+
+    @cython.final
+    cpdef Node pop(self)
+
+    @cython.final
+    cpdef Node peek(self)
+
+    @cython.final
+    cpdef void filter(self, double max_lb)
+
+    @cython.final
+    cpdef size_t size(self)
+
+    @cython.final
+    cpdef void clear(self)
+
+
+@cython.final
+cdef class NodeDualQueueWrapper:
+
+    cdef:
+        NodeDualQueue pq
+
+    @cython.final
+    cpdef void push(self, Node node, vector[double]& priority)
+
+    @cython.final
+    cdef inline void push_key(self, Node node, const PriorityKey& key):
+        self.pq.push_key(<PyObject*>node, node.lb, key)
+
     @cython.final
     cpdef Node pop(self)
 
+    @cython.final
+    cpdef Node pop_min_bound(self)
+
+    @cython.final
+    cpdef Node peek(self)
+
+    @cython.final
+    cpdef Node peek_min_bound(self)
+
     @cython.final
     cpdef void filter(self, double max_lb)
 
@@ -47,6 +47,12 @@ cdef class NodePriQueueWrapper:
         _Py_DECREF(entry.obj)
         return node
 
+    @cython.final
+    cpdef Node peek(self):
+        if self.pq.empty():
+            return None
+        return <Node>self.pq.top().obj
+
     @cython.final
     cpdef size_t size(self):
         return self.pq.size()
@@ -55,15 +61,89 @@ cdef class NodePriQueueWrapper:
     cpdef void filter(self, double max_lb):
         cdef:
             vector[NodePriEntry] removed
-            NodePriEntry entry
+            PyObject* obj
+            Node node
+            size_t i
+
+        removed = self.pq.filter(max_lb)
+        for i in range(removed.size()):
+            obj = removed[i].obj
+            node = <Node>obj
+            _Py_DECREF(obj)
+            node.cleanup()
+
+    @cython.final
+    cpdef void clear(self):
+        self.pq.clear()
+
+
+# ---------------------------------------------------------------------------
+# NodeDualQueueWrapper
+# ---------------------------------------------------------------------------
+
+@cython.final
+cdef class NodeDualQueueWrapper:
+
+    def __dealloc__(self):
+        self.pq.clear()
+
+    @cython.final
+    cpdef void push(self, Node node, vector[double]& priority):
+        self.pq.push(<PyObject*>node, node.lb, priority)
+
+    @cython.final
+    cpdef Node pop(self):
+        cdef:
+            PyObject* obj
+            Node node
+
+        if self.pq.empty():
+            return None
+        obj = self.pq.pop()
+        node = <Node>obj
+        _Py_DECREF(obj)
+        return node
+
+    @cython.final
+    cpdef Node pop_min_bound(self):
+        cdef:
+            PyObject* obj
+            Node node
+
+        if self.pq.empty():
+            return None
+        obj = self.pq.pop_min_bound()
+        node = <Node>obj
+        _Py_DECREF(obj)
+        return node
+
+    @cython.final
+    cpdef Node peek(self):
+        if self.pq.empty():
+            return None
+        return <Node>self.pq.top().obj
+
+    @cython.final
+    cpdef Node peek_min_bound(self):
+        if self.pq.empty():
+            return None
+        return <Node>self.pq.top_min_bound().obj
+
+    @cython.final
+    cpdef size_t size(self):
+        return self.pq.size()
+
+    @cython.final
+    cpdef void filter(self, double max_lb):
+        cdef:
+            vector[PyObject*] removed
             Node node
             size_t i
 
         removed = self.pq.filter(max_lb)
         for i in range(removed.size()):
-            entry = removed[i]
-            node = <Node>entry.obj
-            _Py_DECREF(entry.obj)
+            node = <Node>removed[i]
+            _Py_DECREF(removed[i])
             node.cleanup()
 
     @cython.final
@@ -0,0 +1,38 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+
+from bnbpy.cython.node cimport Node
+
+
+@cython.final
+cdef class SolutionPool:
+
+    cdef readonly:
+        int capacity
+
+    cdef:
+        list _heap
+        dict _keys
+        unsigned long long _count
+        double _threshold
+
+    cdef inline double threshold(self):
+        # Cost a solution must beat to enter a full pool
+        return self._threshold
+
+    cpdef bool add(self, Node node)
+
+    cpdef Node best(self)
+
+    cpdef list[Node] nodes(self)
+
+    cpdef void filter(self, double max_cost)
+
+    cpdef void clear(self)
+
+    cdef void _remove(self, tuple entry)
+
+    cdef void _update_threshold(self)
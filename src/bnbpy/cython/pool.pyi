@@ -0,0 +1,86 @@
+from typing import Any
+
+from bnbpy.cython.node import Node
+
+class SolutionPool:
+    """Bounded pool of the best distinct solutions found by a search.
+
+    Solution nodes are kept in a heap ordered by decreasing cost, so
+    the worst of the ``capacity`` best is replaced in O(log k) by a
+    better one. Assigned as ``pool`` of a
+    :class:`~bnbpy.cython.search.BranchAndBound`, the search prunes by
+    the cost of the worst solution of the pool once it is full instead
+    of the incumbent, such that it finds the ``capacity`` best
+    solutions in a single run. The transposition table of the search
+    is bypassed meanwhile, as dominated subproblems may hold some of
+    these solutions.
+
+    Solutions with equal :meth:`~bnbpy.cython.problem.Problem.solution_key`
+    are duplicates, of which only the cheapest is kept. Problems without
+    a key count every solution node as distinct. Among solutions of
+    equal cost, those found first are kept.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of solutions kept
+    """
+
+    capacity: int
+
+    def __init__(self, capacity: int) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def costs(self) -> list[float]:
+        """Costs of the solutions in the pool, best first"""
+        ...
+
+    def add(self, node: Node[Any]) -> bool:
+        """Adds the solution of *node* if it is among the best ones.
+
+        Parameters
+        ----------
+        node : Node
+            Node of a feasible solution, whose ``lb`` is its cost
+
+        Returns
+        -------
+        bool
+            Whether the solution was added, i.e., it is not worse than
+            the pool or a duplicate of a solution at least as good
+        """
+        ...
+
+    def best(self) -> Node[Any] | None:
+        """Returns the node of the cheapest solution, or None if empty.
+
+        Returns
+        -------
+        Node
+            Best solution node
+        """
+        ...
+
+    def nodes(self) -> list[Node[Any]]:
+        """Returns the solution nodes, best first.
+
+        Returns
+        -------
+        list[Node]
+            Solution nodes sorted by cost
+        """
+        ...
+
+    def filter(self, max_cost: float) -> None:
+        """Removes solutions costing *max_cost* or more.
+
+        Parameters
+        ----------
+        max_cost : float
+            Cost of a known solution to beat
+        """
+        ...
+
+    def clear(self) -> None:
+        """Removes all solutions."""
+        ...
@@ -0,0 +1,153 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libc.math cimport INFINITY
+from libcpp cimport bool
+
+import heapq
+
+from bnbpy.cython.node cimport Node
+
+
+@cython.final
+cdef class SolutionPool:
+    """Bounded pool of the best distinct solutions found by a search.
+
+    Solution nodes are kept in a heap ordered by decreasing cost, so
+    the worst of the ``capacity`` best is replaced in O(log k) by a
+    better one. Assigned as ``pool`` of a
+    :class:`~bnbpy.cython.search.BranchAndBound`, the search prunes by
+    the cost of the worst solution of the pool once it is full instead
+    of the incumbent, such that it finds the ``capacity`` best
+    solutions in a single run. The transposition table of the search
+    is bypassed meanwhile, as dominated subproblems may hold some of
+    these solutions.
+
+    Solutions with equal :meth:`~bnbpy.cython.problem.Problem.solution_key`
+    are duplicates, of which only the cheapest is kept. Problems without
+    a key count every solution node as distinct. Among solutions of
+    equal cost, those found first are kept.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of solutions kept
+    """
+
+    def __init__(self, int capacity):
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        self.capacity = capacity
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __repr__(self) -> str:
+        return f'SolutionPool(capacity={self.capacity}, size={len(self)})'
+
+    @property
+    def costs(self):
+        """Costs of the solutions in the pool, best first"""
+        return [node.lb for node in self.nodes()]
+
+    cpdef bool add(self, Node node):
+        """Adds the solution of *node* if it is among the best ones.
+
+        Parameters
+        ----------
+        node : Node
+            Node of a feasible solution, whose ``lb`` is its cost
+
+        Returns
+        -------
+        bool
+            Whether the solution was added, i.e., it is not worse than
+            the pool or a duplicate of a solution at least as good
+        """
+        cdef:
+            object key
+            tuple entry, worst
+
+        if node.lb >= self._threshold:
+            return False
+        key = node.problem.solution_key()
+        if key is not None:
+            entry = self._keys.get(key)
+            if entry is not None:
+                if node.lb >= -<double>entry[0]:
+                    return False
+                self._remove(entry)
+
+        # Ties on cost evict the latest solution
+        self._count += 1
+        entry = (-node.lb, -self._count, node, key)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+        else:
+            worst = heapq.heappushpop(self._heap, entry)
+            if worst[3] is not None:
+                del self._keys[worst[3]]
+        if key is not None:
+            self._keys[key] = entry
+        self._update_threshold()
+        return True
+
+    cpdef Node best(self):
+        """Returns the node of the cheapest solution, or None if empty.
+
+        Returns
+        -------
+        Node
+            Best solution node
+        """
+        if not self._heap:
+            return None
+        return max(self._heap)[2]
+
+    cpdef list[Node] nodes(self):
+        """Returns the solution nodes, best first.
+
+        Returns
+        -------
+        list[Node]
+            Solution nodes sorted by cost
+        """
+        cdef:
+            tuple entry
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+    cpdef void filter(self, double max_cost):
+        """Removes solutions costing *max_cost* or more.
+
+        Parameters
+        ----------
+        max_cost : float
+            Cost of a known solution to beat
+        """
+        cdef:
+            tuple entry
+
+        for entry in [e for e in self._heap if -<double>e[0] >= max_cost]:
+            self._remove(entry)
+
+    cpdef void clear(self):
+        """Removes all solutions."""
+        self._heap = []
+        self._keys = {}
+        self._count = 0
+        self._threshold = INFINITY
+
+    cdef void _remove(self, tuple entry):
+        self._heap.remove(entry)
+        heapq.heapify(self._heap)
+        if entry[3] is not None:
+            del self._keys[entry[3]]
+        self._update_threshold()
+
+    cdef void _update_threshold(self):
+        if len(self._heap) < self.capacity:
+            self._threshold = INFINITY
+        else:
+            self._threshold = -<double>self._heap[0][0]
@@ -6,13 +6,20 @@ from libcpp.vector cimport vector
 
 from bnbpy.cython.manager cimport BaseNodeManager
 from bnbpy.cython.node cimport Node
-from bnbpy.cython.nodequeue cimport NodePriQueueWrapper
+from bnbpy.cython.nodequeue cimport (
+    NodeDualQueueWrapper,
+    NodePriQueueWrapper,
+    PriorityKey,
+)
 
 
 cdef class PriorityManagerTemplate(BaseNodeManager):
 
     cdef:
         NodePriQueueWrapper pq
+        bool native_key
+
+    cdef void _push(self, Node node)
 
     cpdef void _enqueue(self, Node node)
 
@@ -24,10 +31,104 @@ cdef class PriorityManagerTemplate(BaseNodeManager):
 
     cpdef vector[double] make_priority(self, Node node)
 
+    cdef PriorityKey make_key(self, Node node)
+
 
 cdef class BestFirstSearch(PriorityManagerTemplate):
     cpdef vector[double] make_priority(self, Node node)
 
+    cdef PriorityKey make_key(self, Node node)
+
 
 cdef class DepthFirstSearch(PriorityManagerTemplate):
-    cpdef vector[double] make_priority(self, Node node)
\ No newline at end of file
+    cpdef vector[double] make_priority(self, Node node)
+
+    cdef PriorityKey make_key(self, Node node)
+
+
+cdef class AlternatingSearch(BaseNodeManager):
+
+    cdef readonly:
+        int period
+
+    cdef:
+        NodeDualQueueWrapper pq
+        bool native_key
+        long long _count
+
+    cpdef void _enqueue(self, Node node)
+
+    cpdef Node _dequeue(self)
+
+    cpdef void _filter_by_lb(self, double max_lb)
+
+    cpdef void _clear(self)
+
+    cpdef vector[double] make_priority(self, Node node)
+
+    cdef PriorityKey make_key(self, Node node)
+
+
+cdef class LimitedDiscrepancySearch(PriorityManagerTemplate):
+
+    cdef readonly:
+        object max_discrepancy
+        double discrepancy
+
+    cdef:
+        double _limit
+        double _parent_discrepancy
+        int _parent_level
+        list[Node] _discarded
+
+    cdef void _flush(self)
+
+    cpdef void _enqueue(self, Node node)
+
+    cpdef Node _dequeue(self)
+
+    cpdef void _filter_by_lb(self, double max_lb)
+
+    cpdef void _clear(self)
+
+    cpdef vector[double] make_priority(self, Node node)
+
+    cdef PriorityKey make_key(self, Node node)
+
+
+cdef enum:
+    NODE_BYTES = 192
+
+
+cdef class MemoryAwareSearch(BaseNodeManager):
+
+    cdef readonly:
+        Py_ssize_t max_bytes
+        double low_ratio
+        int sample_interval
+        Py_ssize_t nbytes
+        Py_ssize_t rss_growth
+        bool depth_first
+        int switches
+
+    cdef:
+        NodeDualQueueWrapper pq
+        bool native_key
+        Py_ssize_t _rss_start
+        long long _ops
+
+    cdef Py_ssize_t node_bytes(self, Node node)
+
+    cdef void _update_mode(self)
+
+    cpdef void _enqueue(self, Node node)
+
+    cpdef Node _dequeue(self)
+
+    cpdef void _filter_by_lb(self, double max_lb)
+
+    cpdef void _clear(self)
+
+    cpdef vector[double] make_priority(self, Node node)
+
+    cdef PriorityKey make_key(self, Node node)
@@ -1,4 +1,4 @@
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from bnbpy.cython.manager import BaseNodeManager
 from bnbpy.cython.node import Node
@@ -9,8 +9,9 @@ P = TypeVar('P', bound=Problem)
 class PriorityManagerTemplate(BaseNodeManager[P]):
     """Abstract priority-queue node manager backed by a native C++ binary heap.
 
-    Stores nodes with ``vector[double]`` priorities; the underlying heap is a
+    Stores nodes with lexicographic priorities; the underlying heap is a
     *min*-heap so the entry with the smallest priority key is dequeued first.
+    Keys of up to four values are kept inline in the heap entries.
 
     Subclasses must override :meth:`make_priority` to define the ordering key
     for each node.  All four abstract hooks from :class:`BaseNodeManager`
@@ -91,3 +92,156 @@ class DepthFirstSearch(PriorityManagerTemplate[P]):
             Three-element priority vector ``[-level, lb, -index]``.
         """
         ...
+
+class AlternatingSearch(BaseNodeManager[P]):
+    """Priority search with periodic best-bound dequeues.
+
+    Nodes are dequeued in the order of :meth:`make_priority`, depth-first
+    ``(-level, lb, -index)`` by default, except for every ``period``-th
+    dequeue, which takes the node with the smallest lower bound to raise
+    the global lower bound.  Both orders are kept in an indexed dual heap,
+    so either dequeue is O(log n).
+
+    Parameters
+    ----------
+    period : int, optional
+        Number of dequeues per best-bound dequeue, by default 100.
+        With ``period=1`` every dequeue is best-bound.
+    """
+
+    period: int
+
+    def __init__(self, period: int = 100) -> None: ...
+    def make_priority(self, node: Node[P]) -> list[float]:
+        """Return the priority key ``(-level, lb, -index)`` used between
+        best-bound dequeues.
+
+        Parameters
+        ----------
+        node : Node
+            The node being enqueued.
+
+        Returns
+        -------
+        list[float]
+            Priority vector; smaller values are dequeued first.
+        """
+        ...
+
+class LimitedDiscrepancySearch(PriorityManagerTemplate[P]):
+    """Limited discrepancy search: priority
+    ``(discrepancy, -level, lb, -index)``.
+
+    The order of the children returned by `Problem.branch` is taken as
+    a heuristic ranking: the child at position *i* (its ``rank``) has
+    *i* more discrepancies than its parent, even if earlier siblings
+    were pruned, which is the number of times its path deviates from
+    the first choice.  Nodes are
+    explored depth-first with the fewest discrepancies first, so the
+    heuristic dive comes first, followed by the paths deviating from it
+    once, twice, and so on.
+
+    Nodes with more than *max_discrepancy* discrepancies are dropped,
+    which keeps the frontier small, but then the search is not
+    exhaustive: see ``dropped_lb``.
+
+    Subclasses overriding :meth:`make_priority` must keep
+    ``discrepancy``, that of the node being enqueued, as its first
+    value.
+
+    Parameters
+    ----------
+    max_discrepancy : Optional[int], optional
+        Maximum number of discrepancies of explored nodes, by default
+        None (unlimited)
+    """
+
+    max_discrepancy: Optional[int]
+    discrepancy: float
+    """Number of discrepancies of the node being enqueued"""
+
+    def __init__(self, max_discrepancy: Optional[int] = None) -> None: ...
+    def make_priority(self, node: Node[P]) -> list[float]:
+        """Return the priority key ``(discrepancy, -level, lb, -index)``.
+
+        Parameters
+        ----------
+        node : Node
+            The node being enqueued.
+
+        Returns
+        -------
+        list[float]
+            Priority vector; smaller values are dequeued first.
+        """
+        ...
+
+class MemoryAwareSearch(BaseNodeManager[P]):
+    """Best-first search switching to depth-first under a memory budget.
+
+    The memory of the frontier is estimated as the sum of
+    `Problem.memory_size` of the open nodes, plus a fixed overhead per
+    node.  Every ``sample_interval`` operations, the growth of the
+    resident memory of the process since the search started is also
+    sampled, which accounts for what the estimate misses (e.g. caches
+    shared among nodes), and the larger of both is compared with the
+    budget.
+
+    While under ``max_bytes``, the node of smallest lower bound is
+    dequeued.  Above it, nodes are dequeued depth-first ``(-level, lb,
+    -index)``, which shrinks the frontier, until the memory falls to
+    ``low_ratio * max_bytes``.  Both orders are kept in an indexed dual
+    heap, so switching is O(1).  As freed memory is often not returned
+    to the operating system, a switch caused by the resident memory may
+    last until the end of the search.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget in bytes, by default 1 GiB
+
+    low_ratio : float, optional
+        Fraction of the budget below which best-first search resumes,
+        by default 0.5
+
+    sample_interval : int, optional
+        Number of enqueues and dequeues between samples of the resident
+        memory, by default 1_000.  With 0, only the estimate is used.
+    """
+
+    max_bytes: int
+    low_ratio: float
+    sample_interval: int
+    nbytes: int
+    """Estimated memory of the open nodes in bytes"""
+
+    rss_growth: int
+    """Growth of the resident memory since the search started, as of
+    the last sample"""
+
+    depth_first: bool
+    """Whether nodes are currently dequeued depth-first"""
+
+    switches: int
+    """Number of switches between both orders"""
+
+    def __init__(
+        self,
+        max_bytes: int = ...,
+        low_ratio: float = 0.5,
+        sample_interval: int = 1_000,
+    ) -> None: ...
+    def make_priority(self, node: Node[P]) -> list[float]:
+        """Return the depth-first priority key ``(-level, lb, -index)``.
+
+        Parameters
+        ----------
+        node : Node
+            The node being enqueued.
+
+        Returns
+        -------
+        list[float]
+            Priority vector; smaller values are dequeued first.
+        """
+        ...
@@ -1,34 +1,65 @@
 # distutils: language = c++
 # cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
 
+from cpython.ref cimport PyObject
+from libc.math cimport INFINITY
 from libcpp cimport bool
 from libcpp.vector cimport vector
 
+import logging
+
 from bnbpy.cython.manager cimport BaseNodeManager
 from bnbpy.cython.node cimport Node
-from bnbpy.cython.nodequeue cimport NodePriQueueWrapper
+from bnbpy.cython.nodequeue cimport (
+    NodeDualQueueWrapper,
+    NodePriQueueWrapper,
+    PriorityKey,
+    native_priority,
+)
+from bnbpy.cython.stats cimport resident_memory
+
+
+# Raw CPython DECREF — accepts PyObject* directly
+cdef extern from "Python.h":
+    void _Py_DECREF "Py_DECREF"(PyObject* o)
+
+
+log = logging.getLogger(__name__)
 
 
 cdef class PriorityManagerTemplate(BaseNodeManager):
     """Priority queue manager backed by a native C++ binary heap.
 
-    Stores nodes with ``vector[double]`` priorities; the queue is a
-    *min*-heap (smallest priority dequeued first).
+    Stores nodes with lexicographic priorities; the queue is a
+    *min*-heap (smallest priority dequeued first).  Priorities of up to
+    four values are kept inline in the heap entries.
 
-    Subclasses must override :meth:`make_priority`.
+    Subclasses must override :meth:`make_priority`.  Native subclasses
+    may also override :meth:`make_key` to fill the inline key directly,
+    skipping the ``vector[double]`` returned by :meth:`make_priority`;
+    they enable it by setting ``native_key`` when ``make_priority`` is
+    not overridden further down (see :class:`BestFirstSearch`).
     """
 
-    def __cinit__(self):
+    def __cinit__(self, *args, **kwargs):
         self.pq = NodePriQueueWrapper()
+        self.native_key = False
+
+    cdef void _push(self, Node node):
+        if self.native_key:
+            self.pq.push_key(node, self.make_key(node))
+        else:
+            self.pq.push(node, self.make_priority(node))
 
     cpdef void _enqueue(self, Node node):
-        self.pq.push(node, self.make_priority(node))
+        self._push(node)
 
     cpdef Node _dequeue(self):
         return self.pq.pop()
 
     cpdef void _filter_by_lb(self, double max_lb):
-        self.pq.filter(max_lb)
+        if self.any_lb_above(max_lb):
+            self.pq.filter(max_lb)
 
     cpdef void _clear(self):
         self.pq.clear()
@@ -38,9 +69,17 @@ cdef class PriorityManagerTemplate(BaseNodeManager):
             "Subclasses must implement make_priority()"
         )
 
+    cdef PriorityKey make_key(self, Node node):
+        return PriorityKey(self.make_priority(node))
+
 
 cdef class BestFirstSearch(PriorityManagerTemplate):
     """Best-first variant: priority ``(lb, -level, -index)``."""
+
+    def __cinit__(self, *args, **kwargs):
+        # Subclasses overriding make_priority keep using it
+        self.native_key = native_priority(self, BestFirstSearch)
+
     cpdef vector[double] make_priority(self, Node node):
         cdef:
             vector[double] pri = vector[double](3)
@@ -49,9 +88,22 @@ cdef class BestFirstSearch(PriorityManagerTemplate):
         pri[2] = -node.get_index()
         return pri
 
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = node.lb
+        key.v[1] = -node.level
+        key.v[2] = -node.get_index()
+        key.n = 3
+        return key
+
 
 cdef class DepthFirstSearch(PriorityManagerTemplate):
     """Depth-first variant: priority ``(-level, lb, -index)``."""
+
+    def __cinit__(self, *args, **kwargs):
+        self.native_key = native_priority(self, DepthFirstSearch)
+
     cpdef vector[double] make_priority(self, Node node):
         cdef:
             vector[double] pri = vector[double](3)
@@ -59,3 +111,333 @@ cdef class DepthFirstSearch(PriorityManagerTemplate):
         pri[1] = node.lb
         pri[2] = -node.get_index()
         return pri
+
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = -node.level
+        key.v[1] = node.lb
+        key.v[2] = -node.get_index()
+        key.n = 3
+        return key
+
+
+cdef class AlternatingSearch(BaseNodeManager):
+    """Priority search with periodic best-bound dequeues.
+
+    Nodes are dequeued in the order of :meth:`make_priority`, depth-first
+    ``(-level, lb, -index)`` by default, except for every ``period``-th
+    dequeue, which takes the node with the smallest lower bound to raise
+    the global lower bound.  Both orders are kept in an indexed dual heap,
+    so either dequeue is O(log n).
+
+    Parameters
+    ----------
+    period : int, optional
+        Number of dequeues per best-bound dequeue, by default 100.
+        With ``period=1`` every dequeue is best-bound.
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self.pq = NodeDualQueueWrapper()
+        self.native_key = native_priority(self, AlternatingSearch)
+        self._count = 0
+
+    def __init__(self, int period=100):
+        if period < 1:
+            raise ValueError('period must be positive')
+        self.period = period
+
+    cpdef void _enqueue(self, Node node):
+        if self.native_key:
+            self.pq.push_key(node, self.make_key(node))
+        else:
+            self.pq.push(node, self.make_priority(node))
+
+    cpdef Node _dequeue(self):
+        self._count += 1
+        if self._count % self.period == 0:
+            return self.pq.pop_min_bound()
+        return self.pq.pop()
+
+    cpdef void _filter_by_lb(self, double max_lb):
+        if self.any_lb_above(max_lb):
+            self.pq.filter(max_lb)
+
+    cpdef void _clear(self):
+        self.pq.clear()
+        self._count = 0
+
+    cpdef vector[double] make_priority(self, Node node):
+        cdef:
+            vector[double] pri = vector[double](3)
+        pri[0] = -node.level
+        pri[1] = node.lb
+        pri[2] = -node.get_index()
+        return pri
+
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = -node.level
+        key.v[1] = node.lb
+        key.v[2] = -node.get_index()
+        key.n = 3
+        return key
+
+
+cdef class LimitedDiscrepancySearch(PriorityManagerTemplate):
+    """Limited discrepancy search: priority
+    ``(discrepancy, -level, lb, -index)``.
+
+    The order of the children returned by `Problem.branch` is taken as
+    a heuristic ranking: the child at position *i* (its ``rank``) has
+    *i* more discrepancies than its parent, even if earlier siblings
+    were pruned, which is the number of times its path deviates from
+    the first choice.  Nodes are
+    explored depth-first with the fewest discrepancies first, so the
+    heuristic dive comes first, followed by the paths deviating from it
+    once, twice, and so on.
+
+    Nodes with more than *max_discrepancy* discrepancies are dropped,
+    which keeps the frontier small, but then the search is not
+    exhaustive: see ``dropped_lb``.
+
+    Subclasses overriding :meth:`make_priority` must keep
+    ``discrepancy``, that of the node being enqueued, as its first
+    value.
+
+    Parameters
+    ----------
+    max_discrepancy : Optional[int], optional
+        Maximum number of discrepancies of explored nodes, by default
+        None (unlimited)
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self.native_key = native_priority(self, LimitedDiscrepancySearch)
+        self._discarded = []
+
+    def __init__(self, max_discrepancy=None):
+        if max_discrepancy is not None and max_discrepancy < 0:
+            raise ValueError('max_discrepancy must be non-negative')
+        self.max_discrepancy = max_discrepancy
+        self._limit = INFINITY
+        if max_discrepancy is not None:
+            self._limit = max_discrepancy
+        self._clear()
+
+    cdef void _flush(self):
+        cdef:
+            Node node
+
+        # Discarded nodes are dropped once the template indexed them
+        if self._discarded:
+            for node in self._discarded:
+                self.drop(node)
+            self._discarded = []
+
+    cpdef void _enqueue(self, Node node):
+        self._flush()
+        if node.level == self._parent_level + 1:
+            self.discrepancy = self._parent_discrepancy + node.rank
+        else:
+            # Roots, loaded or re-enqueued nodes
+            self.discrepancy = self._parent_discrepancy
+        if self.discrepancy > self._limit:
+            self._discarded.append(node)
+        else:
+            self._push(node)
+
+    cpdef Node _dequeue(self):
+        cdef:
+            Node node
+
+        self._flush()
+        if self.pq.size() == 0:
+            return None
+        self._parent_discrepancy = self.pq.pq.top().priority.v[0]
+        node = self.pq.pop()
+        self._parent_level = node.level
+        return node
+
+    cpdef void _filter_by_lb(self, double max_lb):
+        self._flush()
+        PriorityManagerTemplate._filter_by_lb(self, max_lb)
+
+    cpdef void _clear(self):
+        self._discarded = []
+        self.pq.clear()
+        self.discrepancy = 0.0
+        self._parent_discrepancy = 0.0
+        self._parent_level = -2
+
+    cpdef vector[double] make_priority(self, Node node):
+        cdef:
+            vector[double] pri = vector[double](4)
+        pri[0] = self.discrepancy
+        pri[1] = -node.level
+        pri[2] = node.lb
+        pri[3] = -node.get_index()
+        return pri
+
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = self.discrepancy
+        key.v[1] = -node.level
+        key.v[2] = node.lb
+        key.v[3] = -node.get_index()
+        key.n = 4
+        return key
+
+
+cdef class MemoryAwareSearch(BaseNodeManager):
+    """Best-first search switching to depth-first under a memory budget.
+
+    The memory of the frontier is estimated as the sum of
+    `Problem.memory_size` of the open nodes, plus a fixed overhead per
+    node.  Every ``sample_interval`` operations, the growth of the
+    resident memory of the process since the search started is also
+    sampled, which accounts for what the estimate misses (e.g. caches
+    shared among nodes), and the larger of both is compared with the
+    budget.
+
+    While under ``max_bytes``, the node of smallest lower bound is
+    dequeued.  Above it, nodes are dequeued depth-first ``(-level, lb,
+    -index)``, which shrinks the frontier, until the memory falls to
+    ``low_ratio * max_bytes``.  Both orders are kept in an indexed dual
+    heap, so switching is O(1).  As freed memory is often not returned
+    to the operating system, a switch caused by the resident memory may
+    last until the end of the search.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget in bytes, by default 1 GiB
+
+    low_ratio : float, optional
+        Fraction of the budget below which best-first search resumes,
+        by default 0.5
+
+    sample_interval : int, optional
+        Number of enqueues and dequeues between samples of the resident
+        memory, by default 1_000.  With 0, only the estimate is used.
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        self.pq = NodeDualQueueWrapper()
+        self.native_key = native_priority(self, MemoryAwareSearch)
+        self.nbytes = 0
+        self.rss_growth = 0
+        self.depth_first = False
+        self.switches = 0
+        self._ops = 0
+
+    def __init__(
+        self,
+        Py_ssize_t max_bytes=1024 ** 3,
+        double low_ratio=0.5,
+        int sample_interval=1_000,
+    ):
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be positive')
+        if not 0.0 <= low_ratio < 1.0:
+            raise ValueError('low_ratio must be in [0, 1)')
+        if sample_interval < 0:
+            raise ValueError('sample_interval must be non-negative')
+        self.max_bytes = max_bytes
+        self.low_ratio = low_ratio
+        self.sample_interval = sample_interval
+        self._rss_start = resident_memory()
+
+    cdef Py_ssize_t node_bytes(self, Node node):
+        return node.problem.memory_size() + NODE_BYTES
+
+    cdef void _update_mode(self):
+        cdef:
+            Py_ssize_t rss, used
+
+        self._ops += 1
+        if (
+            self.sample_interval > 0
+            and self._rss_start >= 0
+            and self._ops % self.sample_interval == 0
+        ):
+            rss = resident_memory()
+            self.rss_growth = max(rss - self._rss_start, 0)
+        used = max(self.nbytes, self.rss_growth)
+        if not self.depth_first and used > self.max_bytes:
+            self.depth_first = True
+            self.switches += 1
+            log.info(f'Memory above budget ({used} bytes), depth-first')
+        elif self.depth_first and used <= self.low_ratio * self.max_bytes:
+            self.depth_first = False
+            self.switches += 1
+            log.info(f'Memory below budget ({used} bytes), best-first')
+
+    cpdef void _enqueue(self, Node node):
+        if self.native_key:
+            self.pq.push_key(node, self.make_key(node))
+        else:
+            self.pq.push(node, self.make_priority(node))
+        self.nbytes += self.node_bytes(node)
+        self._update_mode()
+
+    cpdef Node _dequeue(self):
+        cdef:
+            Node node
+
+        if self.depth_first:
+            node = self.pq.pop()
+        else:
+            node = self.pq.pop_min_bound()
+        if node is not None:
+            self.nbytes -= self.node_bytes(node)
+            if self.pq.size() == 0 or self.nbytes < 0:
+                self.nbytes = 0
+        self._update_mode()
+        return node
+
+    cpdef void _filter_by_lb(self, double max_lb):
+        cdef:
+            vector[PyObject*] removed
+            Node node
+            size_t i
+
+        if not self.any_lb_above(max_lb):
+            return
+        removed = self.pq.pq.filter(max_lb)
+        for i in range(removed.size()):
+            node = <Node>removed[i]
+            _Py_DECREF(removed[i])
+            self.nbytes -= self.node_bytes(node)
+            node.cleanup()
+        if self.pq.size() == 0 or self.nbytes < 0:
+            self.nbytes = 0
+        self._update_mode()
+
+    cpdef void _clear(self):
+        self.pq.clear()
+        self.nbytes = 0
+        self.rss_growth = 0
+        self.depth_first = False
+        self._ops = 0
+        self._rss_start = resident_memory()
+
+    cpdef vector[double] make_priority(self, Node node):
+        cdef:
+            vector[double] pri = vector[double](3)
+        pri[0] = -node.level
+        pri[1] = node.lb
+        pri[2] = -node.get_index()
+        return pri
+
+    cdef PriorityKey make_key(self, Node node):
+        cdef:
+            PriorityKey key
+        key.v[0] = -node.level
+        key.v[1] = node.lb
+        key.v[2] = -node.get_index()
+        key.n = 3
+        return key
@@ -1,4 +1,5 @@
 from libcpp cimport bool
+from libcpp.vector cimport vector
 
 import copy
 
@@ -17,6 +18,8 @@ cdef class Problem:
 
     cpdef double calc_bound(self)
 
+    cpdef vector[double] calc_bound_batch(self, list[Problem] children)
+
     cpdef bool is_feasible(self)
 
     cpdef list[Problem] branch(self)
@@ -26,6 +29,8 @@ cdef class Problem:
 
     cpdef void compute_bound(self)
 
+    cpdef void compute_bound_batch(self, list[Problem] children)
+
     cpdef bool check_feasible(self)
 
     cpdef void set_solution(self, Solution solution)
@@ -36,6 +41,20 @@ cdef class Problem:
 
     cpdef double stronger_bound(self)
 
+    cpdef object state_key(self)
+
+    cpdef double state_value(self)
+
+    cpdef object solution_key(self)
+
+    cpdef object decisions(self)
+
+    cpdef Problem apply_decisions(self, object decisions)
+
+    cpdef double cost_decrease(self, Problem former)
+
+    cpdef Py_ssize_t memory_size(self)
+
     cpdef void upgrade_bound(self, double new_lb)
 
     cpdef Problem copy(self, bool deep=*)
@@ -47,3 +66,12 @@ cdef class Problem:
 
     cdef inline Problem shallow_copy(self):
         return copy.copy(self)
+
+
+cdef inline bool batch_bound(Problem problem):
+    """Whether *problem* overrides ``calc_bound_batch``, so its children
+    are better evaluated at once than one at a time."""
+    return (
+        type(problem).calc_bound_batch
+        is not Problem.__dict__['calc_bound_batch']
+    )
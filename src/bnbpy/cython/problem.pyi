@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional, Sequence, TypeVar, Union
+from typing import Any, Hashable, Optional, Sequence, TypeVar, Union
 
 from bnbpy.cython.solution import Solution
 
@@ -53,6 +53,30 @@ class Problem:
         """
         ...
 
+    def calc_bound_batch(self, children: list[P]) -> list[float]:
+        """
+        Returns lower bounds of child problems derived from this one
+        by branching. Used instead of `calc_bound` when children are
+        evaluated as they are created (``eval_node='in'``).
+
+        By default, `calc_bound` is called for each child. Override it
+        to compute the bounds of all siblings at once, e.g. reusing
+        the state they share with their parent. Searches only call it
+        if overridden, and otherwise evaluate children one at a time,
+        each between its own eval callbacks.
+
+        Parameters
+        ----------
+        children : list[Problem]
+            Child problems returned by `branch`
+
+        Returns
+        -------
+        list[float]
+            Lower bounds, in the same order as `children`
+        """
+        ...
+
     @abstractmethod
     def is_feasible(self) -> bool:
         """
@@ -100,6 +124,20 @@ class Problem:
         """
         ...
 
+    def compute_bound_batch(self, children: list[P]) -> None:
+        """
+        This method is not intended to be modified by the user.
+
+        Computes the lower bounds of child problems via
+        `calc_bound_batch` and sets them to their solutions.
+
+        Raises
+        ------
+        ValueError
+            If `calc_bound_batch` does not return one bound per child.
+        """
+        ...
+
     def check_feasible(self) -> bool:
         """
         This method is not intended to be modified by the user.
@@ -170,6 +208,141 @@ class Problem:
         """
         ...
 
+    def state_key(self) -> Optional[Hashable]:
+        """Placeholder for the key of the problem state, used by a
+        :class:`~bnbpy.cython.transposition.TranspositionTable` to
+        detect duplicate or dominated subproblems before their bounds
+        are evaluated.
+
+        Two problems with equal keys must have the same set of
+        completions, such that the one with the smaller
+        `state_value` leads to solutions at least as good.
+        For instance, the set of jobs fixed in a sequence.
+
+        Returns
+        -------
+        Optional[Hashable]
+            Hashable key, or None (in case not implemented)
+        """
+        ...
+
+    def state_value(self) -> float:
+        """Value of the problem state compared among problems with
+        equal `state_key`, lower is better (e.g. the cost of the
+        decisions fixed so far).
+
+        By default 0.0, so problems with equal keys are duplicates.
+
+        Returns
+        -------
+        float
+            State value
+        """
+        ...
+
+    def solution_key(self) -> Optional[Hashable]:
+        """Placeholder for the key identifying the solution of a
+        feasible problem, used by a
+        :class:`~bnbpy.cython.pool.SolutionPool` to keep distinct
+        solutions only.
+
+        Problems reaching the same solution by different paths (or
+        heuristics) should return equal keys, such as the sequence of
+        jobs of a schedule.
+
+        Returns
+        -------
+        Optional[Hashable]
+            Hashable key, or None (every solution is distinct)
+        """
+        ...
+
+    def decisions(self) -> Any:
+        """Compact description of the decisions fixed in this
+        subproblem, kept by a
+        :class:`~bnbpy.cython.frontier.FrontierRecorder` for each leaf
+        of the tree instead of the subproblem itself.
+
+        It must only depend on the decisions, not on the data of the
+        problem, e.g. the jobs sequenced so far.
+
+        Returns
+        -------
+        Any
+            Decisions, applied by `apply_decisions`
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not support reoptimization.
+        """
+        ...
+
+    def apply_decisions(self, decisions: Any) -> Optional['Problem']:
+        """Returns the subproblem of this (root) problem with the
+        *decisions* of a subproblem of a former version of it, such as
+        one with different costs, used by
+        :meth:`~bnbpy.cython.search.BranchAndBound.reoptimize`.
+
+        Branching must not depend on the data that changes, such that
+        the leaves of a former tree still partition the solutions of
+        this problem. The bound of the subproblem is computed by the
+        search.
+
+        Parameters
+        ----------
+        decisions : Any
+            Decisions returned by `decisions`
+
+        Returns
+        -------
+        Optional[Problem]
+            New subproblem, or None if the decisions are infeasible
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not support reoptimization.
+        """
+        ...
+
+    def cost_decrease(self, former: 'Problem') -> float:
+        """Upper bound on how much cheaper any solution of this problem
+        is than the same solution of *former*, a former version of it.
+
+        Bounds of the former tree, lowered by this amount, remain valid
+        and prune subtrees in a reoptimization without applying their
+        decisions. By default infinity, i.e., the bounds of all leaves
+        are recomputed.
+
+        Parameters
+        ----------
+        former : Problem
+            Former version of this problem
+
+        Returns
+        -------
+        float
+            Maximum cost decrease
+        """
+        ...
+
+    def memory_size(self) -> int:
+        """Approximate memory in bytes held by the problem, used by
+        memory-aware node managers.
+
+        By default, the size of the object, of its solution and of the
+        values in its ``__dict__``, not recursing into containers.
+        Problems holding large containers or native data should
+        override it.
+
+        Returns
+        -------
+        int
+            Size in bytes
+        """
+        ...
+
     def upgrade_bound(self, new_lb: float) -> None:
         """Upgrades the solution lb to new_lb if strictly greater.
 
@@ -1,6 +1,9 @@
+from libc.math cimport INFINITY
 from libcpp cimport bool
+from libcpp.vector cimport vector
 
 import copy
+import sys
 
 from bnbpy.cython.solution cimport Solution
 from bnbpy.cython.status cimport OptStatus
@@ -50,10 +53,58 @@ cdef class Problem:
         """
         raise NotImplementedError("Must implement `calc_bound` method")
 
+    cpdef vector[double] calc_bound_batch(self, list[Problem] children):
+        """
+        Returns lower bounds of child problems derived from this one
+        by branching. Used instead of `calc_bound` when children are
+        evaluated as they are created (``eval_node='in'``).
+
+        By default, `calc_bound` is called for each child. Override it
+        to compute the bounds of all siblings at once, e.g. reusing
+        the state they share with their parent. Searches only call it
+        if overridden, and otherwise evaluate children one at a time,
+        each between its own eval callbacks.
+
+        Parameters
+        ----------
+        children : list[Problem]
+            Child problems returned by `branch`
+
+        Returns
+        -------
+        list[float]
+            Lower bounds, in the same order as `children`
+        """
+        cdef:
+            int i
+            Problem child
+            vector[double] out = vector[double](len(children))
+
+        for i in range(len(children)):
+            child = children[i]
+            out[i] = child.calc_bound()
+        return out
+
     cpdef void compute_bound(self):
         lb = self.calc_bound()
         self.solution.set_lb(lb)
 
+    cpdef void compute_bound_batch(self, list[Problem] children):
+        cdef:
+            int i
+            Problem child
+            vector[double] lbs
+
+        lbs = self.calc_bound_batch(children)
+        if lbs.size() != len(children):
+            raise ValueError(
+                f'calc_bound_batch returned {lbs.size()} bounds'
+                f' for {len(children)} children'
+            )
+        for i in range(len(children)):
+            child = children[i]
+            child.solution.set_lb(lbs[i])
+
     cpdef bool is_feasible(self):
         """
         Returns `True` if the problem in its complete
@@ -150,6 +201,155 @@ cdef class Problem:
         """
         return self.solution.lb
 
+    cpdef object state_key(self):
+        """Placeholder for the key of the problem state, used by a
+        :class:`~bnbpy.cython.transposition.TranspositionTable` to
+        detect duplicate or dominated subproblems before their bounds
+        are evaluated.
+
+        Two problems with equal keys must have the same set of
+        completions, such that the one with the smaller
+        `state_value` leads to solutions at least as good.
+        For instance, the set of jobs fixed in a sequence.
+
+        Returns
+        -------
+        Optional[Hashable]
+            Hashable key, or None (in case not implemented)
+        """
+        return None
+
+    cpdef double state_value(self):
+        """Value of the problem state compared among problems with
+        equal `state_key`, lower is better (e.g. the cost of the
+        decisions fixed so far).
+
+        By default 0.0, so problems with equal keys are duplicates.
+
+        Returns
+        -------
+        float
+            State value
+        """
+        return 0.0
+
+    cpdef object solution_key(self):
+        """Placeholder for the key identifying the solution of a
+        feasible problem, used by a
+        :class:`~bnbpy.cython.pool.SolutionPool` to keep distinct
+        solutions only.
+
+        Problems reaching the same solution by different paths (or
+        heuristics) should return equal keys, such as the sequence of
+        jobs of a schedule.
+
+        Returns
+        -------
+        Optional[Hashable]
+            Hashable key, or None (every solution is distinct)
+        """
+        return None
+
+    cpdef object decisions(self):
+        """Compact description of the decisions fixed in this
+        subproblem, kept by a
+        :class:`~bnbpy.cython.frontier.FrontierRecorder` for each leaf
+        of the tree instead of the subproblem itself.
+
+        It must only depend on the decisions, not on the data of the
+        problem, e.g. the jobs sequenced so far.
+
+        Returns
+        -------
+        Any
+            Decisions, applied by `apply_decisions`
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not support reoptimization.
+        """
+        raise NotImplementedError(
+            "Must implement `decisions` to record a frontier"
+        )
+
+    cpdef Problem apply_decisions(self, object decisions):
+        """Returns the subproblem of this (root) problem with the
+        *decisions* of a subproblem of a former version of it, such as
+        one with different costs, used by
+        :meth:`~bnbpy.cython.search.BranchAndBound.reoptimize`.
+
+        Branching must not depend on the data that changes, such that
+        the leaves of a former tree still partition the solutions of
+        this problem. The bound of the subproblem is computed by the
+        search.
+
+        Parameters
+        ----------
+        decisions : Any
+            Decisions returned by `decisions`
+
+        Returns
+        -------
+        Optional[Problem]
+            New subproblem, or None if the decisions are infeasible
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not support reoptimization.
+        """
+        raise NotImplementedError(
+            "Must implement `apply_decisions` to reoptimize"
+        )
+
+    cpdef double cost_decrease(self, Problem former):
+        """Upper bound on how much cheaper any solution of this problem
+        is than the same solution of *former*, a former version of it.
+
+        Bounds of the former tree, lowered by this amount, remain valid
+        and prune subtrees in a reoptimization without applying their
+        decisions. By default infinity, i.e., the bounds of all leaves
+        are recomputed.
+
+        Parameters
+        ----------
+        former : Problem
+            Former version of this problem
+
+        Returns
+        -------
+        float
+            Maximum cost decrease
+        """
+        return INFINITY
+
+    cpdef Py_ssize_t memory_size(self):
+        """Approximate memory in bytes held by the problem, used by
+        memory-aware node managers.
+
+        By default, the size of the object, of its solution and of the
+        values in its ``__dict__``, not recursing into containers.
+        Problems holding large containers or native data should
+        override it.
+
+        Returns
+        -------
+        int
+            Size in bytes
+        """
+        cdef:
+            Py_ssize_t size
+            object attrs
+
+        size = sys.getsizeof(self) + sys.getsizeof(self.solution)
+        attrs = getattr(self, '__dict__', None)
+        if attrs:
+            size += sys.getsizeof(attrs)
+            for value in attrs.values():
+                size += sys.getsizeof(value)
+        return size
+
     cpdef void upgrade_bound(self, double new_lb):
         if new_lb > self.solution.lb:
             self.solution.set_lb(new_lb)
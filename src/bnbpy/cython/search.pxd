@@ -7,10 +7,16 @@ from libcpp.string cimport string
 
 from typing import Optional
 
+from bnbpy.cython.checkpoint cimport CheckpointWriter
+from bnbpy.cython.frontier cimport FrontierRecorder
 from bnbpy.cython.manager cimport BaseNodeManager
 from bnbpy.cython.node cimport Node
+from bnbpy.cython.pool cimport SolutionPool
 from bnbpy.cython.problem cimport Problem
 from bnbpy.cython.solution cimport Solution
+from bnbpy.cython.stats cimport SearchStats
+from bnbpy.cython.transposition cimport TranspositionTable
+from bnbpy.cython.tree cimport TreeRecorder
 
 
 cdef:
@@ -22,6 +28,17 @@ cdef class SearchResults:
     cdef public:
         Solution solution
         Problem problem
+        SearchStats stats
+
+
+cdef class SearchProgress:
+    cdef readonly:
+        unsigned long long explored
+        double ub
+        double lb
+        double gap
+        bool done
+        SearchResults results
 
 
 cdef class BranchAndBound:
@@ -29,11 +46,18 @@ cdef class BranchAndBound:
     cdef public:
         double rtol
         double atol
+        double time_tol
+        double log_interval
+        TranspositionTable table
+        TreeRecorder recorder
+        SolutionPool pool
+        FrontierRecorder frontier
 
     cdef readonly:
         Problem problem
         Node root
         double gap
+        double cutoff
         BaseNodeManager manager
         unsigned long long explored
         string eval_node
@@ -42,9 +66,20 @@ cdef class BranchAndBound:
         bool save_tree
         Node incumbent
         Node bound_node
+        SearchStats stats
+        str checkpoint_path
+        double checkpoint_interval
 
     cdef:
         object logger
+        bool _log_enabled
+        double _log_last
+        unsigned long long _log_skipped
+        bool _stepping
+        bool _batch_bound
+        CheckpointWriter _checkpoint_writer
+        Py_ssize_t _checkpoint_batch
+        double _checkpoint_last
 
     cdef double get_ub(BranchAndBound self)
 
@@ -90,10 +125,49 @@ cdef class BranchAndBound:
 
     cpdef void set_bound(BranchAndBound self, Node node)
 
+    cpdef void set_cutoff(BranchAndBound self, double value)
+
+    cpdef void load_frontier(BranchAndBound self, list[Node] nodes)
+
+    cpdef list[Node] split_frontier(BranchAndBound self, int n)
+
+    cpdef void checkpoint(BranchAndBound self, object path)
+
+    cpdef void restore(BranchAndBound self, object path)
+
+    cpdef void set_checkpoint(
+        BranchAndBound self,
+        object path,
+        double interval=*,
+        Py_ssize_t batch_size=*,
+    )
+
+    cpdef void reoptimize(
+        BranchAndBound self,
+        FrontierRecorder frontier,
+        Problem incumbent=*,
+    )
+
+    cdef CheckpointWriter _open_checkpoint(BranchAndBound self, object path)
+
+    cdef void _autosave(BranchAndBound self)
+
+    cdef void _finish_checkpoint(BranchAndBound self)
+
+    cdef SearchResults _get_results(BranchAndBound self)
+
+    cdef list[Node] _drain(BranchAndBound self)
+
+    cdef list[Node] _probe_table(BranchAndBound self, list[Node] children)
+
     cdef void _enqueue_core(BranchAndBound self, Node node)
 
+    cdef void _enqueue_batch(BranchAndBound self, Node node, list[Node] children)
+
     cdef Node _dequeue_core(BranchAndBound self)
 
+    cdef void _prune_core(BranchAndBound self, Node node, bool at_enqueue)
+
     cdef bool _check_termination(BranchAndBound self, unsigned long long maxiter)
 
     cdef void _update_bound(BranchAndBound self)
@@ -102,6 +176,12 @@ cdef class BranchAndBound:
 
     cpdef void log_row(BranchAndBound self, object message)
 
+    cpdef void log_progress(BranchAndBound self, object message)
+
+    cdef void _log_start(BranchAndBound self)
+
+    cdef void _log_summary(BranchAndBound self, double elapsed)
+
     cdef void _update_gap(BranchAndBound self)
 
     cdef bool _optimality_check(BranchAndBound self)
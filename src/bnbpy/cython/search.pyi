@@ -1,10 +1,24 @@
-from typing import Any, Generic, Literal, Optional, TypeVar, Union
-
+import os
+from typing import (
+    Any,
+    Generic,
+    Iterator,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from bnbpy.cython.frontier import FrontierRecorder
 from bnbpy.cython.manager import BaseNodeManager
 from bnbpy.cython.node import Node
+from bnbpy.cython.pool import SolutionPool
 from bnbpy.cython.problem import Problem
 from bnbpy.cython.solution import Solution
+from bnbpy.cython.stats import SearchStats
 from bnbpy.cython.status import OptStatus
+from bnbpy.cython.transposition import TranspositionTable
+from bnbpy.cython.tree import TreeRecorder
 from bnbpy.logger import SearchLogger
 
 P = TypeVar('P', bound=Problem)
@@ -14,8 +28,14 @@ class SearchResults(Generic[P]):
 
     solution: Solution
     problem: P
+    stats: SearchStats | None
 
-    def __init__(self, solution: Solution, problem: P) -> None:
+    def __init__(
+        self,
+        solution: Solution,
+        problem: P,
+        stats: SearchStats | None = None,
+    ) -> None:
         """Initialize SearchResults
 
         Parameters
@@ -25,6 +45,9 @@ class SearchResults(Generic[P]):
 
         problem : Problem
             The problem instance corresponding to the solution
+
+        stats : SearchStats, optional
+            Search statistics, if the search was profiled, by default None
         """
         ...
 
@@ -45,6 +68,48 @@ class SearchResults(Generic[P]):
         """Optimization status"""
         ...
 
+class SearchProgress(Generic[P]):
+    """State of a search after a step of :meth:`BranchAndBound.solve_iter`
+
+    Attributes
+    ----------
+    explored : int
+        Number of explored nodes
+
+    ub : float
+        Upper bound (cost of the incumbent, if any)
+
+    lb : float
+        Global lower bound
+
+    gap : float
+        Relative gap between bounds
+
+    done : bool
+        Whether the search finished, by optimality or by a limit
+
+    results : SearchResults
+        Results of the search so far
+    """
+
+    explored: int
+    ub: float
+    lb: float
+    gap: float
+    done: bool
+    results: SearchResults[P]
+
+    def __init__(
+        self,
+        explored: int,
+        ub: float,
+        lb: float,
+        gap: float,
+        done: bool,
+        results: SearchResults[P],
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+
 class BranchAndBound(Generic[P]):
     """
     Class for solving optimization problems via Branch & Bound.
@@ -81,14 +146,48 @@ class BranchAndBound(Generic[P]):
     For a customization of enqueueing and dequeueing strategies,
     pass a custom ``manager`` (subclass of `BaseNodeManager`) at construction
     time, or override ``enqueue`` / ``dequeue`` in a subclass.
+
+    Problems implementing `Problem.state_key` get a default
+    :class:`~bnbpy.cython.transposition.TranspositionTable` as ``table``,
+    consulted as children are created to prune duplicate or dominated
+    subproblems before their bounds are evaluated. Assign another table
+    to change its memory cap or eviction policy, or ``None`` to disable it.
+    Searches with a ``pool`` do not consult the table, as dominated
+    subproblems may still hold some of the best solutions.
+
+    Assign a :class:`~bnbpy.cython.tree.TreeRecorder` as ``recorder``
+    to log the events of each node in compact arrays, which can be
+    plotted by :func:`bnbpy.plot.plot_tree` without keeping the tree
+    (and its subproblems) in memory as ``save_tree`` does.
+
+    Assign a :class:`~bnbpy.cython.pool.SolutionPool` as ``pool`` to
+    keep the k best distinct solutions found instead of the incumbent
+    only. The upper bound of the search is then the cost of the k-th
+    best solution once k are found, such that the pool holds the k best
+    solutions when the search terminates by optimality.
+
+    Assign a :class:`~bnbpy.cython.frontier.FrontierRecorder` as
+    ``frontier`` to keep the leaves of the tree, from which a modified
+    version of the problem can be solved by :meth:`reoptimize`.
+
+    Long searches can be saved by :meth:`checkpoint`, periodically
+    if enabled by :meth:`set_checkpoint`, and resumed by :meth:`restore`,
+    possibly in another process.
     """
 
     problem: P
     root: Node[P]
     gap: float
+    cutoff: float
     manager: BaseNodeManager[P]
     rtol: float
     atol: float
+    time_tol: float
+    log_interval: float
+    table: TranspositionTable | None
+    recorder: TreeRecorder | None
+    pool: SolutionPool | None
+    frontier: FrontierRecorder | None
     explored: int
     eval_node: str
     eval_in: bool
@@ -96,6 +195,9 @@ class BranchAndBound(Generic[P]):
     save_tree: bool
     incumbent: Node[P] | None
     bound_node: Node[P] | None
+    stats: SearchStats | None
+    checkpoint_path: str | None
+    checkpoint_interval: float
     __logger: SearchLogger
 
     def __init__(
@@ -123,6 +225,9 @@ class BranchAndBound(Generic[P]):
                 parent `branch`, before inserting child nodes
                 in the active manager. Useful when
                 bound computation is inexpensive.
+                Siblings are evaluated at once via
+                `Problem.calc_bound_batch` of the parent, if
+                overridden.
 
             *   'out': call `Problem.calc_bound` after
                 selecting a node from the active manager.
@@ -136,7 +241,8 @@ class BranchAndBound(Generic[P]):
 
         save_tree : bool, optional
             Whether to save node relationships, by default False.
-            It can consume a lot of memory in large trees.
+            It can consume a lot of memory in large trees, which
+            are better recorded by a ``recorder``.
 
         manager : BaseNodeManager, optional
             Node manager that controls the search traversal strategy.
@@ -148,7 +254,7 @@ class BranchAndBound(Generic[P]):
         ...
 
     @staticmethod
-    def build_manager(strategy: str) -> BaseNodeManager[Any]:
+    def build_manager(strategy: str, **options: Any) -> BaseNodeManager[Any]:
         """Factory method that returns a :class:`BaseNodeManager` for the
         given traversal strategy name.
 
@@ -156,7 +262,7 @@ class BranchAndBound(Generic[P]):
         ----------
         strategy : str
             One of ``'dfs'``, ``'bfs'``, ``'best'``,
-            ``'lifo'``, ``'fifo'``, ``'cbfs'``.
+            ``'lifo'``, ``'fifo'``, ``'cbfs'``, ``'beam'``, ``'lds'``.
 
             *   ``'dfs'``  — Depth-first search (``DepthFirstSearch``).
             *   ``'bfs'``  — Breadth-first search (``FifoManager``).
@@ -164,6 +270,9 @@ class BranchAndBound(Generic[P]):
             *   ``'lifo'`` — Last-in first-out stack (``LifoManager``).
             *   ``'fifo'`` — First-in first-out queue (``FifoManager``).
             *   ``'cbfs'`` — Cyclic best-first search (``CyclicBestSearch``).
+            *   ``'beam'`` — Beam search (``BeamSearch``), not exhaustive.
+            *   ``'lds'``  — Limited discrepancy search
+                (``LimitedDiscrepancySearch``).
 
         options : Any
             Additional keyword arguments to pass to the manager constructor.
@@ -202,6 +311,8 @@ class BranchAndBound(Generic[P]):
         timelimit: Optional[Union[int, float]] = None,
         rtol: Optional[float] = None,
         atol: Optional[float] = None,
+        workers: Optional[int] = None,
+        profile: bool = False,
     ) -> SearchResults[P]:
         """Solves optimization problem using Branch & Bound.
 
@@ -213,13 +324,31 @@ class BranchAndBound(Generic[P]):
         otherwise a second call to ``solve()`` resumes from the current
         queue state.
 
+        With ``workers > 1``, the tree is first explored breadth-first
+        until the queue holds at least ``RAMP_UP_FACTOR * workers`` nodes
+        (see :mod:`bnbpy.parallel`). Each of these nodes is then the root
+        of a subtree solved by an independent copy of this search in a
+        pool of processes, which share improved upper bounds. Problems
+        must therefore support pickling. Subtrees not finished within the
+        limits are put back in the queue.
+
+        With ``profile=True``, time and call counts of each phase of the
+        search, as well as node counters, are collected in a
+        :class:`~bnbpy.cython.stats.SearchStats` object, available as
+        ``stats`` in the results.  Statistics accumulate over calls that
+        resume the search with ``profile=True``, and only cover work done
+        in this process when ``workers > 1``.
+
         Parameters
         ----------
         maxiter : Optional[int], optional
             Maximum number of additional iterations, by default None
 
         timelimit : Optional[Union[int, float]], optional
-            Time limit in seconds, by default None
+            Time limit in seconds, by default None. The clock is read at
+            an interval calibrated from the observed time per node, so
+            the search stops within about ``self.time_tol`` seconds
+            (0.01 by default) of the limit.
 
         rtol : Optional[float], optional
             Relative tolerance for termination. If provided, permanently
@@ -229,6 +358,102 @@ class BranchAndBound(Generic[P]):
             Absolute tolerance for termination. If provided, permanently
             updates ``self.atol``, by default None
 
+        workers : Optional[int], optional
+            Number of worker processes used to solve subtrees in parallel,
+            by default None (sequential search)
+
+        profile : bool, optional
+            Whether to collect search statistics, by default False
+
+        Returns
+        -------
+        SearchResults
+            Search results containing best solution and problem instance
+        """
+        ...
+
+    def solve_iter(
+        self,
+        step_nodes: Optional[int] = 1000,
+        step_time: Optional[float] = None,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ) -> Iterator[SearchProgress[P]]:
+        """Solves the problem in steps, yielding the progress after each.
+
+        Each step is a call to :meth:`solve` limited to ``step_nodes``
+        nodes and ``step_time`` seconds, so the search can be paused
+        between steps, resumed later by any solve method, or abandoned
+        by closing the generator.
+
+        Parameters
+        ----------
+        step_nodes : Optional[int], optional
+            Maximum number of nodes explored per step, by default 1000
+
+        step_time : Optional[float], optional
+            Maximum time in seconds per step, by default None
+
+        maxiter : Optional[int], optional
+            Maximum number of additional iterations, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds over all steps, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination. If provided, permanently
+            updates ``self.rtol``, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination. If provided, permanently
+            updates ``self.atol``, by default None
+
+        Yields
+        ------
+        SearchProgress
+            Bounds and explored nodes after each step. The last one
+            has ``done`` set and holds the final results.
+        """
+        ...
+
+    async def solve_async(
+        self,
+        step_nodes: Optional[int] = 1000,
+        step_time: Optional[float] = 0.01,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ) -> SearchResults[P]:
+        """Solves the problem in steps of :meth:`solve_iter`, handing
+        control back to the event loop between steps.
+
+        Many searches can thus share one event loop, each blocking
+        it for at most one step. Cancelling the awaiting task stops
+        the search after the current step, leaving it resumable.
+
+        Parameters
+        ----------
+        step_nodes : Optional[int], optional
+            Maximum number of nodes explored per step, by default 1000
+
+        step_time : Optional[float], optional
+            Maximum time in seconds per step, by default 0.01
+
+        maxiter : Optional[int], optional
+            Maximum number of additional iterations, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds over all steps, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination, by default None
+
         Returns
         -------
         SearchResults
@@ -239,8 +464,9 @@ class BranchAndBound(Generic[P]):
     def reset(self) -> None:
         """Reset the search state for a fresh solve.
 
-        Clears the queue, incumbent, bound node, and root so that the
-        next call to ``solve()`` starts from scratch.
+        Clears the queue, incumbent, bound node, cutoff, root and
+        statistics so that the next call to ``solve()`` starts from
+        scratch.
         """
         ...
 
@@ -336,6 +562,10 @@ class BranchAndBound(Generic[P]):
         """Assigns the current node as incumbent, updates gap and calls
         `solution_callback`
 
+        With a ``pool``, the node is added to it instead, the best
+        solution of the pool being the incumbent. Duplicates of pooled
+        solutions are pruned.
+
         Parameters
         ----------
         node : Node[P]
@@ -354,6 +584,176 @@ class BranchAndBound(Generic[P]):
         """
         ...
 
+    def set_cutoff(self, value: float) -> None:
+        """Sets an external upper bound, such as the cost of a solution
+        found by another search, used to prune nodes as if it were
+        the incumbent.
+
+        It is ignored unless strictly better than the current upper bound.
+        The current incumbent, being worse than the cutoff, is discarded,
+        as are solutions of the ``pool`` costing as much or more.
+
+        Parameters
+        ----------
+        value : float
+            Cost of a known feasible solution
+        """
+        ...
+
+    def load_frontier(self, nodes: list[Node[P]]) -> None:
+        """Inserts open nodes created elsewhere (e.g. by another search)
+        into the active manager, keeping their current lower bounds.
+
+        If the search has not started yet, it is initialized without
+        warmstart, such that ``solve()`` explores only the subtrees
+        of the given nodes.
+
+        Parameters
+        ----------
+        nodes : list[Node[P]]
+            Open nodes to be explored
+        """
+        ...
+
+    def split_frontier(self, n: int) -> list[Node[P]]:
+        """Removes up to ``n`` open nodes from the active manager
+        to be explored elsewhere, such as in work stealing.
+
+        The shallowest nodes are chosen, as they usually root
+        the largest subtrees. At least one node is always kept.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of nodes to remove
+
+        Returns
+        -------
+        list[Node[P]]
+            Removed nodes
+        """
+        ...
+
+    def checkpoint(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Saves the state of the search to a file, from which it can
+        be resumed by :meth:`restore`.
+
+        The open nodes, incumbent, solutions of the ``pool``, cutoff,
+        number of explored nodes, tolerances and manager counters are
+        saved, but not the statistics, transposition table or recorded
+        tree. Problems are pickled, the original one first, so hooks
+        such as the compact pickling of flow-shop problems can share
+        instance data among nodes. See
+        :class:`~bnbpy.cython.checkpoint.CheckpointWriter` for the file
+        format.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Destination file, replaced only once completely written
+
+        Raises
+        ------
+        ValueError
+            If the search has not started.
+        """
+        ...
+
+    def restore(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Resumes a search saved by :meth:`checkpoint`, replacing the
+        current state, such that ``solve()`` continues from it.
+
+        Tolerances, the cutoff and the number of explored nodes are
+        those of the saved search. The manager should be of the same
+        type as the saved one; open nodes are read back detached from
+        their parents, as the ``problem`` given to this search is the
+        root of the restored tree.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Checkpoint file
+
+        Raises
+        ------
+        ValueError
+            If the file is not a checkpoint of a supported version.
+        """
+        ...
+
+    def set_checkpoint(
+        self,
+        path: Optional[Union[str, os.PathLike[str]]],
+        interval: float = 300.0,
+        batch_size: int = 1000,
+    ) -> None:
+        """Enables periodic checkpoints of the search while solving.
+
+        Once ``interval`` seconds have passed since the last
+        checkpoint, the open nodes are snapshot and written to
+        ``path`` ``batch_size`` at a time, one batch per node
+        explored, so the search is never stalled by a whole write.
+        The file is replaced only once complete, and checkpoints
+        being written when ``solve()`` returns are completed.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | None
+            Destination file, or None to disable checkpoints
+
+        interval : float, optional
+            Minimum time in seconds between checkpoints,
+            by default 300.0
+
+        batch_size : int, optional
+            Number of nodes written per node explored, by default 1000
+
+        Raises
+        ------
+        ValueError
+            If ``interval`` is negative or ``batch_size`` not positive.
+        """
+        ...
+
+    def reoptimize(
+        self,
+        frontier: FrontierRecorder,
+        incumbent: Optional[Problem] = None,
+    ) -> None:
+        """Starts a search of ``problem``, a modified version of a
+        problem solved before, from the leaves of the former tree
+        recorded by *frontier* instead of the root.
+
+        Former bounds of the leaves, lowered by
+        :meth:`~bnbpy.cython.problem.Problem.cost_decrease`, still
+        prune most of them once the former incumbent (by default, that
+        of *frontier*) is rebuilt in ``problem`` as a warmstart, along
+        with the warmstart of ``problem``. Only the other leaves are
+        rebuilt by :meth:`~bnbpy.cython.problem.Problem.apply_decisions`
+        and have their bounds evaluated under the new data (once
+        dequeued, for nodes evaluated out), so when the data change
+        little ``solve()`` explores a fraction of the nodes of a cold
+        search.
+
+        The leaves of this search are recorded by its ``frontier``, if
+        any, such that it can be reoptimized again. A search
+        reoptimized from its own frontier gets a new one.
+
+        Parameters
+        ----------
+        frontier : FrontierRecorder
+            Leaves recorded by the former search
+
+        incumbent : Problem, optional
+            Former solution, by default the incumbent of *frontier*
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not implement ``apply_decisions``.
+        """
+        ...
+
     def log_row(self, message: Any) -> None:
         """Log a row to the search logger.
 
@@ -364,6 +764,22 @@ class BranchAndBound(Generic[P]):
         """
         ...
 
+    def log_progress(self, message: Any) -> None:
+        """Log a progress row, such as an incumbent or lower bound
+        update, at most once every ``self.log_interval`` seconds.
+
+        Nothing is formatted if the logger did not handle INFO records
+        at the start of the current solve.  Rows skipped by the
+        interval are counted in the summary logged at the end of
+        :meth:`solve`; termination rows are always logged.
+
+        Parameters
+        ----------
+        message : Any
+            Message to log
+        """
+        ...
+
 class DepthFirstBnB(BranchAndBound[P]):
     """Depth-first Branch & Bound algorithm.
 
@@ -6,17 +6,50 @@ from libc.limits cimport ULLONG_MAX
 from libcpp cimport bool
 from libcpp.string cimport string
 
+import asyncio
 import logging
+import os
 import time
 from typing import Any, Literal, Optional, Union
 
-from bnbpy.cython.levelqueue cimport CyclicBestSearch
+from bnbpy.cython.checkpoint cimport CheckpointWriter
+from bnbpy.cython.frontier cimport FrontierRecorder
+from bnbpy.cython.levelqueue cimport BeamSearch, CyclicBestSearch
 from bnbpy.cython.manager cimport BaseNodeManager, FifoManager, LifoManager
 from bnbpy.cython.node cimport Node, init_node
-from bnbpy.cython.primanager cimport BestFirstSearch, DepthFirstSearch
-from bnbpy.cython.problem cimport Problem
+from bnbpy.cython.pool cimport SolutionPool
+from bnbpy.cython.primanager cimport (
+    BestFirstSearch,
+    DepthFirstSearch,
+    LimitedDiscrepancySearch,
+)
+from bnbpy.cython.problem cimport Problem, batch_bound
 from bnbpy.cython.solution cimport Solution
+from bnbpy.cython.stats cimport (
+    BOUND,
+    BRANCH,
+    CALLBACK,
+    DEQUEUE,
+    Deadline,
+    ENQUEUE,
+    FEASIBILITY,
+    INCUMBENT,
+    PRUNE,
+    SearchStats,
+    deadline_reached,
+    deadline_start,
+    monotonic,
+)
 from bnbpy.cython.status cimport OptStatus
+from bnbpy.cython.transposition cimport TranspositionTable
+from bnbpy.cython.tree cimport (
+    BRANCHED,
+    OPENED,
+    PRUNED,
+    SOLUTION,
+    TreeRecorder,
+)
+from bnbpy.cython.checkpoint import read_checkpoint
 from bnbpy.logger import SearchLogger
 
 log = logging.getLogger(__name__)
@@ -43,7 +76,8 @@ cdef class SearchResults:
     def __init__(
         self,
         Solution solution,
-        Problem problem
+        Problem problem,
+        SearchStats stats=None,
     ) -> None:
         """Initialize SearchResults
 
@@ -54,9 +88,13 @@ cdef class SearchResults:
 
         problem : Problem
             The problem instance corresponding to the solution
+
+        stats : SearchStats, optional
+            Search statistics, if the search was profiled, by default None
         """
         self.solution = solution
         self.problem = problem
+        self.stats = stats
 
     def __repr__(self) -> str:
         return str(self.solution)
@@ -80,6 +118,53 @@ cdef class SearchResults:
         return self.solution.status
 
 
+cdef class SearchProgress:
+    """State of a search after a step of :meth:`BranchAndBound.solve_iter`
+
+    Attributes
+    ----------
+    explored : int
+        Number of explored nodes
+
+    ub : float
+        Upper bound (cost of the incumbent, if any)
+
+    lb : float
+        Global lower bound
+
+    gap : float
+        Relative gap between bounds
+
+    done : bool
+        Whether the search finished, by optimality or by a limit
+
+    results : SearchResults
+        Results of the search so far
+    """
+
+    def __init__(
+        self,
+        unsigned long long explored,
+        double ub,
+        double lb,
+        double gap,
+        bool done,
+        SearchResults results,
+    ) -> None:
+        self.explored = explored
+        self.ub = ub
+        self.lb = lb
+        self.gap = gap
+        self.done = done
+        self.results = results
+
+    def __repr__(self) -> str:
+        return (
+            f'SearchProgress(explored={self.explored}, ub={self.ub}, '
+            f'lb={self.lb}, gap={self.gap:.4f}, done={self.done})'
+        )
+
+
 cdef class BranchAndBound:
     """
     Class for solving optimization problems via Branch & Bound.
@@ -116,6 +201,33 @@ cdef class BranchAndBound:
     For a customization of enqueueing and dequeueing strategies,
     pass a custom ``manager`` (subclass of `BaseNodeManager`) at construction
     time, or override ``enqueue`` / ``dequeue`` in a subclass.
+
+    Problems implementing `Problem.state_key` get a default
+    :class:`~bnbpy.cython.transposition.TranspositionTable` as ``table``,
+    consulted as children are created to prune duplicate or dominated
+    subproblems before their bounds are evaluated. Assign another table
+    to change its memory cap or eviction policy, or ``None`` to disable it.
+    Searches with a ``pool`` do not consult the table, as dominated
+    subproblems may still hold some of the best solutions.
+
+    Assign a :class:`~bnbpy.cython.tree.TreeRecorder` as ``recorder``
+    to log the events of each node in compact arrays, which can be
+    plotted by :func:`bnbpy.plot.plot_tree` without keeping the tree
+    (and its subproblems) in memory as ``save_tree`` does.
+
+    Assign a :class:`~bnbpy.cython.pool.SolutionPool` as ``pool`` to
+    keep the k best distinct solutions found instead of the incumbent
+    only. The upper bound of the search is then the cost of the k-th
+    best solution once k are found, such that the pool holds the k best
+    solutions when the search terminates by optimality.
+
+    Assign a :class:`~bnbpy.cython.frontier.FrontierRecorder` as
+    ``frontier`` to keep the leaves of the tree, from which a modified
+    version of the problem can be solved by :meth:`reoptimize`.
+
+    Long searches can be saved by :meth:`checkpoint`, periodically
+    if enabled by :meth:`set_checkpoint`, and resumed by :meth:`restore`,
+    possibly in another process.
     """
 
     def __init__(
@@ -143,6 +255,9 @@ cdef class BranchAndBound:
                 parent `branch`, before inserting child nodes
                 in the active manager. Useful when
                 bound computation is inexpensive.
+                Siblings are evaluated at once via
+                `Problem.calc_bound_batch` of the parent, if
+                overridden.
 
             *   'out': call `Problem.calc_bound` after
                 selecting a node from the active manager.
@@ -156,7 +271,8 @@ cdef class BranchAndBound:
 
         save_tree : bool, optional
             Whether to save node relationships, by default False.
-            It can consume a lot of memory in large trees.
+            It can consume a lot of memory in large trees, which
+            are better recorded by a ``recorder``.
 
         manager : BaseNodeManager, optional
             Node manager that controls the search traversal strategy.
@@ -178,19 +294,55 @@ cdef class BranchAndBound:
         self.rtol = 1e-4
         self.atol = 1e-4
 
+        # Tolerance (seconds) in stopping after a time limit
+        self.time_tol = 0.01
+
+        # Minimum interval (seconds) between progress rows, zero to log
+        # every incumbent and lower bound update
+        self.log_interval = 0.0
+
         # Evaluation strategy flags
         self.eval_node = <string> eval_node.encode("utf-8")
         self.eval_in = self.eval_node in {'in', 'both'}
         self.eval_out = self.eval_node in {'out', 'both'}
         self.save_tree = save_tree
+        # Siblings are only bounded at once by problems able to
+        self._batch_bound = self.eval_in and batch_bound(problem)
 
         # Core search attributes
         self.incumbent = None
         self.bound_node = None
         self.gap = INFINITY
+        self.cutoff = LARGE_POS
+
+        # Statistics are only collected by profiled searches
+        self.stats = None
+
+        # Problems describing their state share a dominance table
+        self.table = None
+        if defines_state(problem):
+            self.table = TranspositionTable()
+
+        # Events of the search tree are only recorded on request
+        self.recorder = None
+
+        # Alternative solutions are only kept on request
+        self.pool = None
+
+        # Leaves of the tree are only kept on request, for reoptimization
+        self.frontier = None
+
+        # Periodic checkpoints are disabled by default
+        self.checkpoint_path = None
+        self.checkpoint_interval = INFINITY
+        self._checkpoint_writer = None
+        self._checkpoint_batch = 0
+        self._checkpoint_last = 0.0
 
         # Initialize logger
         self.logger = SearchLogger(log)
+        self._log_start()
+        self._stepping = False
 
     @classmethod
     def __class_getitem__(cls, item: type[Problem]):
@@ -207,17 +359,25 @@ cdef class BranchAndBound:
         return self.get_ub()
 
     cdef double get_ub(BranchAndBound self):
+        # A pool bounds the search by the worst of its solutions
+        if self.pool is not None:
+            return min(self.pool.threshold(), self.cutoff)
         if self.incumbent is not None:
             return self.incumbent.lb
-        return LARGE_POS
+        return self.cutoff
 
     @property
     def lb(self):
         return self.get_lb()
 
     cdef double get_lb(BranchAndBound self):
+        # Nodes dropped by heuristic managers still bound the optimum
         if self.bound_node is not None:
-            return min(self.bound_node.lb, self.get_ub())
+            return min(
+                self.bound_node.lb, self.get_ub(), self.manager.dropped_lb
+            )
+        if self.root is not None and not self.manager.not_empty():
+            return min(self.get_ub(), self.manager.dropped_lb)
         return LOW_NEG
 
     @property
@@ -239,7 +399,8 @@ cdef class BranchAndBound:
         Parameters
         ----------
         strategy : str
-            One of ``'dfs'``, ``'bfs'``, ``'best'``, ``'lifo'``, ``'fifo'``, ``'cbfs'``.
+            One of ``'dfs'``, ``'bfs'``, ``'best'``, ``'lifo'``, ``'fifo'``,
+            ``'cbfs'``, ``'beam'``, ``'lds'``.
 
             *   ``'dfs'``  — Depth-first search (``DepthFirstSearch``).
             *   ``'bfs'``  — Breadth-first search (``FifoManager``).
@@ -247,6 +408,9 @@ cdef class BranchAndBound:
             *   ``'lifo'`` — Last-in first-out stack (``LifoManager``).
             *   ``'fifo'`` — First-in first-out queue (``FifoManager``).
             *   ``'cbfs'`` — Cyclic best-first search (``CyclicBestSearch``).
+            *   ``'beam'`` — Beam search (``BeamSearch``), not exhaustive.
+            *   ``'lds'``  — Limited discrepancy search
+                (``LimitedDiscrepancySearch``).
 
         options : Any
             Additional keyword arguments to pass to the manager constructor.
@@ -268,6 +432,8 @@ cdef class BranchAndBound:
             'lifo': LifoManager,
             'fifo': FifoManager,
             'cbfs': CyclicBestSearch,
+            'beam': BeamSearch,
+            'lds': LimitedDiscrepancySearch,
         }
         key = strategy.lower()
         if key not in _strategies:
@@ -292,6 +458,18 @@ cdef class BranchAndBound:
         self.bound_node = None
         self.gap = INFINITY
         self.manager.clear()
+        if self.table is not None:
+            self.table.clear()
+        if self.recorder is not None:
+            self.recorder.clear()
+        if self.pool is not None:
+            self.pool.clear()
+        if self.frontier is not None:
+            self.frontier.start(self.problem)
+        # A checkpoint being written describes the former search
+        if self._checkpoint_writer is not None:
+            self._checkpoint_writer.abort()
+            self._checkpoint_writer = None
 
     def solve(
         self,
@@ -299,6 +477,8 @@ cdef class BranchAndBound:
         timelimit: Optional[Union[int, float]] = None,
         rtol: Optional[float] = None,
         atol: Optional[float] = None,
+        workers: Optional[int] = None,
+        profile: bool = False,
     ) -> SearchResults:
         """Solves optimization problem using Branch & Bound.
 
@@ -310,13 +490,31 @@ cdef class BranchAndBound:
         otherwise a second call to ``solve()`` resumes from the current
         queue state.
 
+        With ``workers > 1``, the tree is first explored breadth-first
+        until the queue holds at least ``RAMP_UP_FACTOR * workers`` nodes
+        (see :mod:`bnbpy.parallel`). Each of these nodes is then the root
+        of a subtree solved by an independent copy of this search in a
+        pool of processes, which share improved upper bounds. Problems
+        must therefore support pickling. Subtrees not finished within the
+        limits are put back in the queue.
+
+        With ``profile=True``, time and call counts of each phase of the
+        search, as well as node counters, are collected in a
+        :class:`~bnbpy.cython.stats.SearchStats` object, available as
+        ``stats`` in the results.  Statistics accumulate over calls that
+        resume the search with ``profile=True``, and only cover work done
+        in this process when ``workers > 1``.
+
         Parameters
         ----------
         maxiter : Optional[int], optional
             Maximum number of additional iterations, by default None
 
         timelimit : Optional[Union[int, float]], optional
-            Time limit in seconds, by default None
+            Time limit in seconds, by default None. The clock is read at
+            an interval calibrated from the observed time per node, so
+            the search stops within about ``self.time_tol`` seconds
+            (0.01 by default) of the limit.
 
         rtol : Optional[float], optional
             Relative tolerance for termination. If provided, permanently
@@ -326,6 +524,13 @@ cdef class BranchAndBound:
             Absolute tolerance for termination. If provided, permanently
             updates ``self.atol``, by default None
 
+        workers : Optional[int], optional
+            Number of worker processes used to solve subtrees in parallel,
+            by default None (sequential search)
+
+        profile : bool, optional
+            Whether to collect search statistics, by default False
+
         Returns
         -------
         SearchResults
@@ -333,12 +538,12 @@ cdef class BranchAndBound:
         """
 
         cdef:
-            double start_time, current_time
-            double _tlim = LARGE_POS
+            Deadline deadline
+            double solve_start = monotonic()
+            double stats_start = 0.0
             unsigned long long _mxiter
+            long long dropped
             Node node
-            Solution sol
-            Problem inc_problem
 
         # Permanently update tolerances if provided
         if rtol is not None:
@@ -346,9 +551,23 @@ cdef class BranchAndBound:
         if atol is not None:
             self.atol = atol
 
+        if not profile:
+            self.stats = None
+        elif self.stats is None:
+            self.stats = SearchStats()
+
+        # Steps of solve_iter share the progress rows of a single solve
+        if not self._stepping:
+            self._log_start()
+
+        if workers is not None and workers > 1:
+            return self._solve_subtrees(workers, maxiter, timelimit, profile)
+
+        if self.stats is not None:
+            stats_start = monotonic()
+
         if timelimit is not None:
-            _tlim = timelimit
-        start_time = time.perf_counter()
+            deadline_start(&deadline, timelimit, self.time_tol)
 
         # Initialize on first call only
         if self.root is None:
@@ -367,25 +586,312 @@ cdef class BranchAndBound:
         # In case the root node is already the LB of an optimal warmstart
         self._check_termination(_mxiter)
         while self.manager.not_empty():
-            # Check for time termination
-            if timelimit is not None:
-                current_time = time.perf_counter()
-                if current_time - start_time >= _tlim:
+            # Check for time termination, reading the clock only as
+            # often as needed to stop within time_tol of the limit
+            if timelimit is not None and deadline_reached(&deadline):
+                if not self._stepping:
                     self.log_row('Time Limit')
-                    break
+                break
+            dropped = self.manager.dropped
             node = self._dequeue_core()
             # Avoid node with poor parents in case ub was updated meanwhile
             if node is not None:
                 # Perform iteration (feasibility, bound check, and branching)
                 self._do_iter(node)
-            # Update LB if node is the one
-            if node is self.bound_node:
+            # Update LB if node is the one, or it might have been dropped
+            if node is self.bound_node or self.manager.dropped != dropped:
                 # self.log_row('Bound node dequeued')
                 self._update_bound()
+            # Write the next nodes of a periodic checkpoint, if due
+            if self.checkpoint_path is not None:
+                self._autosave()
             # Termination by optimality
             if self._check_termination(_mxiter):
                 break
 
+        if self.stats is not None:
+            self.stats.add_total(monotonic() - stats_start)
+        if self.recorder is not None:
+            self.recorder.flush()
+        self._finish_checkpoint()
+        if not self._stepping:
+            self._log_summary(monotonic() - solve_start)
+        return self._get_results()
+
+    def solve_iter(
+        self,
+        step_nodes: Optional[int] = 1000,
+        step_time: Optional[float] = None,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ):
+        """Solves the problem in steps, yielding the progress after each.
+
+        Each step is a call to :meth:`solve` limited to ``step_nodes``
+        nodes and ``step_time`` seconds, so the search can be paused
+        between steps, resumed later by any solve method, or abandoned
+        by closing the generator.
+
+        Parameters
+        ----------
+        step_nodes : Optional[int], optional
+            Maximum number of nodes explored per step, by default 1000
+
+        step_time : Optional[float], optional
+            Maximum time in seconds per step, by default None
+
+        maxiter : Optional[int], optional
+            Maximum number of additional iterations, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds over all steps, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination. If provided, permanently
+            updates ``self.rtol``, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination. If provided, permanently
+            updates ``self.atol``, by default None
+
+        Yields
+        ------
+        SearchProgress
+            Bounds and explored nodes after each step. The last one
+            has ``done`` set and holds the final results.
+        """
+        cdef:
+            double start, left
+            unsigned long long start_explored
+            SearchResults results
+            object iters, seconds, reason
+            bool done
+
+        if step_nodes is None and step_time is None:
+            raise ValueError('step_nodes or step_time must be given')
+        if step_nodes is not None and step_nodes < 1:
+            raise ValueError('step_nodes must be positive')
+        if step_time is not None and step_time <= 0:
+            raise ValueError('step_time must be positive')
+
+        start = monotonic()
+        start_explored = self.explored if self.root is not None else 0
+        self._log_start()
+        while True:
+            iters = step_nodes
+            if maxiter is not None:
+                left = maxiter - <double>(self.explored - start_explored)
+                iters = int(left) if iters is None else min(iters, int(left))
+            seconds = step_time
+            if timelimit is not None:
+                left = max(timelimit - (monotonic() - start), 0.0)
+                seconds = left if seconds is None else min(seconds, left)
+
+            self._stepping = True
+            try:
+                results = self.solve(
+                    maxiter=iters, timelimit=seconds, rtol=rtol, atol=atol
+                )
+            finally:
+                self._stepping = False
+
+            # Limits of single steps are not logged, only those of the
+            # whole search
+            reason = None
+            done = True
+            if self._optimality_check() or not self.manager.not_empty():
+                pass
+            elif (
+                maxiter is not None
+                and self.explored - start_explored >= maxiter
+            ):
+                reason = 'Iter Limit'
+            elif timelimit is not None and monotonic() - start >= timelimit:
+                reason = 'Time Limit'
+            else:
+                done = False
+            if done:
+                if reason is not None:
+                    self.log_row(reason)
+                self._log_summary(monotonic() - start)
+            yield SearchProgress(
+                self.explored,
+                self.get_ub(),
+                self.get_lb(),
+                self.gap,
+                done,
+                results,
+            )
+            if done:
+                return
+
+    async def solve_async(
+        self,
+        step_nodes: Optional[int] = 1000,
+        step_time: Optional[float] = 0.01,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ):
+        """Solves the problem in steps of :meth:`solve_iter`, handing
+        control back to the event loop between steps.
+
+        Many searches can thus share one event loop, each blocking
+        it for at most one step. Cancelling the awaiting task stops
+        the search after the current step, leaving it resumable.
+
+        Parameters
+        ----------
+        step_nodes : Optional[int], optional
+            Maximum number of nodes explored per step, by default 1000
+
+        step_time : Optional[float], optional
+            Maximum time in seconds per step, by default 0.01
+
+        maxiter : Optional[int], optional
+            Maximum number of additional iterations, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds over all steps, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination, by default None
+
+        Returns
+        -------
+        SearchResults
+            Search results containing best solution and problem instance
+        """
+        cdef:
+            SearchProgress progress = None
+
+        for progress in self.solve_iter(
+            step_nodes, step_time, maxiter, timelimit, rtol, atol
+        ):
+            if progress.done:
+                break
+            await asyncio.sleep(0)
+        return progress.results
+
+    def _solve_subtrees(
+        self,
+        int workers,
+        maxiter: Optional[int],
+        timelimit: Optional[Union[int, float]],
+        bool profile,
+    ) -> SearchResults:
+        # Imported here as bnbpy.parallel depends on this module
+        from bnbpy.parallel import RAMP_UP_FACTOR, solve_subtrees
+
+        cdef:
+            BaseNodeManager manager = self.manager
+            double start_time = time.perf_counter()
+            unsigned long long start_explored = self.explored
+            int size = RAMP_UP_FACTOR * workers
+            long long iters
+            bool closed
+            list[Node] roots
+            Node node
+            double subtrees_start
+            bool stepping = self._stepping
+
+        # Limits of ramp-up steps are not logged, only the whole search
+        self._stepping = True
+        try:
+            if self.root is None:
+                start_explored = 0
+                self.solve(maxiter=0, timelimit=timelimit, profile=profile)
+
+            # Breadth-first ramp-up until the queue is large enough
+            roots = self._drain()
+            self.set_manager(FifoManager())
+            self.manager.enqueue_all(roots)
+            while 0 < self.manager.size() < size:
+                if self._optimality_check():
+                    break
+                iters = size - self.manager.size()
+                if maxiter is not None:
+                    iters = min(
+                        iters, maxiter - (self.explored - start_explored)
+                    )
+                if iters <= 0:
+                    break
+                if timelimit is not None:
+                    if time.perf_counter() - start_time >= timelimit:
+                        break
+                    self.solve(
+                        maxiter=iters,
+                        timelimit=(
+                            timelimit - (time.perf_counter() - start_time)
+                        ),
+                        profile=profile,
+                    )
+                else:
+                    self.solve(maxiter=iters, profile=profile)
+        finally:
+            self._stepping = stepping
+        closed = self._optimality_check()
+        # Logged while the bound node is still in the queue
+        if not closed and self.manager.size() > 1:
+            self.log_row(f'Subtrees ({self.manager.size()})')
+        roots = self._drain()
+        self.set_manager(manager)
+        self.bound_node = None
+        if closed or len(roots) <= 1:
+            self.manager.enqueue_all(roots)
+            self._update_bound()
+            self._check_termination(ULLONG_MAX)
+            if not stepping:
+                self._log_summary(time.perf_counter() - start_time)
+            return self._get_results()
+
+        subtrees_start = monotonic()
+        explored, value, problem, unfinished = solve_subtrees(
+            self,
+            roots,
+            workers,
+            None
+            if maxiter is None
+            else maxiter - (self.explored - start_explored),
+            None
+            if timelimit is None
+            else max(timelimit - (time.perf_counter() - start_time), 0.0),
+        )
+        self.explored += explored
+        if self.stats is not None:
+            self.stats.add_total(monotonic() - subtrees_start)
+        if problem is not None and value < self.get_ub():
+            # The bound of the problem solution might have been overwritten
+            # by the results of the subtree search
+            node = Node(problem)
+            node.lb = value
+            self.set_solution(node)
+
+        # Subtrees interrupted by limits are resumed from their roots
+        for index, lb in unfinished:
+            node = roots[index]
+            if lb < self.get_ub():
+                node.lb = max(node.lb, lb)
+                self.manager.enqueue(node)
+            else:
+                self.prune(node)
+        self._update_bound()
+        self._check_termination(ULLONG_MAX)
+        if not stepping:
+            self._log_summary(time.perf_counter() - start_time)
+        return self._get_results()
+
+    cdef SearchResults _get_results(BranchAndBound self):
+        cdef:
+            Solution sol
+            Problem inc_problem
+
         sol = self.get_solution()
         sol.set_lb(self.get_lb())
 
@@ -393,28 +899,43 @@ cdef class BranchAndBound:
         if self.incumbent is not None:
             inc_problem = self.incumbent.problem
 
-        res = SearchResults(sol, inc_problem)
-        return res
+        return SearchResults(sol, inc_problem, self.stats)
+
+    cdef list[Node] _drain(BranchAndBound self):
+        cdef:
+            list[Node] nodes = []
+            Node node
+
+        while self.manager.not_empty():
+            node = self.manager.dequeue()
+            if node is not None:
+                nodes.append(node)
+        return nodes
 
     cpdef void reset(self):
         """Reset the search state for a fresh solve.
 
-        Clears the queue, incumbent, bound node, and root so that the
-        next call to ``solve()`` starts from scratch.
+        Clears the queue, incumbent, bound node, cutoff, root and
+        statistics so that the next call to ``solve()`` starts from
+        scratch.
         """
         self._restart_search()
         self.root = None
         self.explored = 0
+        self.cutoff = LARGE_POS
+        self.stats = None
 
     cdef void _do_iter(BranchAndBound self, Node node):
         # Lower bound is accepted
         if node.lb < self.get_ub():
             # Node is valid for evaluation
             self.explored += 1
+            if self.stats is not None:
+                self.stats.add_explored(node.level)
             # Node satisfies all constraints
             self._feasibility_check(node)
         else:
-            self.prune(node)
+            self._prune_core(node, False)
 
     cpdef void _warmstart(
         BranchAndBound self,
@@ -441,13 +962,33 @@ cdef class BranchAndBound:
             Node being evaluated
         """
         cdef:
-            list[Node] children
+            list[Node] children, survivors
             Node child
+            double start
 
-        children = node.branch()
-        if children:
-            for child in children:
-                self._enqueue_core(child)
+        if self.stats is None:
+            children = node.branch()
+        else:
+            start = monotonic()
+            children = node.branch()
+            self.stats.lap(BRANCH, start)
+            if children:
+                for child in children:
+                    self.stats.add_created(child.level)
+        if self.recorder is not None:
+            self.recorder.record(node, BRANCHED)
+        if self.frontier is not None:
+            self.frontier.remove(node)
+        survivors = children
+        # Dominated states may still hold solutions of the pool
+        if children and self.table is not None and self.pool is None:
+            survivors = self._probe_table(children)
+        if survivors:
+            if self._batch_bound:
+                self._enqueue_batch(node, survivors)
+            else:
+                for child in survivors:
+                    self._enqueue_core(child)
         if not self.save_tree and node is not self.root:
             node.cleanup()
         elif self.save_tree:
@@ -473,7 +1014,7 @@ cdef class BranchAndBound:
         if child is None:
             return
         if child.lb < self.get_ub():
-            self.log_row('Primal heuristic')
+            self.log_progress('Primal heuristic')
             self.set_solution(child)
 
     cpdef void upgrade_bound(BranchAndBound self, Node node):
@@ -545,17 +1086,41 @@ cdef class BranchAndBound:
 
     cpdef void _enqueue_root(BranchAndBound self):
         self.root = init_node(self.problem)
+        if self.stats is not None:
+            self.stats.add_created(self.root.level)
         self._enqueue_core(self.root)
         self._update_bound()
         self.explored = 0
 
     cpdef void _node_eval(BranchAndBound self, Node node):
+        cdef:
+            double start
+
+        if self.stats is None:
+            self.pre_eval_callback(node)
+            node.compute_bound()
+            self.post_eval_callback(node)
+            return
+        start = monotonic()
         self.pre_eval_callback(node)
+        start = self.stats.lap(CALLBACK, start)
         node.compute_bound()
+        start = self.stats.lap(BOUND, start)
         self.post_eval_callback(node)
+        self.stats.lap(CALLBACK, start)
 
     cpdef void _feasibility_check(BranchAndBound self, Node node):
-        if node.check_feasible():
+        cdef:
+            bool feasible
+            double start
+
+        if self.stats is None:
+            feasible = node.check_feasible()
+        else:
+            start = monotonic()
+            feasible = node.check_feasible()
+            self.stats.lap(FEASIBILITY, start)
+        if feasible:
             self.set_solution(node)
         # Node might lead to a better solution
         else:
@@ -565,16 +1130,46 @@ cdef class BranchAndBound:
         """Assigns the current node as incumbent, updates gap and calls
         `solution_callback`
 
+        With a ``pool``, the node is added to it instead, the best
+        solution of the pool being the incumbent. Duplicates of pooled
+        solutions are pruned.
+
         Parameters
         ----------
         node : Node
             New solution node
         """
-        self.incumbent = node
-        self.manager.filter_by_lb(node.lb)
+        cdef:
+            SearchStats stats = self.stats
+            double start = 0.0
+            int size = 0
+
+        if self.frontier is not None:
+            self.frontier.add_solution(node)
+        if self.pool is not None and not self.pool.add(node):
+            self.prune(node)
+            return
+        if stats is not None:
+            start = monotonic()
+            size = self.manager.size()
+        if self.recorder is not None:
+            self.recorder.record(node, SOLUTION)
+        if self.pool is None:
+            self.incumbent = node
+            self.manager.filter_by_lb(node.lb)
+        else:
+            self.incumbent = self.pool.best()
+            if self.get_ub() < LARGE_POS:
+                self.manager.filter_by_lb(self.get_ub())
         self._update_gap()
-        self.log_row('New incumbent')
+        self.log_progress('New incumbent')
+        if stats is None:
+            self.solution_callback(node)
+            return
+        stats.add_filtered(size - self.manager.size())
+        start = stats.lap(INCUMBENT, start)
         self.solution_callback(node)
+        stats.lap(CALLBACK, start)
 
     cpdef void set_bound(BranchAndBound self, Node node):
         """Public interface to set a new node as the
@@ -587,30 +1182,511 @@ cdef class BranchAndBound:
         """
         self.bound_node = node
 
+    cpdef void set_cutoff(BranchAndBound self, double value):
+        """Sets an external upper bound, such as the cost of a solution
+        found by another search, used to prune nodes as if it were
+        the incumbent.
+
+        It is ignored unless strictly better than the current upper bound.
+        The current incumbent, being worse than the cutoff, is discarded,
+        as are solutions of the ``pool`` costing as much or more.
+
+        Parameters
+        ----------
+        value : float
+            Cost of a known feasible solution
+        """
+        if value >= self.get_ub():
+            return
+        self.cutoff = value
+        self.incumbent = None
+        if self.pool is not None:
+            self.pool.filter(value)
+            self.incumbent = self.pool.best()
+        self.manager.filter_by_lb(value)
+        # The bound node might have been pruned
+        self.bound_node = None
+        self._update_bound()
+        self.log_progress('Cutoff update')
+
+    cpdef void load_frontier(BranchAndBound self, list[Node] nodes):
+        """Inserts open nodes created elsewhere (e.g. by another search)
+        into the active manager, keeping their current lower bounds.
+
+        If the search has not started yet, it is initialized without
+        warmstart, such that ``solve()`` explores only the subtrees
+        of the given nodes.
+
+        Parameters
+        ----------
+        nodes : list[Node]
+            Open nodes to be explored
+        """
+        cdef:
+            Node node
+
+        if not nodes:
+            return
+        if self.root is None:
+            self._restart_search()
+            self.root = nodes[0]
+            self.explored = 0
+        for node in nodes:
+            if node.lb < self.get_ub():
+                if self.recorder is not None:
+                    self.recorder.record(node, OPENED)
+                if self.frontier is not None:
+                    self.frontier.open(node)
+                self.manager.enqueue(node)
+            else:
+                if self.frontier is not None:
+                    self.frontier.close(node)
+                self.prune(node)
+        # The global bound might decrease with the new nodes
+        self._update_bound()
+        self._update_gap()
+
+    cpdef list[Node] split_frontier(BranchAndBound self, int n):
+        """Removes up to ``n`` open nodes from the active manager
+        to be explored elsewhere, such as in work stealing.
+
+        The shallowest nodes are chosen, as they usually root
+        the largest subtrees. At least one node is always kept.
+
+        Parameters
+        ----------
+        n : int
+            Maximum number of nodes to remove
+
+        Returns
+        -------
+        list[Node]
+            Removed nodes
+        """
+        cdef:
+            int k
+            list[Node] nodes
+
+        k = min(n, self.manager.size() - 1)
+        if k <= 0:
+            return []
+        nodes = self._drain()
+        nodes.sort(key=_node_level)
+        self.manager.enqueue_all(nodes[k:])
+        self._update_bound()
+        return nodes[:k]
+
+    cpdef void checkpoint(BranchAndBound self, object path):
+        """Saves the state of the search to a file, from which it can
+        be resumed by :meth:`restore`.
+
+        The open nodes, incumbent, solutions of the ``pool``, cutoff,
+        number of explored nodes, tolerances and manager counters are
+        saved, but not the statistics, transposition table or recorded
+        tree. Problems are pickled, the original one first, so hooks
+        such as the compact pickling of flow-shop problems can share
+        instance data among nodes. See
+        :class:`~bnbpy.cython.checkpoint.CheckpointWriter` for the file
+        format.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Destination file, replaced only once completely written
+
+        Raises
+        ------
+        ValueError
+            If the search has not started.
+        """
+        cdef:
+            CheckpointWriter writer
+
+        if self.root is None:
+            raise ValueError('The search has not started')
+        writer = self._open_checkpoint(path)
+        writer.step(writer.total)
+        log.info(f'Checkpoint of {writer.total} open nodes saved to {path}')
+
+    cpdef void restore(BranchAndBound self, object path):
+        """Resumes a search saved by :meth:`checkpoint`, replacing the
+        current state, such that ``solve()`` continues from it.
+
+        Tolerances, the cutoff and the number of explored nodes are
+        those of the saved search. The manager should be of the same
+        type as the saved one; open nodes are read back detached from
+        their parents, as the ``problem`` given to this search is the
+        root of the restored tree.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Checkpoint file
+
+        Raises
+        ------
+        ValueError
+            If the file is not a checkpoint of a supported version.
+        """
+        cdef:
+            dict header
+            object nodes, problem
+            double lb
+            Node node
+
+        # The original problem is unpickled along with the header,
+        # before the nodes that might depend on it
+        header, nodes = read_checkpoint(path)
+        if header['manager'] != type(self.manager).__name__:
+            log.warning(
+                f'Checkpoint saved with a {header["manager"]} manager, '
+                f'restored into {type(self.manager).__name__}'
+            )
+        self._restart_search()
+        self._log_start()
+        self.stats = None
+        self.rtol = header['rtol']
+        self.atol = header['atol']
+        self.cutoff = header['cutoff']
+        self.explored = header['explored']
+        self.manager.set_state(header['manager_state'])
+        if header['incumbent'] is not None:
+            self.incumbent = init_node(header['incumbent'])
+            self.incumbent.lb = header['ub']
+        if self.pool is not None and header['solutions']:
+            for problem, lb in header['solutions']:
+                node = init_node(problem)
+                node.lb = lb
+                self.pool.add(node)
+            self.incumbent = self.pool.best()
+        self.root = init_node(self.problem)
+        log.info(f'Restoring {header["nodes"]} open nodes from {path}')
+        self._log_headers()
+        self.load_frontier(list(nodes))
+        self._update_bound()
+        self.log_row('Restored')
+
+    cpdef void set_checkpoint(
+        BranchAndBound self,
+        object path,
+        double interval=300.0,
+        Py_ssize_t batch_size=1000,
+    ):
+        """Enables periodic checkpoints of the search while solving.
+
+        Once ``interval`` seconds have passed since the last
+        checkpoint, the open nodes are snapshot and written to
+        ``path`` ``batch_size`` at a time, one batch per node
+        explored, so the search is never stalled by a whole write.
+        The file is replaced only once complete, and checkpoints
+        being written when ``solve()`` returns are completed.
+
+        Parameters
+        ----------
+        path : str | os.PathLike | None
+            Destination file, or None to disable checkpoints
+
+        interval : float, optional
+            Minimum time in seconds between checkpoints,
+            by default 300.0
+
+        batch_size : int, optional
+            Number of nodes written per node explored, by default 1000
+
+        Raises
+        ------
+        ValueError
+            If ``interval`` is negative or ``batch_size`` not positive.
+        """
+        if interval < 0:
+            raise ValueError('interval must be non-negative')
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        if self._checkpoint_writer is not None:
+            self._checkpoint_writer.abort()
+            self._checkpoint_writer = None
+        if path is None:
+            self.checkpoint_path = None
+            self.checkpoint_interval = INFINITY
+            return
+        self.checkpoint_path = os.fspath(path)
+        self.checkpoint_interval = interval
+        self._checkpoint_batch = batch_size
+        self._checkpoint_last = monotonic()
+
+    cpdef void reoptimize(
+        BranchAndBound self,
+        FrontierRecorder frontier,
+        Problem incumbent=None,
+    ):
+        """Starts a search of ``problem``, a modified version of a
+        problem solved before, from the leaves of the former tree
+        recorded by *frontier* instead of the root.
+
+        Former bounds of the leaves, lowered by
+        :meth:`~bnbpy.cython.problem.Problem.cost_decrease`, still
+        prune most of them once the former incumbent (by default, that
+        of *frontier*) is rebuilt in ``problem`` as a warmstart, along
+        with the warmstart of ``problem``. Only the other leaves are
+        rebuilt by :meth:`~bnbpy.cython.problem.Problem.apply_decisions`
+        and have their bounds evaluated under the new data (once
+        dequeued, for nodes evaluated out), so when the data change
+        little ``solve()`` explores a fraction of the nodes of a cold
+        search.
+
+        The leaves of this search are recorded by its ``frontier``, if
+        any, such that it can be reoptimized again. A search
+        reoptimized from its own frontier gets a new one.
+
+        Parameters
+        ----------
+        frontier : FrontierRecorder
+            Leaves recorded by the former search
+
+        incumbent : Problem, optional
+            Former solution, by default the incumbent of *frontier*
+
+        Raises
+        ------
+        NotImplementedError
+            If the problem does not implement ``apply_decisions``.
+        """
+        cdef:
+            Py_ssize_t i
+            double decrease = INFINITY
+            double lb
+            list[Node] nodes = []
+            object decisions
+            Problem problem
+            Node node
+
+        if incumbent is None:
+            incumbent = frontier.incumbent
+        if frontier.problem is not None:
+            decrease = self.problem.cost_decrease(frontier.problem)
+        if frontier is self.frontier:
+            self.frontier = FrontierRecorder()
+        self._restart_search()
+        self._log_start()
+        self.stats = None
+        self.explored = 0
+        self.cutoff = LARGE_POS
+        log.info(f'Reoptimizing from {len(frontier)} leaves')
+        self._log_headers()
+        self._warmstart(self.problem.warmstart())
+        if incumbent is not None:
+            self._warmstart(self.problem.apply_decisions(incumbent.decisions()))
+        if len(frontier) == 0:
+            self._enqueue_root()
+            return
+
+        self.root = init_node(self.problem)
+        for i in range(len(frontier._decisions)):
+            decisions = frontier._decisions[i]
+            if decisions is None:
+                continue
+            lb = LOW_NEG
+            if decrease < LARGE_POS:
+                lb = frontier._lbs[i] - decrease
+            # Leaves pruned by their former bounds are kept as they are
+            if lb >= self.get_ub():
+                if self.frontier is not None:
+                    self.frontier.add_leaf(decisions, frontier._levels[i], lb)
+                continue
+            problem = self.problem.apply_decisions(decisions)
+            if problem is None:
+                continue
+            node = init_node(problem)
+            node.level = frontier._levels[i]
+            node.lb = lb
+            # Nodes evaluated out are bounded once dequeued
+            if not self.eval_out:
+                self._node_eval(node)
+            nodes.append(node)
+        self.load_frontier(nodes)
+        self._update_bound()
+        self.log_row('Reoptimized')
+
+    cdef CheckpointWriter _open_checkpoint(BranchAndBound self, object path):
+        cdef:
+            dict header
+
+        header = {
+            'problem': self.problem,
+            'incumbent': (
+                self.incumbent.problem if self.incumbent is not None else None
+            ),
+            'ub': (
+                self.incumbent.lb if self.incumbent is not None else LARGE_POS
+            ),
+            'solutions': (
+                [(node.problem, node.lb) for node in self.pool.nodes()]
+                if self.pool is not None
+                else None
+            ),
+            'cutoff': self.cutoff,
+            'explored': self.explored,
+            'rtol': self.rtol,
+            'atol': self.atol,
+            'eval_node': self.eval_node.decode('utf-8'),
+            'manager': type(self.manager).__name__,
+            'manager_state': self.manager.get_state(),
+        }
+        return CheckpointWriter(path, header, self.manager.open_nodes())
+
+    cdef void _autosave(BranchAndBound self):
+        if self._checkpoint_writer is None:
+            if monotonic() - self._checkpoint_last < self.checkpoint_interval:
+                return
+            self._checkpoint_writer = self._open_checkpoint(
+                self.checkpoint_path
+            )
+        if self._checkpoint_writer.step(self._checkpoint_batch):
+            self._finish_checkpoint()
+
+    cdef void _finish_checkpoint(BranchAndBound self):
+        cdef:
+            CheckpointWriter writer = self._checkpoint_writer
+
+        if writer is None:
+            return
+        writer.step(writer.total)
+        self._checkpoint_writer = None
+        self._checkpoint_last = monotonic()
+        log.debug(
+            f'Checkpoint of {writer.total} open nodes saved to {writer.path}'
+        )
+
+    cdef list[Node] _probe_table(BranchAndBound self, list[Node] children):
+        cdef:
+            Node child
+            Problem problem
+            object key
+            list[Node] survivors = []
+
+        # Dominated children are pruned before their bounds are evaluated
+        for child in children:
+            problem = child.problem
+            key = problem.state_key()
+            if key is not None and self.table.probe(
+                key, problem.state_value(), child.level
+            ):
+                self._prune_core(child, True)
+            else:
+                survivors.append(child)
+        return survivors
+
     cdef void _enqueue_core(BranchAndBound self, Node node):
+        cdef:
+            double start
+
         if self.eval_in:
             self._node_eval(node)
-        if node.lb < self.get_ub():
+        if node.lb >= self.get_ub():
+            self._prune_core(node, True)
+            return
+        if self.recorder is not None:
+            self.recorder.record(node, OPENED)
+        if self.frontier is not None:
+            self.frontier.open(node)
+        if self.stats is None:
             self.enqueue_callback(node)
             self.manager.enqueue(node)
         else:
-            self.prune(node)
+            start = monotonic()
+            self.enqueue_callback(node)
+            start = self.stats.lap(CALLBACK, start)
+            self.manager.enqueue(node)
+            self.stats.lap(ENQUEUE, start)
+            self.stats.track_frontier(self.manager.size())
+
+    cdef void _enqueue_batch(
+        BranchAndBound self, Node node, list[Node] children
+    ):
+        cdef:
+            Node child
+            list[Node] survivors
+            SearchStats stats = self.stats
+            double start = 0.0
+
+        # Sibling bounds are computed in a single call
+        if stats is not None:
+            start = monotonic()
+        for child in children:
+            self.pre_eval_callback(child)
+        if stats is not None:
+            start = stats.lap(CALLBACK, start, len(children))
+        node.compute_bound_batch(children)
+        if stats is not None:
+            start = stats.lap(BOUND, start, len(children))
+        survivors = []
+        for child in children:
+            self.post_eval_callback(child)
+            if child.lb < self.get_ub():
+                if self.recorder is not None:
+                    self.recorder.record(child, OPENED)
+                if self.frontier is not None:
+                    self.frontier.open(child)
+                self.enqueue_callback(child)
+                survivors.append(child)
+                if stats is not None:
+                    start = stats.lap(CALLBACK, start, 2)
+            elif stats is None:
+                self._prune_core(child, True)
+            else:
+                start = stats.lap(CALLBACK, start)
+                self._prune_core(child, True)
+                start = monotonic()
+        self.manager.enqueue_all(survivors)
+        if stats is not None:
+            stats.lap(ENQUEUE, start, len(survivors))
+            stats.track_frontier(self.manager.size())
 
     cdef Node _dequeue_core(BranchAndBound self):
         cdef:
             Node node
+            double start
 
-        node = self.manager.dequeue()
+        if self.stats is None:
+            node = self.manager.dequeue()
+        else:
+            start = monotonic()
+            node = self.manager.dequeue()
+            self.stats.lap(DEQUEUE, start)
+        # Heuristic managers might drop their last nodes while dequeuing
+        if node is None:
+            return None
         if self.eval_out:
             self._node_eval(node)
-        self.dequeue_callback(node)
+        if self.stats is None:
+            self.dequeue_callback(node)
+        else:
+            start = monotonic()
+            self.dequeue_callback(node)
+            self.stats.lap(CALLBACK, start)
         if node.lb >= self.get_ub():
             if node is self.bound_node:
                 self._update_bound()
-            self.prune(node)
+            self._prune_core(node, False)
             return None
         return node
 
+    cdef void _prune_core(BranchAndBound self, Node node, bool at_enqueue):
+        cdef:
+            double start
+
+        if self.recorder is not None:
+            self.recorder.record(node, PRUNED)
+        if self.frontier is not None:
+            self.frontier.close(node)
+        if self.stats is None:
+            self.prune(node)
+            return
+        self.stats.add_pruned(node.level, at_enqueue)
+        start = monotonic()
+        self.prune(node)
+        self.stats.lap(PRUNE, start)
+
     cdef bool _check_termination(BranchAndBound self, unsigned long long maxiter):
         cdef:
             Solution sol
@@ -621,7 +1697,8 @@ cdef class BranchAndBound:
             return True
         # Termination by iteration limit
         elif self.explored >= maxiter:
-            self.log_row('Iter Limit')
+            if not self._stepping:
+                self.log_row('Iter Limit')
             return True
         return False
 
@@ -632,18 +1709,24 @@ cdef class BranchAndBound:
         if not self.manager.not_empty():
             if self.incumbent:
                 self.bound_node = self.incumbent
+            else:
+                # Exhausted without an incumbent: no node holds the bound,
+                # and the last one dequeued might have been released
+                self.bound_node = None
             self._update_gap()
             return
 
         old_bound = self.bound_node
         self.bound_node = self.manager.get_lower_bound()
+        # The gap might have been computed with the lb of a dequeued
+        # bound node, raised by its own evaluation
+        self._update_gap()
         if (
             old_bound is None
             or old_bound is self.root
             or self.bound_node.lb > old_bound.lb
         ):
-            self._update_gap()
-            self.log_row('LB update')
+            self.log_progress('LB update')
 
     cpdef void _log_headers(BranchAndBound self):
         self.logger.log_headers()
@@ -656,23 +1739,81 @@ cdef class BranchAndBound:
         message : Any
             Message to log
         """
+        if not self.logger.is_enabled():
+            return
         gap = f'{(100 * self.gap):.2f}%'
         ub = f'{float(self.get_ub()):^6.4}'
         lb = f'{float(self.get_lb()):^6.4}'
         self.logger.log_row(self.explored, ub, lb, gap, message)
 
+    cpdef void log_progress(BranchAndBound self, object message):
+        """Log a progress row, such as an incumbent or lower bound
+        update, at most once every ``self.log_interval`` seconds.
+
+        Nothing is formatted if the logger did not handle INFO records
+        at the start of the current solve.  Rows skipped by the
+        interval are counted in the summary logged at the end of
+        :meth:`solve`; termination rows are always logged.
+
+        Parameters
+        ----------
+        message : Any
+            Message to log
+        """
+        cdef:
+            double now
+
+        if not self._log_enabled:
+            return
+        if self.log_interval > 0:
+            now = monotonic()
+            if now - self._log_last < self.log_interval:
+                self._log_skipped += 1
+                return
+            self._log_last = now
+        self.log_row(message)
+
+    cdef void _log_start(BranchAndBound self):
+        # The level is checked once, so hot paths test a flag only
+        self._log_enabled = self.logger.is_enabled()
+        self._log_last = LOW_NEG
+        self._log_skipped = 0
+
+    cdef void _log_summary(BranchAndBound self, double elapsed):
+        if not self._log_enabled:
+            return
+        msg = (
+            f'Finished exploration: {self.explored} nodes, '
+            f'gap {(100 * self.gap):.2f}%, {elapsed:.3f} s'
+        )
+        if self._log_skipped > 0:
+            msg += f' ({self._log_skipped} progress rows skipped)'
+        log.info(msg)
+
     cdef void _update_gap(BranchAndBound self):
         if self.get_ub() != LARGE_POS:
             self.gap = abs(self.get_ub() - self.get_lb()) / abs(self.get_ub())
 
     cdef bool _optimality_check(BranchAndBound self):
-        if self.incumbent is not None and not self.manager.not_empty():
+        if (
+            self.incumbent is not None
+            and not self.manager.not_empty()
+            and self.manager.dropped_lb >= self.get_ub()
+        ):
             return True
         return (
             self.get_ub() <= self.get_lb() + self.atol or self.gap <= self.rtol
         )
 
 
+def _node_level(Node node):
+    return node.level
+
+
+cdef inline bool defines_state(Problem problem):
+    return type(problem).state_key is not Problem.__dict__['state_key']
+
+
 cdef class DepthFirstBnB(BranchAndBound):
     """Depth-first Branch & Bound algorithm.
 
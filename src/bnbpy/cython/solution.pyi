@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Any, Union
 
 from bnbpy.cython.status import OptStatus
 
@@ -25,6 +25,7 @@ class Solution:
     def __init__(self) -> None: ...
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
+    def __reduce__(self) -> tuple[Any, ...]: ...
     @property
     def _signature(self) -> str: ...
     def set_optimal(self) -> None: ...
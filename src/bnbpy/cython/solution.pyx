@@ -28,6 +28,13 @@ cdef class Solution:
     def __del__(self):
         pass
 
+    def __reduce__(self):
+        return (
+            _rebuild_solution,
+            (type(self), self.cost, self.lb, self.status),
+            getattr(self, '__dict__', None),
+        )
+
     def __repr__(self) -> str:
         return self._signature
 
@@ -74,3 +81,13 @@ cdef class Solution:
         sol.lb = self.lb
         sol.status = self.status
         return sol
+
+
+def _rebuild_solution(cls, double cost, double lb, int status):
+    cdef:
+        Solution sol
+    sol = cls.__new__(cls)
+    sol.cost = cost
+    sol.lb = lb
+    sol.status = <OptStatus>status
+    return sol
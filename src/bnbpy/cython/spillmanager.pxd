@@ -0,0 +1,78 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.primanager cimport BestFirstSearch
+
+
+@cython.final
+cdef class SpillRun:
+
+    cdef readonly:
+        str path
+
+    cdef:
+        object buffer
+        const double[::1] lbs
+        const unsigned long long[::1] offsets
+        Py_ssize_t payload
+        Py_ssize_t pos
+        Py_ssize_t end
+
+    cdef inline Py_ssize_t remaining(self):
+        return self.end - self.pos
+
+    cdef inline double head_lb(self):
+        return self.lbs[self.pos]
+
+    cdef list[Node] take(self, Py_ssize_t n)
+
+    cdef list[Node] read(self, Py_ssize_t start, Py_ssize_t stop)
+
+    cdef Py_ssize_t truncate(self, double max_lb)
+
+    cpdef void close(self)
+
+
+cdef SpillRun write_run(str path, list[Node] nodes)
+
+
+cdef class SpillingBestFirstSearch(BestFirstSearch):
+
+    cdef readonly:
+        int max_nodes
+        int batch_size
+        int spilled
+        object directory
+        str path
+
+    cdef:
+        list[SpillRun] runs
+        int _run_count
+        object _finalizer
+        object __weakref__
+
+    cpdef bool not_empty(self)
+
+    cpdef void set_lazy(self, bool lazy=*, double threshold=*)
+
+    cpdef int size(self)
+
+    cpdef list[Node] open_nodes(self)
+
+    cpdef void _enqueue(self, Node node)
+
+    cpdef Node _dequeue(self)
+
+    cpdef void _filter_by_lb(self, double max_lb)
+
+    cpdef void _clear(self)
+
+    cdef void _spill(self)
+
+    cdef void _refill(self)
+
+    cdef void _close_runs(self)
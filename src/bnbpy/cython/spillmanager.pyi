@@ -0,0 +1,74 @@
+from typing import Optional, TypeVar
+
+from bnbpy.cython.primanager import BestFirstSearch
+from bnbpy.cython.problem import Problem
+
+P = TypeVar('P', bound=Problem)
+
+class SpillingBestFirstSearch(BestFirstSearch[P]):
+    """Best-first manager that spills the tail of its heap to disk.
+
+    At most ``max_nodes`` nodes are kept in the in-memory heap.  When it
+    is full, the best half is kept and the rest is written as a sorted
+    run to a memory-mapped file.  Runs are merged back in lb order: the
+    heap is refilled from the run with the smallest head whenever that
+    head has a lower bound smaller than the best node in memory, so the
+    node with the global minimum lb is always in memory.
+
+    Pruning by :meth:`filter_by_lb` is lazy for spilled nodes: runs are
+    only truncated by binary search on their lower bounds.  The lazy
+    pruning mode of :meth:`set_lazy` is not supported.
+
+    Nodes are spilled with pickle, so problems must be picklable, and
+    they are read back detached from their parents (see
+    :class:`~bnbpy.cython.node.Node`).
+    """
+
+    max_nodes: int
+    """Maximum number of nodes kept in memory"""
+
+    batch_size: int
+    """Number of nodes read back from a run at once"""
+
+    spilled: int
+    """Number of active nodes currently stored on disk"""
+
+    directory: Optional[str]
+    """Parent directory of the temporary spill directory"""
+
+    path: Optional[str]
+    """Spill directory, created on the first spill"""
+
+    def __init__(
+        self,
+        max_nodes: int = 1_000_000,
+        batch_size: Optional[int] = None,
+        directory: Optional[str] = None,
+    ) -> None:
+        """Best-first manager that spills the tail of its heap to disk.
+
+        Parameters
+        ----------
+        max_nodes : int, optional
+            Maximum number of nodes kept in memory, by default 1,000,000
+
+        batch_size : int, optional
+            Number of nodes read back from a run at once, by default
+            ``max_nodes // 10``
+
+        directory : str, optional
+            Parent directory of the temporary spill directory, by default
+            the system temporary directory
+
+        Raises
+        ------
+        ValueError
+            If ``max_nodes`` is smaller than 2 or ``batch_size``
+            is not positive.
+        """
+        ...
+
+    @property
+    def n_runs(self) -> int:
+        """Number of run files not yet fully merged back."""
+        ...
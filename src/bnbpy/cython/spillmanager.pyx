@@ -0,0 +1,330 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+
+import logging
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from array import array
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.primanager cimport BestFirstSearch
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# SpillRun
+# ---------------------------------------------------------------------------
+
+@cython.final
+cdef class SpillRun:
+    """Nodes sorted by lower bound, stored in a memory-mapped file.
+
+    The file holds ``n`` lower bounds (float64), ``n + 1`` offsets
+    (uint64) of each pickled node relative to the start of the payload,
+    and the payload itself.  Nodes are read back in order from ``pos``;
+    nodes from ``end`` onwards were pruned by :meth:`truncate` without
+    touching the file.
+    """
+
+    def __init__(self, str path, Py_ssize_t n):
+        cdef:
+            object view
+
+        self.path = path
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.buffer)
+        self.lbs = view[:8 * n].cast('d')
+        self.offsets = view[8 * n:8 * (2 * n + 1)].cast('Q')
+        self.payload = 8 * (2 * n + 1)
+        self.pos = 0
+        self.end = n
+
+    def __len__(self):
+        return self.remaining()
+
+    cdef list[Node] take(self, Py_ssize_t n):
+        """Reads up to *n* nodes from the head of the run."""
+        cdef:
+            Py_ssize_t stop
+            list[Node] out
+
+        stop = min(self.pos + n, self.end)
+        out = self.read(self.pos, stop)
+        self.pos = stop
+        return out
+
+    cdef list[Node] read(self, Py_ssize_t start, Py_ssize_t stop):
+        """Reads nodes from *start* to *stop* without consuming them."""
+        cdef:
+            Py_ssize_t i
+            list[Node] out
+
+        out = [None] * (stop - start)
+        for i in range(start, stop):
+            out[i - start] = pickle.loads(
+                self.buffer[
+                    self.payload + self.offsets[i]:
+                    self.payload + self.offsets[i + 1]
+                ]
+            )
+        return out
+
+    cdef Py_ssize_t truncate(self, double max_lb):
+        """Drops nodes with lb >= *max_lb*, returning how many."""
+        cdef:
+            Py_ssize_t lo, hi, mid, removed
+
+        lo = self.pos
+        hi = self.end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.lbs[mid] < max_lb:
+                lo = mid + 1
+            else:
+                hi = mid
+        removed = self.end - lo
+        self.end = lo
+        return removed
+
+    cpdef void close(self):
+        """Unmaps and deletes the run file."""
+        # Buffer exports must be released before unmapping
+        self.lbs = None
+        self.offsets = None
+        self.pos = self.end
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+cdef SpillRun write_run(str path, list[Node] nodes):
+    """Writes *nodes*, sorted by lower bound, to a new run file."""
+    cdef:
+        Node node
+        object lbs, offsets
+        list[bytes] blobs
+        bytes blob
+        unsigned long long total
+
+    lbs = array('d')
+    offsets = array('Q', [0])
+    blobs = []
+    total = 0
+    for node in nodes:
+        blob = pickle.dumps(node, pickle.HIGHEST_PROTOCOL)
+        total += len(blob)
+        lbs.append(node.lb)
+        offsets.append(total)
+        blobs.append(blob)
+
+    with open(path, 'wb') as f:
+        f.write(lbs.tobytes())
+        f.write(offsets.tobytes())
+        f.writelines(blobs)
+    return SpillRun(path, len(nodes))
+
+
+# ---------------------------------------------------------------------------
+# SpillingBestFirstSearch
+# ---------------------------------------------------------------------------
+
+cdef class SpillingBestFirstSearch(BestFirstSearch):
+    """Best-first manager that spills the tail of its heap to disk.
+
+    At most ``max_nodes`` nodes are kept in the in-memory heap.  When it
+    is full, the best half is kept and the rest is written as a sorted
+    run to a memory-mapped file.  Runs are merged back in lb order: the
+    heap is refilled from the run with the smallest head whenever that
+    head has a lower bound smaller than the best node in memory, so the
+    node with the global minimum lb is always in memory.
+
+    Pruning by :meth:`filter_by_lb` is lazy for spilled nodes: runs are
+    only truncated by binary search on their lower bounds.  The lazy
+    pruning mode of :meth:`set_lazy` is not supported.
+
+    Nodes are spilled with pickle, so problems must be picklable, and
+    they are read back detached from their parents (see
+    :class:`~bnbpy.cython.node.Node`).
+
+    Parameters
+    ----------
+    max_nodes : int, optional
+        Maximum number of nodes kept in memory, by default 1,000,000
+
+    batch_size : int, optional
+        Number of nodes read back from a run at once, by default
+        ``max_nodes // 10``
+
+    directory : str, optional
+        Parent directory of the temporary spill directory, by default
+        the system temporary directory
+    """
+
+    def __init__(
+        self,
+        int max_nodes=1_000_000,
+        batch_size=None,
+        directory=None,
+    ):
+        if max_nodes < 2:
+            raise ValueError('max_nodes must be at least 2')
+        if batch_size is None:
+            batch_size = max(1, max_nodes // 10)
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        self.max_nodes = max_nodes
+        self.batch_size = batch_size
+        self.directory = directory
+        self.path = None
+        self.spilled = 0
+        self.runs = []
+        self._run_count = 0
+        self._finalizer = None
+
+    @property
+    def n_runs(self):
+        return len(self.runs)
+
+    cpdef bool not_empty(self):
+        return self.nodecount + self.spilled > 0
+
+    cpdef void set_lazy(self, bool lazy=True, double threshold=0.5):
+        # Spilled runs are truncated as they are filtered, which lazy
+        # pruning would defer until after their nodes are loaded back
+        if lazy:
+            raise ValueError(
+                'SpillingBestFirstSearch does not support lazy pruning'
+            )
+
+    cpdef int size(self):
+        return self.nodecount + self.spilled
+
+    cpdef list[Node] open_nodes(self):
+        # Spilled nodes are read back as copies, leaving the runs intact
+        cdef:
+            SpillRun run
+            list[Node] nodes
+
+        nodes = BestFirstSearch.open_nodes(self)
+        for run in self.runs:
+            nodes.extend(run.read(run.pos, run.end))
+        return nodes
+
+    cpdef void _enqueue(self, Node node):
+        if <int>self.pq.size() >= self.max_nodes:
+            self._spill()
+        self._push(node)
+
+    cpdef Node _dequeue(self):
+        cdef:
+            Node node
+
+        if self.pq.size() == 0:
+            self._refill()
+        node = self.pq.pop()
+        if node is not None:
+            self._refill()
+        return node
+
+    cpdef void _filter_by_lb(self, double max_lb):
+        cdef:
+            SpillRun run
+            list[SpillRun] runs
+
+        if self.any_lb_above(max_lb):
+            self.pq.filter(max_lb)
+        runs = []
+        for run in self.runs:
+            self.spilled -= run.truncate(max_lb)
+            if run.remaining() > 0:
+                runs.append(run)
+            else:
+                run.close()
+        self.runs = runs
+        self._refill()
+
+    cpdef void _clear(self):
+        self.pq.clear()
+        self._close_runs()
+
+    cdef void _spill(self):
+        cdef:
+            int i, keep
+            Node node
+            list[Node] kept, spilled
+            str path
+
+        # Nodes leave the heap in priority order, hence sorted by lb
+        keep = self.max_nodes // 2
+        kept = [None] * keep
+        for i in range(keep):
+            kept[i] = self.pq.pop()
+        spilled = []
+        while self.pq.size() > 0:
+            node = self.pq.pop()
+            self.forget(node)
+            spilled.append(node)
+        for node in kept:
+            self._push(node)
+        if not spilled:
+            return
+
+        if self.path is None:
+            self.path = tempfile.mkdtemp(
+                prefix='bnbpy-spill-', dir=self.directory
+            )
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self.path, True
+            )
+        path = os.path.join(self.path, f'run-{self._run_count}.bin')
+        self._run_count += 1
+        self.runs.append(write_run(path, spilled))
+        self.nodecount -= len(spilled)
+        self.spilled += len(spilled)
+        log.debug(f'Spilled {len(spilled)} nodes to {path}')
+
+    cdef void _refill(self):
+        cdef:
+            SpillRun run, best
+            Node node, top
+            list[Node] nodes
+
+        while self.runs:
+            best = None
+            for run in self.runs:
+                if best is None or run.head_lb() < best.head_lb():
+                    best = run
+            top = self.pq.peek()
+            if top is not None and best.head_lb() >= top.lb:
+                return
+            nodes = best.take(self.batch_size)
+            for node in nodes:
+                self._push(node)
+                self.memorize(node)
+            self.nodecount += len(nodes)
+            self.spilled -= len(nodes)
+            if best.remaining() == 0:
+                best.close()
+                self.runs.remove(best)
+
+    cdef void _close_runs(self):
+        cdef:
+            SpillRun run
+
+        for run in self.runs:
+            run.close()
+        self.runs = []
+        self.spilled = 0
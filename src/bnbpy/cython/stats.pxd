@@ -0,0 +1,165 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+from libcpp.vector cimport vector
+
+
+cdef extern from * nogil:
+    """
+    #include <chrono>
+
+    static inline double bnbpy_monotonic(void) {
+        return std::chrono::duration<double>(
+            std::chrono::steady_clock::now().time_since_epoch()
+        ).count();
+    }
+    """
+    double bnbpy_monotonic()
+
+
+cdef inline double monotonic() noexcept nogil:
+    """Seconds of a native monotonic clock, without Python calls."""
+    return bnbpy_monotonic()
+
+
+cpdef double perf_clock()
+
+
+cpdef Py_ssize_t resident_memory()
+
+
+cdef enum:
+    MAX_CHECK_INTERVAL = 1_000_000
+
+
+cdef struct Deadline:
+    double start
+    double limit
+    double tol
+    double last
+    unsigned long long every
+    unsigned long long count
+
+
+cdef inline void deadline_start(
+    Deadline* d, double limit, double tol
+) noexcept nogil:
+    """Starts counting *limit* seconds from now; the clock is then read
+    about every *tol* seconds of work."""
+    d.start = monotonic()
+    d.last = d.start
+    d.limit = limit
+    d.tol = tol
+    d.every = 1
+    d.count = 0
+
+
+cdef inline bool deadline_reached(Deadline* d) noexcept nogil:
+    """Counts an iteration and tells whether the limit has passed.
+
+    The clock is only read every ``d.every`` iterations.  The interval
+    is recalibrated at each read from the observed time per iteration,
+    so the next read is due after half the tolerance (or half the time
+    left), and grows at most twofold per read to absorb variance.
+    """
+    cdef:
+        double now, per_iter, target
+
+    d.count += 1
+    if d.count < d.every:
+        return False
+    now = monotonic()
+    if now - d.start >= d.limit:
+        return True
+    per_iter = (now - d.last) / d.count
+    target = 0.5 * min(d.tol, d.limit - (now - d.start))
+    if per_iter > 0:
+        target = target / per_iter
+    else:
+        target = 2.0 * d.every
+    target = min(target, 2.0 * d.every, <double>MAX_CHECK_INTERVAL)
+    d.every = max(<unsigned long long>target, 1)
+    d.last = now
+    d.count = 0
+    return False
+
+
+cdef enum Phase:
+    BOUND = 0
+    BRANCH = 1
+    FEASIBILITY = 2
+    ENQUEUE = 3
+    DEQUEUE = 4
+    PRUNE = 5
+    CALLBACK = 6
+    INCUMBENT = 7
+
+
+cdef enum:
+    N_PHASES = 8
+
+
+cdef inline void _count_level(vector[unsigned long long]& hist, int level):
+    if level < 0:
+        return
+    if <size_t>level >= hist.size():
+        hist.resize(level + 1, 0)
+    hist[level] += 1
+
+
+@cython.final
+cdef class SearchStats:
+
+    cdef readonly:
+        double total_time
+        unsigned long long nodes_created
+        unsigned long long pruned_enqueue
+        unsigned long long pruned_dequeue
+        unsigned long long pruned_filter
+        unsigned long long max_frontier
+
+    cdef:
+        double _time[N_PHASES]
+        unsigned long long _calls[N_PHASES]
+        vector[unsigned long long] _created
+        vector[unsigned long long] _explored
+        vector[unsigned long long] _pruned
+
+    cdef inline double lap(
+        SearchStats self, int phase, double start, unsigned long long n=1
+    ):
+        """Accounts ``n`` calls of *phase* since *start* and returns
+        the current time, to be used as the start of the next lap."""
+        cdef double now = monotonic()
+        self._time[phase] += now - start
+        self._calls[phase] += n
+        return now
+
+    cdef inline void add_created(SearchStats self, int level):
+        self.nodes_created += 1
+        _count_level(self._created, level)
+
+    cdef inline void add_explored(SearchStats self, int level):
+        _count_level(self._explored, level)
+
+    cdef inline void add_pruned(SearchStats self, int level, bool at_enqueue):
+        if at_enqueue:
+            self.pruned_enqueue += 1
+        else:
+            self.pruned_dequeue += 1
+        _count_level(self._pruned, level)
+
+    cdef inline void add_filtered(SearchStats self, long long n):
+        if n > 0:
+            self.pruned_filter += n
+
+    cdef inline void track_frontier(SearchStats self, long long size):
+        if size > 0 and <unsigned long long>size > self.max_frontier:
+            self.max_frontier = size
+
+    cdef inline void add_total(SearchStats self, double seconds):
+        self.total_time += seconds
+
+    cpdef dict as_dict(self)
@@ -0,0 +1,129 @@
+from typing import Any
+
+PHASES: tuple[str, ...]
+
+def perf_clock() -> float:
+    """Seconds of the native monotonic clock used for search statistics.
+
+    Returns
+    -------
+    float
+        Clock value in seconds, from an arbitrary reference
+    """
+    ...
+
+def resident_memory() -> int:
+    """Resident set size of the process in bytes, read from
+    ``/proc/self/statm``.
+
+    Returns
+    -------
+    int
+        Resident memory in bytes, or -1 where it is unavailable
+        (platforms without ``/proc``)
+    """
+    ...
+
+class SearchStats:
+    """Statistics collected by a profiled Branch & Bound search.
+
+    Wall times (seconds) and call counts are accumulated per phase:
+
+    *   ``'bound'``: ``Node.compute_bound()`` and batched sibling bounds.
+    *   ``'branch'``: ``Node.branch()``, i.e., creation of children.
+    *   ``'feasibility'``: ``Node.check_feasible()``.
+    *   ``'enqueue'`` / ``'dequeue'``: node manager operations.
+    *   ``'prune'``: ``BranchAndBound.prune()``.
+    *   ``'callback'``: user callbacks (pre/post evaluation, enqueue,
+        dequeue and solution).
+    *   ``'incumbent'``: incumbent updates, including the filter of
+        open nodes by the new upper bound.
+
+    Phases are timed where the search calls them, so work nested in a
+    callback (e.g. a primal heuristic setting a new incumbent) is also
+    accounted for in its own phase.
+
+    Nodes are counted when created, explored (dequeued and accepted)
+    and pruned, the latter split by whether they were pruned before
+    entering the queue (``pruned_enqueue``), after leaving it
+    (``pruned_dequeue``) or filtered from it by an improved upper
+    bound (``pruned_filter``).
+    """
+
+    total_time: float
+    """Wall time in seconds of profiled ``solve()`` calls"""
+
+    nodes_created: int
+    """Number of nodes created, including the root"""
+
+    pruned_enqueue: int
+    """Number of nodes pruned before entering the queue"""
+
+    pruned_dequeue: int
+    """Number of nodes pruned after leaving the queue"""
+
+    pruned_filter: int
+    """Number of queued nodes filtered by an improved upper bound"""
+
+    max_frontier: int
+    """Maximum number of open nodes in the queue"""
+
+    def __init__(self) -> None: ...
+    def __repr__(self) -> str: ...
+    @property
+    def times(self) -> dict[str, float]:
+        """Wall time in seconds spent in each phase"""
+        ...
+
+    @property
+    def calls(self) -> dict[str, int]:
+        """Number of calls of each phase"""
+        ...
+
+    @property
+    def explored(self) -> int:
+        """Number of explored nodes"""
+        ...
+
+    @property
+    def pruned(self) -> int:
+        """Total number of pruned nodes"""
+        ...
+
+    @property
+    def created_by_level(self) -> list[int]:
+        """Number of nodes created at each tree level"""
+        ...
+
+    @property
+    def explored_by_level(self) -> list[int]:
+        """Number of nodes explored at each tree level"""
+        ...
+
+    @property
+    def pruned_by_level(self) -> list[int]:
+        """Number of nodes pruned at each tree level, excluding
+        those filtered from the queue by an improved upper bound"""
+        ...
+
+    def as_dict(self) -> dict[str, Any]:
+        """All statistics as a dictionary of plain Python objects.
+
+        Returns
+        -------
+        dict[str, Any]
+            Statistics by name
+        """
+        ...
+
+    def summary(self) -> str:
+        """Table of time and calls per phase.
+
+        Returns
+        -------
+        str
+            Formatted table
+        """
+        ...
+
+    def __reduce__(self) -> tuple[Any, ...]: ...
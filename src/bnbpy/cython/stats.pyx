@@ -0,0 +1,220 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp.vector cimport vector
+
+import mmap
+from typing import Any
+
+
+PHASES = (
+    'bound',
+    'branch',
+    'feasibility',
+    'enqueue',
+    'dequeue',
+    'prune',
+    'callback',
+    'incumbent',
+)
+
+
+cpdef double perf_clock():
+    """Seconds of the native monotonic clock used for search statistics.
+
+    Returns
+    -------
+    float
+        Clock value in seconds, from an arbitrary reference
+    """
+    return monotonic()
+
+
+cpdef Py_ssize_t resident_memory():
+    """Resident set size of the process in bytes, read from
+    ``/proc/self/statm``.
+
+    Returns
+    -------
+    int
+        Resident memory in bytes, or -1 where it is unavailable
+        (platforms without ``/proc``)
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            fields = f.read().split()
+    except OSError:
+        return -1
+    return int(fields[1]) * mmap.PAGESIZE
+
+
+cdef list _as_list(vector[unsigned long long]& hist):
+    cdef:
+        size_t i
+        list out = [0] * hist.size()
+
+    for i in range(hist.size()):
+        out[i] = hist[i]
+    return out
+
+
+@cython.final
+cdef class SearchStats:
+    """Statistics collected by a profiled Branch & Bound search.
+
+    Wall times (seconds) and call counts are accumulated per phase:
+
+    *   ``'bound'``: ``Node.compute_bound()`` and batched sibling bounds.
+    *   ``'branch'``: ``Node.branch()``, i.e., creation of children.
+    *   ``'feasibility'``: ``Node.check_feasible()``.
+    *   ``'enqueue'`` / ``'dequeue'``: node manager operations.
+    *   ``'prune'``: ``BranchAndBound.prune()``.
+    *   ``'callback'``: user callbacks (pre/post evaluation, enqueue,
+        dequeue and solution).
+    *   ``'incumbent'``: incumbent updates, including the filter of
+        open nodes by the new upper bound.
+
+    Phases are timed where the search calls them, so work nested in a
+    callback (e.g. a primal heuristic setting a new incumbent) is also
+    accounted for in its own phase.
+
+    Nodes are counted when created, explored (dequeued and accepted)
+    and pruned, the latter split by whether they were pruned before
+    entering the queue (``pruned_enqueue``), after leaving it
+    (``pruned_dequeue``) or filtered from it by an improved upper
+    bound (``pruned_filter``).
+    """
+
+    def __init__(self):
+        cdef int i
+
+        for i in range(N_PHASES):
+            self._time[i] = 0.0
+            self._calls[i] = 0
+        self.total_time = 0.0
+        self.nodes_created = 0
+        self.pruned_enqueue = 0
+        self.pruned_dequeue = 0
+        self.pruned_filter = 0
+        self.max_frontier = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'SearchStats(total_time={self.total_time:.4f}, '
+            f'nodes_created={self.nodes_created}, '
+            f'explored={self.explored}, '
+            f'pruned={self.pruned}, '
+            f'max_frontier={self.max_frontier})'
+        )
+
+    @property
+    def times(self) -> dict[str, float]:
+        """Wall time in seconds spent in each phase"""
+        return {name: self._time[i] for i, name in enumerate(PHASES)}
+
+    @property
+    def calls(self) -> dict[str, int]:
+        """Number of calls of each phase"""
+        return {name: self._calls[i] for i, name in enumerate(PHASES)}
+
+    @property
+    def explored(self) -> int:
+        """Number of explored nodes"""
+        return sum(_as_list(self._explored))
+
+    @property
+    def pruned(self) -> int:
+        """Total number of pruned nodes"""
+        return self.pruned_enqueue + self.pruned_dequeue + self.pruned_filter
+
+    @property
+    def created_by_level(self) -> list[int]:
+        """Number of nodes created at each tree level"""
+        return _as_list(self._created)
+
+    @property
+    def explored_by_level(self) -> list[int]:
+        """Number of nodes explored at each tree level"""
+        return _as_list(self._explored)
+
+    @property
+    def pruned_by_level(self) -> list[int]:
+        """Number of nodes pruned at each tree level, excluding
+        those filtered from the queue by an improved upper bound"""
+        return _as_list(self._pruned)
+
+    cpdef dict as_dict(self):
+        """All statistics as a dictionary of plain Python objects.
+
+        Returns
+        -------
+        dict[str, Any]
+            Statistics by name
+        """
+        return {
+            'total_time': self.total_time,
+            'times': self.times,
+            'calls': self.calls,
+            'nodes_created': self.nodes_created,
+            'explored': self.explored,
+            'pruned_enqueue': self.pruned_enqueue,
+            'pruned_dequeue': self.pruned_dequeue,
+            'pruned_filter': self.pruned_filter,
+            'max_frontier': self.max_frontier,
+            'created_by_level': self.created_by_level,
+            'explored_by_level': self.explored_by_level,
+            'pruned_by_level': self.pruned_by_level,
+        }
+
+    def summary(self) -> str:
+        """Table of time and calls per phase.
+
+        Returns
+        -------
+        str
+            Formatted table
+        """
+        cdef:
+            int i
+            double share
+            list[str] lines
+
+        lines = [f'{"Phase":<12} {"Calls":>12} {"Time (s)":>12} {"Share":>8}']
+        for i, name in enumerate(PHASES):
+            share = 0.0
+            if self.total_time > 0:
+                share = self._time[i] / self.total_time
+            lines.append(
+                f'{name:<12} {self._calls[i]:>12} '
+                f'{self._time[i]:>12.4f} {100 * share:>7.1f}%'
+            )
+        lines.append(f'{"total":<12} {"":>12} {self.total_time:>12.4f}')
+        return '\n'.join(lines)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_rebuild_stats, (self.as_dict(),))
+
+
+def _rebuild_stats(dict data):
+    cdef:
+        SearchStats stats = SearchStats()
+        int i
+        unsigned long long value
+
+    stats.total_time = data['total_time']
+    for i, name in enumerate(PHASES):
+        stats._time[i] = data['times'][name]
+        stats._calls[i] = data['calls'][name]
+    stats.nodes_created = data['nodes_created']
+    stats.pruned_enqueue = data['pruned_enqueue']
+    stats.pruned_dequeue = data['pruned_dequeue']
+    stats.pruned_filter = data['pruned_filter']
+    stats.max_frontier = data['max_frontier']
+    for value in data['created_by_level']:
+        stats._created.push_back(value)
+    for value in data['explored_by_level']:
+        stats._explored.push_back(value)
+    for value in data['pruned_by_level']:
+        stats._pruned.push_back(value)
+    return stats
@@ -0,0 +1,38 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+
+
+cdef enum:
+    ENTRY_BYTES = 128
+    DEPTH_ENTRY_BYTES = 64
+
+
+@cython.final
+cdef class TranspositionTable:
+
+    cdef readonly:
+        Py_ssize_t max_bytes
+        str policy
+        Py_ssize_t nbytes
+        unsigned long long hits
+        unsigned long long evictions
+
+    cdef:
+        bool by_depth
+        Py_ssize_t entry_bytes
+        list _buckets
+        dict _depths
+        Py_ssize_t _deepest
+
+    cpdef bool probe(self, object key, double value, int depth=*)
+
+    cpdef void clear(self)
+
+    cdef object _bucket_of(self, object key)
+
+    cdef void _insert(self, object key, double value, int depth)
+
+    cdef void _evict(self)
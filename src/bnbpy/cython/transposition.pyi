@@ -0,0 +1,69 @@
+from typing import Hashable
+
+DEFAULT_MAX_BYTES: int
+POLICIES: tuple[str, ...]
+
+class TranspositionTable:
+    """Memory-bounded table of the best known value of each state.
+
+    Problems describe their state by :meth:`Problem.state_key` and
+    :meth:`Problem.state_value` (e.g. the set of decisions fixed so far
+    and their cost).  A new subproblem whose key is already stored with
+    a value no greater than its own is dominated, so its subtree cannot
+    hold a better solution than that of the stored one.
+
+    The memory used by entries is estimated from a fixed overhead
+    per entry plus ``sys.getsizeof`` of the key.  Once above
+    ``max_bytes``, entries are evicted according to ``policy``:
+
+    *   ``'lru'``: least recently probed entries first.
+    *   ``'depth'``: entries of the deepest tree levels first, which
+        root the smallest subtrees, and the oldest within a level.
+
+    Evictions only make the table forget dominance relations, so they
+    never prune a node that should be explored.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Approximate memory cap of the entries, by default 64 MiB
+
+    policy : str, optional
+        Eviction policy (``'lru'`` or ``'depth'``), by default ``'lru'``
+    """
+
+    max_bytes: int
+    policy: str
+    nbytes: int
+    hits: int
+    evictions: int
+
+    def __init__(self, max_bytes: int = ..., policy: str = 'lru') -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+    def probe(self, key: Hashable, value: float, depth: int = 0) -> bool:
+        """Tells whether a state is dominated, storing it otherwise.
+
+        Parameters
+        ----------
+        key : Hashable
+            State key
+
+        value : float
+            Value of the state (lower is better)
+
+        depth : int, optional
+            Tree level of the state, used by the ``'depth'`` policy,
+            by default 0
+
+        Returns
+        -------
+        bool
+            True if the key is stored with a value no greater than
+            *value*
+        """
+        ...
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters."""
+        ...
@@ -0,0 +1,165 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp cimport bool
+
+import sys
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+POLICIES = ('lru', 'depth')
+
+
+@cython.final
+cdef class TranspositionTable:
+    """Memory-bounded table of the best known value of each state.
+
+    Problems describe their state by :meth:`Problem.state_key` and
+    :meth:`Problem.state_value` (e.g. the set of decisions fixed so far
+    and their cost).  A new subproblem whose key is already stored with
+    a value no greater than its own is dominated, so its subtree cannot
+    hold a better solution than that of the stored one.
+
+    The memory used by entries is estimated from a fixed overhead
+    per entry plus ``sys.getsizeof`` of the key.  Once above
+    ``max_bytes``, entries are evicted according to ``policy``:
+
+    *   ``'lru'``: least recently probed entries first.
+    *   ``'depth'``: entries of the deepest tree levels first, which
+        root the smallest subtrees, and the oldest within a level.
+
+    Evictions only make the table forget dominance relations, so they
+    never prune a node that should be explored.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Approximate memory cap of the entries, by default 64 MiB
+
+    policy : str, optional
+        Eviction policy (``'lru'`` or ``'depth'``), by default ``'lru'``
+    """
+
+    def __init__(
+        self,
+        Py_ssize_t max_bytes=DEFAULT_MAX_BYTES,
+        str policy='lru',
+    ):
+        if max_bytes < 0:
+            raise ValueError('max_bytes must be non-negative')
+        if policy not in POLICIES:
+            raise ValueError(
+                f'Unknown eviction policy {policy!r}, expected one of'
+                f' {POLICIES}'
+            )
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.by_depth = policy == 'depth'
+        self.entry_bytes = ENTRY_BYTES
+        if self.by_depth:
+            self.entry_bytes += DEPTH_ENTRY_BYTES
+        self.clear()
+
+    def __len__(self) -> int:
+        if self.by_depth:
+            return len(self._depths)
+        return len(self._buckets[0])
+
+    def __contains__(self, object key) -> bool:
+        return self._bucket_of(key) is not None
+
+    def __repr__(self) -> str:
+        return (
+            f'TranspositionTable(policy={self.policy!r}, '
+            f'entries={len(self)}, nbytes={self.nbytes}, '
+            f'hits={self.hits}, evictions={self.evictions})'
+        )
+
+    cpdef bool probe(self, object key, double value, int depth=0):
+        """Tells whether a state is dominated, storing it otherwise.
+
+        Parameters
+        ----------
+        key : Hashable
+            State key
+
+        value : float
+            Value of the state (lower is better)
+
+        depth : int, optional
+            Tree level of the state, used by the ``'depth'`` policy,
+            by default 0
+
+        Returns
+        -------
+        bool
+            True if the key is stored with a value no greater than
+            *value*
+        """
+        cdef:
+            object bucket, old
+
+        bucket = self._bucket_of(key)
+        if bucket is None:
+            self._insert(key, value, depth)
+            return False
+        old = bucket[key]
+        if not self.by_depth:
+            bucket.move_to_end(key)
+        if <double>old <= value:
+            self.hits += 1
+            return True
+        bucket[key] = value
+        return False
+
+    cpdef void clear(self):
+        """Removes all entries and resets the counters."""
+        self._buckets = [OrderedDict()]
+        self._depths = {}
+        self._deepest = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.evictions = 0
+
+    cdef object _bucket_of(self, object key):
+        cdef:
+            object bucket, depth
+
+        if self.by_depth:
+            depth = self._depths.get(key)
+            if depth is None:
+                return None
+            return self._buckets[depth]
+        bucket = self._buckets[0]
+        if key in bucket:
+            return bucket
+        return None
+
+    cdef void _insert(self, object key, double value, int depth):
+        if self.by_depth:
+            depth = max(depth, 0)
+            while len(self._buckets) <= depth:
+                self._buckets.append(OrderedDict())
+            self._depths[key] = depth
+            self._deepest = max(self._deepest, depth)
+        else:
+            depth = 0
+        self._buckets[depth][key] = value
+        self.nbytes += self.entry_bytes + sys.getsizeof(key)
+        while self.nbytes > self.max_bytes:
+            self._evict()
+
+    cdef void _evict(self):
+        cdef:
+            object bucket, key
+
+        if self.by_depth:
+            while self._deepest > 0 and not self._buckets[self._deepest]:
+                self._deepest -= 1
+        bucket = self._buckets[self._deepest]
+        key, _ = bucket.popitem(last=False)
+        if self.by_depth:
+            del self._depths[key]
+        self.nbytes -= self.entry_bytes + sys.getsizeof(key)
+        self.evictions += 1
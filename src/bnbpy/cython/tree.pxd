@@ -0,0 +1,58 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libcpp.vector cimport vector
+
+from bnbpy.cython.node cimport Node
+from bnbpy.cython.stats cimport monotonic
+
+
+cpdef enum TreeEvent:
+    OPENED = 0
+    BRANCHED = 1
+    PRUNED = 2
+    SOLUTION = 3
+
+
+@cython.final
+cdef class TreeRecorder:
+
+    cdef readonly:
+        object path
+        Py_ssize_t chunk_rows
+        unsigned long long flushed
+        unsigned long long chunks
+
+    cdef:
+        vector[long long] _index
+        vector[long long] _parent
+        vector[int] _level
+        vector[double] _lb
+        vector[unsigned char] _event
+        vector[double] _time
+        double _start
+
+    cdef inline void record(TreeRecorder self, Node node, TreeEvent event):
+        """Appends a row describing *event* of *node*."""
+        self._index.push_back(node._sort_index)
+        self._parent.push_back(node._parent_index)
+        self._level.push_back(node.level)
+        self._lb.push_back(node.lb)
+        self._event.push_back(<unsigned char>event)
+        self._time.push_back(monotonic() - self._start)
+        if (
+            self.path is not None
+            and <Py_ssize_t>self._index.size() >= self.chunk_rows
+        ):
+            self.flush()
+
+    cpdef void flush(self)
+
+    cpdef void clear(self)
+
+    cpdef dict arrays(self)
+
+    cdef void _clear_rows(self)
+
+    cdef dict _buffered(self)
@@ -0,0 +1,106 @@
+import os
+from enum import IntEnum
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_CHUNK_ROWS: int
+COLUMNS: tuple[str, ...]
+DTYPES: dict[str, type[np.generic]]
+
+class TreeEvent(IntEnum):
+    OPENED = 0
+    BRANCHED = 1
+    PRUNED = 2
+    SOLUTION = 3
+
+class TreeRecorder:
+    """Compact record of the events of a search tree.
+
+    Each event of a node appends a row of
+    ``(index, parent, level, lb, event, time)`` to growable typed
+    arrays, where ``parent`` is the index of the node it was branched
+    from (0 for roots), ``event`` a :class:`TreeEvent` and ``time``
+    the seconds since the recorder was cleared. Rows take about 40
+    bytes, and no node or subproblem is kept alive by the recorder.
+
+    Nodes are opened as they enter the queue, and leave it either
+    branched, pruned (including infeasible and dominated nodes, with
+    an infinite ``lb`` for the former) or as a new incumbent.
+    Nodes discarded by the manager once a better incumbent is
+    found keep ``OPENED`` as their last event.
+
+    Given a ``path``, rows are streamed to an ``.npz`` file every
+    ``chunk_rows`` rows (and at the end of each ``solve``), as one
+    array per column and chunk, so memory stays bounded however large
+    the tree. Read the file back with :func:`load_tree`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike, optional
+        File to stream rows to, by default None (kept in memory)
+
+    chunk_rows : int, optional
+        Rows buffered before being written to ``path``,
+        by default 65536
+    """
+
+    path: Optional[str]
+    chunk_rows: int
+    flushed: int
+    chunks: int
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike[str]]] = None,
+        chunk_rows: int = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def flush(self) -> None:
+        """Writes the buffered rows to ``path`` as a new chunk.
+        Recorders without a path keep their rows in memory."""
+        ...
+
+    def clear(self) -> None:
+        """Removes all rows (truncating ``path``) and restarts the
+        clock."""
+        ...
+
+    def arrays(self) -> dict[str, npt.NDArray[np.generic]]:
+        """Returns all rows recorded so far.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            One array per column of :data:`COLUMNS`
+        """
+        ...
+
+    def save(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Saves all rows to an ``.npz`` file, one array per column.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Destination file
+        """
+        ...
+
+def load_tree(
+    path: Union[str, os.PathLike[str]],
+) -> dict[str, npt.NDArray[np.generic]]:
+    """Reads the rows of a tree saved or streamed by
+    :class:`TreeRecorder`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        ``.npz`` file
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        One array per column of :data:`COLUMNS`
+    """
+    ...
@@ -0,0 +1,204 @@
+# distutils: language = c++
+# cython: language_level=3str, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False, nonecheck=False
+
+cimport cython
+from libc.string cimport memcpy
+from libcpp.vector cimport vector
+
+import os
+import zipfile
+
+import numpy as np
+
+from bnbpy.cython.stats cimport monotonic
+
+DEFAULT_CHUNK_ROWS = 65536
+COLUMNS = ('index', 'parent', 'level', 'lb', 'event', 'time')
+DTYPES = {
+    'index': np.int64,
+    'parent': np.int64,
+    'level': np.int32,
+    'lb': np.float64,
+    'event': np.uint8,
+    'time': np.float64,
+}
+
+
+cdef object _to_array(const void* data, size_t size, object dtype):
+    cdef object array = np.empty(size, dtype=dtype)
+    if size > 0:
+        memcpy(
+            <void*><size_t>array.ctypes.data, data, size * array.itemsize
+        )
+    return array
+
+
+@cython.final
+cdef class TreeRecorder:
+    """Compact record of the events of a search tree.
+
+    Each event of a node appends a row of
+    ``(index, parent, level, lb, event, time)`` to growable typed
+    arrays, where ``parent`` is the index of the node it was branched
+    from (0 for roots), ``event`` a :class:`TreeEvent` and ``time``
+    the seconds since the recorder was cleared. Rows take about 40
+    bytes, and no node or subproblem is kept alive by the recorder.
+
+    Nodes are opened as they enter the queue, and leave it either
+    branched, pruned (including infeasible and dominated nodes, with
+    an infinite ``lb`` for the former) or as a new incumbent.
+    Nodes discarded by the manager once a better incumbent is
+    found keep ``OPENED`` as their last event.
+
+    Given a ``path``, rows are streamed to an ``.npz`` file every
+    ``chunk_rows`` rows (and at the end of each ``solve``), as one
+    array per column and chunk, so memory stays bounded however large
+    the tree. Read the file back with :func:`load_tree`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike, optional
+        File to stream rows to, by default None (kept in memory)
+
+    chunk_rows : int, optional
+        Rows buffered before being written to ``path``,
+        by default 65536
+    """
+
+    def __init__(self, path=None, Py_ssize_t chunk_rows=DEFAULT_CHUNK_ROWS):
+        if chunk_rows < 1:
+            raise ValueError('chunk_rows must be positive')
+        self.path = os.fspath(path) if path is not None else None
+        self.chunk_rows = chunk_rows
+        self.clear()
+
+    def __len__(self) -> int:
+        return self.flushed + self._index.size()
+
+    def __repr__(self) -> str:
+        return (
+            f'TreeRecorder(path={self.path!r}, rows={len(self)}, '
+            f'chunks={self.chunks})'
+        )
+
+    cpdef void flush(self):
+        """Writes the buffered rows to ``path`` as a new chunk.
+        Recorders without a path keep their rows in memory."""
+        cdef:
+            str name
+            object values, archive, f
+
+        if self.path is None or self._index.empty():
+            return
+        with zipfile.ZipFile(self.path, mode='a') as archive:
+            for name, values in self._buffered().items():
+                with archive.open(
+                    f'{name}_{self.chunks:06d}.npy',
+                    mode='w',
+                    force_zip64=True,
+                ) as f:
+                    np.lib.format.write_array(f, values, allow_pickle=False)
+        self.flushed += self._index.size()
+        self.chunks += 1
+        self._clear_rows()
+
+    cpdef void clear(self):
+        """Removes all rows (truncating ``path``) and restarts the
+        clock."""
+        self._clear_rows()
+        self.flushed = 0
+        self.chunks = 0
+        self._start = monotonic()
+        if self.path is not None:
+            zipfile.ZipFile(self.path, mode='w').close()
+
+    cpdef dict arrays(self):
+        """Returns all rows recorded so far.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            One array per column of :data:`COLUMNS`
+        """
+        if self.path is None:
+            return self._buffered()
+        self.flush()
+        return load_tree(self.path)
+
+    def save(self, path) -> None:
+        """Saves all rows to an ``.npz`` file, one array per column.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            Destination file
+        """
+        np.savez(path, **self.arrays())
+
+    cdef void _clear_rows(self):
+        self._index.clear()
+        self._parent.clear()
+        self._level.clear()
+        self._lb.clear()
+        self._event.clear()
+        self._time.clear()
+
+    cdef dict _buffered(self):
+        return {
+            'index': _to_array(
+                self._index.data(), self._index.size(), DTYPES['index']
+            ),
+            'parent': _to_array(
+                self._parent.data(), self._parent.size(), DTYPES['parent']
+            ),
+            'level': _to_array(
+                self._level.data(), self._level.size(), DTYPES['level']
+            ),
+            'lb': _to_array(self._lb.data(), self._lb.size(), DTYPES['lb']),
+            'event': _to_array(
+                self._event.data(), self._event.size(), DTYPES['event']
+            ),
+            'time': _to_array(
+                self._time.data(), self._time.size(), DTYPES['time']
+            ),
+        }
+
+
+def load_tree(path) -> dict:
+    """Reads the rows of a tree saved or streamed by
+    :class:`TreeRecorder`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        ``.npz`` file
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        One array per column of :data:`COLUMNS`
+    """
+    cdef:
+        dict parts = {name: [] for name in COLUMNS}
+        dict arrays = {}
+        list chunks
+        str key, name, chunk
+
+    with np.load(path) as data:
+        for key in data.files:
+            name, _, chunk = key.rpartition('_')
+            if chunk.isdigit():
+                parts[name].append((int(chunk), data[key]))
+            else:
+                parts[key].append((0, data[key]))
+    for name in COLUMNS:
+        chunks = sorted(parts[name], key=_chunk_number)
+        if chunks:
+            arrays[name] = np.concatenate([values for _, values in chunks])
+        else:
+            arrays[name] = np.empty(0, dtype=DTYPES[name])
+    return arrays
+
+
+def _chunk_number(part):
+    return part[0]
@@ -10,7 +10,13 @@ class SearchLogger:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
+    def is_enabled(self) -> bool:
+        # Rows are only worth formatting if INFO records are handled
+        return self.logger.isEnabledFor(logging.INFO)
+
     def log_headers(self) -> None:
+        if not self.is_enabled():
+            return
         # Create a formatted header row with fixed widths, centered
         formatted_headers = self._format_row(*self.headers)
         self.logger.info(formatted_headers)
@@ -19,6 +25,8 @@ class SearchLogger:
         self.logger.info(underscore_line)
 
     def log_row(self, *row: Any) -> None:
+        if not self.is_enabled():
+            return
         # Log the formatted row with fixed widths, centered
         formatted_row = self._format_row(*row)
         self.logger.info(formatted_row)
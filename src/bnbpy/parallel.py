@@ -1,44 +1,966 @@
+from __future__ import annotations
+
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Literal
+import multiprocessing as mp
+import os
+import queue
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from multiprocessing.context import BaseContext
+from typing import Any, Generic, Literal, Optional, TypeVar, Union
 
 from bnbpy.cython.node import Node
 from bnbpy.cython.problem import Problem
-from bnbpy.cython.search import BranchAndBound
+from bnbpy.cython.search import BranchAndBound, SearchResults
+from bnbpy.cython.solution import Solution
 
 log = logging.getLogger(__name__)
 
+P = TypeVar('P', bound=Problem)
+EvalNode = Literal['in', 'out', 'both']
+
+LARGE_POS = float('inf')
+POLL_INTERVAL = 0.01
+STEAL_BACKOFF = 0.005
+CHUNK_SIZE = 1_000
+RAMP_UP_FACTOR = 4
+
+# Message kinds exchanged between the coordinator and workers
+_NODES = 'nodes'
+_STEAL = 'steal'
+_STOP = 'stop'
+_IDLE = 'idle'
+_SOLUTION = 'solution'
+_DONE = 'done'
+_ERROR = 'error'
+
+
+class SharedIncumbent:
+    """Cost of the best known solution, shared among processes
+    through a shared-memory cell."""
+
+    def __init__(self, ctx: BaseContext) -> None:
+        self._cell = ctx.Value('d', LARGE_POS)
+
+    @property
+    def value(self) -> float:
+        return float(self._cell.value)
+
+    def offer(self, value: float) -> bool:
+        """Stores *value* if it improves the shared upper bound.
+
+        Parameters
+        ----------
+        value : float
+            Cost of a new feasible solution
+
+        Returns
+        -------
+        bool
+            Whether the shared value was updated
+        """
+        with self._cell.get_lock():
+            if value < self._cell.value:
+                self._cell.value = value
+                return True
+        return False
+
+
+def fork_context() -> BaseContext:
+    """Multiprocessing context used by parallel searches.
+
+    Search objects are Cython extension types holding native state,
+    so they are handed to worker processes by forking rather than
+    by pickling.
+
+    Raises
+    ------
+    ValueError
+        If the platform does not support the 'fork' start method.
+    """
+    if 'fork' not in mp.get_all_start_methods():
+        raise ValueError(
+            "Parallel search requires the 'fork' start method,"
+            ' which is not available on this platform'
+        )
+    return mp.get_context('fork')
+
+
+def sync_cutoff(search: BranchAndBound[P], incumbent: SharedIncumbent) -> None:
+    """Prunes *search* with the shared upper bound, if better."""
+    value = incumbent.value
+    if value < search.ub:
+        search.set_cutoff(value)
+
+
+def discard_if_closed(search: BranchAndBound[P]) -> None:
+    """Empties the frontier of *search* if it cannot improve the upper
+    bound beyond the search tolerances."""
+    if search.manager.not_empty() and (
+        search.ub <= search.lb + search.atol or search.gap <= search.rtol
+    ):
+        search.manager.clear()
+
+
+def _frontier_lb(search: BranchAndBound[P]) -> float:
+    # Nodes dropped by heuristic managers still bound the subtree
+    lb = float(search.manager.dropped_lb)
+    node = search.manager.get_lower_bound()
+    if node is None:
+        return lb
+    return min(float(node.lb), lb)
+
+
+def _worker(  # noqa: PLR0913, PLR0917
+    rank: int,
+    search: BranchAndBound[P],
+    inbox: 'mp.Queue[Any]',
+    outbox: 'mp.Queue[Any]',
+    incumbent: SharedIncumbent,
+    chunk_size: int,
+    maxiter: Optional[int],
+    deadline: float,
+) -> None:
+    logging.getLogger('bnbpy.cython.search').disabled = True
+    try:
+        _work_loop(
+            rank,
+            search,
+            inbox,
+            outbox,
+            incumbent,
+            chunk_size,
+            maxiter,
+            deadline,
+        )
+    except Exception:  # noqa: BLE001
+        outbox.put((_ERROR, rank, traceback.format_exc()))
+
+
+def _work_loop(  # noqa: C901, PLR0913, PLR0917
+    rank: int,
+    search: BranchAndBound[P],
+    inbox: 'mp.Queue[Any]',
+    outbox: 'mp.Queue[Any]',
+    incumbent: SharedIncumbent,
+    chunk_size: int,
+    maxiter: Optional[int],
+    deadline: float,
+) -> None:
+    reported = LARGE_POS
+    idle = False
+    limit = LARGE_POS if maxiter is None else maxiter
+
+    # Only the first worker starts from the root (including warmstart)
+    # the others wait to steal open nodes
+    if rank == 0:
+        search.solve(maxiter=0)
+
+    while True:
+        try:
+            msg = inbox.get(block=idle)
+        except queue.Empty:
+            msg = None
+        if msg is not None:
+            kind = msg[0]
+            if kind == _STOP:
+                break
+            if kind == _NODES:
+                search.load_frontier(msg[1])
+                idle = False
+            elif kind == _STEAL:
+                stolen = []
+                if search.explored < limit:
+                    stolen = search.split_frontier(search.manager.size() // 2)
+                outbox.put((_NODES, rank, stolen))
+            continue
+
+        sync_cutoff(search, incumbent)
+        working = search.manager.not_empty() and search.explored < limit
+        if working:
+            search.solve(
+                maxiter=int(min(chunk_size, limit - search.explored)),
+                timelimit=max(deadline - time.monotonic(), 0.0),
+            )
+        if search.incumbent is not None and search.ub < reported:
+            reported = search.ub
+            incumbent.offer(reported)
+            outbox.put((_SOLUTION, rank, reported, search.incumbent.problem))
+        if working:
+            discard_if_closed(search)
+            continue
+
+        if not idle:
+            available = search.explored < limit
+            outbox.put((_IDLE, rank, search.explored, available))
+            idle = True
+
+    outbox.put((_DONE, rank, search.explored, _frontier_lb(search)))
+
+
+# State of subtree workers, inherited by forking the coordinator
+_subtree_search: Optional[BranchAndBound[Any]] = None
+_subtree_incumbent: Optional[SharedIncumbent] = None
+_subtree_counter: Any = None
+_subtree_limits: tuple[float, float, int] = (LARGE_POS, LARGE_POS, CHUNK_SIZE)
+
+
+def _init_subtree_worker(
+    search: BranchAndBound[P],
+    incumbent: SharedIncumbent,
+    counter: Any,
+    limits: tuple[float, float, int],
+) -> None:
+    global _subtree_search, _subtree_incumbent, _subtree_counter  # noqa: PLW0603
+    global _subtree_limits  # noqa: PLW0603
+    logging.getLogger('bnbpy.cython.search').disabled = True
+    _subtree_search = search
+    _subtree_incumbent = incumbent
+    _subtree_counter = counter
+    _subtree_limits = limits
+
+
+def _solve_subtree(
+    task: tuple[int, Node[P]],
+) -> tuple[int, int, float, Optional[P], float]:
+    index, root = task
+    search = _subtree_search
+    incumbent = _subtree_incumbent
+    if search is None or incumbent is None:
+        raise RuntimeError('Subtree worker was not initialized')
+    limit, deadline, chunk_size = _subtree_limits
+
+    # Independent search of the subtree, pruned by the shared cutoff
+    search.reset()
+    search.set_cutoff(incumbent.value)
+    search.load_frontier([root])
+    reported = LARGE_POS
+    problem = None
+    while search.manager.not_empty() and time.monotonic() < deadline:
+        # Iterations are reserved in advance so the total respects the limit
+        with _subtree_counter.get_lock():
+            budget = int(min(chunk_size, limit - _subtree_counter.value))
+            if budget > 0:
+                _subtree_counter.value += budget
+        if budget <= 0:
+            break
+        done = search.explored
+        search.solve(
+            maxiter=budget,
+            timelimit=max(deadline - time.monotonic(), 0.0),
+        )
+        with _subtree_counter.get_lock():
+            _subtree_counter.value -= budget - (search.explored - done)
+        if search.incumbent is not None and search.ub < reported:
+            reported = search.ub
+            problem = search.incumbent.problem
+            incumbent.offer(reported)
+        discard_if_closed(search)
+        sync_cutoff(search, incumbent)
+    return index, search.explored, reported, problem, _frontier_lb(search)
+
+
+def solve_subtrees(  # noqa: PLR0913, PLR0917
+    search: BranchAndBound[P],
+    roots: list[Node[P]],
+    workers: int,
+    maxiter: Optional[int] = None,
+    timelimit: Optional[Union[int, float]] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[int, float, Optional[P], list[tuple[int, float]]]:
+    """Solves the subtrees of *roots* independently on a process pool.
+
+    Each pool worker owns a forked copy of *search*, which is reset to
+    explore one subtree at a time. Improved upper bounds are broadcast
+    to all workers through a shared-memory cell. Subtrees are
+    submitted by increasing lower bound.
+
+    Parameters
+    ----------
+    search : BranchAndBound[P]
+        Search whose configuration (manager, callbacks, tolerances)
+        is used for every subtree
+
+    roots : list[Node[P]]
+        Open nodes, each one the root of a subtree
+
+    workers : int
+        Number of worker processes
+
+    maxiter : Optional[int], optional
+        Maximum number of iterations summed over all subtrees,
+        by default None
+
+    timelimit : Optional[Union[int, float]], optional
+        Time limit in seconds, by default None
+
+    chunk_size : int, optional
+        Number of nodes explored between checks of the shared upper bound
+        and of the limits, by default 1_000
+
+    Returns
+    -------
+    tuple[int, float, Optional[P], list[tuple[int, float]]]
+        Number of explored nodes, best upper bound, its problem (if found
+        in any subtree) and pairs of index in *roots* and frontier lower
+        bound of the subtrees not finished within the limits
+    """
+    ctx = fork_context()
+    deadline = LARGE_POS
+    if timelimit is not None:
+        deadline = time.monotonic() + timelimit
+    limit = LARGE_POS if maxiter is None else maxiter
+    incumbent = SharedIncumbent(ctx)
+    incumbent.offer(search.ub)
+    counter = ctx.Value('Q', 0)
+    tasks = sorted(enumerate(roots), key=lambda task: task[1].lb)
+
+    explored = 0
+    best_value = LARGE_POS
+    best_problem: Optional[P] = None
+    unfinished: list[tuple[int, float]] = []
+    with ctx.Pool(  # type: ignore[attr-defined]
+        workers,
+        initializer=_init_subtree_worker,
+        initargs=(search, incumbent, counter, (limit, deadline, chunk_size)),
+    ) as pool:
+        for index, n, value, problem, lb in pool.imap_unordered(
+            _solve_subtree, tasks
+        ):
+            explored += n
+            if problem is not None and value < best_value:
+                best_value = value
+                best_problem = problem
+                log.info(f'Subtree {index} - New incumbent {value}')
+            if lb < LARGE_POS:
+                unfinished.append((index, lb))
+    return explored, best_value, best_problem, unfinished
+
+
+# State of batch workers, inherited by forking the caller
+_batch_problems: Sequence[Any] = ()
+_batch_factory: Optional[Callable[[Any], BranchAndBound[Any]]] = None
+_batch_limits: tuple[Optional[int], Optional[float]] = (None, None)
+
+
+def _init_batch_worker(
+    problems: Sequence[P],
+    factory: Callable[[P], BranchAndBound[P]],
+    limits: tuple[Optional[int], Optional[float]],
+) -> None:
+    global _batch_problems, _batch_factory, _batch_limits  # noqa: PLW0603
+    logging.getLogger('bnbpy.cython.search').disabled = True
+    _batch_problems = problems
+    _batch_factory = factory
+    _batch_limits = limits
+
+
+def _solve_instance(index: int) -> tuple[int, SearchResults[Any]]:
+    if _batch_factory is None:
+        raise RuntimeError('Batch worker was not initialized')
+    maxiter, timelimit = _batch_limits
+    search = _batch_factory(_batch_problems[index])
+    return index, search.solve(maxiter=maxiter, timelimit=timelimit)
+
+
+def solve_many(
+    problems: Sequence[P],
+    algorithm_factory: Callable[[P], BranchAndBound[P]],
+    workers: Optional[int] = None,
+    timelimit: Optional[Union[int, float]] = None,
+    maxiter: Optional[int] = None,
+) -> Iterator[tuple[int, SearchResults[P]]]:
+    """Solves independent problems on a process pool, yielding the
+    results of each one as soon as it is finished.
+
+    Workers share nothing but the task indices: the problems and the
+    factory are inherited by forking the current process, so neither
+    has to be picklable (e.g. a lambda factory is fine), and each
+    search runs in a single worker. Only the results, which hold the
+    best problem found, are pickled back.
+
+    Parameters
+    ----------
+    problems : Sequence[P]
+        Problems to solve
+
+    algorithm_factory : Callable[[P], BranchAndBound[P]]
+        Builds the search of each problem, e.g. ``BestFirstBnB`` or
+        ``lambda p: LazyBnB(p, delay_lb5=True)``
+
+    workers : Optional[int], optional
+        Number of worker processes, by default ``os.cpu_count()``.
+        With a single worker, problems are solved in the current
+        process, in order.
+
+    timelimit : Optional[Union[int, float]], optional
+        Time limit in seconds of each problem, by default None
+
+    maxiter : Optional[int], optional
+        Maximum number of iterations of each problem, by default None
+
+    Yields
+    ------
+    tuple[int, SearchResults[P]]
+        Index of the problem in *problems* and its search results,
+        in order of completion
+    """
+    n = workers if workers is not None else os.cpu_count() or 1
+    n = min(n, len(problems))
+    if n <= 1:
+        for index, problem in enumerate(problems):
+            search = algorithm_factory(problem)
+            yield index, search.solve(maxiter=maxiter, timelimit=timelimit)
+        return
+
+    ctx = fork_context()
+    with ctx.Pool(  # type: ignore[attr-defined]
+        n,
+        initializer=_init_batch_worker,
+        initargs=(problems, algorithm_factory, (maxiter, timelimit)),
+    ) as pool:
+        yield from pool.imap_unordered(_solve_instance, range(len(problems)))
+
+
+class ParallelBnB(Generic[P]):
+    """Multi-process Branch & Bound with work stealing.
+
+    Each worker process owns a copy of the given search, and thus its
+    own node manager, callbacks and tolerances. The first worker starts
+    from the root node while the others steal open nodes whenever their
+    local frontier is empty. The best upper bound is shared among all
+    workers through a shared-memory cell, so every process prunes with it.
+
+    Workers are started by forking the current process, and open nodes
+    are exchanged by pickling their problems, so `Problem` subclasses
+    must support pickling.
+    """
+
+    search: BranchAndBound[P]
+    workers: int
+    chunk_size: int
+    explored: int
+    ub: float
+    lb: float
+    gap: float
+    solution: Solution
 
-class ParallelBnB(BranchAndBound[Problem]):
     def __init__(
         self,
-        problem: Problem,
-        eval_node: Literal['in', 'out', 'both'] = 'out',
-        max_workers: int = 4,
+        search: BranchAndBound[P],
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
     ) -> None:
-        super().__init__(problem, eval_node)
-        self.max_workers = max_workers
-
-    def branch(self, node: Node[Problem]) -> None:
-        children = node.branch()
-        if children:
-            # Use ThreadPoolExecutor for parallel execution
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit compute_bound tasks for each child node
-                futures = {
-                    executor.submit(child.compute_bound): child
-                    for child in children
-                }
-
-                # Process the results as they complete
-                for future in as_completed(futures):
-                    child = futures[future]
-                    try:
-                        future.result()
-                    except Exception as e:
-                        log.error(f'Error in computing LB for child node: {e}')
-
-                    # Enqueue each child after computing the lower bound
-                    self.manager.enqueue(child)
+        """Instantiate a parallel search from a sequential one.
+
+        Parameters
+        ----------
+        search : BranchAndBound[P]
+            Configured search (e.g. `LazyBnB`, `CallbackBnB`) which is not
+            yet started. It is copied into every worker process.
+
+        workers : Optional[int], optional
+            Number of worker processes, by default ``os.cpu_count()``
+
+        chunk_size : int, optional
+            Number of nodes each worker explores between checks of
+            messages and of the shared upper bound, by default 1_000
+        """
+        self.search = search
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.explored = 0
+        self.ub = LARGE_POS
+        self.lb = -LARGE_POS
+        self.gap = LARGE_POS
+        self.solution = Solution()
+        self._ctx = fork_context()
+
+    def solve(  # noqa: C901, PLR0912, PLR0914, PLR0915
+        self,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ) -> SearchResults[P]:
+        """Solves the problem of the given search using all workers.
+
+        Parameters
+        ----------
+        maxiter : Optional[int], optional
+            Maximum number of iterations of each worker, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination, by default None
+
+        Returns
+        -------
+        SearchResults
+            Search results containing best solution and problem instance
+        """
+        if rtol is not None:
+            self.search.rtol = rtol
+        if atol is not None:
+            self.search.atol = atol
+        if self.search.root is not None:
+            raise ValueError('ParallelBnB requires a search not yet started')
+
+        ctx = self._ctx
+        n = self.workers
+        deadline = LARGE_POS
+        if timelimit is not None:
+            deadline = time.monotonic() + timelimit
+        incumbent = SharedIncumbent(ctx)
+        outbox: mp.Queue[Any] = ctx.Queue()
+        inboxes: list[mp.Queue[Any]] = [ctx.Queue() for _ in range(n)]
+        procs = [
+            ctx.Process(  # type: ignore[attr-defined]
+                target=_worker,
+                args=(
+                    rank,
+                    self.search,
+                    inboxes[rank],
+                    outbox,
+                    incumbent,
+                    self.chunk_size,
+                    maxiter,
+                    deadline,
+                ),
+                daemon=True,
+            )
+            for rank in range(n)
+        ]
+        for proc in procs:
+            proc.start()
+
+        best_value = LARGE_POS
+        best_problem: Optional[P] = None
+        explored = [0] * n
+        frontier_lbs: list[float] = []
+        busy = set(range(n))
+        idle: deque[int] = deque()
+        asked: set[int] = set()
+        refused: dict[int, float] = {}
+        error: Optional[str] = None
+
+        def handle(msg: tuple[Any, ...]) -> None:
+            nonlocal best_value, best_problem, error
+            kind = msg[0]
+            if kind == _SOLUTION:
+                _, rank, value, problem = msg
+                if value < best_value:
+                    best_value = value
+                    best_problem = problem
+                    log.info(f'Worker {rank} - New incumbent {value}')
+            elif kind == _IDLE:
+                _, rank, explored[rank], available = msg
+                busy.discard(rank)
+                if available:
+                    idle.append(rank)
+            elif kind == _NODES:
+                _, victim, nodes = msg
+                asked.discard(victim)
+                if not nodes:
+                    refused[victim] = time.monotonic()
+                elif idle:
+                    thief = idle.popleft()
+                    busy.add(thief)
+                    inboxes[thief].put((_NODES, nodes))
+                else:
+                    # Late answer after termination was decided
+                    frontier_lbs.extend(node.lb for node in nodes)
+            elif kind == _ERROR:
+                error = msg[2]
+
+        def request_steals() -> None:
+            now = time.monotonic()
+            for victim in list(busy):
+                if len(asked) >= len(idle):
+                    break
+                if victim in asked:
+                    continue
+                if now - refused.get(victim, -LARGE_POS) < STEAL_BACKOFF:
+                    continue
+                inboxes[victim].put((_STEAL,))
+                asked.add(victim)
+
+        while (busy or asked) and error is None:
+            if time.monotonic() >= deadline:
+                log.info('Time Limit')
+                break
+            try:
+                handle(outbox.get(timeout=POLL_INTERVAL))
+            except queue.Empty:
+                dead = [r for r in busy | asked if not procs[r].is_alive()]
+                if dead:
+                    error = (
+                        f'Worker {dead[0]} exited unexpectedly'
+                        f' (exit code {procs[dead[0]].exitcode})'
+                    )
+            request_steals()
+
+        # Stop all workers and gather their final state
+        idle.clear()
+        for inbox in inboxes:
+            inbox.put((_STOP,))
+        pending = set(range(n))
+        while pending and error is None:
+            try:
+                msg = outbox.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not any(procs[rank].is_alive() for rank in pending):
+                    break
+                continue
+            if msg[0] == _DONE:
+                _, rank, explored[rank], lb = msg
+                frontier_lbs.append(lb)
+                pending.discard(rank)
+            else:
+                handle(msg)
+        for proc in procs:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.terminate()
+        if error is not None:
+            raise RuntimeError(f'Worker failed with:\n{error}')
+
+        self.explored = sum(explored)
+        self.ub = best_value
+        self.lb = min([best_value, *frontier_lbs])
+        if best_value != LARGE_POS:
+            self.gap = abs(best_value - self.lb) / abs(best_value)
+        if best_problem is not None:
+            sol = best_problem.solution
+            sol.set_lb(self.lb)
+            if (
+                self.ub <= self.lb + self.search.atol
+                or self.gap <= self.search.rtol
+            ):
+                sol.set_optimal()
+            problem = best_problem
+        else:
+            sol = Solution()
+            sol.set_lb(self.lb)
+            if self.lb == LARGE_POS:
+                sol.set_infeasible()
+            problem = self.search.problem
+        self.solution = sol
+        return SearchResults(sol, problem)
+
+
+# Traversal strategy and node evaluation of each default portfolio member
+DEFAULT_PORTFOLIO: tuple[tuple[str, EvalNode], ...] = (
+    ('dfs', 'out'),
+    ('best', 'in'),
+    ('cbfs', 'out'),
+)
+
+
+def _race_worker(  # noqa: PLR0913, PLR0917
+    rank: int,
+    search: BranchAndBound[P],
+    outbox: 'mp.Queue[Any]',
+    incumbent: SharedIncumbent,
+    stop: Any,
+    chunk_size: int,
+    maxiter: Optional[int],
+    deadline: float,
+) -> None:
+    logging.getLogger('bnbpy.cython.search').disabled = True
+    try:
+        _race_loop(
+            rank,
+            search,
+            outbox,
+            incumbent,
+            stop,
+            chunk_size,
+            maxiter,
+            deadline,
+        )
+    except Exception:  # noqa: BLE001
+        outbox.put((_ERROR, rank, traceback.format_exc()))
+
+
+def _race_loop(  # noqa: PLR0913, PLR0917
+    rank: int,
+    search: BranchAndBound[P],
+    outbox: 'mp.Queue[Any]',
+    incumbent: SharedIncumbent,
+    stop: Any,
+    chunk_size: int,
+    maxiter: Optional[int],
+    deadline: float,
+) -> None:
+    reported = LARGE_POS
+    limit = LARGE_POS if maxiter is None else maxiter
+    search.solve(maxiter=0)
+    while True:
+        if search.incumbent is not None and search.ub < reported:
+            reported = search.ub
+            incumbent.offer(reported)
+            outbox.put((_SOLUTION, rank, reported, search.incumbent.problem))
+        sync_cutoff(search, incumbent)
+        discard_if_closed(search)
+        if (
+            stop.is_set()
+            or not search.manager.not_empty()
+            or search.explored >= limit
+            or time.monotonic() >= deadline
+        ):
+            break
+        search.solve(
+            maxiter=int(min(chunk_size, limit - search.explored)),
+            timelimit=max(deadline - time.monotonic(), 0.0),
+        )
+
+    # An empty frontier proves that no solution beats the shared cutoff,
+    # unless heuristic managers dropped nodes which might
+    proved = not search.manager.not_empty() and (
+        search.manager.dropped_lb >= search.ub
+    )
+    if proved:
+        stop.set()
+    outbox.put((_DONE, rank, search.explored, _frontier_lb(search), proved))
+
+
+class PortfolioBnB(Generic[P]):
+    """Races several searches of the same problem in separate processes.
+
+    Each member is a configured search, usually differing in traversal
+    strategy or node evaluation, whose best strategy is hard to predict
+    for a given instance. Members share the best upper bound through a
+    shared-memory cell, so each one prunes with the incumbents found by
+    the others. The first member to empty its frontier proves the shared
+    upper bound optimal and stops the whole portfolio.
+
+    Unlike `ParallelBnB`, members do not exchange nodes, so each one
+    explores the complete tree on its own. On a time or iteration limit,
+    the lower bound of the portfolio is the greatest among members.
+    """
+
+    searches: list[BranchAndBound[P]]
+    chunk_size: int
+    explored: int
+    explored_by: list[int]
+    winner: Optional[int]
+    ub: float
+    lb: float
+    gap: float
+    solution: Solution
+
+    def __init__(
+        self,
+        searches: Sequence[BranchAndBound[P]],
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Instantiate a portfolio from configured searches.
+
+        Parameters
+        ----------
+        searches : Sequence[BranchAndBound[P]]
+            Searches of the same problem which are not yet started,
+            one per worker process
+
+        chunk_size : int, optional
+            Number of nodes each member explores between checks of the
+            shared upper bound and of the stop signal, by default 1_000
+        """
+        if not searches:
+            raise ValueError('PortfolioBnB requires at least one search')
+        self.searches = list(searches)
+        self.chunk_size = chunk_size
+        self.explored = 0
+        self.explored_by = [0] * len(self.searches)
+        self.winner = None
+        self.ub = LARGE_POS
+        self.lb = -LARGE_POS
+        self.gap = LARGE_POS
+        self.solution = Solution()
+        self._ctx = fork_context()
+
+    @classmethod
+    def from_strategies(
+        cls,
+        problem: P,
+        strategies: Sequence[tuple[str, EvalNode]] = DEFAULT_PORTFOLIO,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> PortfolioBnB[P]:
+        """Builds a portfolio of plain searches of *problem*.
+
+        Parameters
+        ----------
+        problem : P
+            Problem instance to solve
+
+        strategies : Sequence[tuple[str, EvalNode]], optional
+            Pairs of traversal strategy, as in
+            `BranchAndBound.build_manager`, and ``eval_node``, by default
+            ``(('dfs', 'out'), ('best', 'in'), ('cbfs', 'out'))``
+
+        chunk_size : int, optional
+            Number of nodes each member explores between checks of the
+            shared upper bound and of the stop signal, by default 1_000
+
+        Returns
+        -------
+        PortfolioBnB[P]
+            Portfolio with one member per strategy
+        """
+        searches = [
+            BranchAndBound(
+                problem,
+                eval_node=eval_node,
+                manager=BranchAndBound.build_manager(strategy),
+            )
+            for strategy, eval_node in strategies
+        ]
+        return cls(searches, chunk_size=chunk_size)
+
+    def solve(  # noqa: C901, PLR0912, PLR0914, PLR0915
+        self,
+        maxiter: Optional[int] = None,
+        timelimit: Optional[Union[int, float]] = None,
+        rtol: Optional[float] = None,
+        atol: Optional[float] = None,
+    ) -> SearchResults[P]:
+        """Races all members until one of them proves optimality.
+
+        Parameters
+        ----------
+        maxiter : Optional[int], optional
+            Maximum number of iterations of each member, by default None
+
+        timelimit : Optional[Union[int, float]], optional
+            Time limit in seconds, by default None
+
+        rtol : Optional[float], optional
+            Relative tolerance for termination, by default None
+
+        atol : Optional[float], optional
+            Absolute tolerance for termination, by default None
+
+        Returns
+        -------
+        SearchResults
+            Search results containing best solution and problem instance
+        """
+        for search in self.searches:
+            if rtol is not None:
+                search.rtol = rtol
+            if atol is not None:
+                search.atol = atol
+            if search.root is not None:
+                raise ValueError(
+                    'PortfolioBnB requires searches not yet started'
+                )
+
+        ctx = self._ctx
+        n = len(self.searches)
+        deadline = LARGE_POS
+        if timelimit is not None:
+            deadline = time.monotonic() + timelimit
+        incumbent = SharedIncumbent(ctx)
+        stop = ctx.Event()  # type: ignore[attr-defined]
+        outbox: mp.Queue[Any] = ctx.Queue()
+        procs = [
+            ctx.Process(  # type: ignore[attr-defined]
+                target=_race_worker,
+                args=(
+                    rank,
+                    search,
+                    outbox,
+                    incumbent,
+                    stop,
+                    self.chunk_size,
+                    maxiter,
+                    deadline,
+                ),
+                daemon=True,
+            )
+            for rank, search in enumerate(self.searches)
+        ]
+        for proc in procs:
+            proc.start()
+
+        best_value = LARGE_POS
+        best_problem: Optional[P] = None
+        explored = [0] * n
+        frontier_lbs: list[float] = []
+        winner: Optional[int] = None
+        pending = set(range(n))
+        error: Optional[str] = None
+        while pending and error is None:
+            if time.monotonic() >= deadline and not stop.is_set():
+                log.info('Time Limit')
+                stop.set()
+            try:
+                msg = outbox.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                dead = [r for r in pending if not procs[r].is_alive()]
+                if dead:
+                    error = (
+                        f'Worker {dead[0]} exited unexpectedly'
+                        f' (exit code {procs[dead[0]].exitcode})'
+                    )
+                continue
+            kind = msg[0]
+            if kind == _SOLUTION:
+                _, rank, value, problem = msg
+                if value < best_value:
+                    best_value = value
+                    best_problem = problem
+                    log.info(f'Worker {rank} - New incumbent {value}')
+            elif kind == _DONE:
+                _, rank, explored[rank], lb, proved = msg
+                frontier_lbs.append(lb)
+                pending.discard(rank)
+                if proved and winner is None:
+                    winner = rank
+                    log.info(f'Worker {rank} - Optimality proved')
+            elif kind == _ERROR:
+                error = msg[2]
+        stop.set()
+        for proc in procs:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.terminate()
+        if error is not None:
+            raise RuntimeError(f'Worker failed with:\n{error}')
+
+        # Every member explores the whole tree, so any of their frontier
+        # bounds is valid for the problem
+        self.explored_by = explored
+        self.explored = sum(explored)
+        self.winner = winner
+        self.ub = best_value
+        self.lb = min(best_value, max(frontier_lbs))
+        if best_value != LARGE_POS:
+            self.gap = abs(best_value - self.lb) / abs(best_value)
+        search = self.searches[0]
+        if best_problem is not None:
+            sol = best_problem.solution
+            sol.set_lb(self.lb)
+            if (
+                winner is not None
+                or self.ub <= self.lb + search.atol
+                or self.gap <= search.rtol
+            ):
+                sol.set_optimal()
+            problem = best_problem
         else:
-            self.log_row('Cutoff')
+            sol = Solution()
+            sol.set_lb(self.lb)
+            if self.lb == LARGE_POS:
+                sol.set_infeasible()
+            problem = search.problem
+        self.solution = sol
+        return SearchResults(sol, problem)
@@ -1,12 +1,57 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Union
+import os
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Union
 
 import matplotlib.pyplot as plt
-import networkx as nx
+import numpy as np
+import numpy.typing as npt
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 
 from bnbpy.cython.node import Node
 from bnbpy.cython.status import OptStatus
+from bnbpy.cython.tree import TreeEvent, TreeRecorder, load_tree
+
+TreeArrays = Mapping[str, npt.NDArray[Any]]
+TreeRows = Union[TreeRecorder, TreeArrays, str, os.PathLike[str]]
+TreeLike = Union['Node[Any]', TreeRows]
+
+EVENT_COLORS = {
+    TreeEvent.OPENED: 'lightgrey',
+    TreeEvent.BRANCHED: 'gold',
+    TreeEvent.PRUNED: 'darkgrey',
+    TreeEvent.SOLUTION: 'lightblue',
+}
+
+# Nodes drawn before subtrees are collapsed, and labelled at most
+DEFAULT_MAX_NODES = 2000
+MAX_LABELS = 200
+
+
+@dataclass(frozen=True)
+class TreeNodes:
+    """Nodes of a search tree as parallel arrays, sorted by index.
+
+    ``parent`` is 0 for the root, and ``hidden`` counts the
+    descendants of each node collapsed into it (0 if none).
+    """
+
+    index: npt.NDArray[np.int64]
+    parent: npt.NDArray[np.int64]
+    level: npt.NDArray[np.int64]
+    lb: npt.NDArray[np.float64]
+    color: npt.NDArray[np.str_]
+    hidden: npt.NDArray[np.int64]
+    root: int
+
+    def parent_positions(self) -> npt.NDArray[np.intp]:
+        """Positions of the parents in the arrays (that of the root
+        for the root itself)."""
+        positions = np.searchsorted(self.index, self.parent)
+        positions[self.parent == 0] = np.searchsorted(self.index, self.root)
+        return positions
 
 
 def get_color(node: Node[Any]) -> str:  # noqa: PLR0911
@@ -25,25 +70,261 @@ def get_color(node: Node[Any]) -> str:  # noqa: PLR0911
     return 'lightgrey'
 
 
-class Edges(list[Any]):
-    nodes: List[Node[Any]]
+def _tree_arrays(tree: TreeRows) -> TreeArrays:
+    if isinstance(tree, TreeRecorder):
+        return tree.arrays()
+    if isinstance(tree, (str, os.PathLike)):
+        return load_tree(tree)
+    return tree
+
+
+def _level_groups(level: npt.NDArray[Any]) -> list[npt.NDArray[np.intp]]:
+    # Positions of the nodes of each level, shallowest first, keeping
+    # their current order within levels
+    order = np.argsort(level, kind='stable')
+    splits = np.flatnonzero(np.diff(level[order])) + 1
+    return np.split(order, splits)
+
+
+def _make_nodes(  # noqa: PLR0913, PLR0917
+    index: npt.NDArray[Any],
+    parent: npt.NDArray[Any],
+    level: npt.NDArray[Any],
+    lb: npt.NDArray[Any],
+    color: npt.NDArray[Any],
+    root: int,
+) -> TreeNodes:
+    order = np.argsort(index, kind='stable')
+    return TreeNodes(
+        index=np.asarray(index, dtype=np.int64)[order],
+        parent=np.asarray(parent, dtype=np.int64)[order],
+        level=np.asarray(level, dtype=np.int64)[order],
+        lb=np.asarray(lb, dtype=np.float64)[order],
+        color=np.asarray(color, dtype=np.str_)[order],
+        hidden=np.zeros(len(order), dtype=np.int64),
+        root=root,
+    )
+
+
+def _saved_nodes(root: Node[Any]) -> TreeNodes:
+    index: list[int] = []
+    parent: list[int] = []
+    level: list[int] = []
+    lb: list[float] = []
+    color: list[str] = []
+    # Explicit stack, as deep trees exceed the recursion limit
+    stack: list[tuple[Node[Any], int]] = [(root, 0)]
+    while stack:
+        node, parent_index = stack.pop()
+        index.append(node.index)
+        parent.append(parent_index)
+        level.append(node.level)
+        lb.append(node.lb)
+        color.append(get_color(node))
+        if node.children:
+            stack.extend((child, node.index) for child in node.children)
+    color[0] = 'cyan'
+    return _make_nodes(
+        np.array(index),
+        np.array(parent),
+        np.array(level),
+        np.array(lb),
+        np.array(color),
+        root.index,
+    )
+
+
+def _descendants(
+    index: npt.NDArray[Any],
+    parent: npt.NDArray[Any],
+    level: npt.NDArray[Any],
+    root: int,
+) -> npt.NDArray[np.bool_]:
+    # Nodes not descending from the root (such as warmstart solutions)
+    # are left out, level by level
+    keep: npt.NDArray[np.bool_] = index == root
+    kept = np.array([root])
+    for group in _level_groups(level):
+        found = group[(index[group] != root) & np.isin(parent[group], kept)]
+        if len(found) > 0:
+            keep[found] = True
+            kept = index[found]
+    return keep
+
+
+def _recorded_nodes(rows: TreeArrays) -> TreeNodes:
+    index = np.asarray(rows['index'])
+    events = np.asarray(rows['event'])
+    opened = (events == TreeEvent.OPENED) & (np.asarray(rows['parent']) == 0)
+    if not opened.any():
+        raise ValueError('No root node in the recorded tree')
+    root = int(index[np.argmax(opened)])
+
+    # Parents and levels are those of the first row of each node,
+    # lower bounds and events those of the last one
+    nodes, first = np.unique(index, return_index=True)
+    last = len(index) - 1 - np.unique(index[::-1], return_index=True)[1]
+    parent = np.asarray(rows['parent'])[first]
+    level = np.asarray(rows['level'])[first]
+    lb = np.asarray(rows['lb'])[last]
+    event = events[last]
+    palette = np.array([EVENT_COLORS[e] for e in TreeEvent], dtype='U10')
+    color = palette[event]
+    color[(event == TreeEvent.PRUNED) & np.isinf(lb)] = 'lightcoral'
+    solutions = index[events == TreeEvent.SOLUTION]
+    if len(solutions) > 0:
+        color[np.searchsorted(nodes, solutions[-1])] = 'lightgreen'
+    color[np.searchsorted(nodes, root)] = 'cyan'
+
+    keep = _descendants(nodes, parent, level, root)
+    return _make_nodes(
+        nodes[keep], parent[keep], level[keep], lb[keep], color[keep], root
+    )
+
+
+def tree_nodes(tree: TreeLike) -> TreeNodes:
+    """Extracts the nodes of a search tree as arrays.
+
+    Parameters
+    ----------
+    tree : Node | TreeRecorder | Mapping[str, ndarray] | str | PathLike
+        Root node of a search with ``save_tree=True``, or the rows of
+        a :class:`~bnbpy.cython.tree.TreeRecorder`: the recorder, its
+        arrays, or the ``.npz`` file they were saved to
+
+    Returns
+    -------
+    TreeNodes
+        Nodes of the tree. Recorded nodes are colored by their last
+        event, and the last incumbent as the best solution.
+    """
+    if isinstance(tree, Node):
+        return _saved_nodes(tree)
+    return _recorded_nodes(_tree_arrays(tree))
+
+
+def collapse_tree(nodes: TreeNodes, max_nodes: int) -> TreeNodes:
+    """Keeps the shallowest levels of a tree that fit in ``max_nodes``
+    nodes (at least the root), collapsing the subtrees below them
+    into their roots.
+
+    Parameters
+    ----------
+    nodes : TreeNodes
+        Nodes of the tree
+
+    max_nodes : int
+        Maximum number of nodes kept
+
+    Returns
+    -------
+    TreeNodes
+        Kept nodes, with the size of their collapsed subtrees as
+        ``hidden``. Subtrees holding the best solution are colored
+        as such.
+    """
+    if len(nodes.index) <= max_nodes:
+        return nodes
+    levels, counts = np.unique(nodes.level, return_counts=True)
+    fits = np.cumsum(counts) <= max_nodes
+    depth = levels[np.argmin(fits) - 1] if fits[0] else levels[0]
+
+    # Sizes of subtrees and whether they hold the best solution,
+    # accumulated from the deepest level up
+    parents = nodes.parent_positions()
+    hidden = nodes.hidden.copy()
+    best = nodes.color == 'lightgreen'
+    for group in reversed(_level_groups(nodes.level)):
+        if nodes.level[group[0]] <= depth:
+            break
+        np.add.at(hidden, parents[group], hidden[group] + 1)
+        np.logical_or.at(best, parents[group], best[group])
+
+    keep = nodes.level <= depth
+    color = nodes.color.copy()
+    color[best & (nodes.level == depth)] = 'lightgreen'
+    return TreeNodes(
+        index=nodes.index[keep],
+        parent=nodes.parent[keep],
+        level=nodes.level[keep],
+        lb=nodes.lb[keep],
+        color=color[keep],
+        hidden=hidden[keep],
+        root=nodes.root,
+    )
+
+
+def tree_layout(
+    nodes: TreeNodes,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Positions the nodes of a tree by levels.
+
+    Each leaf (or collapsed subtree) takes a slot of the width, in
+    order of index within each parent, and each node is centered over
+    the slots of its descendants. Positions are computed with one
+    array operation per level.
+
+    Parameters
+    ----------
+    nodes : TreeNodes
+        Nodes of the tree
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        Horizontal position (between 0 and 1) and depth of each node
+    """
+    n = len(nodes.index)
+    parents = nodes.parent_positions()
+    groups = _level_groups(nodes.level)
+    root = np.searchsorted(nodes.index, nodes.root)
+
+    # Number of leaves below each node
+    leaves = np.zeros(n, dtype=np.int64)
+    for group in reversed(groups[1:]):
+        leaves[group] = np.maximum(leaves[group], 1)
+        np.add.at(leaves, parents[group], leaves[group])
+    leaves[root] = max(leaves[root], 1)
+
+    # Children split the slots of their parent, from left to right
+    left = np.zeros(n, dtype=np.int64)
+    for level_nodes in groups[1:]:
+        group = level_nodes[
+            np.lexsort((nodes.index[level_nodes], parents[level_nodes]))
+        ]
+        offset = np.cumsum(leaves[group]) - leaves[group]
+        starts = np.flatnonzero(np.diff(parents[group], prepend=-1))
+        offset -= np.repeat(offset[starts], np.diff(starts, append=len(group)))
+        left[group] = left[parents[group]] + offset
+    x = (left + 0.5 * leaves) / leaves[root]
+    depth = (nodes.level - nodes.level[root]).astype(np.float64)
+    return x, depth
+
+
+class Edges(list[tuple[int, int]]):
+    """Edges (parent, child) between node indices of a search tree,
+    along with the lower bound and color of each node.
 
-    def __init__(self, root: Node[Any]):
-        super().__init__()
-        self.nodes = []
-        self.traverse(root)
+    The tree is either the root of a search with ``save_tree=True``,
+    or the rows of a :class:`~bnbpy.cython.tree.TreeRecorder` (the
+    recorder itself, its arrays, or the ``.npz`` file they were saved
+    to). Rows give each node the color of its last event, and the
+    last incumbent is highlighted as the best solution.
+    """
 
-    def traverse(self, node: Node[Any]) -> None:
-        self.nodes.append(node)
-        if node.children is None:
-            return
-        for child in node.children:
-            self.append((node.index, child.index))
-            self.traverse(child)
+    root: int
+    lbs: dict[int, float]
+    colors: dict[int, str]
 
-    @property
-    def colors(self) -> dict[int, str]:
-        return {node.index: get_color(node) for node in self.nodes}
+    def __init__(self, tree: TreeLike):
+        nodes = tree_nodes(tree)
+        child = nodes.parent > 0
+        super().__init__(
+            zip(nodes.parent[child].tolist(), nodes.index[child].tolist())
+        )
+        self.root = nodes.root
+        self.lbs = dict(zip(nodes.index.tolist(), nodes.lb.tolist()))
+        self.colors = dict(zip(nodes.index.tolist(), nodes.color.tolist()))
 
 
 def _format_lb(x: float | str) -> str:
@@ -55,70 +336,146 @@ def _format_lb(x: float | str) -> str:
         return f'{x}'
 
 
-def plot_tree(  # noqa: PLR0913, PLR0917
-    root: Node[Any],
+def _draw_labels(  # noqa: PLR0913, PLR0917
+    ax: Axes,
+    nodes: TreeNodes,
+    px: npt.NDArray[np.float64],
+    py: npt.NDArray[np.float64],
+    labels: Mapping[int, Any],
+    font_size: float,
+) -> None:
+    for i, (index, hidden) in enumerate(
+        zip(nodes.index.tolist(), nodes.hidden.tolist())
+    ):
+        label = str(labels.get(index, ''))
+        if hidden > 0:
+            label = f'{label}\n+{hidden}'.strip()
+        if label:
+            ax.text(
+                px[i],
+                py[i],
+                label,
+                ha='center',
+                va='center',
+                fontsize=font_size,
+                zorder=3,
+            )
+
+
+def plot_tree(  # noqa: PLR0913, PLR0914, PLR0917
+    tree: TreeLike,
     align: str = 'horizontal',
     show_lb: bool = True,
     custom_labels: Any = None,
     figsize: Optional[Union[tuple[Any, ...], list[Any]]] = None,
     dpi: int = 100,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    node_size: Optional[float] = None,
+    font_size: float = 12,
+    ax: Optional[Axes] = None,
     **options: Any,
-) -> None:
-    """From the root node of a solved Branch & Bound, create a tree-plot
+) -> Axes:
+    """From the tree of a solved Branch & Bound, create a tree-plot
+
+    Trees of more than ``max_nodes`` nodes are cut at the deepest level
+    that fits, and the subtrees below are drawn collapsed into
+    triangles labelled with the number of nodes they hold.
 
     Parameters
     ----------
-    root : Node[Any]
-        Root node of search tree
+    tree : Node | TreeRecorder | Mapping[str, ndarray] | str | PathLike
+        Root node of a search with ``save_tree=True``, or the rows of
+        a :class:`~bnbpy.cython.tree.TreeRecorder`: the recorder, its
+        arrays, or the ``.npz`` file they were saved to
 
     align : str, optional
-        Mode of alignment in `networkx.bfs_layout`, by default 'horizontal'
+        Either 'horizontal' (levels in rows, root on top) or 'vertical'
+        (levels in columns, root on the left), by default 'horizontal'
 
     show_lb : bool, optional
         Either or not to show lower bounds (custom_labels must be `None`),
-        by default True
+        by default True. Labels are only drawn in trees of up to 200 nodes.
 
     custom_labels : Any, optional
-        Custom labels parsed to `networkx.draw`, by default None
+        Custom labels of nodes, by index, by default None
 
     figsize : Optional[Union[tuple, list]], optional
         Figure size parsed to `matplotlib`, by default None
 
     dpi : int, optional
         Dpi parsed to `matplotlib`, by default 100
+
+    max_nodes : int, optional
+        Nodes drawn before subtrees are collapsed, by default 2000
+
+    node_size : Optional[float], optional
+        Marker area of nodes, by default scaled down with the number
+        of nodes drawn
+
+    font_size : float, optional
+        Font size of labels, by default 12
+
+    ax : Optional[Axes], optional
+        Axes to draw on, by default a new figure that is shown
+
+    **options
+        Passed to `matplotlib.axes.Axes.scatter` when drawing nodes
+
+    Returns
+    -------
+    Axes
+        Axes of the plot
     """
-    if figsize is None:
-        figsize = (8, 6)
-    # Extract edges from the root node
-    tree_edges = Edges(root)
-
-    # Create a directed graph
-    G: nx.DiGraph = nx.DiGraph()
-    G.add_edges_from(tree_edges)
-
-    # Draw the graph with a spring layout
-    pos = nx.bfs_layout(
-        G, start=root.index, align=align
-    )  # You can use other layouts like shell_layout or circular_layout
-
-    pos = {node: (x, -y) for node, (x, y) in pos.items()}
-    color_code = tree_edges.colors
-    colors = [color_code.get(node, 'lightgrey') for node in G.nodes()]
-    if show_lb:
-        custom_labels = {
-            node.index: _format_lb(node.lb) + f'$_{ ({node.index}) }$'
-            for node in tree_edges.nodes
-        }
+    if align not in {'horizontal', 'vertical'}:
+        raise ValueError(f'Unknown align {align!r}')
+    nodes = collapse_tree(tree_nodes(tree), max_nodes)
+    n = len(nodes.index)
+    x, depth = tree_layout(nodes)
+    # The root is kept at the top (or on the left)
+    px, py = (x, -depth) if align == 'horizontal' else (depth, -x)
+    if node_size is None:
+        node_size = min(700.0, max(5.0, 70000.0 / n))
 
-    plt.figure(figsize=figsize, dpi=dpi)
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        labels=custom_labels,
-        node_size=700,
-        node_color=colors,
-        arrows=False,
-        **options,
+    show = ax is None
+    if ax is None:
+        _, ax = plt.subplots(figsize=figsize or (8, 6), dpi=dpi)
+    parents = nodes.parent_positions()
+    child = nodes.parent > 0
+    segments = np.stack(
+        [
+            np.column_stack([px[parents[child]], py[parents[child]]]),
+            np.column_stack([px[child], py[child]]),
+        ],
+        axis=1,
     )
-    plt.show()
+    ax.add_collection(
+        LineCollection(
+            list(segments), colors='black', linewidths=0.5, zorder=1
+        )
+    )
+    collapsed = nodes.hidden > 0
+    for mask, marker in ((~collapsed, 'o'), (collapsed, '^')):
+        if mask.any():
+            ax.scatter(
+                px[mask],
+                py[mask],
+                s=node_size,
+                c=nodes.color[mask].tolist(),
+                marker=marker,
+                zorder=2,
+                **options,
+            )
+
+    if custom_labels is None and show_lb and n <= MAX_LABELS:
+        # Node indices are unique in the process; number from the root
+        custom_labels = {
+            index: _format_lb(lb) + f'$_{ ({index - nodes.root + 1}) }$'
+            for index, lb in zip(nodes.index.tolist(), nodes.lb.tolist())
+        }
+    if custom_labels is not None or n <= MAX_LABELS:
+        _draw_labels(ax, nodes, px, py, custom_labels or {}, font_size)
+    ax.autoscale_view()
+    ax.set_axis_off()
+    if show:
+        plt.show()
+    return ax
@@ -1,4 +1,5 @@
-from typing import List, Optional, Union
+import random
+from typing import List, Optional, Tuple, Union
 
 from bnbpy.cython.problem import Problem
 
@@ -61,3 +62,84 @@ class StrongerBoundProblem(MyProblem):
 
     def stronger_bound(self) -> float:
         return self.solution.lb + STRONGER_BOUND_DELTA
+
+
+class KnapsackProblem(Problem):
+    """0/1 knapsack (as minimization of negative value) with the
+    fractional relaxation as bound. Items are fixed in the given order.
+    """
+
+    def __init__(
+        self,
+        values: List[float],
+        weights: List[float],
+        capacity: float,
+    ):
+        super().__init__()
+        self.values = values
+        self.weights = weights
+        self.capacity = capacity
+        self.fixed: List[int] = []
+        self.value = 0.0
+        self.weight = 0.0
+
+    def calc_bound(self) -> float:
+        room = self.capacity - self.weight
+        bound = self.value
+        for i in range(len(self.fixed), len(self.values)):
+            if self.weights[i] <= room:
+                room -= self.weights[i]
+                bound += self.values[i]
+            else:
+                bound += self.values[i] * room / self.weights[i]
+                break
+        return -bound
+
+    def is_feasible(self) -> bool:
+        return len(self.fixed) == len(self.values)
+
+    def branch(self) -> List['KnapsackProblem']:
+        i = len(self.fixed)
+        children = []
+        for take in (1, 0):
+            if take and self.weight + self.weights[i] > self.capacity:
+                continue
+            child = self.child_copy()
+            child.fixed = [*self.fixed, take]
+            child.value = self.value + take * self.values[i]
+            child.weight = self.weight + take * self.weights[i]
+            children.append(child)
+        return children
+
+    def decisions(self) -> Tuple[int, ...]:
+        return tuple(self.fixed)
+
+    def apply_decisions(
+        self, decisions: Tuple[int, ...]
+    ) -> Optional['KnapsackProblem']:
+        child = self.child_copy()
+        child.fixed = list(decisions)
+        child.value = sum(v * t for v, t in zip(self.values, decisions))
+        child.weight = sum(w * t for w, t in zip(self.weights, decisions))
+        if child.weight > self.capacity:
+            return None
+        return child
+
+    def cost_decrease(self, former: Problem) -> float:
+        # Branching depends on weights, so only values might change
+        assert isinstance(former, KnapsackProblem)
+        assert former.weights == self.weights
+        return sum(max(0.0, v - u) for v, u in zip(self.values, former.values))
+
+
+def make_knapsack(n: int = 24, seed: int = 7) -> KnapsackProblem:
+    """Random knapsack instance with items sorted by value/weight ratio."""
+    rng = random.Random(seed)
+    items = [
+        (float(rng.randint(10, 60)), float(rng.randint(5, 40)))
+        for _ in range(n)
+    ]
+    items.sort(key=lambda vw: vw[0] / vw[1], reverse=True)
+    values = [v for v, _ in items]
+    weights = [w for _, w in items]
+    return KnapsackProblem(values, weights, capacity=sum(weights) / 2)
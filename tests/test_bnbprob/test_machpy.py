@@ -1,7 +1,15 @@
+import pickle
+
 import pytest
 
-from bnbprob.machdeadline import Job, MachDeadlineProb
-from bnbpy import BestFirstBnB, BreadthFirstBnB, DepthFirstBnB
+from bnbprob.machdeadline import Job, LagrangianDeadline, MachDeadlineProb
+from bnbpy import (
+    BestFirstBnB,
+    BranchAndBound,
+    BreadthFirstBnB,
+    DepthFirstBnB,
+    SolutionPool,
+)
 
 
 class NoWarmstart(MachDeadlineProb):
@@ -18,6 +26,7 @@ class TestMachDeadLine:
     dfs_nodes = 3
     bfs_nodes = 9
     bb_nodes = 3
+    pool_costs = [86, 87, 99, 101, 104]
 
     @pytest.fixture
     def problem(self) -> MachDeadlineProb:  # noqa: PLR6301
@@ -63,3 +72,27 @@ class TestMachDeadLine:
             f'Wrong number of explored nodes for lb priority'
             f' {bnb.explored}, expected {self.bb_nodes}'
         )
+
+    @pytest.mark.pool
+    def test_pool_bypasses_table(self, problem: MachDeadlineProb) -> None:
+        bnb = BranchAndBound(problem, eval_node='in')
+        bnb.pool = SolutionPool(len(self.pool_costs))
+        bnb.solve()
+        # Dominated sequences still hold some of the best solutions
+        assert bnb.table is not None
+        assert bnb.pool.costs == self.pool_costs
+
+    def test_clean_cache_deprecated(self) -> None:
+        jobs = [
+            Job(id=j, p=self.p[j], w=self.w[j], d=self.d[j])
+            for j in range(len(self.p))
+        ]
+        with pytest.deprecated_call():
+            LagrangianDeadline(jobs).clean_cache()
+
+    def test_pickle(self, problem: MachDeadlineProb) -> None:
+        other = pickle.loads(pickle.dumps(problem))
+        assert other.sequence == problem.sequence
+        bnb = DepthFirstBnB(other, eval_node='in')
+        bnb.solve()
+        assert bnb.solution.cost == self.sol_value
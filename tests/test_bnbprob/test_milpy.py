@@ -105,6 +105,14 @@ class TestKnapsack:
         assert x_res is not None, 'No solution found'
         self.assert_sol(x_res)
 
+    @pytest.mark.parallel
+    def test_knapsack_workers(self, milp: MILP) -> None:
+        bnb = BestFirstBnB(milp, eval_node='in')
+        res = bnb.solve(workers=2)
+        assert res.solution.status == OptStatus.OPTIMAL
+        self.assert_cost(res.solution.cost)
+        self.assert_sol(res.problem.results.x)
+
     @pytest.mark.parametrize(
         ('status', 'eval_node', 'maxiter', 'explored'),
         [
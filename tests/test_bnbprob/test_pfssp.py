@@ -1,11 +1,24 @@
+import gc
+import itertools
+import pickle
 import random
+from pathlib import Path
 from typing import Any, Type
 
 import pytest
 
-from bnbprob.pafssp.cython.bnb import LazyBnB
+from bnbprob.pafssp.cython.bnb import (
+    CallbackBnB,
+    CutoffBnB,
+    CycleBestFlowShop,
+    LazyBnB,
+)
 from bnbprob.pafssp.cython.problem import PermFlowShop
+from bnbpy.cython.frontier import FrontierRecorder
+from bnbpy.cython.node import Node
+from bnbpy.cython.pool import SolutionPool
 from bnbpy.cython.search import BestFirstBnB, BranchAndBound, DepthFirstBnB
+from bnbpy.cython.tree import TreeRecorder
 
 
 @pytest.mark.pafssp
@@ -99,6 +112,197 @@ class TestPFSSP:
             f' expected {self.nodes}'
         )
 
+    def test_pickle(self) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        node = Node(problem)
+        child = node.branch()[2]
+        child.compute_bound()
+        grandchild = child.branch()[1]
+        grandchild.compute_bound()
+        other = pickle.loads(pickle.dumps(grandchild))
+        assert other.level == grandchild.level
+        assert other.lb == grandchild.lb
+        assert [job.j for job in other.problem.sequence] == [
+            job.j for job in grandchild.problem.sequence
+        ]
+        assert other.problem.sigma1.C == grandchild.problem.sigma1.C
+        assert other.problem.sigma2.C == grandchild.problem.sigma2.C
+        # Unpickled permutations have their r and q params up to date
+        grandchild.problem.update_params()
+        assert other.problem.calc_lb_2m() == grandchild.problem.calc_lb_2m()
+        # Processing times are only sent along with root problems
+        assert len(pickle.dumps(grandchild.problem)) < len(
+            pickle.dumps(problem)
+        )
+
+    def test_pickle_solve(self) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        other = pickle.loads(pickle.dumps(problem))
+        bnb = DepthFirstBnB(other, eval_node='in')
+        bnb.solve()
+        assert bnb.solution.cost == self.sol_value
+        assert bnb.explored == self.nodes
+
+    @pytest.mark.checkpoint
+    def test_checkpoint(self, tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        ref = CallbackBnB(self.start_problem(PermFlowShop))
+        ref.solve()
+        bnb = CallbackBnB(self.start_problem(PermFlowShop))
+        bnb.solve(maxiter=3)
+        bnb.checkpoint(path)
+        explored = bnb.explored
+        # The instance is read back from the file once the original
+        # problems are gone
+        del bnb
+        gc.collect()
+        resumed = CallbackBnB(self.start_problem(PermFlowShop))
+        resumed.restore(path)
+        assert resumed.explored == explored
+        assert resumed.solve().cost == self.sol_value
+        assert resumed.explored == ref.explored
+
+    @pytest.mark.reopt
+    def test_decisions(self) -> None:
+        problem = self.start_problem(PermFlowShop)
+        # Jobs fixed in both sigma1 and sigma2
+        child = problem.branch()[1].branch()[2].branch()[0]
+        rebuilt = self.start_problem(PermFlowShop).apply_decisions(
+            child.decisions()
+        )
+        for sigma, other in [
+            (child.sigma1, rebuilt.sigma1),
+            (child.sigma2, rebuilt.sigma2),
+        ]:
+            assert [job.j for job in sigma.get_jobs()] == [
+                job.j for job in other.get_jobs()
+            ]
+            assert sigma.get_C() == other.get_C()
+        assert {job.j for job in rebuilt.free_jobs} == {
+            job.j for job in child.free_jobs
+        }
+        assert rebuilt.calc_lb_1m() == child.calc_lb_1m()
+        assert problem.cost_decrease(self.start_problem(PermFlowShop)) == 0
+
+    @staticmethod
+    @pytest.mark.reopt
+    def test_cost_decrease() -> None:
+        p: list[list[int]] = [[5, 9, 8], [9, 3, 10], [9, 4, 5]]
+        q = [[3, 9, 8], [9, 3, 12], [9, 4, 4]]
+        problem = PermFlowShop.from_p(q)
+        assert problem.cost_decrease(PermFlowShop.from_p(p)) == 3  # noqa: PLR2004
+        assert problem.cost_decrease(PermFlowShop.from_p(p[:2])) == float(
+            'inf'
+        )
+
+    @pytest.mark.reopt
+    @pytest.mark.parametrize('bnb_cls', [LazyBnB, CallbackBnB])
+    def test_reoptimize(self, bnb_cls: Type[LazyBnB]) -> None:
+        former = bnb_cls(
+            self.start_problem(PermFlowShop, constructive='quick')
+        )
+        former.frontier = FrontierRecorder()
+        former.solve()
+        p: list[list[int]] = [[] for _ in range(self.J)]
+        for job in former.problem.sequence:
+            p[job.j] = list(job.p)
+        rng = random.Random(7)
+        for _ in range(3):
+            p[rng.randrange(self.J)][rng.randrange(self.M)] += rng.randint(
+                -5, 5
+            )
+        cold = bnb_cls(PermFlowShop.from_p(p, constructive='quick'))
+        cold.solve()
+        bnb = bnb_cls(PermFlowShop.from_p(p, constructive='quick'))
+        bnb.reoptimize(former.frontier)
+        assert bnb.solve().cost == cold.solution.cost
+        assert bnb.explored <= cold.explored
+
+    @pytest.mark.reopt
+    def test_cutoff_reset(self) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        bnb = CutoffBnB(problem, ub_value=self.sol_value + 1)
+        bnb.recorder = TreeRecorder()
+        bnb.frontier = FrontierRecorder()
+        assert bnb.solve().cost == self.sol_value
+        rows, leaves = len(bnb.recorder), len(bnb.frontier)
+        bnb.reset()
+        assert bnb.solve().cost == self.sol_value
+        # Restarts clear what the former search recorded
+        assert len(bnb.recorder) == rows
+        assert len(bnb.frontier) == leaves
+        assert bnb.frontier.problem is problem
+        other = CutoffBnB(
+            self.start_problem(PermFlowShop, constructive='quick'),
+            ub_value=self.sol_value + 1,
+        )
+        other.reoptimize(bnb.frontier)
+        assert other.solve().cost == self.sol_value
+        assert other.explored == 0
+
+    @pytest.mark.parametrize('bnb_cls', [LazyBnB, CallbackBnB])
+    def test_stats(self, bnb_cls: Type[LazyBnB]) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        bnb = bnb_cls(problem, delay_lb5=False)
+        sol = bnb.solve(profile=True)
+        assert sol.cost == self.sol_value
+        assert sol.stats is not None
+        assert sol.stats.explored == bnb.explored
+        assert sol.stats.calls['callback'] > 0
+
+    def test_stats_cyclic(self) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        bnb = LazyBnB(problem, delay_lb5=False)
+        bnb.set_manager(CycleBestFlowShop())
+        sol = bnb.solve(profile=True)
+        assert sol.cost == self.sol_value
+        assert sol.stats is not None
+        assert sol.stats.nodes_created == (
+            sol.stats.explored + sol.stats.pruned
+        )
+        assert len(sol.stats.created_by_level) == self.J + 1
+
+    @pytest.mark.parallel
+    def test_lazy_workers(self) -> None:
+        problem = self.start_problem(PermFlowShop, constructive='quick')
+        bnb = LazyBnB(problem, delay_lb5=False)
+        sol = bnb.solve(workers=2)
+        assert sol.cost == self.sol_value
+
+    def test_memory_size(self) -> None:
+        """Subproblems count their permutation, not the shared jobs."""
+        problem = self.start_problem(PermFlowShop)
+        child = problem.branch()[0]
+        assert child.memory_size() == problem.memory_size() > 0
+
+    @staticmethod
+    @pytest.mark.pool
+    @pytest.mark.parametrize('bnb_cls', [LazyBnB, CallbackBnB])
+    def test_pool(bnb_cls: Type[LazyBnB]) -> None:
+        p: list[list[int]] = [
+            [5, 9, 8, 10, 1],
+            [9, 3, 10, 1, 8],
+            [9, 4, 5, 8, 6],
+            [4, 8, 8, 7, 2],
+        ]
+        k = 5
+        makespans = []
+        for seq in itertools.permutations(range(len(p))):
+            c = [0] * len(p[0])
+            for j in seq:
+                c[0] += p[j][0]
+                for m in range(1, len(c)):
+                    c[m] = max(c[m], c[m - 1]) + p[j][m]
+            makespans.append(c[-1])
+        bnb = bnb_cls(PermFlowShop.from_p(p, constructive='neh'))
+        bnb.pool = SolutionPool(k)
+        bnb.solve()
+        assert bnb.pool.costs == sorted(makespans)[:k]
+        # Heuristic solutions found again in the tree are not repeated
+        keys = [node.problem.solution_key() for node in bnb.pool.nodes()]
+        assert len(set(keys)) == k
+        assert all(sorted(key) == list(range(len(p))) for key in keys)
+
     @staticmethod
     def test_neh() -> None:
         p: list[list[int]] = [
@@ -0,0 +1,179 @@
+import os
+from pathlib import Path
+
+import pytest
+from myfixtures.myproblem import make_knapsack
+
+from bnbpy.cython.checkpoint import MAGIC, CheckpointWriter, read_checkpoint
+from bnbpy.cython.levelqueue import BeamSearch
+from bnbpy.cython.node import Node
+from bnbpy.cython.primanager import BestFirstSearch
+from bnbpy.cython.search import BestFirstBnB, BranchAndBound
+from bnbpy.cython.spillmanager import SpillingBestFirstSearch
+
+# Test constants
+MAXITER = 5
+RTOL = 0.05
+ATOL = 2.0
+BATCH = 2
+SPILL_NODES = 4
+
+
+def _solved() -> BranchAndBound:
+    bnb = BestFirstBnB(make_knapsack())
+    bnb.solve()
+    return bnb
+
+
+def _partial(
+    path: Path, bnb: BranchAndBound, **options: float
+) -> BranchAndBound:
+    bnb.solve(maxiter=MAXITER, **options)
+    bnb.checkpoint(path)
+    return bnb
+
+
+@pytest.mark.core
+@pytest.mark.checkpoint
+class TestCheckpoint:
+    @staticmethod
+    def test_requires_started_search(tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match='not started'):
+            BestFirstBnB(make_knapsack()).checkpoint(tmp_path / 'ck')
+
+    @staticmethod
+    def test_invalid_file(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        path.write_bytes(b'not a checkpoint')
+        with pytest.raises(ValueError, match='not a bnbpy checkpoint'):
+            BestFirstBnB(make_knapsack()).restore(path)
+
+    @staticmethod
+    def test_restores_state(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        saved = _partial(
+            path, BestFirstBnB(make_knapsack()), rtol=RTOL, atol=ATOL
+        )
+        assert path.read_bytes().startswith(MAGIC)
+        assert not os.path.exists(f'{path}.tmp')
+        bnb = BestFirstBnB(make_knapsack())
+        bnb.restore(path)
+        assert bnb.explored == saved.explored
+        assert bnb.rtol == RTOL
+        assert bnb.atol == ATOL
+        assert bnb.ub == saved.ub
+        assert bnb.lb == saved.lb
+        assert bnb.manager.size() == saved.manager.size()
+        restored = sorted(node.lb for node in bnb.manager.open_nodes())
+        assert restored == sorted(
+            node.lb for node in saved.manager.open_nodes()
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_resume_finds_optimum(tmp_path: Path, eval_node: str) -> None:
+        path = tmp_path / 'ck'
+        expected = BranchAndBound(make_knapsack(), eval_node=eval_node)
+        expected.solve()
+        _partial(path, BranchAndBound(make_knapsack(), eval_node=eval_node))
+        bnb = BranchAndBound(make_knapsack(), eval_node=eval_node)
+        bnb.restore(path)
+        bnb.solve()
+        assert bnb.solution.cost == expected.solution.cost
+        assert bnb.solution.status == expected.solution.status
+
+    @staticmethod
+    def test_restore_replaces_search(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        saved = _partial(path, BestFirstBnB(make_knapsack()))
+        bnb = _solved()
+        bnb.restore(path)
+        assert bnb.explored == saved.explored
+        bnb.solve()
+        assert bnb.solution.cost == _solved().solution.cost
+
+    @staticmethod
+    def test_manager_state(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        saved = BranchAndBound(make_knapsack(), manager=BeamSearch(1))
+        _partial(path, saved)
+        assert saved.manager.dropped > 0
+        bnb = BranchAndBound(make_knapsack(), manager=BeamSearch(1))
+        bnb.restore(path)
+        assert bnb.manager.get_state() == saved.manager.get_state()
+        assert bnb.lb == saved.lb
+
+    @staticmethod
+    def test_spilled_nodes(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        manager = SpillingBestFirstSearch(SPILL_NODES, directory=str(tmp_path))
+        saved = _partial(
+            path, BranchAndBound(make_knapsack(), manager=manager)
+        )
+        assert manager.spilled > 0
+        spilled = manager.spilled
+        assert len(manager.open_nodes()) == manager.size()
+        # Spilled nodes are read without being consumed
+        assert manager.spilled == spilled
+        bnb = BestFirstBnB(make_knapsack())
+        bnb.restore(path)
+        assert bnb.manager.size() == saved.manager.size()
+        bnb.solve()
+        assert bnb.solution.cost == _solved().solution.cost
+
+    @staticmethod
+    def test_periodic_checkpoints(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        bnb = BestFirstBnB(make_knapsack())
+        with pytest.raises(ValueError, match='interval'):
+            bnb.set_checkpoint(path, interval=-1.0)
+        with pytest.raises(ValueError, match='batch_size'):
+            bnb.set_checkpoint(path, batch_size=0)
+        bnb.set_checkpoint(path, interval=0.0, batch_size=BATCH)
+        assert bnb.checkpoint_path == str(path)
+        bnb.solve(maxiter=MAXITER)
+        header, nodes = read_checkpoint(path)
+        # Snapshots describe the search when they were taken
+        assert header['explored'] <= bnb.explored
+        assert len(list(nodes)) == header['nodes']
+        resumed = BestFirstBnB(make_knapsack())
+        resumed.restore(path)
+        resumed.solve()
+        assert resumed.solution.cost == _solved().solution.cost
+        bnb.set_checkpoint(None)
+        assert bnb.checkpoint_path is None
+
+    @staticmethod
+    def test_writer_steps(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        bnb = BestFirstBnB(make_knapsack())
+        bnb.solve(maxiter=MAXITER)
+        nodes = bnb.manager.open_nodes()
+        expected = [(node.level, node.lb) for node in nodes]
+        assert len(nodes) > BATCH
+        writer = CheckpointWriter(path, {'explored': 1}, nodes)
+        assert not writer.step(BATCH)
+        assert writer.written == BATCH
+        # Nodes explored meanwhile do not change the snapshot
+        bnb.solve()
+        assert not path.exists()
+        while not writer.step(BATCH):
+            pass
+        assert writer.done
+        header, restored = read_checkpoint(path)
+        assert header['explored'] == 1
+        assert [(node.level, node.lb) for node in restored] == expected
+        aborted = CheckpointWriter(tmp_path / 'other', {}, nodes)
+        aborted.abort()
+        assert aborted.done
+        assert os.listdir(tmp_path) == ['ck']
+
+    @staticmethod
+    def test_open_nodes() -> None:
+        manager = BestFirstSearch()
+        nodes = [Node(problem) for problem in [make_knapsack()] * 3]
+        for node, lb in zip(nodes, [3.0, 1.0, 2.0]):
+            node.lb = lb
+            manager.enqueue(node)
+        assert [n.lb for n in manager.open_nodes()] == [1.0, 2.0, 3.0]
+        assert manager.size() == len(nodes)
@@ -0,0 +1,163 @@
+import itertools
+import random
+
+import pytest
+from myfixtures.myproblem import KnapsackProblem, MyProblem, make_knapsack
+
+from bnbpy.cython.frontier import FrontierRecorder
+from bnbpy.cython.search import BestFirstBnB, BranchAndBound
+
+# Test constants
+ITEMS = 12
+MAXITER = 5
+CHANGES = 3
+CHAIN = 3
+MAX_CHANGE = 6.0
+WARMSTARTS = 2
+
+
+class BlindKnapsack(KnapsackProblem):
+    """Knapsack without an estimate of cost changes"""
+
+    def cost_decrease(self, former: KnapsackProblem) -> float:  # noqa: PLR6301
+        return float('inf')
+
+
+class CountingKnapsack(BlindKnapsack):
+    """Knapsack counting the evaluations of its bounds"""
+
+    evaluated = 0
+
+    def calc_bound(self) -> float:
+        CountingKnapsack.evaluated += 1
+        return super().calc_bound()
+
+
+def _recorded(problem: KnapsackProblem, **options: str) -> BranchAndBound:
+    bnb = BranchAndBound(problem, **options)
+    bnb.frontier = FrontierRecorder()
+    return bnb
+
+
+def _modified(
+    problem: KnapsackProblem, seed: int, cls: type = KnapsackProblem
+) -> KnapsackProblem:
+    rng = random.Random(seed)
+    values = list(problem.values)
+    for _ in range(CHANGES):
+        i = rng.randrange(len(values))
+        values[i] = max(1.0, values[i] + rng.uniform(-MAX_CHANGE, MAX_CHANGE))
+    return cls(values, problem.weights, problem.capacity)
+
+
+@pytest.mark.core
+@pytest.mark.reopt
+class TestReoptimize:
+    @staticmethod
+    def test_default_frontier() -> None:
+        assert BranchAndBound(make_knapsack()).frontier is None
+
+    @staticmethod
+    def test_requires_decisions() -> None:
+        bnb = BranchAndBound(MyProblem(lb_value=1))
+        bnb.frontier = FrontierRecorder()
+        with pytest.raises(NotImplementedError, match='decisions'):
+            bnb.solve()
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    @pytest.mark.parametrize('maxiter', [None, MAXITER])
+    def test_leaves_partition(eval_node: str, maxiter: int) -> None:
+        problem = make_knapsack(ITEMS)
+        bnb = _recorded(problem, eval_node=eval_node)
+        bnb.solve(maxiter=maxiter)
+        leaves = [decisions for decisions, _, _ in bnb.frontier.leaves()]
+        assert len(leaves) == len(bnb.frontier)
+        assert bnb.frontier.problem is problem
+        # Each solution completes the decisions of exactly one leaf
+        for take in itertools.product((1, 0), repeat=ITEMS):
+            weight = sum(w * t for w, t in zip(problem.weights, take))
+            if weight <= problem.capacity:
+                prefixes = [d for d in leaves if take[: len(d)] == d]
+                assert len(prefixes) == 1
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    @pytest.mark.parametrize('cls', [KnapsackProblem, BlindKnapsack])
+    def test_matches_cold_search(eval_node: str, cls: type) -> None:
+        former = _recorded(make_knapsack(), eval_node=eval_node)
+        former.solve()
+        assert former.frontier.incumbent is former.incumbent.problem
+        problem = _modified(former.problem, seed=1, cls=cls)
+        cold = BranchAndBound(problem, eval_node=eval_node)
+        cold.solve()
+        bnb = BranchAndBound(problem, eval_node=eval_node)
+        bnb.reoptimize(former.frontier)
+        assert bnb.root is not None
+        sol = bnb.solve()
+        assert sol.cost == cold.solution.cost
+        assert sol.status == cold.solution.status
+        assert bnb.explored < cold.explored
+
+    @staticmethod
+    def test_eval_out_bounds_once() -> None:
+        former = _recorded(make_knapsack(), eval_node='out')
+        former.solve()
+        problem = _modified(former.problem, seed=1, cls=CountingKnapsack)
+        CountingKnapsack.evaluated = 0
+        bnb = BranchAndBound(problem, eval_node='out')
+        bnb.reoptimize(former.frontier)
+        # Only warmstarts are evaluated before leaves are dequeued
+        assert CountingKnapsack.evaluated <= WARMSTARTS
+        bnb.solve()
+        assert CountingKnapsack.evaluated <= len(former.frontier) + WARMSTARTS
+
+    @staticmethod
+    def test_interrupted_search() -> None:
+        former = _recorded(make_knapsack())
+        former.solve(maxiter=MAXITER)
+        problem = _modified(former.problem, seed=2)
+        bnb = BestFirstBnB(problem)
+        bnb.reoptimize(former.frontier)
+        assert bnb.solve().cost == BestFirstBnB(problem).solve().cost
+
+    @staticmethod
+    def test_chained_reoptimization() -> None:
+        bnb = _recorded(make_knapsack())
+        bnb.solve()
+        for seed in range(CHAIN):
+            problem = _modified(bnb.problem, seed)
+            frontier = bnb.frontier
+            bnb = _recorded(problem)
+            bnb.reoptimize(frontier)
+            assert bnb.frontier is not frontier
+            assert bnb.solve().cost == BranchAndBound(problem).solve().cost
+
+    @staticmethod
+    def test_own_frontier() -> None:
+        bnb = _recorded(make_knapsack())
+        cost = bnb.solve().cost
+        frontier = bnb.frontier
+        bnb.reoptimize(frontier)
+        # Leaves are recorded again by a new frontier
+        assert bnb.frontier is not frontier
+        assert bnb.solve().cost == cost
+        assert bnb.explored == 0
+
+    @staticmethod
+    def test_empty_frontier() -> None:
+        problem = make_knapsack()
+        bnb = BranchAndBound(problem)
+        bnb.reoptimize(FrontierRecorder())
+        assert bnb.solve().cost == BranchAndBound(problem).solve().cost
+        assert bnb.explored > 0
+
+    @staticmethod
+    def test_clear() -> None:
+        bnb = _recorded(make_knapsack())
+        bnb.solve()
+        assert len(bnb.frontier) > 0
+        bnb.frontier.clear()
+        assert len(bnb.frontier) == 0
+        assert bnb.frontier.incumbent is None
+        assert bnb.frontier.leaves() == []
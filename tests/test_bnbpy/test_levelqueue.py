@@ -1,7 +1,8 @@
 import pytest
-from myfixtures.myproblem import MyProblem
+from myfixtures.myproblem import MyProblem, make_knapsack
 
 from bnbpy.cython.levelqueue import (
+    BeamSearch,
     CyclicBestSearch,
     DfsPriority,
     LevelManagerInterface,
@@ -25,6 +26,10 @@ THREE = 3
 FOUR = 4
 FIVE = 5
 NEW_LEVEL = 3
+WIDTH = 2
+N_NODES = 10
+KNAPSACK_ITEMS = 12
+WIDE_BEAM = 10_000
 
 
 SIX = 6
@@ -144,6 +149,24 @@ class TestLevelQueue:
         assert level.pop() is low
         assert level.pop() is high
 
+    @staticmethod
+    def test_make_priority_override() -> None:
+        """A Python override of make_priority replaces the inline key."""
+
+        class WorstFirst(LevelQueue[MyProblem]):
+            def make_priority(  # noqa: PLR6301
+                self, node: Node[MyProblem]
+            ) -> list[float]:
+                return [-node.lb]
+
+        level = WorstFirst(0)
+        high = _make_node(LB_HIGH)
+        low = _make_node(LB_LOW)
+        level.push(low)
+        level.push(high)
+        assert level.pop() is high
+        assert level.pop() is low
+
     @staticmethod
     def test_filter_removes_above_threshold() -> None:
         level: LevelQueue[MyProblem] = LevelQueue(0)
@@ -704,6 +727,93 @@ class TestDfsPriority:
         assert node.lb == LB_LOW
 
 
+# ---------------------------------------------------------------------------
+# BeamSearch
+# ---------------------------------------------------------------------------
+@pytest.mark.core
+@pytest.mark.levelqueue
+class TestBeamSearch:
+    @staticmethod
+    def test_invalid_width() -> None:
+        with pytest.raises(ValueError, match='width'):
+            BeamSearch(width=0)
+
+    @staticmethod
+    def test_best_nodes_of_each_level() -> None:
+        """Only the best nodes of a level are dequeued, shallowest first."""
+        beam: BeamSearch[MyProblem] = BeamSearch(width=WIDTH)
+        deep = [_make_node(float(i), level=1) for i in range(FIVE)]
+        shallow = [_make_node(LB_HIGH, level=0)]
+        for node in deep + shallow:
+            beam.enqueue(node)
+        out = [beam.dequeue() for _ in range(WIDTH + 1)]
+        assert out == [shallow[0], deep[0], deep[1]]
+        assert beam.dequeue() is None
+        assert not beam.not_empty()
+        assert beam.dropped == FIVE - WIDTH
+        assert beam.dropped_lb == deep[WIDTH].lb
+
+    @staticmethod
+    def test_levels_are_truncated() -> None:
+        """Levels never hold more than twice the width."""
+        beam: BeamSearch[MyProblem] = BeamSearch(width=WIDTH)
+        for i in reversed(range(N_NODES)):
+            beam.enqueue(_make_node(float(i), level=0))
+            assert beam.size() <= 2 * WIDTH
+        assert [beam.dequeue().lb for _ in range(WIDTH)] == [0.0, 1.0]
+        assert beam.dequeue() is None
+        assert beam.dropped == N_NODES - WIDTH
+        assert beam.dropped_lb == WIDTH
+
+    @staticmethod
+    def test_clear_resets_beam() -> None:
+        beam: BeamSearch[MyProblem] = BeamSearch(width=1)
+        beam.enqueue_all([_make_node(float(i), level=0) for i in range(TWO)])
+        beam.dequeue()
+        beam.dequeue()
+        beam.clear()
+        assert beam.dropped == 0
+        node = _make_node(LB_LOW, level=0)
+        beam.enqueue(node)
+        assert beam.dequeue() is node
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_narrow_beam_is_not_exhaustive(eval_node: str) -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS),
+            eval_node=eval_node,
+            manager=BranchAndBound.build_manager('beam', width=1),
+        )
+        sol = bnb.solve()
+        assert sol.cost >= ref.cost
+        assert sol.lb <= ref.cost
+        assert sol.solution.status == OptStatus.FEASIBLE
+
+    @staticmethod
+    def test_bound_node_dropped() -> None:
+        bnb = BranchAndBound(make_knapsack(), manager=BeamSearch(width=1))
+        # Levels left by the beam drop their nodes, the bound node first
+        for explored in range(1, FIVE):
+            sol = bnb.solve(maxiter=1)
+            assert bnb.explored == explored
+            assert bnb.bound_node.problem is not None
+            assert sol.lb == bnb.lb
+
+    @staticmethod
+    def test_wide_beam_is_exact() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS),
+            eval_node='in',
+            manager=BeamSearch(width=WIDE_BEAM),
+        )
+        sol = bnb.solve()
+        assert sol.cost == ref.cost
+        assert sol.solution.status == OptStatus.OPTIMAL
+
+
 # ---------------------------------------------------------------------------
 # Integration with BranchAndBound
 # ---------------------------------------------------------------------------
@@ -64,6 +64,15 @@ class TestLogger:
         # Check the row formatting
         assert log_call[0][0] == self.ref_row
 
+    def test_disabled_logger(
+        self, search_logger: SearchLogger, mock_logger: Any
+    ) -> None:
+        """Test that nothing is logged if INFO records are not handled."""
+        mock_logger.isEnabledFor.return_value = False
+        search_logger.log_headers()
+        search_logger.log_row(*self.ref_args)
+        mock_logger.info.assert_not_called()
+
     def test_format_row(self, search_logger: SearchLogger) -> None:
         """Test the private _format_row method (optional)."""
         # Directly test the formatting
@@ -1,8 +1,11 @@
+import sys
+
 import pytest
 from myfixtures.myproblem import MyProblem
 
 from bnbpy.cython.manager import BaseNodeManager, FifoManager, LifoManager
 from bnbpy.cython.node import Node
+from bnbpy.cython.primanager import BestFirstSearch, DepthFirstSearch
 
 # Test constants
 LB_LOW = 5
@@ -15,6 +18,8 @@ LEVEL_CHILD = 1
 LEVEL_GRANDCHILD = 2
 TWO = 2
 THREE = 3
+N_NODES = 100
+LAZY_THRESHOLD = 0.6
 
 
 def _make_node(lb: float) -> Node[MyProblem]:
@@ -337,6 +342,25 @@ class TestFifoManager:
         assert manager.dequeue() is node_low
         assert manager.dequeue() is node_medium
 
+    @staticmethod
+    def test_interleaved_order(manager: FifoManager[MyProblem]) -> None:
+        lbs = [(i * 7) % N_NODES for i in range(N_NODES)]
+        nodes = [_make_node(lb) for lb in lbs]
+        out = []
+        for i, node in enumerate(nodes):
+            manager.enqueue(node)
+            if i % THREE == 0:
+                out.append(manager.dequeue())
+        manager.filter_by_lb(N_NODES // TWO)
+        while manager.not_empty():
+            out.append(manager.dequeue())
+        # Nodes dequeued before filtering are the oldest ones
+        n_early = len(range(0, N_NODES, THREE))
+        expected = nodes[:n_early] + [
+            node for node in nodes[n_early:] if node.lb < N_NODES // TWO
+        ]
+        assert out == expected
+
 
 @pytest.mark.core
 @pytest.mark.manager
@@ -383,7 +407,8 @@ class TestBoundMemory:
         assert mgr.lb == LB_LOW
         mgr.dequeue()  # pops high (LIFO), forget(high) — lb stays LB_LOW
         assert mgr.lb == LB_LOW
-        mgr.dequeue()  # pops low (LIFO), forget(low) — lb stays stale (lazy)
+        mgr.dequeue()  # pops low (LIFO), forget(low) — index is empty
+        assert mgr.lb == float('inf')
         assert len(mgr.bound_memory) == 0
         assert len(mgr.bound_nodes) == 0
 
@@ -396,9 +421,21 @@ class TestBoundMemory:
         mgr.enqueue(medium)
         mgr.dequeue()  # pops medium (LIFO)
         assert mgr.lb == LB_LOW
-        mgr.dequeue()  # pops low (LIFO) — sole min-lb node; lb stays stale (lazy)
+        mgr.dequeue()  # pops low (LIFO) — sole min-lb node
         assert len(mgr.bound_memory) == 0
 
+    @staticmethod
+    def test_lb_exact_when_min_lb_node_dequeued() -> None:
+        mgr: FifoManager[MyProblem] = FifoManager()
+        low = _make_node(LB_LOW)
+        high = _make_node(LB_HIGH)
+        mgr.enqueue(low)
+        mgr.enqueue(high)
+        assert mgr.dequeue() is low
+        assert mgr.lb == LB_HIGH
+        assert mgr.get_lower_bound() is high
+        assert mgr.bound_nodes == {high}
+
     @staticmethod
     def test_filter_memory_lb_removes_entries() -> None:
         mgr: LifoManager[MyProblem] = LifoManager()
@@ -411,6 +448,31 @@ class TestBoundMemory:
         assert LB_LOW in mgr.bound_memory or LB_MEDIUM in mgr.bound_memory
         assert mgr.lb < MAX_LB_FILTER
 
+    @staticmethod
+    def test_filter_memory_lb_recounts_nodes() -> None:
+        mgr: LifoManager[MyProblem] = LifoManager()
+        for lb in (LB_LOW, LB_MEDIUM, LB_HIGH, LB_VERY_HIGH):
+            mgr.enqueue(_make_node(lb))
+        mgr.filter_by_lb(MAX_LB_FILTER)
+        assert mgr.size() == TWO
+        assert set(mgr.bound_memory) == {LB_LOW, LB_MEDIUM}
+        # No node above the new bound: nothing is removed
+        mgr.filter_by_lb(LB_VERY_HIGH)
+        assert mgr.size() == TWO
+
+    @staticmethod
+    def test_memory_releases_references() -> None:
+        mgr: FifoManager[MyProblem] = FifoManager()
+        node = _make_node(LB_LOW)
+        before = sys.getrefcount(node)
+        mgr.enqueue(node)
+        assert sys.getrefcount(node) > before
+        mgr.dequeue()
+        assert sys.getrefcount(node) == before
+        mgr.enqueue(node)
+        mgr.filter_by_lb(LB_LOW)
+        assert sys.getrefcount(node) == before
+
     @staticmethod
     def test_clear_memory_resets_all() -> None:
         mgr: LifoManager[MyProblem] = LifoManager()
@@ -433,3 +495,78 @@ class TestBoundMemory:
         assert n1 in mgr.bound_memory[LB_LOW]
         assert n2 in mgr.bound_memory[LB_MEDIUM]
         assert n3 in mgr.bound_memory[LB_HIGH]
+
+
+@pytest.mark.core
+@pytest.mark.manager
+class TestLazyPruning:
+    """filter_by_lb in lazy mode defers the removal of pruned nodes."""
+
+    @staticmethod
+    @pytest.fixture(
+        params=[LifoManager, FifoManager, BestFirstSearch, DepthFirstSearch]
+    )
+    def manager(request: pytest.FixtureRequest) -> BaseNodeManager[MyProblem]:
+        mgr = request.param()
+        mgr.set_lazy(threshold=LAZY_THRESHOLD)
+        return mgr
+
+    @staticmethod
+    def test_invalid_threshold() -> None:
+        mgr: LifoManager[MyProblem] = LifoManager()
+        with pytest.raises(ValueError, match='threshold'):
+            mgr.set_lazy(threshold=0.0)
+
+    @staticmethod
+    def test_filter_is_deferred(manager: BaseNodeManager[MyProblem]) -> None:
+        lbs = [LB_LOW, LB_HIGH, LB_MEDIUM, LB_VERY_HIGH, LB_LOW]
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        manager.filter_by_lb(MAX_LB_FILTER)
+        # Two of five nodes are stale, below the threshold
+        assert manager.stale == TWO
+        assert manager.size() == THREE
+        assert manager.lb == LB_LOW
+        out = []
+        while manager.not_empty():
+            node = manager.dequeue()
+            assert node is not None
+            out.append(node.lb)
+        assert sorted(out) == [LB_LOW, LB_LOW, LB_MEDIUM]
+        assert manager.dequeue() is None
+        assert manager.stale == 0
+
+    @staticmethod
+    def test_compaction(manager: BaseNodeManager[MyProblem]) -> None:
+        lbs = [LB_LOW, LB_HIGH, LB_VERY_HIGH, LB_HIGH]
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        manager.filter_by_lb(LB_VERY_HIGH)
+        assert manager.stale == 1
+        # Three of four nodes are stale, above the threshold
+        manager.filter_by_lb(MAX_LB_FILTER)
+        assert manager.stale == 0
+        assert manager.size() == 1
+        node = manager.dequeue()
+        assert node is not None
+        assert node.lb == LB_LOW
+
+    @staticmethod
+    def test_disable_compacts(manager: BaseNodeManager[MyProblem]) -> None:
+        lbs = [LB_LOW, LB_HIGH, LB_MEDIUM]
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        manager.filter_by_lb(MAX_LB_FILTER)
+        assert manager.stale == 1
+        manager.set_lazy(False)
+        assert manager.stale == 0
+        assert manager.size() == TWO
+
+    @staticmethod
+    def test_enqueue_after_filter(manager: BaseNodeManager[MyProblem]) -> None:
+        manager.enqueue_all([_make_node(lb) for lb in (LB_LOW, LB_HIGH)])
+        manager.filter_by_lb(MAX_LB_FILTER)
+        # Nodes enqueued later are kept as by an eager filter
+        late = _make_node(LB_VERY_HIGH)
+        manager.enqueue(late)
+        assert manager.size() == TWO
+        out = [manager.dequeue(), manager.dequeue()]
+        assert late in out
+        assert not manager.not_empty()
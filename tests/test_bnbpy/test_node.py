@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from myfixtures.myproblem import (
     MyProblem,
@@ -42,6 +44,7 @@ class TestNode:
         assert node.parent is None
         assert isinstance(node.solution, Solution)
         assert node.children is None
+        assert node.parent_index == 0
         assert node.lb == parent_problem.lb
 
     @staticmethod
@@ -116,11 +119,17 @@ class TestNode:
         assert children is not None
         assert len(children) == n_children
 
-        # Verify that the children are instances of Node
-        # and have the correct parent
+        # Verify that the children are instances of Node, only linked
+        # to their parent once saved
         for child in children:
             assert type(child) is type(node), f'{type(child)} x {type(node)}'
-            assert child.parent == node
+            assert child.parent is None
+            assert child.parent_index == node.index
+            assert child.level == node.level + 1
+            assert child.index > node.index
+        node.save_children(children)
+        for child in children:
+            assert child.parent is node
 
         # Check that the children have the correct lower bounds
         # based on the branching logic of MyProblem
@@ -141,6 +150,24 @@ class TestNode:
         assert shallow_copy.solution is node.solution
         assert deep_copy.solution is not node.solution
 
+    @staticmethod
+    def test_pickle(parent_problem: MyProblem) -> None:
+        """Pickled nodes keep level and bound but not tree links."""
+        node = Node(problem=parent_problem)
+        node.compute_bound()
+        child = node.branch()[0]
+        node.save_children([child])
+        other = pickle.loads(pickle.dumps(child))
+
+        assert other.level == child.level
+        assert other.lb == child.lb
+        assert other.parent is None
+        assert other.parent_index == 0
+        assert other.children is None
+        assert other.problem is not child.problem
+        assert other.solution.status == child.solution.status
+        assert pickle.loads(pickle.dumps(node)).children is None
+
     # ------------------------------------------------------------------
     # primal_heuristic
     # ------------------------------------------------------------------
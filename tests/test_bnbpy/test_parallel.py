@@ -0,0 +1,336 @@
+import logging
+
+import pytest
+from myfixtures.myproblem import KnapsackProblem, MyProblem, make_knapsack
+
+from bnbpy.cython.levelqueue import BeamSearch
+from bnbpy.cython.search import BestFirstBnB, BranchAndBound
+from bnbpy.cython.status import OptStatus
+from bnbpy.parallel import (
+    RAMP_UP_FACTOR,
+    ParallelBnB,
+    PortfolioBnB,
+    SharedIncumbent,
+    fork_context,
+    solve_many,
+    solve_subtrees,
+)
+
+KNAPSACK_ITEMS = 30
+CHUNK_SIZE = 100
+BEAM_CHUNK_SIZE = 50
+BEAM_SEEDS = [1, 2, 5]
+MAX_ITER = 50
+FEASIBLE_LB = 10
+SAFETY_TIMELIMIT = 60
+N_INSTANCES = 6
+SEARCH_LOGGER = 'bnbpy.cython.search'
+BATCH_ITEMS = 16
+
+
+class _RowsBnB(BranchAndBound[KnapsackProblem]):
+    """Keeps the rows requested to the logger, with the bounds."""
+
+    def __init__(self, problem: KnapsackProblem) -> None:
+        super().__init__(problem)
+        self.rows: list[tuple[object, float, float]] = []
+
+    def log_row(self, message: object) -> None:
+        self.rows.append((message, self.lb, self.ub))
+        super().log_row(message)
+
+
+@pytest.fixture(scope='module')
+def optimum() -> float:
+    res = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+    assert res.solution.status == OptStatus.OPTIMAL
+    return float(res.solution.cost)
+
+
+@pytest.mark.parallel
+class TestParallelBnB:
+    """Tests for the process-based parallel search."""
+
+    @staticmethod
+    @pytest.mark.parametrize('workers', [1, 2, 4])
+    def test_matches_sequential(workers: int, optimum: float) -> None:
+        """Any number of workers proves the sequential optimum."""
+        search = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        pbnb = ParallelBnB(search, workers=workers, chunk_size=CHUNK_SIZE)
+        res = pbnb.solve(timelimit=SAFETY_TIMELIMIT)
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == optimum
+        assert pbnb.ub == optimum
+        assert pbnb.lb == optimum
+        assert pbnb.explored > 0
+        assert res.problem.is_feasible()
+
+    @staticmethod
+    def test_best_first_search(optimum: float) -> None:
+        """Workers keep the node manager of the given search."""
+        search = BestFirstBnB(make_knapsack(KNAPSACK_ITEMS))
+        pbnb = ParallelBnB(search, workers=2, chunk_size=CHUNK_SIZE)
+        res = pbnb.solve(timelimit=SAFETY_TIMELIMIT)
+        assert res.solution.cost == optimum
+
+    @staticmethod
+    def test_repeated_runs(optimum: float) -> None:
+        """Several parallel searches can run in the same process."""
+        for _ in range(2):
+            search = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+            res = ParallelBnB(search, workers=2).solve(
+                timelimit=SAFETY_TIMELIMIT
+            )
+            assert res.solution.cost == optimum
+
+    @staticmethod
+    def test_maxiter_limit(optimum: float) -> None:
+        """Iteration limits apply to each worker."""
+        search = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        pbnb = ParallelBnB(search, workers=2, chunk_size=CHUNK_SIZE)
+        res = pbnb.solve(maxiter=MAX_ITER)
+        assert pbnb.explored <= 2 * MAX_ITER
+        assert pbnb.lb <= optimum
+        assert res.solution.status != OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_trivial_problem() -> None:
+        """A root which is already feasible is solved by the first worker."""
+        search = BranchAndBound(MyProblem(lb_value=FEASIBLE_LB, feasible=True))
+        res = ParallelBnB(search, workers=2).solve()
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == FEASIBLE_LB
+
+    @staticmethod
+    def test_started_search_raises() -> None:
+        """Only searches not yet started can be parallelized."""
+        search = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        search.solve(maxiter=MAX_ITER)
+        with pytest.raises(ValueError, match='not yet started'):
+            ParallelBnB(search, workers=2).solve()
+
+    @staticmethod
+    def test_shared_incumbent() -> None:
+        """Only improving values are stored."""
+        incumbent = SharedIncumbent(fork_context())
+        assert incumbent.value == float('inf')
+        assert incumbent.offer(FEASIBLE_LB)
+        assert not incumbent.offer(FEASIBLE_LB + 1)
+        assert incumbent.value == FEASIBLE_LB
+
+
+@pytest.mark.parallel
+class TestPortfolioBnB:
+    """Tests for the racing of search strategies."""
+
+    @staticmethod
+    def test_default_portfolio(optimum: float) -> None:
+        """The first member to finish proves the optimum."""
+        portfolio = PortfolioBnB.from_strategies(
+            make_knapsack(KNAPSACK_ITEMS), chunk_size=CHUNK_SIZE
+        )
+        res = portfolio.solve(timelimit=SAFETY_TIMELIMIT)
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == optimum
+        assert portfolio.lb == portfolio.ub == optimum
+        assert portfolio.winner is not None
+        assert len(portfolio.explored_by) == len(portfolio.searches)
+        assert portfolio.explored == sum(portfolio.explored_by)
+        assert res.problem.is_feasible()
+
+    @staticmethod
+    def test_configured_searches(optimum: float) -> None:
+        """Members may be any configured searches."""
+        problem = make_knapsack(KNAPSACK_ITEMS)
+        portfolio = PortfolioBnB([
+            BranchAndBound(problem),
+            BestFirstBnB(problem, eval_node='in'),
+        ])
+        res = portfolio.solve(timelimit=SAFETY_TIMELIMIT)
+        assert res.solution.cost == optimum
+
+    @staticmethod
+    @pytest.mark.parametrize('seed', BEAM_SEEDS)
+    def test_beam_member(seed: int) -> None:
+        """Members which dropped nodes do not prove the optimum."""
+        problem = make_knapsack(KNAPSACK_ITEMS, seed=seed)
+        expected = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS, seed=seed)
+        ).solve()
+        portfolio = PortfolioBnB(
+            [
+                BranchAndBound(
+                    problem, eval_node='in', manager=BeamSearch(width=1)
+                ),
+                BestFirstBnB(problem, eval_node='in'),
+            ],
+            chunk_size=BEAM_CHUNK_SIZE,
+        )
+        res = portfolio.solve(timelimit=SAFETY_TIMELIMIT)
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == expected.solution.cost
+
+    @staticmethod
+    def test_maxiter_limit(optimum: float) -> None:
+        """Iteration limits apply to each member."""
+        portfolio = PortfolioBnB.from_strategies(
+            make_knapsack(KNAPSACK_ITEMS),
+            strategies=[('dfs', 'out'), ('bfs', 'out')],
+            chunk_size=CHUNK_SIZE,
+        )
+        res = portfolio.solve(maxiter=MAX_ITER)
+        assert portfolio.winner is None
+        assert all(n <= MAX_ITER for n in portfolio.explored_by)
+        assert portfolio.lb <= optimum
+        assert res.solution.status != OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_trivial_problem() -> None:
+        """A root which is already feasible is solved by every member."""
+        problem = MyProblem(lb_value=FEASIBLE_LB, feasible=True)
+        res = PortfolioBnB.from_strategies(problem).solve()
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == FEASIBLE_LB
+
+    @staticmethod
+    def test_invalid_searches() -> None:
+        """Members must be given and not yet started."""
+        with pytest.raises(ValueError, match='at least one'):
+            PortfolioBnB([])
+        search = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        search.solve(maxiter=MAX_ITER)
+        with pytest.raises(ValueError, match='not yet started'):
+            PortfolioBnB([search]).solve()
+
+
+@pytest.mark.parallel
+@pytest.mark.search
+class TestSolveSubtrees:
+    """Tests for the ramp-up and subtree partitioning mode of solve()."""
+
+    @staticmethod
+    @pytest.mark.parametrize('workers', [2, 4])
+    @pytest.mark.parametrize('bnb_class', [BranchAndBound, BestFirstBnB])
+    def test_matches_sequential(
+        workers: int,
+        bnb_class: type[BranchAndBound[KnapsackProblem]],
+        optimum: float,
+    ) -> None:
+        """Subtrees solved in parallel prove the sequential optimum."""
+        bnb = bnb_class(make_knapsack(KNAPSACK_ITEMS))
+        res = bnb.solve(workers=workers)
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == optimum
+        assert bnb.ub == optimum
+        assert bnb.incumbent is not None
+        assert not bnb.manager.not_empty()
+
+    @staticmethod
+    def test_maxiter_and_resume(optimum: float) -> None:
+        """The iteration limit holds overall and open subtrees resume."""
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        res = bnb.solve(maxiter=MAX_ITER * 10, workers=2)
+        assert bnb.explored == MAX_ITER * 10
+        assert res.solution.status != OptStatus.OPTIMAL
+        assert bnb.manager.not_empty()
+        assert bnb.lb <= optimum
+        res = bnb.solve()
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == optimum
+
+    @staticmethod
+    def test_ramp_up_logging(caplog: pytest.LogCaptureFixture) -> None:
+        """Ramp-up steps log neither limits nor summaries."""
+        caplog.set_level(logging.INFO, logger=SEARCH_LOGGER)
+        bnb = _RowsBnB(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve(workers=2)
+        assert 'Iter Limit' not in [message for message, _, _ in bnb.rows]
+        subtrees = [
+            (lb, ub)
+            for message, lb, ub in bnb.rows
+            if str(message).startswith('Subtrees')
+        ]
+        assert len(subtrees) == 1
+        # Bounded by the open roots, not the incumbent
+        lb, ub = subtrees[0]
+        assert lb < ub
+        summaries = [
+            record
+            for record in caplog.records
+            if 'Finished exploration' in record.getMessage()
+        ]
+        assert len(summaries) == 1
+
+    @staticmethod
+    def test_closed_during_ramp_up() -> None:
+        """No pool is needed if the ramp-up solves the problem."""
+        bnb = BranchAndBound(MyProblem(lb_value=FEASIBLE_LB, feasible=True))
+        res = bnb.solve(workers=2)
+        assert res.solution.status == OptStatus.OPTIMAL
+        assert res.solution.cost == FEASIBLE_LB
+
+    @staticmethod
+    def test_solve_subtrees(optimum: float) -> None:
+        """All subtrees of a breadth-first frontier are solved."""
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve(maxiter=RAMP_UP_FACTOR)
+        roots = [bnb.manager.dequeue() for _ in range(bnb.manager.size())]
+        explored, value, problem, unfinished = solve_subtrees(bnb, roots, 2)
+        assert explored > 0
+        assert value == optimum
+        assert problem is not None
+        assert problem.is_feasible()
+        assert unfinished == []
+
+
+@pytest.mark.parallel
+class TestSolveMany:
+    """Tests for the batch solution of independent problems."""
+
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def costs() -> list[float]:
+        return [
+            float(
+                BranchAndBound(make_knapsack(BATCH_ITEMS, seed)).solve().cost
+            )
+            for seed in range(N_INSTANCES)
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_matches_sequential(workers: int, costs: list[float]) -> None:
+        """Every problem is solved once, as in a sequential loop."""
+        problems = [make_knapsack(BATCH_ITEMS, s) for s in range(N_INSTANCES)]
+        out = dict(
+            solve_many(
+                problems,
+                lambda p: BestFirstBnB(p, eval_node='in'),
+                workers=workers,
+                timelimit=SAFETY_TIMELIMIT,
+            )
+        )
+        assert sorted(out) == list(range(N_INSTANCES))
+        for index, res in out.items():
+            assert res.solution.status == OptStatus.OPTIMAL
+            assert res.cost == costs[index]
+            assert isinstance(res.problem, KnapsackProblem)
+
+    @staticmethod
+    def test_per_instance_limits() -> None:
+        """Limits apply to each search on its own."""
+        problems = [make_knapsack(KNAPSACK_ITEMS, s) for s in range(2)]
+        out = list(solve_many(problems, BranchAndBound, 2, maxiter=MAX_ITER))
+        assert len(out) == len(problems)
+        for _, res in out:
+            assert res.solution.status != OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_early_exit() -> None:
+        """The pool is shut down if results are no longer consumed."""
+        problems = [make_knapsack(BATCH_ITEMS, s) for s in range(N_INSTANCES)]
+        results = solve_many(problems, BranchAndBound, workers=2)
+        index, res = next(results)
+        results.close()
+        assert 0 <= index < N_INSTANCES
+        assert res.solution.status == OptStatus.OPTIMAL
@@ -0,0 +1,155 @@
+import itertools
+from pathlib import Path
+from typing import Hashable, Optional
+
+import pytest
+from myfixtures.myproblem import MyProblem, make_knapsack
+
+from bnbpy.cython.node import Node
+from bnbpy.cython.pool import SolutionPool
+from bnbpy.cython.search import BestFirstBnB, BranchAndBound
+from bnbpy.cython.status import OptStatus
+
+# Test constants
+CAPACITY = 3
+ITEMS = 10
+K_BEST = 5
+CUTOFF_RANK = 2
+
+
+class KeyedProblem(MyProblem):
+    def __init__(self, lb_value: float, key: Optional[Hashable] = None):
+        super().__init__(lb_value=lb_value)
+        self.key = key
+
+    def solution_key(self) -> Optional[Hashable]:
+        return self.key
+
+
+def _node(cost: float, key: Optional[Hashable] = None) -> Node[KeyedProblem]:
+    node = Node(KeyedProblem(cost, key))
+    node.lb = cost
+    return node
+
+
+def _best_costs(n: int, k: int) -> list[float]:
+    problem = make_knapsack(n)
+    costs = []
+    for take in itertools.product((0, 1), repeat=n):
+        weight = sum(w * t for w, t in zip(problem.weights, take))
+        if weight <= problem.capacity:
+            costs.append(-sum(v * t for v, t in zip(problem.values, take)))
+    return sorted(costs)[:k]
+
+
+@pytest.mark.core
+@pytest.mark.pool
+class TestSolutionPool:
+    @staticmethod
+    def test_invalid_capacity() -> None:
+        with pytest.raises(ValueError, match='capacity'):
+            SolutionPool(0)
+
+    @staticmethod
+    def test_keeps_best() -> None:
+        pool = SolutionPool(CAPACITY)
+        assert pool.best() is None
+        for cost in [5.0, 3.0, 4.0, 1.0]:
+            assert pool.add(_node(cost))
+        assert len(pool) == CAPACITY
+        assert pool.costs == [1.0, 3.0, 4.0]
+        assert not pool.add(_node(4.0))
+        assert pool.add(_node(2.0))
+        assert pool.costs == [1.0, 2.0, 3.0]
+        assert pool.best().lb == 1.0
+        pool.filter(2.0)
+        assert pool.costs == [1.0]
+        pool.clear()
+        assert len(pool) == 0
+
+    @staticmethod
+    def test_ties_keep_first() -> None:
+        pool = SolutionPool(2)
+        first, second, third = _node(1.0), _node(1.0), _node(1.0)
+        for node in (first, second, third):
+            pool.add(node)
+        assert pool.nodes() == [first, second]
+        assert pool.best() is first
+
+    @staticmethod
+    def test_duplicates() -> None:
+        pool = SolutionPool(CAPACITY)
+        assert pool.add(_node(2.0, key='a'))
+        assert not pool.add(_node(2.0, key='a'))
+        assert not pool.add(_node(3.0, key='a'))
+        better = _node(1.0, key='a')
+        assert pool.add(better)
+        assert pool.nodes() == [better]
+        assert pool.add(_node(2.0, key='b'))
+        assert pool.add(_node(4.0, key='c'))
+        # The key of an evicted solution can be added again
+        assert pool.add(_node(3.0, key='d'))
+        assert pool.add(_node(2.5, key='c'))
+        assert pool.costs == [1.0, 2.0, 2.5]
+
+
+@pytest.mark.core
+@pytest.mark.pool
+class TestSearchPool:
+    @staticmethod
+    @pytest.mark.parametrize('bnb_cls', [BranchAndBound, BestFirstBnB])
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_k_best(bnb_cls: type[BranchAndBound], eval_node: str) -> None:
+        bnb = bnb_cls(make_knapsack(ITEMS), eval_node=eval_node)
+        bnb.pool = SolutionPool(K_BEST)
+        sol = bnb.solve()
+        expected = _best_costs(ITEMS, K_BEST)
+        assert bnb.pool.costs == expected
+        assert sol.cost == expected[0]
+        assert bnb.incumbent is bnb.pool.best()
+        assert bnb.ub == expected[-1]
+        assert sol.status == OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_fewer_solutions_than_capacity() -> None:
+        bnb = BranchAndBound(KeyedProblem(1.0))
+        bnb.pool = SolutionPool(CAPACITY)
+        sol = bnb.solve()
+        assert len(bnb.pool) == 1
+        assert sol.status == OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_cutoff() -> None:
+        expected = _best_costs(ITEMS, K_BEST)
+        bnb = BranchAndBound(make_knapsack(ITEMS))
+        bnb.pool = SolutionPool(K_BEST)
+        bnb.solve()
+        bnb.set_cutoff(expected[CUTOFF_RANK])
+        assert bnb.pool.costs == expected[:CUTOFF_RANK]
+        assert bnb.ub == expected[CUTOFF_RANK]
+
+    @staticmethod
+    def test_reset_clears_pool() -> None:
+        bnb = BranchAndBound(make_knapsack(ITEMS))
+        bnb.pool = SolutionPool(K_BEST)
+        bnb.solve()
+        bnb.reset()
+        assert len(bnb.pool) == 0
+        bnb.solve()
+        assert bnb.pool.costs == _best_costs(ITEMS, K_BEST)
+
+    @staticmethod
+    @pytest.mark.checkpoint
+    def test_checkpoint(tmp_path: Path) -> None:
+        path = tmp_path / 'ck'
+        bnb = BranchAndBound(make_knapsack(ITEMS))
+        bnb.pool = SolutionPool(K_BEST)
+        bnb.solve(maxiter=ITEMS * K_BEST)
+        bnb.checkpoint(path)
+        resumed = BranchAndBound(make_knapsack(ITEMS))
+        resumed.pool = SolutionPool(K_BEST)
+        resumed.restore(path)
+        assert resumed.pool.costs == bnb.pool.costs
+        assert resumed.ub == bnb.ub
+        resumed.solve()
+        assert resumed.pool.costs == _best_costs(ITEMS, K_BEST)
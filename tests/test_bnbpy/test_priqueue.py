@@ -1,12 +1,21 @@
+import pickle
+import random
+
 import pytest
-from myfixtures.myproblem import MyProblem
+from myfixtures.myproblem import KnapsackProblem, MyProblem, make_knapsack
 
 from bnbpy.cython.node import Node
 from bnbpy.cython.primanager import (
+    AlternatingSearch,
     BestFirstSearch,
     DepthFirstSearch,
+    LimitedDiscrepancySearch,
+    MemoryAwareSearch,
     PriorityManagerTemplate,
 )
+from bnbpy.cython.search import BranchAndBound
+from bnbpy.cython.stats import resident_memory
+from bnbpy.cython.status import OptStatus
 
 # Test constants
 LB_LOW = 5
@@ -18,6 +27,16 @@ LEVEL_ROOT = 0
 LEVEL_CHILD = 1
 LEVEL_GRANDCHILD = 2
 LEVEL_DEEP = 3
+N_RANDOM_NODES = 200
+SEED = 7
+WIDE_PREFIX = 4
+PERIOD = 3
+P_ENQUEUE = 0.55
+P_DEQUEUE = 0.98
+N_OPERATIONS = 2000
+KNAPSACK_ITEMS = 12
+N_CHILDREN = 3
+BUDGET_NODES = 10
 
 
 @pytest.mark.core
@@ -505,3 +524,347 @@ class TestBoundNodesTracking:
         result = queue.get_lower_bound()
         assert result is high
         assert result.lb == LB_HIGH
+
+
+class ReverseBestFirst(BestFirstSearch[MyProblem]):
+    """Python override of a native priority: largest lb first."""
+
+    def make_priority(  # noqa: PLR6301
+        self, node: Node[MyProblem]
+    ) -> list[float]:
+        return [-node.lb]
+
+
+class WidePriority(PriorityManagerTemplate[MyProblem]):
+    """Priority longer than the inline key of the heap."""
+
+    def make_priority(  # noqa: PLR6301
+        self, node: Node[MyProblem]
+    ) -> list[float]:
+        return [0.0] * WIDE_PREFIX + [node.lb % 2, node.lb][: node.level]
+
+
+@pytest.mark.core
+@pytest.mark.priqueue
+class TestInlinePriority:
+    """Inline keys must order nodes exactly as ``make_priority`` does."""
+
+    @staticmethod
+    @pytest.mark.parametrize('manager', [BestFirstSearch, DepthFirstSearch])
+    def test_matches_make_priority(
+        manager: type[PriorityManagerTemplate[MyProblem]],
+    ) -> None:
+        rng = random.Random(SEED)
+        queue = manager()
+        keys = {}
+        for _ in range(N_RANDOM_NODES):
+            node = Node(
+                MyProblem(
+                    lb_value=rng.randint(0, LB_VERY_HIGH), feasible=False
+                )
+            )
+            node.compute_bound()
+            node.level = rng.randint(LEVEL_ROOT, LEVEL_DEEP)
+            keys[id(node)] = queue.make_priority(node)
+            queue.enqueue(node)
+        out = []
+        while queue.not_empty():
+            out.append(keys[id(queue.dequeue())])
+        assert out == sorted(keys.values())
+
+    @staticmethod
+    def test_python_override_is_used() -> None:
+        queue = ReverseBestFirst()
+        for lb in (LB_LOW, LB_HIGH, LB_MEDIUM):
+            node = Node(MyProblem(lb_value=lb, feasible=False))
+            node.compute_bound()
+            queue.enqueue(node)
+        assert [queue.dequeue().lb for _ in range(3)] == [
+            LB_HIGH,
+            LB_MEDIUM,
+            LB_LOW,
+        ]
+
+    @staticmethod
+    def test_wide_priority() -> None:
+        """Keys wider than four values, and keys that are a prefix of
+        others, keep the lexicographic order of lists."""
+        queue = WidePriority()
+        nodes = []
+        for lb, level in [
+            (LB_LOW, 2),
+            (LB_HIGH, 1),
+            (LB_MEDIUM, 2),
+            (LB_VERY_HIGH, 0),
+            (LB_VERY_HIGH, 2),
+        ]:
+            node = Node(MyProblem(lb_value=lb, feasible=False))
+            node.compute_bound()
+            node.level = level
+            nodes.append(node)
+            queue.enqueue(node)
+        expected = sorted(nodes, key=queue.make_priority)
+        assert [queue.dequeue() for _ in nodes] == expected
+
+
+def _random_node(rng: random.Random) -> Node[MyProblem]:
+    node = Node(
+        MyProblem(lb_value=rng.randint(0, LB_VERY_HIGH), feasible=False)
+    )
+    node.compute_bound()
+    node.level = rng.randint(LEVEL_ROOT, LEVEL_DEEP)
+    return node
+
+
+@pytest.mark.core
+@pytest.mark.priqueue
+class TestAlternatingSearch:
+    @staticmethod
+    def test_invalid_period() -> None:
+        with pytest.raises(ValueError, match='period'):
+            AlternatingSearch(period=0)
+
+    @staticmethod
+    def test_period_one_is_best_bound() -> None:
+        rng = random.Random(SEED)
+        queue: AlternatingSearch[MyProblem] = AlternatingSearch(period=1)
+        queue.enqueue_all([_random_node(rng) for _ in range(N_RANDOM_NODES)])
+        out = [queue.dequeue().lb for _ in range(N_RANDOM_NODES)]
+        assert out == sorted(out)
+
+    @staticmethod
+    def test_matches_reference() -> None:
+        """Random enqueues, dequeues and filters against a list model."""
+        rng = random.Random(SEED)
+        queue: AlternatingSearch[MyProblem] = AlternatingSearch(period=PERIOD)
+        ref: list[Node[MyProblem]] = []
+        n_dequeued = 0
+        for _ in range(N_OPERATIONS):
+            op = rng.random()
+            if op < P_ENQUEUE or not ref:
+                node = _random_node(rng)
+                queue.enqueue(node)
+                ref.append(node)
+            elif op < P_DEQUEUE:
+                n_dequeued += 1
+                node = queue.dequeue()
+                # Ties have equal keys, so only keys are compared
+                if n_dequeued % PERIOD == 0:
+                    key = min((n.lb, queue.make_priority(n)) for n in ref)
+                    assert (node.lb, queue.make_priority(node)) == key
+                else:
+                    key = min(queue.make_priority(n) for n in ref)
+                    assert queue.make_priority(node) == key
+                ref.remove(node)
+            else:
+                max_lb = rng.randint(LB_LOW, LB_VERY_HIGH)
+                queue.filter_by_lb(max_lb)
+                ref = [n for n in ref if n.lb < max_lb]
+            assert queue.size() == len(ref)
+
+    @staticmethod
+    def test_search() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        ref_sol = ref.solve()
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS), manager=AlternatingSearch(PERIOD)
+        )
+        sol = bnb.solve()
+        assert sol.cost == ref_sol.cost
+
+
+def _child(lb: float, level: int, rank: int = 0) -> Node[MyProblem]:
+    node = Node(MyProblem(lb_value=lb, feasible=False))
+    node.compute_bound()
+    node.level = level
+    node.rank = rank
+    return node
+
+
+@pytest.mark.core
+@pytest.mark.priqueue
+class TestLimitedDiscrepancySearch:
+    @staticmethod
+    def test_invalid_limit() -> None:
+        with pytest.raises(ValueError, match='max_discrepancy'):
+            LimitedDiscrepancySearch(max_discrepancy=-1)
+
+    @staticmethod
+    def test_discrepancy_order() -> None:
+        """Fewest deviations from the branching order first, then deepest."""
+        queue: LimitedDiscrepancySearch[MyProblem] = LimitedDiscrepancySearch()
+        root = _child(LB_LOW, LEVEL_ROOT)
+        queue.enqueue(root)
+        assert queue.dequeue() is root
+        # Children in reverse order of lb, so the order is not by bound
+        children = [
+            _child(LB_VERY_HIGH - i, LEVEL_CHILD, i) for i in range(N_CHILDREN)
+        ]
+        queue.enqueue_all(children)
+        assert queue.dequeue() is children[0]
+        grandchildren = [
+            _child(LB_HIGH, LEVEL_GRANDCHILD, i) for i in range(N_CHILDREN - 1)
+        ]
+        queue.enqueue_all(grandchildren)
+        assert queue.discrepancy == 1
+        out = [queue.dequeue() for _ in range(2 * N_CHILDREN - 2)]
+        assert out == [grandchildren[0], grandchildren[1], *children[1:]]
+        assert not queue.not_empty()
+
+    @staticmethod
+    def test_limit_drops_nodes() -> None:
+        queue: LimitedDiscrepancySearch[MyProblem] = LimitedDiscrepancySearch(
+            max_discrepancy=1
+        )
+        queue.enqueue(_child(LB_LOW, LEVEL_ROOT))
+        queue.dequeue()
+        children = [
+            _child(LB_MEDIUM + i, LEVEL_CHILD, i) for i in range(N_CHILDREN)
+        ]
+        queue.enqueue_all(children)
+        assert queue.dequeue() is children[0]
+        assert queue.dequeue() is children[1]
+        assert queue.dequeue() is None
+        assert queue.size() == 0
+        assert queue.dropped == 1
+        assert queue.dropped_lb == children[2].lb
+        queue.clear()
+        assert queue.dropped == 0
+
+    @staticmethod
+    def test_pruned_siblings_keep_rank() -> None:
+        """Children not enqueued do not shift the discrepancy of others."""
+        queue: LimitedDiscrepancySearch[MyProblem] = LimitedDiscrepancySearch(
+            max_discrepancy=1
+        )
+        queue.enqueue(_child(LB_LOW, LEVEL_ROOT))
+        queue.dequeue()
+        children = [
+            _child(LB_MEDIUM, LEVEL_CHILD, i) for i in range(N_CHILDREN)
+        ]
+        # As if the first child had been pruned by bound
+        queue.enqueue(children[1])
+        assert queue.discrepancy == 1
+        queue.enqueue(children[2])
+        assert queue.discrepancy == 2  # noqa: PLR2004
+        assert queue.dequeue() is children[1]
+        assert queue.dequeue() is None
+        assert queue.dropped == 1
+
+    @staticmethod
+    def test_branch_rank() -> None:
+        node = Node(make_knapsack(KNAPSACK_ITEMS))
+        node.compute_bound()
+        assert node.rank == 0
+        children = node.branch()
+        assert [child.rank for child in children] == list(range(len(children)))
+        grandchildren = children[-1].branch()
+        assert [child.rank for child in grandchildren] == list(
+            range(len(grandchildren))
+        )
+        assert (
+            pickle.loads(pickle.dumps(children[-1])).rank == len(children) - 1
+        )
+
+    @staticmethod
+    def test_search() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS),
+            eval_node='in',
+            manager=BranchAndBound.build_manager('lds'),
+        )
+        sol = bnb.solve()
+        assert sol.cost == ref.cost
+        assert sol.status == OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_limited_search_is_not_exhaustive() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS),
+            eval_node='in',
+            manager=LimitedDiscrepancySearch(max_discrepancy=0),
+        )
+        sol = bnb.solve()
+        assert sol.cost >= ref.cost
+        assert sol.lb <= ref.cost
+        assert bnb.manager.dropped > 0
+        assert sol.status == OptStatus.FEASIBLE
+
+
+def _node_bytes() -> int:
+    queue: MemoryAwareSearch[MyProblem] = MemoryAwareSearch()
+    queue.enqueue(_child(LB_LOW, LEVEL_ROOT))
+    return queue.nbytes
+
+
+@pytest.mark.core
+@pytest.mark.priqueue
+class TestMemoryAwareSearch:
+    @staticmethod
+    def test_invalid_arguments() -> None:
+        with pytest.raises(ValueError, match='max_bytes'):
+            MemoryAwareSearch(max_bytes=0)
+        with pytest.raises(ValueError, match='low_ratio'):
+            MemoryAwareSearch(low_ratio=1.0)
+        with pytest.raises(ValueError, match='sample_interval'):
+            MemoryAwareSearch(sample_interval=-1)
+
+    @staticmethod
+    def test_resident_memory() -> None:
+        assert resident_memory() != 0
+
+    @staticmethod
+    def test_best_first_under_budget() -> None:
+        rng = random.Random(SEED)
+        queue: MemoryAwareSearch[MyProblem] = MemoryAwareSearch()
+        queue.enqueue_all([_random_node(rng) for _ in range(N_RANDOM_NODES)])
+        assert queue.nbytes > 0
+        out = [queue.dequeue().lb for _ in range(N_RANDOM_NODES)]
+        assert out == sorted(out)
+        assert not queue.depth_first
+        assert queue.nbytes == 0
+
+    @staticmethod
+    def test_switches_over_budget() -> None:
+        """Depth-first above the budget, best-first again below half."""
+        queue: MemoryAwareSearch[MyProblem] = MemoryAwareSearch(
+            max_bytes=BUDGET_NODES * _node_bytes(), sample_interval=0
+        )
+        rng = random.Random(SEED)
+        queue.enqueue_all([_random_node(rng) for _ in range(2 * BUDGET_NODES)])
+        assert queue.depth_first
+        assert queue.switches == 1
+        levels = []
+        while queue.depth_first:
+            levels.append(queue.dequeue().level)
+        assert levels == sorted(levels, reverse=True)
+        assert queue.size() == BUDGET_NODES // 2
+        assert queue.switches == 2  # noqa: PLR2004
+        out = [queue.dequeue().lb for _ in range(queue.size())]
+        assert out == sorted(out)
+
+    @staticmethod
+    def test_filter_releases_memory() -> None:
+        queue: MemoryAwareSearch[MyProblem] = MemoryAwareSearch()
+        queue.enqueue(_child(LB_LOW, LEVEL_ROOT))
+        size = queue.nbytes
+        queue.enqueue(_child(LB_HIGH, LEVEL_ROOT))
+        queue.filter_by_lb(MAX_LB_FILTER)
+        assert queue.size() == 1
+        assert queue.nbytes == size
+        queue.clear()
+        assert queue.nbytes == 0
+
+    @staticmethod
+    def test_search() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        manager: MemoryAwareSearch[KnapsackProblem] = MemoryAwareSearch(
+            max_bytes=BUDGET_NODES * _node_bytes()
+        )
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS), manager=manager)
+        sol = bnb.solve()
+        assert sol.cost == ref.cost
+        assert sol.status == OptStatus.OPTIMAL
+        assert manager.switches > 0
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from myfixtures.myproblem import (
     STRONGER_BOUND_DELTA,
@@ -11,6 +13,7 @@ from bnbpy.cython.solution import Solution
 from bnbpy.cython.status import OptStatus
 
 _SMALL_NUM = -1e6
+_LARGE_ITEMS = 1000
 
 
 @pytest.mark.core
@@ -93,6 +96,20 @@ class TestProblem:
         assert prob_copy.solution is not prob.solution
         assert prob_copy.solution.status == prob.solution.status
 
+    @staticmethod
+    def test_pickle() -> None:
+        """Test that problem attributes and solution are pickled."""
+        ref_value = 15
+        prob = MyProblem(lb_value=ref_value, feasible=False)
+        prob.compute_bound()
+        other = pickle.loads(pickle.dumps(prob))
+
+        assert type(other) is MyProblem
+        assert other.lb == ref_value
+        assert other.solution is not prob.solution
+        assert other.solution.status == prob.solution.status
+        assert not other.check_feasible()
+
     @staticmethod
     @pytest.mark.parametrize('deep', [True, False])
     def test_child_copy(deep: bool) -> None:
@@ -192,3 +209,12 @@ class TestProblem:
         prob.compute_bound()
         prob.upgrade_bound(ref_value - 3.0)
         assert prob.lb == ref_value
+
+    @staticmethod
+    def test_memory_size() -> None:
+        """The default size grows with the attributes of the problem."""
+        prob = MyProblem(lb_value=1)
+        size = prob.memory_size()
+        assert size > 0
+        prob.items = list(range(_LARGE_ITEMS))
+        assert prob.memory_size() > size + _LARGE_ITEMS
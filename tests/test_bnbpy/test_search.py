@@ -1,11 +1,17 @@
+import asyncio
+import logging
+import pickle
+import time
 from typing import Literal
 
 import pytest
 from myfixtures.myproblem import (
+    KnapsackProblem,
     MyProblem,
     PrimalHeuristicProblem,
     StrongerBoundProblem,
     UnboundedProblem,
+    make_knapsack,
 )
 
 from bnbpy.cython.manager import BaseNodeManager, FifoManager, LifoManager
@@ -19,7 +25,9 @@ from bnbpy.cython.search import (
     DepthFirstBnB,
     FifoBnB,
     LifoBnB,
+    SearchProgress,
 )
+from bnbpy.cython.stats import PHASES, SearchStats
 from bnbpy.cython.status import OptStatus
 
 # Test constants
@@ -36,6 +44,25 @@ THREE = 3
 TWO = 2
 ONE = 1
 SAFETY_MAXITER = 1000
+KNAPSACK_ITEMS = 20
+KNAPSACK_ITER = 50
+LAZY_KNAPSACK_ITEMS = 12
+TIMELIMIT = 0.2
+SLOW_NODE = 0.005
+TIME_SLACK = 0.05
+LOG_INTERVAL = 3600.0
+SEARCH_LOGGER = 'bnbpy.cython.search'
+STEP_NODES = 100
+STEP_TIME = 0.02
+N_SEARCHES = 3
+
+
+class _SlowProblem(UnboundedProblem):
+    """Problem whose bounds take milliseconds."""
+
+    def calc_bound(self) -> float:
+        time.sleep(SLOW_NODE)
+        return super().calc_bound()
 
 
 class _CallbackBnB(BranchAndBound[MyProblem]):
@@ -69,6 +96,46 @@ class _PrePostEvalBnB(BranchAndBound[UnboundedProblem]):
         self.post_eval_count += 1
 
 
+class _BatchKnapsack(KnapsackProblem):
+    """Knapsack computing sibling bounds in a single call."""
+
+    batch_calls = 0
+
+    def calc_bound_batch(self, children: list[KnapsackProblem]) -> list[float]:
+        type(self).batch_calls += 1
+        return [child.calc_bound() for child in children]
+
+
+class _EvalOrderBnB(BranchAndBound[MyProblem]):
+    """Keeps the evaluation events of each node."""
+
+    def __init__(self, problem: MyProblem) -> None:
+        super().__init__(problem, eval_node='in')
+        self.events: list[tuple[str, int]] = []
+
+    def pre_eval_callback(self, node: Node[MyProblem]) -> None:
+        self.events.append(('pre', node.index))
+
+    def _node_eval(self, node: Node[MyProblem]) -> None:
+        self.events.append(('eval', node.index))
+        super()._node_eval(node)
+
+    def post_eval_callback(self, node: Node[MyProblem]) -> None:
+        self.events.append(('post', node.index))
+
+    def enqueue_callback(self, node: Node[MyProblem]) -> None:
+        self.events.append(('enqueue', node.index))
+
+
+class _WrongBatchProblem(MyProblem):
+    """Returns fewer bounds than children."""
+
+    def calc_bound_batch(  # noqa: PLR6301
+        self, children: list[MyProblem]
+    ) -> list[float]:
+        return [1.0] * (len(children) - 1)
+
+
 class _WarmstartProblem(MyProblem):
     """Test subclass for warmstart testing."""
 
@@ -78,6 +145,19 @@ class _WarmstartProblem(MyProblem):
         return _WarmstartProblem(lb_value=WARMSTART_LB, feasible=True)
 
 
+class _DeadEndProblem(MyProblem):
+    """Infeasible problem whose children cannot be branched."""
+
+    def __init__(self, level: int = 0) -> None:
+        super().__init__(lb_value=level, feasible=False)
+        self.level = level
+
+    def branch(self) -> list[MyProblem]:
+        if self.level > 0:
+            return []
+        return [_DeadEndProblem(self.level + 1) for _ in range(TWO)]
+
+
 @pytest.mark.core
 @pytest.mark.search
 class TestBranchAndBoundBasic:
@@ -210,6 +290,17 @@ class TestBranchAndBoundSolve:
         assert result.solution.status == OptStatus.OPTIMAL
         assert result.solution.cost == FEASIBLE_LB
 
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_solve_exhausted_without_solution(eval_node: str) -> None:
+        """A tree exhausted without solutions has no bound node left."""
+        bnb = BranchAndBound(_DeadEndProblem(), eval_node=eval_node)
+        result = bnb.solve(maxiter=SAFETY_MAXITER)
+        assert bnb.explored == THREE
+        assert bnb.incumbent is None
+        assert bnb.bound_node is None
+        assert result.solution.status == OptStatus.RELAXATION
+
     @staticmethod
     def test_solve_with_maxiter() -> None:
         """Test solving with iteration limit."""
@@ -219,6 +310,25 @@ class TestBranchAndBoundSolve:
         # Should stop due to iteration limit
         assert bnb.explored == MAX_ITER
 
+    @staticmethod
+    @pytest.mark.parametrize('slow', [False, True])
+    def test_solve_with_timelimit(slow: bool) -> None:
+        """The search stops shortly after the time limit, whether nodes
+        take microseconds or milliseconds."""
+        problem = _SlowProblem() if slow else UnboundedProblem()
+        bnb = BranchAndBound(problem)
+        start = time.perf_counter()
+        bnb.solve(timelimit=TIMELIMIT)
+        elapsed = time.perf_counter() - start
+        assert bnb.explored > 0
+        assert TIMELIMIT <= elapsed < TIMELIMIT + bnb.time_tol + TIME_SLACK
+
+    @staticmethod
+    def test_solve_zero_timelimit() -> None:
+        bnb = BranchAndBound(UnboundedProblem())
+        bnb.solve(timelimit=0)
+        assert bnb.explored == 0
+
     @staticmethod
     def test_solve_resume() -> None:
         """Test that a second solve() resumes from where the first stopped."""
@@ -275,8 +385,8 @@ class TestBranchAndBoundSolve:
         assert child1 is not None
         assert child2 is not None
         assert node.children is None
-        assert child1.parent is node
-        assert child2.parent is node
+        assert child1.parent is None
+        assert child2.parent is None
 
     @staticmethod
     def test_optimality_check() -> None:
@@ -299,6 +409,157 @@ class TestBranchAndBoundSolve:
         assert bnb.gap == (WARMSTART_LB - SIMPLE_LB) / WARMSTART_LB
 
 
+@pytest.mark.core
+@pytest.mark.search
+class TestBatchBound:
+    """Siblings are evaluated via calc_bound_batch when eval_node='in'."""
+
+    @staticmethod
+    def test_default_batch() -> None:
+        problem = MyProblem(lb_value=SIMPLE_LB)
+        children = problem.branch()
+        assert problem.calc_bound_batch(children) == [
+            SIMPLE_LB + 1,
+            SIMPLE_LB + 2,
+        ]
+        problem.compute_bound_batch(children)
+        assert [child.lb for child in children] == [
+            SIMPLE_LB + 1,
+            SIMPLE_LB + 2,
+        ]
+
+    @staticmethod
+    def test_node_batch() -> None:
+        node = Node(MyProblem(lb_value=SIMPLE_LB))
+        node.compute_bound()
+        children = node.branch()
+        node.compute_bound_batch(children)
+        assert [child.lb for child in children] == [
+            SIMPLE_LB + 1,
+            SIMPLE_LB + 2,
+        ]
+
+    @staticmethod
+    def test_wrong_size() -> None:
+        problem = _WrongBatchProblem(lb_value=SIMPLE_LB)
+        with pytest.raises(ValueError, match='bounds'):
+            problem.compute_bound_batch(problem.branch())
+
+    @staticmethod
+    def test_default_batch_per_child() -> None:
+        """Problems without a batch bound evaluate children in turn."""
+        bnb = _EvalOrderBnB(MyProblem(lb_value=SIMPLE_LB, feasible=False))
+        bnb.solve(maxiter=TWO)
+        children = [
+            index
+            for event, index in bnb.events
+            if event == 'eval' and index != bnb.root.index
+        ]
+        assert len(children) == TWO
+        # Each child is enqueued before the next is evaluated
+        assert [(e, i) for e, i in bnb.events if i in children] == [
+            (event, index)
+            for index in children
+            for event in ('eval', 'pre', 'post', 'enqueue')
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'both', 'out'])
+    def test_search(eval_node: Literal['in', 'out', 'both']) -> None:
+        ref = make_knapsack(KNAPSACK_ITEMS)
+        problem = _BatchKnapsack(ref.values, ref.weights, ref.capacity)
+        _BatchKnapsack.batch_calls = 0
+        bnb = BranchAndBound(problem, eval_node=eval_node)
+        sol = bnb.solve()
+        ref_bnb = BranchAndBound(ref, eval_node=eval_node)
+        ref_sol = ref_bnb.solve()
+        assert sol.cost == ref_sol.cost
+        assert bnb.explored == ref_bnb.explored
+        if eval_node == 'out':
+            assert _BatchKnapsack.batch_calls == 0
+        else:
+            assert _BatchKnapsack.batch_calls > 0
+
+
+@pytest.mark.core
+@pytest.mark.search
+class TestSearchStats:
+    """Statistics are only collected by profiled searches."""
+
+    @staticmethod
+    def test_disabled() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        sol = bnb.solve()
+        assert sol.stats is None
+        assert bnb.stats is None
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'both', 'out'])
+    def test_counters(eval_node: Literal['in', 'out', 'both']) -> None:
+        bnb = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS), eval_node=eval_node
+        )
+        sol = bnb.solve(profile=True)
+        stats = sol.stats
+        assert isinstance(stats, SearchStats)
+        assert stats is bnb.stats
+        assert stats.explored == bnb.explored
+        assert sum(stats.explored_by_level) == bnb.explored
+        assert sum(stats.created_by_level) == stats.nodes_created
+        assert (
+            sum(stats.pruned_by_level)
+            == stats.pruned_enqueue + stats.pruned_dequeue
+        )
+        # Every node created is either explored or pruned
+        assert stats.nodes_created == stats.explored + stats.pruned
+        assert stats.calls['feasibility'] == bnb.explored
+        assert stats.calls['dequeue'] <= stats.calls['enqueue']
+        assert stats.calls['incumbent'] > 0
+        assert stats.max_frontier > 0
+        assert set(stats.times) == set(PHASES)
+        assert 0 < sum(stats.times.values()) <= stats.total_time
+        if eval_node == 'out':
+            assert stats.pruned_enqueue == 0
+
+    @staticmethod
+    def test_same_search() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        ref_sol = ref.solve()
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        sol = bnb.solve(profile=True)
+        assert sol.cost == ref_sol.cost
+        assert bnb.explored == ref.explored
+
+    @staticmethod
+    def test_resume_and_reset() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve(maxiter=KNAPSACK_ITER, profile=True)
+        stats = bnb.stats
+        assert stats is not None
+        assert stats.explored == KNAPSACK_ITER
+        sol = bnb.solve(profile=True)
+        assert sol.stats is stats
+        assert stats.explored == bnb.explored
+        bnb.reset()
+        assert bnb.stats is None
+
+    @staticmethod
+    def test_callbacks() -> None:
+        bnb = _CallbackBnB(MyProblem(lb_value=SIMPLE_LB))
+        sol = bnb.solve(maxiter=SAFETY_MAXITER, profile=True)
+        assert sol.stats is not None
+        assert sol.stats.calls['callback'] > 0
+
+    @staticmethod
+    def test_pickle() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        stats = bnb.solve(profile=True).stats
+        assert stats is not None
+        other = pickle.loads(pickle.dumps(stats))
+        assert other.as_dict() == stats.as_dict()
+        assert 'bound' in other.summary()
+
+
 @pytest.mark.core
 @pytest.mark.search
 class TestBranchAndBoundCallbacks:
@@ -459,6 +720,158 @@ class TestBranchAndBoundPrimalAndBound:
         assert bnb_upgrade.explored <= bnb_base.explored
 
 
+class _RowCounterBnB(BranchAndBound[KnapsackProblem]):
+    """Counts the rows requested to the logger."""
+
+    def __init__(self, problem: KnapsackProblem) -> None:
+        super().__init__(problem)
+        self.rows: list[object] = []
+
+    def log_row(self, message: object) -> None:
+        self.rows.append(message)
+        super().log_row(message)
+
+
+@pytest.mark.core
+@pytest.mark.search
+class TestProgressLogging:
+    """Tests for the level check and rate limit of progress rows."""
+
+    @staticmethod
+    def test_every_update_logged(caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.INFO, logger=SEARCH_LOGGER)
+        bnb = _RowCounterBnB(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve()
+        assert bnb.rows.count('New incumbent') > 1
+        assert bnb.rows[-1] == 'Optimal'
+        assert 'Finished exploration' in caplog.records[-1].getMessage()
+
+    @staticmethod
+    def test_rate_limited(caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.INFO, logger=SEARCH_LOGGER)
+        bnb = _RowCounterBnB(make_knapsack(KNAPSACK_ITEMS))
+        bnb.log_interval = LOG_INTERVAL
+        bnb.solve()
+        # Only the first progress row, then the termination row
+        assert bnb.rows == ['LB update', 'Optimal']
+        assert 'progress rows skipped' in caplog.records[-1].getMessage()
+
+    @staticmethod
+    def test_disabled_logger(caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.WARNING, logger=SEARCH_LOGGER)
+        bnb = _RowCounterBnB(make_knapsack(KNAPSACK_ITEMS))
+        sol = bnb.solve()
+        # Progress rows are not even requested, termination rows are
+        # requested but not formatted
+        assert bnb.rows == ['Optimal']
+        assert sol.solution.status == OptStatus.OPTIMAL
+        assert not caplog.records
+
+
+@pytest.mark.core
+@pytest.mark.search
+class TestIncrementalSolve:
+    """Tests for the stepping and asyncio solve API."""
+
+    @staticmethod
+    def test_solve_iter_matches_solve() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        ref_sol = ref.solve()
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        steps = list(bnb.solve_iter(step_nodes=STEP_NODES))
+        assert all(isinstance(p, SearchProgress) for p in steps)
+        assert [p.done for p in steps] == [False] * (len(steps) - 1) + [True]
+        explored = [0] + [p.explored for p in steps]
+        assert all(
+            0 <= b - a <= STEP_NODES for a, b in zip(explored, explored[1:])
+        )
+        last = steps[-1]
+        assert last.explored == ref.explored
+        assert last.ub == ref_sol.cost
+        assert last.results.solution.status == OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_solve_iter_maxiter() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        steps = list(
+            bnb.solve_iter(step_nodes=STEP_NODES // 3, maxiter=MAX_ITER)
+        )
+        assert steps[-1].done
+        assert steps[-1].explored == MAX_ITER
+        assert steps[-1].results.solution.status != OptStatus.OPTIMAL
+
+    @staticmethod
+    def test_solve_iter_resume() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        ref.solve()
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        steps = bnb.solve_iter(step_nodes=STEP_NODES)
+        progress = next(steps)
+        steps.close()
+        assert progress.explored == STEP_NODES
+        # Abandoned steps leave a search that can be resumed
+        sol = bnb.solve()
+        assert sol.solution.status == OptStatus.OPTIMAL
+        assert bnb.explored == ref.explored
+
+    @staticmethod
+    def test_solve_iter_step_time() -> None:
+        bnb = BranchAndBound(_SlowProblem())
+        start = time.perf_counter()
+        steps = list(
+            bnb.solve_iter(
+                step_nodes=None, step_time=STEP_TIME, timelimit=TIMELIMIT
+            )
+        )
+        elapsed = time.perf_counter() - start
+        assert len(steps) > 1
+        assert steps[-1].done
+        assert TIMELIMIT <= elapsed < TIMELIMIT + TIME_SLACK
+
+    @staticmethod
+    def test_solve_iter_invalid_steps() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        with pytest.raises(ValueError, match='step_nodes or step_time'):
+            next(bnb.solve_iter(step_nodes=None))
+        with pytest.raises(ValueError, match='step_nodes'):
+            next(bnb.solve_iter(step_nodes=0))
+        with pytest.raises(ValueError, match='step_time'):
+            next(bnb.solve_iter(step_time=0.0))
+
+    @staticmethod
+    def test_solve_async_interleaved() -> None:
+        ref = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        ref_sol = ref.solve()
+
+        async def main() -> list[float]:
+            searches = [
+                BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+                for _ in range(N_SEARCHES)
+            ]
+            results = await asyncio.gather(
+                *(bnb.solve_async(step_nodes=STEP_NODES) for bnb in searches)
+            )
+            return [res.cost for res in results]
+
+        assert asyncio.run(main()) == [ref_sol.cost] * N_SEARCHES
+
+    @staticmethod
+    def test_solve_async_cancel() -> None:
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+
+        async def main() -> None:
+            task = asyncio.create_task(bnb.solve_async(step_nodes=STEP_NODES))
+            for _ in range(N_SEARCHES):
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert 0 < bnb.explored <= N_SEARCHES * STEP_NODES
+        assert bnb.solve().solution.status == OptStatus.OPTIMAL
+
+
 class TestGenericBehavior:
     @staticmethod
     def test_raises_type_error_on_wrong_generic() -> None:
@@ -550,6 +963,23 @@ class TestManagerStrategy:
         assert res1.solution.status == res2.solution.status
         assert res1.solution.cost == res2.solution.cost
 
+    @staticmethod
+    @pytest.mark.parametrize('strategy', ['dfs', 'bfs', 'best', 'cbfs'])
+    def test_lazy_pruning_equivalence(strategy: str) -> None:
+        """Lazy pruning explores the same nodes as eager filtering."""
+        ref = BranchAndBound(
+            make_knapsack(LAZY_KNAPSACK_ITEMS),
+            manager=BranchAndBound.build_manager(strategy),
+        )
+        ref_sol = ref.solve()
+        mgr = BranchAndBound.build_manager(strategy)
+        mgr.set_lazy(threshold=1.0)
+        bnb = BranchAndBound(make_knapsack(LAZY_KNAPSACK_ITEMS), manager=mgr)
+        sol = bnb.solve()
+        assert sol.cost == ref_sol.cost
+        assert sol.status == ref_sol.status
+        assert bnb.explored == ref.explored
+
 
 @pytest.mark.core
 @pytest.mark.search
@@ -603,3 +1033,78 @@ class TestSubclassStrategies:
         result = bnb.solve(maxiter=SAFETY_MAXITER)
         assert result.solution.status == OptStatus.OPTIMAL
         assert result.solution.cost == FEASIBLE_LB
+
+
+@pytest.mark.core
+@pytest.mark.search
+class TestFrontierExchange:
+    """Tests for cutoff and frontier exchange between searches."""
+
+    @staticmethod
+    def test_set_cutoff_prunes_and_bounds() -> None:
+        """A cutoff acts as upper bound and prunes open nodes."""
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve(maxiter=KNAPSACK_ITER)
+        size = bnb.manager.size()
+        bnb.set_cutoff(bnb.lb + 1.0)
+        assert bnb.ub == bnb.cutoff
+        assert bnb.incumbent is None
+        assert bnb.manager.size() < size
+
+    @staticmethod
+    def test_set_cutoff_ignores_worse_value() -> None:
+        """A cutoff worse than the incumbent is ignored."""
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve()
+        ub = bnb.ub
+        bnb.set_cutoff(ub + 1.0)
+        assert bnb.ub == ub
+        assert bnb.incumbent is not None
+
+    @staticmethod
+    def test_solve_exhausted_under_cutoff() -> None:
+        """A search closed by an optimal cutoff finds no better solution."""
+        optimum = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        bnb.solve(maxiter=0)
+        bnb.set_cutoff(optimum.solution.cost)
+        res = bnb.solve()
+        assert bnb.incumbent is None
+        assert not bnb.manager.not_empty()
+        assert res.solution.status == OptStatus.RELAXATION
+        assert res.solution.lb == optimum.solution.cost
+        assert bnb.lb == optimum.solution.cost
+
+    @staticmethod
+    def test_split_and_load_frontier() -> None:
+        """Two searches sharing a frontier find the sequential optimum."""
+        optimum = BranchAndBound(make_knapsack(KNAPSACK_ITEMS)).solve()
+        first = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        first.solve(maxiter=KNAPSACK_ITER)
+        size = first.manager.size()
+        nodes = first.split_frontier(size // 2)
+        assert len(nodes) == size // 2
+        assert first.manager.size() == size - len(nodes)
+        # Shallow nodes are given away first
+        assert max(n.level for n in nodes) <= min(
+            n.level for n in first.split_frontier(size)
+        )
+
+        second = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        second.load_frontier(nodes)
+        assert second.root is nodes[0]
+        assert second.manager.size() == len(nodes)
+        res = second.solve()
+        best = min(first.solve().solution.cost, res.solution.cost)
+        assert best == optimum.solution.cost
+
+    @staticmethod
+    def test_split_frontier_keeps_one_node() -> None:
+        """The search giving nodes away always keeps at least one."""
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS))
+        assert bnb.split_frontier(TWO) == []
+        node = Node(make_knapsack(KNAPSACK_ITEMS))
+        node.compute_bound()
+        bnb.load_frontier([node])
+        assert bnb.split_frontier(TWO) == []
+        assert bnb.manager.size() == ONE
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from bnbpy.cython.solution import Solution
@@ -66,3 +68,15 @@ class TestSolution:
         assert deep_copy is not sol
         assert shallow_copy.status == sol.status
         assert deep_copy.status == sol.status
+
+    def test_pickle(self) -> None:
+        """Test that a solution survives a pickle round trip."""
+        sol = Solution()
+        sol.set_lb(self.cost_value)
+        sol.set_feasible()
+        other = pickle.loads(pickle.dumps(sol))
+
+        assert other is not sol
+        assert other.lb == self.cost_value
+        assert other.cost == self.cost_value
+        assert other.status == OptStatus.FEASIBLE
@@ -0,0 +1,141 @@
+import os
+import random
+from pathlib import Path
+
+import pytest
+from myfixtures.myproblem import MyProblem, make_knapsack
+
+from bnbpy.cython.node import Node
+from bnbpy.cython.primanager import BestFirstSearch
+from bnbpy.cython.search import BranchAndBound
+from bnbpy.cython.spillmanager import SpillingBestFirstSearch
+
+# Test constants
+N_NODES = 200
+MAX_NODES = 16
+BATCH_SIZE = 4
+MAX_LB_FILTER = 50
+LB_WORST = 200
+KNAPSACK_ITEMS = 30
+
+
+def _make_node(lb: float) -> Node[MyProblem]:
+    problem = MyProblem(lb_value=lb, feasible=False)
+    node = Node(problem)
+    node.compute_bound()
+    return node
+
+
+def _random_lbs(n: int = N_NODES, seed: int = 12) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randint(0, 100) for _ in range(n)]
+
+
+@pytest.mark.core
+@pytest.mark.manager
+class TestSpillingBestFirstSearch:
+    @staticmethod
+    @pytest.fixture
+    def manager(tmp_path: Path) -> SpillingBestFirstSearch[MyProblem]:
+        return SpillingBestFirstSearch(
+            max_nodes=MAX_NODES, batch_size=BATCH_SIZE, directory=str(tmp_path)
+        )
+
+    @staticmethod
+    def test_invalid_max_nodes() -> None:
+        with pytest.raises(ValueError, match='max_nodes'):
+            SpillingBestFirstSearch(max_nodes=1)
+
+    @staticmethod
+    def test_no_spill_below_capacity(
+        manager: SpillingBestFirstSearch[MyProblem],
+    ) -> None:
+        manager.enqueue_all([_make_node(lb) for lb in range(MAX_NODES)])
+        assert manager.size() == MAX_NODES
+        assert manager.spilled == 0
+        assert manager.n_runs == 0
+        assert manager.path is None
+
+    @staticmethod
+    def test_spill_keeps_size(
+        manager: SpillingBestFirstSearch[MyProblem],
+    ) -> None:
+        manager.enqueue_all([_make_node(lb) for lb in _random_lbs()])
+        assert manager.size() == N_NODES
+        assert manager.spilled > 0
+        assert manager.n_runs > 0
+        assert manager.spilled + manager.nodecount == N_NODES
+        assert os.listdir(manager.path)
+
+    @staticmethod
+    def test_dequeue_in_lb_order(
+        manager: SpillingBestFirstSearch[MyProblem],
+    ) -> None:
+        lbs = _random_lbs()
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        out = []
+        while manager.not_empty():
+            node = manager.dequeue()
+            assert node is not None
+            out.append(node.lb)
+        assert out == sorted(lbs)
+        assert manager.n_runs == 0
+        assert manager.dequeue() is None
+
+    @staticmethod
+    def test_lower_bound_includes_spilled(
+        manager: SpillingBestFirstSearch[MyProblem],
+    ) -> None:
+        lbs = _random_lbs()
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        for _ in range(N_NODES // 2):
+            # New nodes worse than spilled ones do not hide them
+            manager.enqueue(_make_node(LB_WORST))
+            node = manager.get_lower_bound()
+            assert node is not None
+            assert node.lb == manager.dequeue().lb
+
+    @staticmethod
+    def test_filter_by_lb(
+        manager: SpillingBestFirstSearch[MyProblem],
+    ) -> None:
+        lbs = _random_lbs()
+        manager.enqueue_all([_make_node(lb) for lb in lbs])
+        manager.filter_by_lb(MAX_LB_FILTER)
+        expected = sorted(lb for lb in lbs if lb < MAX_LB_FILTER)
+        assert manager.size() == len(expected)
+        out = []
+        while manager.not_empty():
+            out.append(manager.dequeue().lb)
+        assert out == expected
+
+    @staticmethod
+    def test_clear(manager: SpillingBestFirstSearch[MyProblem]) -> None:
+        manager.enqueue_all([_make_node(lb) for lb in _random_lbs()])
+        manager.clear()
+        assert manager.size() == 0
+        assert manager.not_empty() is False
+        assert manager.n_runs == 0
+        assert not os.listdir(manager.path)
+
+    @staticmethod
+    def test_directory_removed() -> None:
+        manager = SpillingBestFirstSearch[MyProblem](max_nodes=MAX_NODES)
+        manager.enqueue_all([_make_node(lb) for lb in _random_lbs()])
+        path = manager.path
+        assert path is not None
+        assert os.path.isdir(path)
+        del manager
+        assert not os.path.exists(path)
+
+    @staticmethod
+    def test_search(manager: SpillingBestFirstSearch[MyProblem]) -> None:
+        ref = BranchAndBound(
+            make_knapsack(KNAPSACK_ITEMS), manager=BestFirstSearch()
+        )
+        ref_sol = ref.solve()
+        bnb = BranchAndBound(make_knapsack(KNAPSACK_ITEMS), manager=manager)
+        sol = bnb.solve()
+        assert manager.path is not None
+        assert sol.cost == ref_sol.cost
+        assert bnb.explored == ref.explored
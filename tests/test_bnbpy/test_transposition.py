@@ -0,0 +1,149 @@
+import sys
+from typing import Optional
+
+import pytest
+from myfixtures.myproblem import MyProblem
+
+from bnbpy.cython.problem import Problem
+from bnbpy.cython.search import BranchAndBound
+from bnbpy.cython.transposition import TranspositionTable
+
+# Test constants
+N_ITEMS = 8
+N_CHOSEN = 4
+COSTS = [7, 3, 9, 1, 4, 8, 2, 6]
+OPTIMAL_COST = 10
+N_KEYS = 10
+ENTRY_SIZE = 128 + sys.getsizeof(1)
+DEEP = 5
+
+
+class SubsetProblem(Problem):
+    """Chooses N_CHOSEN items of least cost, one item per branch.
+
+    Items can be chosen in any order, so each subset is reached by
+    many paths of the tree.
+    """
+
+    def __init__(self, chosen: Optional[frozenset[int]] = None) -> None:
+        super().__init__()
+        self.chosen = chosen if chosen is not None else frozenset()
+        self.cost = sum(COSTS[i] for i in self.chosen)
+
+    def calc_bound(self) -> float:
+        # Weak bound, so the search visits many subsets
+        return self.cost
+
+    def is_feasible(self) -> bool:
+        return len(self.chosen) == N_CHOSEN
+
+    def branch(self) -> list['SubsetProblem']:
+        return [
+            SubsetProblem(self.chosen | {i})
+            for i in range(N_ITEMS)
+            if i not in self.chosen
+        ]
+
+    def state_key(self) -> frozenset[int]:
+        return self.chosen
+
+    def state_value(self) -> float:
+        return self.cost
+
+
+@pytest.mark.core
+@pytest.mark.transposition
+class TestTranspositionTable:
+    @staticmethod
+    def test_invalid_arguments() -> None:
+        with pytest.raises(ValueError, match='max_bytes'):
+            TranspositionTable(max_bytes=-1)
+        with pytest.raises(ValueError, match='policy'):
+            TranspositionTable(policy='fifo')
+
+    @staticmethod
+    def test_probe_dominance() -> None:
+        table = TranspositionTable()
+        assert not table.probe('a', 5.0)
+        assert table.probe('a', 5.0)
+        assert table.probe('a', 6.0)
+        # A better value replaces the stored one
+        assert not table.probe('a', 4.0)
+        assert table.probe('a', 4.5)
+        assert 'a' in table
+        assert len(table) == 1
+        assert table.hits == 3  # noqa: PLR2004
+
+    @staticmethod
+    def test_lru_eviction() -> None:
+        table = TranspositionTable(max_bytes=N_KEYS * ENTRY_SIZE)
+        for key in range(N_KEYS):
+            table.probe(key, 0.0)
+        assert len(table) == N_KEYS
+        # Touch the oldest key so the next one is evicted instead
+        table.probe(0, 0.0)
+        table.probe(N_KEYS, 0.0)
+        assert len(table) == N_KEYS
+        assert table.evictions == 1
+        assert 0 in table
+        assert 1 not in table
+        assert table.nbytes <= table.max_bytes
+
+    @staticmethod
+    def test_depth_eviction() -> None:
+        table = TranspositionTable(
+            max_bytes=N_KEYS * (ENTRY_SIZE + 64), policy='depth'
+        )
+        table.probe(-1, 0.0, DEEP)
+        for key in range(N_KEYS - 1):
+            table.probe(key, 0.0, 1)
+        table.probe(N_KEYS, 0.0, 0)
+        # The deepest entry goes first, even though probed last
+        assert -1 not in table
+        table.probe(N_KEYS + 1, 0.0, 0)
+        # Then the oldest of the deepest remaining level
+        assert 0 not in table
+        assert N_KEYS in table
+        assert len(table) == N_KEYS
+
+    @staticmethod
+    def test_clear() -> None:
+        table = TranspositionTable()
+        for key in range(N_KEYS):
+            table.probe(key, 0.0)
+        table.probe(0, 0.0)
+        table.clear()
+        assert len(table) == 0
+        assert table.nbytes == 0
+        assert table.hits == 0
+
+    @staticmethod
+    def test_default_table() -> None:
+        assert BranchAndBound(SubsetProblem()).table is not None
+        assert BranchAndBound(MyProblem(lb_value=1)).table is None
+
+    @staticmethod
+    @pytest.mark.parametrize('policy', ['lru', 'depth'])
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_search_prunes_duplicates(policy: str, eval_node: str) -> None:
+        ref = BranchAndBound(SubsetProblem(), eval_node=eval_node)
+        ref.table = None
+        ref_sol = ref.solve()
+        bnb = BranchAndBound(SubsetProblem(), eval_node=eval_node)
+        bnb.table = TranspositionTable(policy=policy)
+        sol = bnb.solve(profile=True)
+        assert ref_sol.cost == sol.cost == OPTIMAL_COST
+        assert bnb.explored < ref.explored
+        assert bnb.table.hits > 0
+        assert sol.stats is not None
+        assert sol.stats.pruned_enqueue >= bnb.table.hits
+
+    @staticmethod
+    def test_reset_clears_table() -> None:
+        bnb = BranchAndBound(SubsetProblem())
+        bnb.solve()
+        explored = bnb.explored
+        bnb.reset()
+        sol = bnb.solve()
+        assert sol.cost == OPTIMAL_COST
+        assert bnb.explored == explored
@@ -0,0 +1,173 @@
+import sys
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from myfixtures.myproblem import MyProblem, make_knapsack
+
+from bnbpy.cython.node import Node
+from bnbpy.cython.search import BranchAndBound
+from bnbpy.cython.tree import COLUMNS, TreeEvent, TreeRecorder, load_tree
+from bnbpy.plot import Edges, collapse_tree, plot_tree, tree_layout, tree_nodes
+
+# Test constants
+CHUNK_ROWS = 7
+SAME_COLUMNS = ('level', 'lb', 'event')
+DEEP = sys.getrecursionlimit() + 100
+MAX_NODES = 20
+
+
+def _record(eval_node: str, recorder: TreeRecorder) -> BranchAndBound:
+    bnb = BranchAndBound(make_knapsack(), eval_node=eval_node)
+    bnb.recorder = recorder
+    bnb.solve()
+    return bnb
+
+
+@pytest.mark.core
+@pytest.mark.tree
+class TestTreeRecorder:
+    @staticmethod
+    def test_invalid_arguments() -> None:
+        with pytest.raises(ValueError, match='chunk_rows'):
+            TreeRecorder(chunk_rows=0)
+
+    @staticmethod
+    def test_default_recorder() -> None:
+        assert BranchAndBound(make_knapsack()).recorder is None
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out', 'both'])
+    def test_records_search(eval_node: str) -> None:
+        bnb = _record(eval_node, TreeRecorder())
+        rows = bnb.recorder.arrays()
+        assert set(rows) == set(COLUMNS)
+        assert len(rows['index']) == len(bnb.recorder)
+        # The root is opened first
+        assert rows['event'][0] == TreeEvent.OPENED
+        assert rows['parent'][0] == 0
+        assert rows['index'][0] == bnb.root.index
+        # Every other node descends from a branched one
+        branched = rows['index'][rows['event'] == TreeEvent.BRANCHED]
+        children = rows['parent'] > 0
+        assert np.isin(rows['parent'][children], branched).all()
+        assert (rows['level'][children] > 0).all()
+        # Nodes are explored at most once
+        assert len(np.unique(branched)) == len(branched)
+        explored = [TreeEvent.BRANCHED, TreeEvent.SOLUTION]
+        assert bnb.explored == np.isin(rows['event'], explored).sum()
+        solutions = rows['lb'][rows['event'] == TreeEvent.SOLUTION]
+        assert solutions.min() == bnb.solution.cost
+        assert (np.diff(rows['time']) >= 0).all()
+
+    @staticmethod
+    def test_stream_matches_memory(tmp_path: Path) -> None:
+        path = tmp_path / 'tree.npz'
+        memory = _record('in', TreeRecorder()).recorder
+        stream = _record('in', TreeRecorder(path, chunk_rows=CHUNK_ROWS))
+        recorder = stream.recorder
+        assert len(recorder) == len(memory)
+        assert recorder.chunks == -(-len(memory) // CHUNK_ROWS)
+        # Only the rows since the last chunk are kept in memory
+        assert recorder.flushed == len(recorder)
+        rows = load_tree(path)
+        for name in SAME_COLUMNS:
+            assert np.array_equal(rows[name], memory.arrays()[name])
+        saved = tmp_path / 'saved.npz'
+        recorder.save(saved)
+        for name in COLUMNS:
+            assert np.array_equal(load_tree(saved)[name], rows[name])
+
+    @staticmethod
+    def test_reset_clears_rows(tmp_path: Path) -> None:
+        bnb = _record('out', TreeRecorder(tmp_path / 'tree.npz'))
+        rows = len(bnb.recorder)
+        bnb.reset()
+        bnb.solve()
+        assert len(bnb.recorder) == rows
+        assert len(load_tree(bnb.recorder.path)['index']) == rows
+
+    @staticmethod
+    @pytest.mark.parametrize('eval_node', ['in', 'out'])
+    def test_edges_match_saved_tree(eval_node: str) -> None:
+        bnb = BranchAndBound(
+            make_knapsack(), eval_node=eval_node, save_tree=True
+        )
+        bnb.recorder = TreeRecorder()
+        bnb.solve()
+        saved = Edges(bnb.root)
+        recorded = Edges(bnb.recorder)
+        assert recorded.root == saved.root
+        assert set(recorded) == set(saved)
+        assert recorded.lbs == saved.lbs
+        assert recorded.colors[recorded.root] == 'cyan'
+        assert 'lightgreen' in recorded.colors.values()
+        assert set(Edges(bnb.recorder.arrays())) == set(saved)
+
+
+@pytest.mark.core
+@pytest.mark.tree
+class TestTreePlot:
+    @staticmethod
+    @pytest.fixture
+    def recorder() -> TreeRecorder:
+        return _record('out', TreeRecorder()).recorder
+
+    @staticmethod
+    def test_deep_saved_tree() -> None:
+        root = node = Node(MyProblem(lb_value=1))
+        for _ in range(DEEP):
+            child = Node(MyProblem(lb_value=1), parent=node)
+            node.save_children([child])
+            node = child
+        nodes = tree_nodes(root)
+        assert len(nodes.index) == DEEP + 1
+        assert len(Edges(root)) == DEEP
+        x, depth = tree_layout(nodes)
+        assert np.allclose(x, 0.5)
+        assert depth.max() == DEEP
+
+    @staticmethod
+    def test_layout_centers_parents(recorder: TreeRecorder) -> None:
+        nodes = tree_nodes(recorder)
+        x, depth = tree_layout(nodes)
+        assert ((x > 0) & (x < 1)).all()
+        assert np.array_equal(depth, nodes.level)
+        # Nodes of a level do not overlap
+        for level in np.unique(nodes.level):
+            assert (
+                len(np.unique(x[nodes.level == level]))
+                == (nodes.level == level).sum()
+            )
+        # Parents are centered over their first and last children
+        parents = nodes.parent_positions()
+        for i in np.unique(parents[nodes.parent > 0])[:MAX_NODES]:
+            children = np.flatnonzero(nodes.parent == nodes.index[i])
+            assert np.all(np.diff(x[children]) > 0)
+            assert x[children[0]] <= x[i] <= x[children[-1]]
+
+    @staticmethod
+    def test_collapse_tree(recorder: TreeRecorder) -> None:
+        nodes = tree_nodes(recorder)
+        collapsed = collapse_tree(nodes, MAX_NODES)
+        assert len(collapsed.index) <= MAX_NODES
+        assert len(collapsed.index) + collapsed.hidden.sum() == len(
+            nodes.index
+        )
+        hidden = collapsed.hidden > 0
+        assert hidden.any()
+        assert (collapsed.level[hidden] == collapsed.level.max()).all()
+        assert 'lightgreen' in collapsed.color.tolist()
+        assert collapse_tree(nodes, len(nodes.index)) is nodes
+
+    @staticmethod
+    @pytest.mark.parametrize('align', ['horizontal', 'vertical'])
+    def test_plot_tree(recorder: TreeRecorder, align: str) -> None:
+        _, ax = plt.subplots()
+        assert plot_tree(recorder, align, max_nodes=MAX_NODES, ax=ax) is ax
+        assert len(ax.collections) == 3  # noqa: PLR2004
+        assert any('+' in text.get_text() for text in ax.texts)
+        plt.close(ax.figure)
+        with pytest.raises(ValueError, match='align'):
+            plot_tree(recorder, align='diagonal')